@@ -1,9 +1,51 @@
 from django.db import models
 
+from access.services.permission_registry import PermissionRegistry
 from users.models.roles import RoleAssignment
 
 
-class Permission(models.Model):
+class PermissionRegistryQuerySet(models.QuerySet):
+    """
+    Marks the compiled permission registry stale after bulk writes.
+    """
+
+    def bulk_create(self, *args, **kwargs):
+        created = super().bulk_create(*args, **kwargs)
+        PermissionRegistry.mark_changed()
+        return created
+
+    def update(self, **kwargs):
+        updated = super().update(**kwargs)
+        PermissionRegistry.mark_changed()
+        return updated
+
+    def delete(self):
+        deleted = super().delete()
+        PermissionRegistry.mark_changed()
+        return deleted
+
+
+class PermissionRegistryModel(models.Model):
+    """
+    Base for models compiled into ``PermissionRegistry``.
+    """
+
+    objects = PermissionRegistryQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        PermissionRegistry.mark_changed()
+
+    def delete(self, *args, **kwargs):
+        deleted = super().delete(*args, **kwargs)
+        PermissionRegistry.mark_changed()
+        return deleted
+
+
+class Permission(PermissionRegistryModel):
     domain = models.CharField( max_length=100, db_index=True )
 
     code = models.CharField( max_length=100, unique=True, db_index=True)
@@ -32,7 +74,7 @@ class Permission(models.Model):
     def __str__(self):
         return self.code
 
-class RolePermission(models.Model):
+class RolePermission(PermissionRegistryModel):
     role = models.CharField(
         max_length=40,
         choices=RoleAssignment.ROLE_CHOICES,
@@ -1,4 +1,4 @@
-from access.models import RolePermission
+from access.services.permission_registry import PermissionRegistry
 
 
 class AccessService:
@@ -21,7 +21,7 @@ class AccessService:
         if active_role.role == "SITE_ADMIN":
             return True
 
-        return RolePermission.objects.filter(
-            role=active_role.role,
-            permission__code=permission_code,
-        ).exists()
\ No newline at end of file
+        return PermissionRegistry.has_permission(
+            active_role.role,
+            permission_code,
+        )
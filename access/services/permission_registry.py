@@ -0,0 +1,231 @@
+"""
+Compiled runtime permission registry.
+
+Permission checks run on almost every request, while the permission matrix
+changes rarely. Each process compiles the whole matrix once into a
+``CompiledPermissions`` snapshot:
+
+- ``by_role``: role code -> frozenset of permission codes, so a check is a
+  set lookup with no database access;
+- ``ordered_by_role`` / ``all_codes``: the ordered code lists returned by
+  the ``/me`` permissions payload.
+
+The snapshot is tagged with a generation token held in Redis and read
+through the process-local ``GenerationTokenCache`` tier. Writes to
+``Permission`` / ``RolePermission`` (model saves and deletes, bulk queryset
+writes, ``PermissionMatrixService.update_matrix``) call ``mark_changed``,
+which rotates the generation immediately and again on commit and
+broadcasts it to every worker.
+
+Until the transaction that changed permissions ends, this thread compiles
+from the database on every read and keeps nothing, so an uncommitted or
+rolled-back change is never cached.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from core.services.generation_cache import GenerationTokenCache
+
+logger = logging.getLogger("arms.permission_registry")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPermissions:
+    generation: str | None
+    all_codes: tuple = ()
+    ordered_by_role: dict = field(default_factory=dict)
+    by_role: dict = field(default_factory=dict)
+
+    def has_permission(self, role: str, permission_code: str) -> bool:
+        return permission_code in self.by_role.get(role, frozenset())
+
+    def codes_for_role(self, role: str) -> tuple:
+        return self.ordered_by_role.get(role, ())
+
+
+class PermissionRegistry:
+    """Process-local compiled permission sets, one per generation."""
+
+    GENERATION_KEY = "permission-registry:v1:generation"
+
+    _compiled: CompiledPermissions | None = None
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @classmethod
+    def get_cache_alias(cls) -> str:
+        return settings.PERMISSION_REGISTRY_CACHE_ALIAS
+
+    # =====================================================
+    # Reads
+    # =====================================================
+
+    @classmethod
+    def get(cls) -> CompiledPermissions:
+        if getattr(cls._local, "changed", False):
+            if transaction.get_connection().in_atomic_block:
+                return cls.compile(generation=None)
+
+            cls._local.changed = False
+
+        generation = cls.get_generation()
+        compiled = cls._compiled
+
+        if (
+            generation is not None
+            and compiled is not None
+            and compiled.generation == generation
+        ):
+            return compiled
+
+        compiled = cls.compile(generation=generation)
+
+        if generation is not None:
+            with cls._lock:
+                cls._compiled = compiled
+
+        return compiled
+
+    @classmethod
+    def has_permission(cls, role: str, permission_code: str) -> bool:
+        return cls.get().has_permission(role, permission_code)
+
+    @classmethod
+    def codes_for_role(cls, role: str) -> list:
+        return list(cls.get().codes_for_role(role))
+
+    @classmethod
+    def all_codes(cls) -> list:
+        return list(cls.get().all_codes)
+
+    @classmethod
+    def compile(cls, *, generation) -> CompiledPermissions:
+        from access.models import Permission, RolePermission
+
+        all_codes = tuple(
+            Permission.objects
+            .order_by(
+                "sort_order",
+                "domain",
+                "code",
+            )
+            .values_list(
+                "code",
+                flat=True,
+            )
+        )
+
+        ordered_by_role = {}
+
+        for role, code in (
+            RolePermission.objects
+            .order_by(
+                "permission__sort_order",
+                "permission__domain",
+                "permission__code",
+            )
+            .values_list(
+                "role",
+                "permission__code",
+            )
+        ):
+            ordered_by_role.setdefault(role, []).append(code)
+
+        return CompiledPermissions(
+            generation=generation,
+            all_codes=all_codes,
+            ordered_by_role={
+                role: tuple(codes)
+                for role, codes in ordered_by_role.items()
+            },
+            by_role={
+                role: frozenset(codes)
+                for role, codes in ordered_by_role.items()
+            },
+        )
+
+    # =====================================================
+    # Generation
+    # =====================================================
+
+    @classmethod
+    def get_generation(cls) -> str | None:
+        """Current generation, or None if the cache is unavailable."""
+
+        alias = cls.get_cache_alias()
+
+        generation = GenerationTokenCache.get(alias, cls.GENERATION_KEY)
+        if generation is not None:
+            return generation
+
+        epoch = GenerationTokenCache.epoch()
+
+        try:
+            backend = caches[alias]
+            generation = backend.get(cls.GENERATION_KEY)
+
+            if not generation:
+                backend.add(cls.GENERATION_KEY, uuid4().hex, timeout=None)
+                generation = backend.get(cls.GENERATION_KEY)
+        except Exception:
+            logger.warning(
+                "PERMISSION REGISTRY GENERATION READ FAILED | cache_alias=%s",
+                alias,
+                exc_info=True,
+            )
+            return None
+
+        if not generation:
+            return None
+
+        GenerationTokenCache.set(
+            alias,
+            cls.GENERATION_KEY,
+            generation,
+            epoch=epoch,
+        )
+        return str(generation)
+
+    @classmethod
+    def mark_changed(cls) -> None:
+        """
+        Record a permission write. Call after changing ``Permission`` or
+        ``RolePermission`` rows outside their model and queryset methods.
+        """
+
+        connection = transaction.get_connection()
+
+        if connection.in_atomic_block:
+            cls._local.changed = True
+            transaction.on_commit(cls.rotate)
+
+        cls.rotate()
+
+    @classmethod
+    def rotate(cls) -> None:
+        """Start a new generation and tell every worker to drop its sets."""
+
+        alias = cls.get_cache_alias()
+
+        with cls._lock:
+            cls._compiled = None
+
+        try:
+            caches[alias].set(cls.GENERATION_KEY, uuid4().hex, timeout=None)
+        except Exception:
+            # Workers fall back to GENERATION_LOCAL_CACHE_TTL.
+            logger.exception(
+                "PERMISSION REGISTRY GENERATION ROTATE FAILED | cache_alias=%s",
+                alias,
+            )
+
+        GenerationTokenCache.invalidate(alias, cls.GENERATION_KEY)
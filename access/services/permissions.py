@@ -400,8 +400,8 @@ class PermissionMatrixSessionService:
             .distinct()
         )
 
-        revoked_count = sessions.update(
-            status=UserSession.Status.REVOKED,
+        revoked_count = sessions.set_status(
+            UserSession.Status.REVOKED,
         )
 
         User = get_user_model()
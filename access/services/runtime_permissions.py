@@ -1,4 +1,4 @@
-from access.models import Permission, RolePermission
+from access.services.permission_registry import PermissionRegistry
 
 
 class RuntimePermissionService:
@@ -38,40 +38,15 @@ class RuntimePermissionService:
         SITE_ADMIN is not stored in RolePermission rows because it is
         not editable through the matrix.
 
-        Non-site roles read from RolePermission.
+        Non-site roles read from RolePermission. Both come from the
+        compiled ``PermissionRegistry`` for the current generation.
         """
 
         if active_role.role == "SITE_ADMIN":
-            return list(
-                Permission.objects
-                .order_by(
-                    "sort_order",
-                    "domain",
-                    "code",
-                )
-                .values_list(
-                    "code",
-                    flat=True,
-                )
-            )
-
-        return list(
-            RolePermission.objects
-            .filter(
-                role=active_role.role,
-            )
-            .select_related(
-                "permission",
-            )
-            .order_by(
-                "permission__sort_order",
-                "permission__domain",
-                "permission__code",
-            )
-            .values_list(
-                "permission__code",
-                flat=True,
-            )
+            return PermissionRegistry.all_codes()
+
+        return PermissionRegistry.codes_for_role(
+            active_role.role,
         )
 
     @classmethod
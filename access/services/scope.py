@@ -1,7 +1,10 @@
+from django.contrib.auth import get_user_model
+
 from assignments.models.asset_assignment import ReturnRequest, ReturnRequestItem
 from users.models.roles import RoleAssignment
 from sites.models.sites import Room
 from sites.models.sites import UserPlacement
+from sites.services.room_ancestry import RoomAncestryService
 
 
 class ScopeService:
@@ -39,15 +42,12 @@ class ScopeService:
             "DEPARTMENT_VIEWER",
             "DEPARTMENT_ADMIN",
         }:
-            result = (
-                room.location
-                and room.location.department_id
-                == role_assignment.department_id
+            department_id = ScopeService.get_room_department_id(
+                room,
             )
             return (
-                room.location
-                and room.location.department_id
-                == role_assignment.department_id
+                department_id is not None
+                and department_id == role_assignment.department_id
             )
 
         # -------------------------
@@ -81,6 +81,111 @@ class ScopeService:
 
         return False
 
+    @staticmethod
+    def can_access_room_id(
+        role_assignment: RoleAssignment,
+        room_id: int | None,
+    ) -> bool:
+        """
+        Room check for callers that only hold a room primary key.
+
+        Answered from the in-process room scope index, so no room,
+        location or department rows are loaded.
+        """
+
+        if not role_assignment or room_id is None:
+            return False
+
+        room_ids = ScopeService.get_room_ids_in_scope(
+            role_assignment,
+        )
+
+        if room_ids is None:
+            return True
+
+        return room_id in room_ids
+
+    @staticmethod
+    def get_room_ids_in_scope(
+        role_assignment: RoleAssignment,
+    ) -> frozenset[int] | None:
+        """
+        Return the ids of every room the role assignment covers.
+
+        ``None`` means unrestricted (SITE_ADMIN). Unknown roles and
+        missing assignments resolve to an empty set.
+        """
+
+        if not role_assignment:
+            return frozenset()
+
+        role = role_assignment.role
+
+        if role == "SITE_ADMIN":
+            return None
+
+        if role in {
+            "DEPARTMENT_VIEWER",
+            "DEPARTMENT_ADMIN",
+        }:
+            return RoomAncestryService.get_index().room_ids_for_department(
+                role_assignment.department_id,
+            )
+
+        if role in {
+            "LOCATION_VIEWER",
+            "LOCATION_ADMIN",
+        }:
+            return RoomAncestryService.get_index().room_ids_for_location(
+                role_assignment.location_id,
+            )
+
+        if role in {
+            "ROOM_VIEWER",
+            "ROOM_CLERK",
+            "ROOM_ADMIN",
+        }:
+            if role_assignment.room_id is None:
+                return frozenset()
+            return frozenset({role_assignment.room_id})
+
+        return frozenset()
+
+    @staticmethod
+    def get_room_department_id(
+        room,
+    ) -> int | None:
+        """
+        Resolve a room's department id without a lazy location load.
+
+        An already-loaded ``room.location`` is trusted as-is. Otherwise the
+        department comes from the room scope index, falling back to the
+        relation only when the index has not seen the location yet.
+        """
+
+        location_id = getattr(room, "location_id", None)
+
+        if location_id is None:
+            return None
+
+        if not isinstance(room, Room) or Room.location.is_cached(room):
+            return getattr(
+                getattr(room, "location", None),
+                "department_id",
+                None,
+            )
+
+        index = RoomAncestryService.get_index()
+
+        if index.knows_location(location_id):
+            return index.department_for_location(location_id)
+
+        return getattr(
+            room.location,
+            "department_id",
+            None,
+        )
+
     # =====================================================
     # Room Resolvers
     # =====================================================
@@ -246,6 +351,292 @@ class ScopeService:
         )
     
 
+    # =====================================================
+    # Batch Scope Checks
+    # =====================================================
+
+    @staticmethod
+    def bulk_get_asset_room_ids(
+        assets,
+    ) -> dict:
+        """
+        Map asset pk -> room id. Reads ``room_id`` directly, so no
+        query is issued.
+        """
+
+        room_ids = {}
+
+        for asset in assets:
+            room_id = getattr(asset, "room_id", None)
+
+            if room_id is None:
+                room_id = getattr(
+                    ScopeService.get_asset_room(asset),
+                    "id",
+                    None,
+                )
+
+            room_ids[asset.pk] = room_id
+
+        return room_ids
+
+    @staticmethod
+    def bulk_get_user_room_ids(
+        users,
+    ) -> dict:
+        """
+        Map user pk -> current placement room id with one query.
+        """
+
+        room_ids = dict.fromkeys(
+            user.pk
+            for user in users
+        )
+
+        if not room_ids:
+            return room_ids
+
+        placements = (
+            UserPlacement.objects
+            .filter(
+                user_id__in=room_ids.keys(),
+                is_current=True,
+            )
+            .values_list(
+                "user_id",
+                "room_id",
+            )
+        )
+
+        for user_id, room_id in placements:
+            room_ids[user_id] = room_id
+
+        return room_ids
+
+    @staticmethod
+    def bulk_get_return_request_room_ids(
+        objs,
+    ) -> dict:
+        """
+        Map ``(model, pk)`` -> scope room id for return requests and/or
+        request items. Keys include the model because requests and items
+        have independent primary keys.
+
+        Items carry ``room_id`` directly. Requests resolve to their
+        first item's room (matching ``get_return_request_room``) with
+        one query for the whole batch.
+        """
+
+        room_ids = {}
+        request_ids = []
+
+        for obj in objs:
+            if isinstance(obj, ReturnRequestItem):
+                room_ids[(ReturnRequestItem, obj.pk)] = obj.room_id
+
+            elif isinstance(obj, ReturnRequest):
+                room_ids[(ReturnRequest, obj.pk)] = None
+                request_ids.append(obj.pk)
+
+            else:
+                raise TypeError(
+                    f"Expected ReturnRequest or ReturnRequestItem, "
+                    f"got {type(obj).__name__}."
+                )
+
+        if request_ids:
+            first_items = (
+                ReturnRequestItem.objects
+                .filter(return_request_id__in=request_ids)
+                .order_by(
+                    "return_request_id",
+                    "pk",
+                )
+                .values_list(
+                    "return_request_id",
+                    "room_id",
+                )
+            )
+
+            seen = set()
+
+            for request_id, room_id in first_items:
+                if request_id in seen:
+                    continue
+
+                seen.add(request_id)
+                room_ids[(ReturnRequest, request_id)] = room_id
+
+        return room_ids
+
+    @staticmethod
+    def bulk_can_access_rooms(
+        role_assignment: RoleAssignment,
+        room_ids: dict,
+    ) -> dict:
+        """
+        Evaluate a ``{key: room_id}`` map against the active role.
+
+        Membership is answered from the room scope index. Rooms the
+        index has not seen yet (created by another worker since the
+        last refresh) are loaded together and checked individually,
+        so the cost stays constant per batch.
+        """
+
+        if not role_assignment:
+            return dict.fromkeys(room_ids, False)
+
+        # SITE_ADMIN is unrestricted, including objects whose room was
+        # deleted (room FKs are SET_NULL).
+        if role_assignment.role == "SITE_ADMIN":
+            return dict.fromkeys(room_ids, True)
+
+        scope_room_ids = ScopeService.get_room_ids_in_scope(
+            role_assignment,
+        )
+
+        verdicts = {
+            key: (
+                room_id is not None
+                and (
+                    scope_room_ids is None
+                    or room_id in scope_room_ids
+                )
+            )
+            for key, room_id in room_ids.items()
+        }
+
+        if role_assignment.role not in {
+            "DEPARTMENT_VIEWER",
+            "DEPARTMENT_ADMIN",
+            "LOCATION_VIEWER",
+            "LOCATION_ADMIN",
+        }:
+            return verdicts
+
+        index = RoomAncestryService.get_index()
+
+        unknown = {
+            room_id
+            for key, room_id in room_ids.items()
+            if room_id is not None
+            and not verdicts[key]
+            and room_id not in index.room_locations
+        }
+
+        if unknown:
+            rooms = (
+                Room.objects
+                .select_related("location")
+                .in_bulk(unknown)
+            )
+
+            for key, room_id in room_ids.items():
+                if room_id in unknown:
+                    verdicts[key] = ScopeService.can_access_room(
+                        role_assignment,
+                        rooms.get(room_id),
+                    )
+
+        return verdicts
+
+    @staticmethod
+    def bulk_can_access_assets(
+        role_assignment,
+        assets,
+    ) -> dict:
+        """
+        Batch form of ``can_access_asset``; returns ``{asset.pk: bool}``.
+        """
+
+        return ScopeService.bulk_can_access_rooms(
+            role_assignment,
+            ScopeService.bulk_get_asset_room_ids(assets),
+        )
+
+    @staticmethod
+    def bulk_can_access_users(
+        role_assignment,
+        users,
+    ) -> dict:
+        """
+        Batch form of ``can_access_user``; returns ``{user.pk: bool}``.
+        """
+
+        return ScopeService.bulk_can_access_rooms(
+            role_assignment,
+            ScopeService.bulk_get_user_room_ids(users),
+        )
+
+    @staticmethod
+    def bulk_can_access_return_requests(
+        role_assignment,
+        objs,
+    ) -> dict:
+        """
+        Batch form of ``can_access_return_request``; returns
+        ``{(model, obj.pk): bool}`` for requests and/or request items.
+        """
+
+        return ScopeService.bulk_can_access_rooms(
+            role_assignment,
+            ScopeService.bulk_get_return_request_room_ids(objs),
+        )
+
+    @staticmethod
+    def filter_accessible(
+        role_assignment,
+        objects,
+    ) -> list:
+        """
+        Return the objects the active role may access, preserving order.
+
+        All objects must be of one kind: return requests/items, users,
+        or room-scoped assets. Mixed input raises ``TypeError``.
+        """
+
+        objects = list(objects)
+
+        if not objects:
+            return []
+
+        return_types = (ReturnRequest, ReturnRequestItem)
+        user_model = get_user_model()
+
+        if all(isinstance(obj, return_types) for obj in objects):
+            verdicts = ScopeService.bulk_can_access_return_requests(
+                role_assignment,
+                objects,
+            )
+
+            return [
+                obj
+                for obj in objects
+                if verdicts.get((type(obj), obj.pk), False)
+            ]
+
+        model = type(objects[0])
+
+        if any(type(obj) is not model for obj in objects):
+            raise TypeError("filter_accessible expects objects of one type.")
+
+        if issubclass(model, user_model):
+            verdicts = ScopeService.bulk_can_access_users(
+                role_assignment,
+                objects,
+            )
+        else:
+            verdicts = ScopeService.bulk_can_access_assets(
+                role_assignment,
+                objects,
+            )
+
+        return [
+            obj
+            for obj in objects
+            if verdicts.get(obj.pk, False)
+        ]
+
     @staticmethod
     def can_access_role_assignment( role_assignment, assignment):
         """
@@ -14,8 +14,8 @@ class AccessServiceTests(SimpleTestCase):
 
         "Does the user's active role have this permission code?"
 
-    These tests intentionally avoid the database. Database-backed behavior
-    for Permission / RolePermission belongs in model or integration tests.
+    These tests intentionally avoid the database. The compiled
+    PermissionRegistry is covered by its own tests.
     """
 
     def make_user(self, role=None):
@@ -30,8 +30,8 @@ class AccessServiceTests(SimpleTestCase):
     # No active role
     # ------------------------------------------------------------------
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_returns_false_when_user_has_no_active_role(self, mock_filter):
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_returns_false_when_user_has_no_active_role(self, mock_has_permission):
         user = self.make_user()
 
         result = AccessService.has_permission(
@@ -40,10 +40,10 @@ class AccessServiceTests(SimpleTestCase):
         )
 
         self.assertFalse(result)
-        mock_filter.assert_not_called()
+        mock_has_permission.assert_not_called()
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_returns_false_when_user_has_no_active_role_attribute(self, mock_filter):
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_returns_false_when_user_has_no_active_role_attribute(self, mock_has_permission):
         user = SimpleNamespace()
 
         result = AccessService.has_permission(
@@ -52,14 +52,14 @@ class AccessServiceTests(SimpleTestCase):
         )
 
         self.assertFalse(result)
-        mock_filter.assert_not_called()
+        mock_has_permission.assert_not_called()
 
     # ------------------------------------------------------------------
     # SITE_ADMIN bypass
     # ------------------------------------------------------------------
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_site_admin_bypasses_permission_matrix(self, mock_filter):
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_site_admin_bypasses_permission_matrix(self, mock_has_permission):
         user = self.make_user("SITE_ADMIN")
 
         result = AccessService.has_permission(
@@ -68,10 +68,10 @@ class AccessServiceTests(SimpleTestCase):
         )
 
         self.assertTrue(result)
-        mock_filter.assert_not_called()
+        mock_has_permission.assert_not_called()
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_site_admin_does_not_need_permission_row_to_exist(self, mock_filter):
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_site_admin_does_not_need_permission_row_to_exist(self, mock_has_permission):
         user = self.make_user("SITE_ADMIN")
 
         result = AccessService.has_permission(
@@ -80,15 +80,15 @@ class AccessServiceTests(SimpleTestCase):
         )
 
         self.assertTrue(result)
-        mock_filter.assert_not_called()
+        mock_has_permission.assert_not_called()
 
     # ------------------------------------------------------------------
     # Permission lookup
     # ------------------------------------------------------------------
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_returns_true_when_active_role_has_permission(self, mock_filter):
-        mock_filter.return_value.exists.return_value = True
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_returns_true_when_active_role_has_permission(self, mock_has_permission):
+        mock_has_permission.return_value = True
 
         user = self.make_user("ROOM_ADMIN")
 
@@ -99,14 +99,14 @@ class AccessServiceTests(SimpleTestCase):
 
         self.assertTrue(result)
 
-        mock_filter.assert_called_once_with(
-            role="ROOM_ADMIN",
-            permission__code="assets.create",
+        mock_has_permission.assert_called_once_with(
+            "ROOM_ADMIN",
+            "assets.create",
         )
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_returns_false_when_active_role_lacks_permission(self, mock_filter):
-        mock_filter.return_value.exists.return_value = False
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_returns_false_when_active_role_lacks_permission(self, mock_has_permission):
+        mock_has_permission.return_value = False
 
         user = self.make_user("ROOM_VIEWER")
 
@@ -117,14 +117,14 @@ class AccessServiceTests(SimpleTestCase):
 
         self.assertFalse(result)
 
-        mock_filter.assert_called_once_with(
-            role="ROOM_VIEWER",
-            permission__code="assets.create",
+        mock_has_permission.assert_called_once_with(
+            "ROOM_VIEWER",
+            "assets.create",
         )
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_permission_lookup_uses_exact_permission_code(self, mock_filter):
-        mock_filter.return_value.exists.return_value = True
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_permission_lookup_uses_exact_permission_code(self, mock_has_permission):
+        mock_has_permission.return_value = True
 
         user = self.make_user("LOCATION_ADMIN")
 
@@ -135,14 +135,14 @@ class AccessServiceTests(SimpleTestCase):
 
         self.assertTrue(result)
 
-        mock_filter.assert_called_once_with(
-            role="LOCATION_ADMIN",
-            permission__code="assets.update_status",
+        mock_has_permission.assert_called_once_with(
+            "LOCATION_ADMIN",
+            "assets.update_status",
         )
 
-    @patch("access.services.access.RolePermission.objects.filter")
-    def test_permission_lookup_uses_only_active_role(self, mock_filter):
-        mock_filter.return_value.exists.return_value = False
+    @patch("access.services.access.PermissionRegistry.has_permission")
+    def test_permission_lookup_uses_only_active_role(self, mock_has_permission):
+        mock_has_permission.return_value = False
 
         user = self.make_user("ROOM_CLERK")
 
@@ -153,7 +153,7 @@ class AccessServiceTests(SimpleTestCase):
 
         self.assertFalse(result)
 
-        mock_filter.assert_called_once_with(
-            role="ROOM_CLERK",
-            permission__code="assets.delete",
+        mock_has_permission.assert_called_once_with(
+            "ROOM_CLERK",
+            "assets.delete",
         )
\ No newline at end of file
@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from access.models import Permission, RolePermission
+from access.services.access import AccessService
+from access.services.permission_registry import PermissionRegistry
+from access.services.permissions import PermissionMatrixService
+from access.services.runtime_permissions import RuntimePermissionService
+from core.services.generation_cache import GenerationTokenCache
+
+
+def make_permission(code, *, sort_order=1):
+    return Permission.objects.create(
+        domain=code.split(".")[0],
+        code=code,
+        name=code.replace(".", " ").title(),
+        scope_type="SCOPED",
+        description="Test permission.",
+        sort_order=sort_order,
+    )
+
+
+def make_user(role):
+    return SimpleNamespace(active_role=SimpleNamespace(role=role))
+
+
+class PermissionRegistryCompiledTests(TransactionTestCase):
+    """
+    Committed permission sets are compiled once per generation and
+    checked without database access.
+    """
+
+    def setUp(self):
+        cache.clear()
+        GenerationTokenCache.reset()
+        PermissionRegistry.rotate()
+        self.addCleanup(PermissionRegistry.rotate)
+
+        self.rooms_view = make_permission("rooms.view", sort_order=2)
+        self.assets_view = make_permission("assets.view", sort_order=1)
+
+        RolePermission.objects.create(
+            role="ROOM_VIEWER",
+            permission=self.rooms_view,
+        )
+        RolePermission.objects.create(
+            role="ROOM_VIEWER",
+            permission=self.assets_view,
+        )
+
+    def test_checks_use_the_compiled_sets(self):
+        PermissionRegistry.get()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                AccessService.has_permission(
+                    make_user("ROOM_VIEWER"),
+                    "rooms.view",
+                )
+            )
+            self.assertFalse(
+                AccessService.has_permission(
+                    make_user("ROOM_CLERK"),
+                    "rooms.view",
+                )
+            )
+            self.assertEqual(
+                RuntimePermissionService.get_permission_codes(
+                    make_user("ROOM_VIEWER").active_role,
+                ),
+                ["assets.view", "rooms.view"],
+            )
+
+    def test_writes_rotate_the_generation(self):
+        generation = PermissionRegistry.get().generation
+
+        RolePermission.objects.filter(
+            role="ROOM_VIEWER",
+            permission=self.rooms_view,
+        ).delete()
+
+        self.assertNotEqual(PermissionRegistry.get().generation, generation)
+        self.assertFalse(
+            PermissionRegistry.has_permission("ROOM_VIEWER", "rooms.view")
+        )
+
+    def test_snapshot_changes_only_with_the_generation(self):
+        PermissionRegistry.get()
+
+        # Raw SQL bypasses the model and queryset hooks.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {RolePermission._meta.db_table}"
+            )
+
+        self.assertTrue(
+            PermissionRegistry.has_permission("ROOM_VIEWER", "rooms.view")
+        )
+
+        PermissionRegistry.rotate()
+
+        self.assertFalse(
+            PermissionRegistry.has_permission("ROOM_VIEWER", "rooms.view")
+        )
+
+
+class PermissionRegistryTransactionTests(TestCase):
+    """
+    Permission writes are visible inside their own transaction and are
+    never cached before they commit.
+    """
+
+    def setUp(self):
+        cache.clear()
+        GenerationTokenCache.reset()
+        PermissionRegistry.rotate()
+
+        self.rooms_view = make_permission("rooms.view")
+
+    def test_matrix_update_applies_immediately(self):
+        self.assertFalse(
+            PermissionRegistry.has_permission("ROOM_VIEWER", "rooms.view")
+        )
+
+        PermissionMatrixService.update_matrix(
+            {
+                "domains": [
+                    {
+                        "code": "rooms",
+                        "permissions": [
+                            {
+                                "code": "rooms.view",
+                                "roles": [
+                                    {
+                                        "role": "ROOM_VIEWER",
+                                        "enabled": True,
+                                    },
+                                ],
+                            },
+                        ],
+                    },
+                ],
+            }
+        )
+
+        self.assertTrue(
+            PermissionRegistry.has_permission("ROOM_VIEWER", "rooms.view")
+        )
+
+    def test_uncommitted_sets_are_not_stored(self):
+        RolePermission.objects.create(
+            role="ROOM_VIEWER",
+            permission=self.rooms_view,
+        )
+
+        compiled = PermissionRegistry.get()
+
+        self.assertIsNone(compiled.generation)
+        self.assertIsNone(PermissionRegistry._compiled)
+        self.assertTrue(compiled.has_permission("ROOM_VIEWER", "rooms.view"))
+
+    def test_site_admin_receives_every_code(self):
+        make_permission("assets.view", sort_order=0)
+
+        self.assertEqual(
+            RuntimePermissionService.get_permission_codes(
+                make_user("SITE_ADMIN").active_role,
+            ),
+            ["assets.view", "rooms.view"],
+        )
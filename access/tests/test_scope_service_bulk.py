@@ -0,0 +1,258 @@
+# access/tests/test_scope_service_bulk.py
+
+from types import SimpleNamespace
+
+from django.test import TestCase
+
+from access.services.scope import ScopeService
+from assets.asset_factories import EquipmentFactory
+from assignments.models.asset_assignment import (
+    ReturnRequest,
+    ReturnRequestItem,
+)
+from assignments.factories.return_factories import (
+    EquipmentReturnItemFactory,
+    ReturnRequestFactory,
+)
+from sites.factories.site_factories import (
+    DepartmentFactory,
+    LocationFactory,
+    RoomFactory,
+)
+from sites.services.room_ancestry import (
+    RoomAncestryService,
+    RoomScopeIndex,
+)
+from users.factories.user_factories import (
+    UserFactory,
+    UserPlacementFactory,
+)
+
+
+class BulkScopeServiceTests(TestCase):
+    """
+    Batch scope checks must agree with the single-object checks while
+    issuing a constant number of queries per batch.
+    """
+
+    def setUp(self):
+        RoomAncestryService.reset_local_index()
+
+        self.department = DepartmentFactory()
+        self.location = LocationFactory(department=self.department)
+        self.room = RoomFactory(location=self.location)
+        self.other_room = RoomFactory()
+
+        self.in_scope_assets = [
+            EquipmentFactory(room=self.room)
+            for _ in range(3)
+        ]
+        self.outside_asset = EquipmentFactory(room=self.other_room)
+
+    def tearDown(self):
+        RoomAncestryService.reset_local_index()
+
+    def role(self, role, **scope):
+        return SimpleNamespace(
+            role=role,
+            department_id=scope.get("department_id"),
+            location_id=scope.get("location_id"),
+            room_id=scope.get("room_id"),
+        )
+
+    def department_role(self):
+        return self.role(
+            "DEPARTMENT_ADMIN",
+            department_id=self.department.pk,
+        )
+
+    def test_bulk_assets_match_single_checks(self):
+        role = self.department_role()
+        assets = [*self.in_scope_assets, self.outside_asset]
+
+        verdicts = ScopeService.bulk_can_access_assets(role, assets)
+
+        self.assertEqual(
+            verdicts,
+            {
+                asset.pk: ScopeService.can_access_asset(role, asset)
+                for asset in assets
+            },
+        )
+        self.assertFalse(verdicts[self.outside_asset.pk])
+
+    def test_bulk_assets_query_count_is_constant(self):
+        role = self.department_role()
+        RoomAncestryService.get_index()
+
+        more_assets = [
+            EquipmentFactory(room=self.room)
+            for _ in range(10)
+        ]
+        RoomAncestryService.get_index()
+
+        with self.assertNumQueries(0):
+            verdicts = ScopeService.bulk_can_access_assets(role, more_assets)
+
+        self.assertTrue(all(verdicts.values()))
+
+    def test_room_unknown_to_index_is_resolved(self):
+        role = self.department_role()
+        new_room = RoomFactory(location=self.location)
+        asset = EquipmentFactory(room=new_room)
+
+        # Simulate a snapshot taken before the room existed.
+        RoomAncestryService._index = RoomScopeIndex.from_rows(
+            [],
+            generation=None,
+        )
+        RoomAncestryService._checked_at = float("inf")
+
+        verdicts = ScopeService.bulk_can_access_assets(role, [asset])
+
+        self.assertTrue(verdicts[asset.pk])
+
+    def test_missing_role_denies_everything(self):
+        verdicts = ScopeService.bulk_can_access_assets(
+            None,
+            self.in_scope_assets,
+        )
+
+        self.assertFalse(any(verdicts.values()))
+
+    def test_site_admin_allows_everything(self):
+        verdicts = ScopeService.bulk_can_access_assets(
+            self.role("SITE_ADMIN"),
+            [*self.in_scope_assets, self.outside_asset],
+        )
+
+        self.assertTrue(all(verdicts.values()))
+
+    def test_bulk_users_use_current_placement(self):
+        placed = UserPlacementFactory(room=self.room).user
+        outside = UserPlacementFactory(room=self.other_room).user
+        unplaced = UserFactory()
+
+        with self.assertNumQueries(1):
+            verdicts = ScopeService.bulk_can_access_users(
+                self.role("ROOM_ADMIN", room_id=self.room.pk),
+                [placed, outside, unplaced],
+            )
+
+        self.assertEqual(
+            verdicts,
+            {
+                placed.pk: True,
+                outside.pk: False,
+                unplaced.pk: False,
+            },
+        )
+
+    def test_bulk_return_requests_resolve_first_item_room(self):
+        role = self.role("LOCATION_ADMIN", location_id=self.location.pk)
+        RoomAncestryService.get_index()
+
+        in_scope = ReturnRequestFactory()
+        EquipmentReturnItemFactory(
+            return_request=in_scope,
+            equipment_assignment__equipment=self.in_scope_assets[0],
+        )
+
+        outside = ReturnRequestFactory()
+        EquipmentReturnItemFactory(
+            return_request=outside,
+            equipment_assignment__equipment=self.outside_asset,
+        )
+
+        empty = ReturnRequestFactory()
+
+        with self.assertNumQueries(1):
+            verdicts = ScopeService.bulk_can_access_return_requests(
+                role,
+                [in_scope, outside, empty],
+            )
+
+        self.assertEqual(
+            verdicts,
+            {
+                (ReturnRequest, in_scope.pk): True,
+                (ReturnRequest, outside.pk): False,
+                (ReturnRequest, empty.pk): False,
+            },
+        )
+
+    def test_bulk_return_verdicts_are_keyed_by_model(self):
+        role = self.role("ROOM_ADMIN", room_id=self.room.pk)
+
+        outside = ReturnRequestFactory()
+        EquipmentReturnItemFactory(
+            return_request=outside,
+            equipment_assignment__equipment=self.outside_asset,
+        )
+        item = EquipmentReturnItemFactory(
+            equipment_assignment__equipment=self.in_scope_assets[0],
+        )
+
+        verdicts = ScopeService.bulk_can_access_return_requests(
+            role,
+            [outside, item],
+        )
+
+        self.assertFalse(verdicts[(ReturnRequest, outside.pk)])
+        self.assertTrue(verdicts[(ReturnRequestItem, item.pk)])
+
+    def test_site_admin_allows_assets_without_room(self):
+        roomless = EquipmentFactory(room=None)
+
+        verdicts = ScopeService.bulk_can_access_assets(
+            self.role("SITE_ADMIN"),
+            [roomless, self.outside_asset],
+        )
+
+        self.assertEqual(
+            verdicts,
+            {
+                roomless.pk: True,
+                self.outside_asset.pk: True,
+            },
+        )
+
+    def test_filter_accessible_preserves_order(self):
+        role = self.role("ROOM_VIEWER", room_id=self.room.pk)
+        assets = [
+            self.in_scope_assets[2],
+            self.outside_asset,
+            self.in_scope_assets[0],
+        ]
+
+        self.assertEqual(
+            ScopeService.filter_accessible(role, assets),
+            [self.in_scope_assets[2], self.in_scope_assets[0]],
+        )
+
+    def test_filter_accessible_dispatches_return_items(self):
+        role = self.role("ROOM_ADMIN", room_id=self.room.pk)
+
+        in_scope_item = EquipmentReturnItemFactory(
+            equipment_assignment__equipment=self.in_scope_assets[1],
+        )
+        outside_item = EquipmentReturnItemFactory(
+            equipment_assignment__equipment=self.outside_asset,
+        )
+
+        self.assertEqual(
+            ScopeService.filter_accessible(
+                role,
+                [outside_item, in_scope_item],
+            ),
+            [in_scope_item],
+        )
+
+    def test_filter_accessible_rejects_mixed_types(self):
+        role = self.role("ROOM_ADMIN", room_id=self.room.pk)
+
+        with self.assertRaises(TypeError):
+            ScopeService.filter_accessible(
+                role,
+                [self.in_scope_assets[0], UserFactory()],
+            )
@@ -9,6 +9,12 @@ from assets.models.assets import Accessory, Component, Consumable, Equipment, Eq
 from core.models.security import PasswordResetEvent
 from core.models.sessions import UserSession
 from assets.selectors.accessories import department_accessories_queryset
+from assets.selectors.aggregates import (
+    aggregate,
+    summarize_accessories,
+    summarize_consumables,
+    summarize_equipment,
+)
 from assets.selectors.base import accessory_queryset, consumable_queryset, equipment_queryset
 
 from assets.selectors.consumables import department_consumables_queryset
@@ -49,37 +55,15 @@ def generate_daily_system_metrics(for_date=None):
     )
     end = start + timedelta(days=1)
 
-    equipment = equipment_queryset()
-    consumables = consumable_queryset()
-    accessories = accessory_queryset()
+    # One conditional aggregate per asset type instead of a query per
+    # figure.
+    equipment = summarize_equipment(equipment_queryset())
+    consumables = summarize_consumables(consumable_queryset())
+    accessories = summarize_accessories(accessory_queryset())
 
-    equipment_value = ( equipment.aggregate( total=Sum("purchase_price") )["total"] or Decimal("0.00") )
-
-    consumable_value = (
-        consumables.aggregate(
-            total=Sum(
-                F("quantity") * F("unit_cost"),
-                output_field=DecimalField(
-                    max_digits=18,
-                    decimal_places=2,
-                ),
-            )
-        )["total"]
-        or Decimal("0.00")
-    )
-
-    accessory_value = (
-        accessories.aggregate(
-            total=Sum(
-                F("quantity") * F("unit_cost"),
-                output_field=DecimalField(
-                    max_digits=18,
-                    decimal_places=2,
-                ),
-            )
-        )["total"]
-        or Decimal("0.00")
-    )
+    equipment_value = equipment["value"] or Decimal("0.00")
+    consumable_value = consumables["value"] or Decimal("0.00")
+    accessory_value = accessories["value"] or Decimal("0.00")
 
     total_inventory_value = (
         equipment_value
@@ -87,14 +71,10 @@ def generate_daily_system_metrics(for_date=None):
         + accessory_value
     )
 
-    active_equipment = equipment.filter(
-        status__in=[
-            EquipmentStatus.OK,
-            EquipmentStatus.UNDER_REPAIR,
-            EquipmentStatus.DAMAGED,
-        ]
+    components = aggregate(
+        Component.objects.all(),
+        {"total": Count("id"), "quantity": Sum("quantity")},
     )
-    
 
     with transaction.atomic():
         obj, created = DailySystemMetrics.objects.get_or_create(
@@ -166,38 +146,27 @@ def generate_daily_system_metrics(for_date=None):
                 # -------------------------
                 # Inventory metrics
                 # -------------------------
-                "total_equipment": equipment.count(),
+                "total_equipment": equipment["total"],
 
-                "equipment_ok": active_equipment.filter( status=EquipmentStatus.OK ).count(),
+                "equipment_ok": equipment[EquipmentStatus.OK],
 
-                "equipment_under_repair": active_equipment.filter( status=EquipmentStatus.UNDER_REPAIR ).count(),
+                "equipment_under_repair": equipment[EquipmentStatus.UNDER_REPAIR],
 
-                "equipment_damaged": active_equipment.filter(
-                    status=EquipmentStatus.DAMAGED
-                ).count(),
+                "equipment_damaged": equipment[EquipmentStatus.DAMAGED],
 
-                "total_components": Component.objects.count(),
+                "total_components": components["total"],
 
-                "total_components_quantity":
-                    Component.objects.aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
+                "total_components_quantity": components["quantity"],
 
                 # Consumables
-                "total_consumables": consumables.count(),
+                "total_consumables": consumables["items"],
 
-                "total_consumables_quantity":
-                    consumables.aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
+                "total_consumables_quantity": consumables["units"],
 
                 # Accessories
-                "total_accessories": accessories.count(),
+                "total_accessories": accessories["items"],
 
-                "total_accessories_quantity":
-                    accessories.aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
+                "total_accessories_quantity": accessories["units"],
 
                 "total_equipment_value": equipment_value,
                 "total_consumable_value": consumable_value,
@@ -9,6 +9,7 @@ from django.utils import timezone
 from core.models.tasks import ScheduledTaskRun
 from data_import.utils import delete_import_upload
 from reporting.models.reports import ReportJob
+from reporting.services.result_cache import report_file_is_shared
 from reporting.services.storage import delete_report
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,12 @@ def delete_old_reports(self):
 
         for job in old_jobs:
             try:
-                if delete_report(job.report_file):
+                # Cached results can be shared with newer jobs; the object
+                # goes with the last job that references it.
+                if (
+                    not report_file_is_shared(job)
+                    and delete_report(job.report_file)
+                ):
                     deleted_files += 1
             except Exception:
                 # Keep the database row so a later cleanup run can retry the
@@ -20,6 +20,7 @@ from django.conf import settings
 from django.core.cache import caches
 from django.db import transaction
 
+from core.cache.codec import CachePayloadCodec, CachePayloadDecodeError
 
 logger = logging.getLogger("analytics.cache")
 
@@ -57,7 +58,8 @@ class AnalyticsCacheService:
     """Cache analytics values while keeping Redis an optional optimisation."""
 
     KEY_PREFIX = "analytics-query-cache:v1"
-    CACHE_SCHEMA_VERSION = 1
+    # 2: values are stored as CachePayloadCodec bytes.
+    CACHE_SCHEMA_VERSION = 2
 
     @classmethod
     def get_cache_alias(cls) -> str:
@@ -200,7 +202,21 @@ class AnalyticsCacheService:
 
     @classmethod
     def _read(cls, cache, key: str):
-        return cache.get(key, _CACHE_MISSING)
+        value = cache.get(key, _CACHE_MISSING)
+
+        if value is _CACHE_MISSING:
+            return value
+
+        try:
+            return CachePayloadCodec.decode(value)
+        except CachePayloadDecodeError:
+            # Written by a worker with a codec this one lacks, or corrupt.
+            logger.warning(
+                "ANALYTICS CACHE DECODE FAILED | key=%s",
+                key,
+                exc_info=True,
+            )
+            return _CACHE_MISSING
 
     @classmethod
     def get_or_build(
@@ -300,13 +316,17 @@ class AnalyticsCacheService:
             value = builder()
 
             try:
-                cache.set(key, value, timeout=cls.get_timeout())
+                encoded = CachePayloadCodec.encode(value, strict=True)
+                cache.set(key, encoded.data, timeout=cls.get_timeout())
                 logger.info(
                     "ANALYTICS CACHE STORED | "
-                    "scope=%s identity=%s section=%s",
+                    "scope=%s identity=%s section=%s "
+                    "raw_bytes=%s stored_bytes=%s",
                     scope,
                     identity,
                     section,
+                    encoded.raw_size,
+                    encoded.size,
                 )
             except Exception:
                 logger.exception(
@@ -10,7 +10,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from core.permissions import AssetPermission
-from core.mixins import AuditMixin
+from core.mixins import AuditMixin, StreamingExportMixin
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import PermissionDenied
@@ -22,7 +22,7 @@ from assets.models.assets import Accessory
 from assets.asset_filters import AccessoryFilter
 from access.permissions.base import RequiresPermission
 
-class AccessoryModelViewSet(AuditMixin,ScopeFilterMixin, viewsets.ModelViewSet):
+class AccessoryModelViewSet(AuditMixin,ScopeFilterMixin, StreamingExportMixin, viewsets.ModelViewSet):
 
     """ViewSet for managing Accessory objects.
     This viewset provides `list`, `create`, `retrieve`, `update`, and `destroy` actions for Accessory objects."""
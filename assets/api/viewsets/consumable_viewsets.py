@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
 from core.pagination import FlexiblePagination
-from core.mixins import AuditMixin, ScopeFilterMixin
+from core.mixins import AuditMixin, ScopeFilterMixin, StreamingExportMixin
 from core.permissions import AssetPermission, is_in_scope
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
@@ -22,7 +22,7 @@ from access.permissions.base import RequiresPermission
 from sites.models.sites import Room
 
 
-class ConsumableModelViewSet(AuditMixin,ScopeFilterMixin, viewsets.ModelViewSet):
+class ConsumableModelViewSet(AuditMixin,ScopeFilterMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """ViewSet for managing Consumable objects.
     This viewset provides `list`, `create`, `retrieve`, `update`, and `destroy` actions for Consumable objects."""
     
@@ -3,7 +3,7 @@ from rest_framework.serializers import ValidationError
 
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter
-from core.mixins import ScopeFilterMixin,AuditMixin
+from core.mixins import ScopeFilterMixin,AuditMixin, StreamingExportMixin
 from django.db.models import Case, When, Value, IntegerField
 from rest_framework.response import Response
 from rest_framework import status
@@ -27,9 +27,48 @@ from assets.services.assets import hard_delete_asset, restore_asset, soft_delete
 from core.models.audit import AuditLog
 from assets.asset_filters import EquipmentFilter
 from access.permissions.base import RequiresPermission
+from access.services.scope import ScopeService
 from sites.models.sites import Room
 
-class EquipmentModelViewSet(AuditMixin, ScopeFilterMixin, viewsets.ModelViewSet):
+def lock_equipment_rows(equipment_public_ids):
+    """
+    Lock the requested equipment rows and return them keyed by public_id.
+
+    Rooms are joined so service-level scope re-checks do not lazy-load
+    them; only the equipment rows are locked.
+    """
+    equipment_qs = (
+        Equipment.objects
+        .select_for_update(of=("self",))
+        .select_related("room__location__department")
+        .filter(public_id__in=equipment_public_ids)
+        .order_by("id")
+    )
+
+    return {e.public_id: e for e in equipment_qs}
+
+
+def lock_equipment_batch(request, equipment_public_ids):
+    """
+    Lock the requested equipment rows and resolve the active role's scope
+    for the whole batch up front.
+
+    Returns ``(equipment_map, in_scope)`` where ``equipment_map`` is keyed
+    by public_id and ``in_scope`` by equipment pk. Scope is evaluated once
+    per batch through ``ScopeService.bulk_can_access_assets`` rather than
+    once per row.
+    """
+    equipment_map = lock_equipment_rows(equipment_public_ids)
+
+    in_scope = ScopeService.bulk_can_access_assets(
+        get_active_role(request.user),
+        equipment_map.values(),
+    )
+
+    return equipment_map, in_scope
+
+
+class EquipmentModelViewSet(AuditMixin, ScopeFilterMixin, StreamingExportMixin, viewsets.ModelViewSet):
 
     """ViewSet for managing Equipment objects.
     """
@@ -45,6 +84,7 @@ class EquipmentModelViewSet(AuditMixin, ScopeFilterMixin, viewsets.ModelViewSet)
     filterset_class = EquipmentFilter
 
     pagination_class = FlexiblePagination
+    keyset_ordering = "-id"
 
     permission_classes = [AssetPermission]
 
@@ -214,14 +254,10 @@ class BatchUnassignEquipmentView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-                Equipment.objects
-                .select_for_update()
-                .filter(public_id__in=equipment_public_ids)
-                .order_by("id")
+            equipment_map, in_scope = lock_equipment_batch(
+                request,
+                equipment_public_ids,
             )
-
-            equipment_map = {e.public_id: e for e in equipment_qs}
             now = timezone.now()
 
             for public_id in equipment_public_ids:
@@ -232,8 +268,11 @@ class BatchUnassignEquipmentView(APIView):
                     failed += 1
                     continue
 
+                if not in_scope[equipment.pk]:
+                    failed += 1
+                    continue
+
                 try:
-                    self.check_object_permissions(request, equipment)
 
                     result = unassign_equipment(
                         actor=actor,
@@ -287,14 +326,10 @@ class BatchAssignEquipmentView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-                Equipment.objects
-                .select_for_update()
-                .filter(public_id__in=equipment_public_ids)
-                .order_by("id")
+            equipment_map, in_scope = lock_equipment_batch(
+                request,
+                equipment_public_ids,
             )
-
-            equipment_map = {e.public_id: e for e in equipment_qs}
             now = timezone.now()
 
             for public_id in equipment_public_ids:
@@ -305,8 +340,11 @@ class BatchAssignEquipmentView(APIView):
                     failed += 1
                     continue
 
+                if not in_scope[equipment.pk]:
+                    failed += 1
+                    continue
+
                 try:
-                    self.check_object_permissions(request, equipment)
 
                     result = assign_equipment(
                         actor=actor,
@@ -356,14 +394,10 @@ class BatchEquipmentStatusChangeView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-            Equipment.objects
-            .select_for_update()
-            .filter(public_id__in=equipment_public_ids)
-            .order_by("id")
-            )
-
-            equipment_map = {e.public_id: e for e in equipment_qs}
+            # No room-scope gate here: change_equipment_status authorizes
+            # each row itself (SITE_ADMIN, in-scope admins, and assignees
+            # self-reporting condition).
+            equipment_map = lock_equipment_rows(equipment_public_ids)
 
             for public_id in equipment_public_ids:
 
@@ -373,7 +407,6 @@ class BatchEquipmentStatusChangeView(APIView):
                     continue
 
                 try:
-                    self.check_object_permissions(request, eq)
 
                     result = change_equipment_status(
                         actor=actor,
@@ -418,15 +451,11 @@ class BatchEquipmentCondemnView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-                Equipment.objects
-                .select_for_update()
-                .filter(public_id__in=equipment_public_ids)
-                .order_by("id")
+            equipment_map, in_scope = lock_equipment_batch(
+                request,
+                equipment_public_ids,
             )
 
-            equipment_map = {e.public_id: e for e in equipment_qs}
-
             for public_id in equipment_public_ids:
 
                 eq = equipment_map.get(public_id)
@@ -434,8 +463,11 @@ class BatchEquipmentCondemnView(APIView):
                     failed += 1
                     continue
 
+                if not in_scope[eq.pk]:
+                    failed += 1
+                    continue
+
                 try:
-                    self.check_object_permissions(request, eq)
 
                     result = condemn_equipment(
                         actor=actor,
@@ -480,15 +512,11 @@ class BatchEquipmentHardDeleteView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-                Equipment.objects
-                .select_for_update()
-                .filter(public_id__in=equipment_public_ids)
-                .order_by("id")
+            equipment_map, in_scope = lock_equipment_batch(
+                request,
+                equipment_public_ids,
             )
 
-            equipment_map = {e.public_id: e for e in equipment_qs}
-
             for public_id in equipment_public_ids:
 
                 eq = equipment_map.get(public_id)
@@ -496,8 +524,11 @@ class BatchEquipmentHardDeleteView(APIView):
                     failed += 1
                     continue
 
+                if not in_scope[eq.pk]:
+                    failed += 1
+                    continue
+
                 try:
-                    self.check_object_permissions(request, eq)
 
                     result = hard_delete_asset(
                         actor=actor,
@@ -615,15 +646,11 @@ class BatchEquipmentSoftDeleteView(APIView):
 
         with transaction.atomic():
 
-            equipment_qs = (
-                Equipment.objects
-                .select_for_update()
-                .filter(public_id__in=equipment_public_ids)
-                .order_by("id")
+            equipment_map, in_scope = lock_equipment_batch(
+                request,
+                equipment_public_ids,
             )
 
-            equipment_map = {e.public_id: e for e in equipment_qs}
-
             for public_id in equipment_public_ids:
 
                 eq = equipment_map.get(public_id)
@@ -631,8 +658,11 @@ class BatchEquipmentSoftDeleteView(APIView):
                     failed += 1
                     continue
 
+                if not in_scope[eq.pk]:
+                    failed += 1
+                    continue
+
                 try:
-                    self.check_object_permissions(request, eq)
 
                     result = soft_delete_asset(
                         actor=actor,
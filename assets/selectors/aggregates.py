@@ -0,0 +1,176 @@
+"""
+Single-pass inventory aggregation.
+
+Each ``summarize_*`` helper computes every count, unit total and value
+for one asset type with conditional aggregation (``Count(filter=...)``),
+so a scope costs one query per asset type instead of one per figure.
+
+Pass ``group_by`` (e.g. ``"room__location__department_id"``) to get the
+same figures for every group from one ``GROUP BY`` query::
+
+    summarize_equipment(qs)
+    -> {"total": 12, "ok": 9, ...}
+
+    summarize_equipment(qs, group_by="room_id")
+    -> {4: {"total": 3, ...}, 7: {...}}
+
+Groups without rows are absent; use ``empty_*_summary()`` as the default.
+"""
+
+from django.db.models import Count, DecimalField, F, Q, Sum
+
+from assets.models.assets import EquipmentStatus
+
+
+VALUE_FIELD = DecimalField(max_digits=18, decimal_places=2)
+
+
+def aggregate(queryset, aggregates: dict, *, group_by: str | None = None):
+    """
+    Evaluate ``aggregates`` over ``queryset`` (optionally per ``group_by``).
+
+    Missing sums are reported as 0, matching ``aggregate(...)["x"] or 0``.
+    """
+
+    if group_by is None:
+        return _fill_nulls(queryset.aggregate(**aggregates))
+
+    rows = (
+        queryset.order_by()
+        .values(group_by)
+        .annotate(**aggregates)
+    )
+
+    return {
+        row.pop(group_by): _fill_nulls(row)
+        for row in rows
+    }
+
+
+def _fill_nulls(row: dict) -> dict:
+    return {
+        key: 0 if value is None else value
+        for key, value in row.items()
+    }
+
+
+def _empty(aggregates: dict) -> dict:
+    return {key: 0 for key in aggregates}
+
+
+# ==========================================================
+# Equipment
+# ==========================================================
+
+UNUSABLE_EQUIPMENT_STATUSES = (
+    EquipmentStatus.RETIRED,
+    EquipmentStatus.CONDEMNED,
+)
+
+
+def equipment_aggregates() -> dict:
+    usable = ~Q(status__in=UNUSABLE_EQUIPMENT_STATUSES)
+    assigned = Q(active_assignment__returned_at__isnull=True)
+
+    aggregates = {
+        "total": Count("id"),
+        "usable": Count("id", filter=usable),
+        "assigned": Count("id", filter=assigned),
+        "assigned_usable": Count("id", filter=usable & assigned),
+        "value": Sum("purchase_price", output_field=VALUE_FIELD),
+    }
+
+    for status in EquipmentStatus:
+        aggregates[status.value] = Count("id", filter=Q(status=status))
+
+    return aggregates
+
+
+def summarize_equipment(queryset, *, group_by: str | None = None):
+    return aggregate(queryset, equipment_aggregates(), group_by=group_by)
+
+
+def empty_equipment_summary() -> dict:
+    return _empty(equipment_aggregates())
+
+
+# ==========================================================
+# Accessories / Consumables
+# ==========================================================
+
+def _stock_value():
+    return Sum(F("quantity") * F("unit_cost"), output_field=VALUE_FIELD)
+
+
+def accessory_aggregates() -> dict:
+    return {
+        "items": Count("id"),
+        "units": Sum("quantity"),
+        "value": _stock_value(),
+    }
+
+
+def summarize_accessories(queryset, *, group_by: str | None = None):
+    return aggregate(queryset, accessory_aggregates(), group_by=group_by)
+
+
+def empty_accessory_summary() -> dict:
+    return _empty(accessory_aggregates())
+
+
+def consumable_aggregates() -> dict:
+    return {
+        "items": Count("id"),
+        "units": Sum("quantity"),
+        "value": _stock_value(),
+        "low_stock": Count(
+            "id",
+            filter=Q(
+                low_stock_threshold__gt=0,
+                quantity__lte=F("low_stock_threshold"),
+            ),
+        ),
+        "out_of_stock": Count("id", filter=Q(quantity=0)),
+    }
+
+
+def summarize_consumables(queryset, *, group_by: str | None = None):
+    return aggregate(queryset, consumable_aggregates(), group_by=group_by)
+
+
+def empty_consumable_summary() -> dict:
+    return _empty(consumable_aggregates())
+
+
+# ==========================================================
+# User placements
+# ==========================================================
+
+def placement_aggregates() -> dict:
+    return {
+        "placements": Count("id"),
+        "users": Count("user_id", distinct=True),
+        "active_users": Count(
+            "user_id",
+            distinct=True,
+            filter=Q(user__is_active=True),
+        ),
+    }
+
+
+def summarize_placements(queryset, *, group_by: str | None = None):
+    return aggregate(queryset, placement_aggregates(), group_by=group_by)
+
+
+def empty_placement_summary() -> dict:
+    return _empty(placement_aggregates())
+
+
+def inventory_value(equipment: dict, accessories: dict, consumables: dict):
+    """Total value across the three summaries."""
+
+    return (
+        equipment["value"]
+        + accessories["value"]
+        + consumables["value"]
+    )
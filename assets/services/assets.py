@@ -1,5 +1,6 @@
 
 from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 from core.permissions.helpers import can_hard_delete_asset, can_soft_delete_asset
 from core.utils.asset_helpers import ASSET_CONFIG
 from django.db import transaction
@@ -20,7 +21,7 @@ def create_asset_audit_log(
     location = getattr(room, "location", None) if room else None
     department = getattr(location, "department", None) if location else None
 
-    AuditLog.objects.create(
+    AuditLogWriter.record(
         user=actor,
         user_public_id=actor.public_id,
         user_email=actor.email,
@@ -17,6 +17,9 @@ from assignments.api.serializers.returns import ReturnRequestSerializer
 from assignments.services.asset_returns import create_mixed_return_request, approve_return_request, deny_return_request, approve_return_item, deny_return_item
 from assignments.assignment_filters import AdminReturnRequestFilter, ReturnRequestFilter
 from access.permissions.returns import ReturnRequestPermission
+from access.services.scope import ScopeService
+from core.permissions.helpers import get_active_role
+from rest_framework.exceptions import PermissionDenied
 from users.api.serializers.self import MixedAssetReturnSerializer
 
 
@@ -166,6 +169,30 @@ class AdminReturnRequestWorkflowViewSet( AuditMixin, NotificationMixin, viewsets
     lookup_field = "public_id"
     lookup_url_kwarg = "public_id"
 
+    def ensure_items_in_scope(self, request, items):
+        """
+        Object permission only checks the request's first item room.
+        Approving touches every item, so verify all of them in one
+        batch scope evaluation before anything is changed.
+        """
+        verdicts = ScopeService.bulk_can_access_return_requests(
+            get_active_role(request.user),
+            items,
+        )
+
+        out_of_scope = [
+            item.public_id
+            for item in items
+            if not verdicts.get((type(item), item.pk), False)
+        ]
+
+        if out_of_scope:
+            raise PermissionDenied({
+                "detail": "Some return items are outside active role scope.",
+                "reason": "OUT_OF_SCOPE",
+                "items": out_of_scope,
+            })
+
     # ------------------------------------------------
     # Approve return request
     # ------------------------------------------------
@@ -181,6 +208,11 @@ class AdminReturnRequestWorkflowViewSet( AuditMixin, NotificationMixin, viewsets
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        self.ensure_items_in_scope(
+            request,
+            list(rr.items.filter(status=ReturnRequestItem.Status.PENDING)),
+        )
+
         rr = approve_return_request(rr, request.user)
 
         # audit log
@@ -282,6 +314,15 @@ class AdminReturnRequestWorkflowViewSet( AuditMixin, NotificationMixin, viewsets
             for item in rr.items.all()
         }
 
+        self.ensure_items_in_scope(
+            request,
+            [
+                items_map[entry.get("public_id")]
+                for entry in items_data
+                if entry.get("public_id") in items_map
+            ],
+        )
+
         processed = []
 
         for entry in items_data:
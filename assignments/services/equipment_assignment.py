@@ -2,6 +2,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 from core.models.notifications import Notification
 from django.apps import apps
 from channels.layers import get_channel_layer
@@ -72,7 +73,7 @@ def unassign_equipment(
             notes=notes or "Equipment returned",
         )
 
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             user=actor,
             user_public_id=actor.public_id,
             user_email=actor.email,
@@ -214,7 +215,7 @@ def assign_equipment(
             notes=notes or "Equipment assigned",
         )
 
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             user=actor,
             user_public_id=actor.public_id,
             user_email=actor.email,
@@ -359,7 +360,7 @@ def change_equipment_status(
             notes=notes or f"{old_status} → {new_status}",
         )
 
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             user=actor,
             user_public_id=actor.public_id,
             user_email=actor.email,
@@ -441,7 +442,7 @@ def condemn_equipment(
         )
 
         # --- Audit trail ---
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             user=actor,
             user_public_id=actor.public_id,
             user_email=actor.email,
@@ -162,7 +162,8 @@ class AdminReturnItemWorkflowTests(TestCase):
 
         url = reverse( "admin-return-request-item-deny", args=[self.item.public_id] )
 
-        self.client.post(url, {"reason": "Damaged"}, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"reason": "Damaged"}, format="json")
 
         audit = AuditLog.objects.filter(
             target_id=self.item.public_id
@@ -72,13 +72,6 @@ class SecuritySettingsAdmin(admin.ModelAdmin):
     # Cache invalidation
     # -----------------------------------------------------
 
-    def save_model(self, request, obj, form, change):
-        """
-        Clear policy cache when settings are updated.
-        """
-        super().save_model(request, obj, form, change)
-        invalidate_security_policy_cache()
-
     def delete_model(self, request, obj):
         """
         Clear policy cache if deleted.
@@ -2,6 +2,8 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import AuthenticationFailed
 
 from core.services.security.login_failures import is_temporarily_locked
+from core.services.security.session_activity import SessionActivityTracker
+from core.services.security.session_state import SessionState, SessionStateCache
 from .models import UserSession
 from django.utils import timezone
 import time
@@ -10,8 +12,32 @@ import time
 class SessionJWTAuthentication(JWTAuthentication):
     """
     Enforces session-based access control on top of JWT authentication.
+
+    Session status and idle expiry are read from ``SessionStateCache`` and
+    the session row is loaded only on a miss (or when ``session`` is used).
     """
 
+    session_id = None
+    _session = None
+
+    @property
+    def session(self):
+        """The authenticated ``UserSession``, loaded on first use."""
+
+        if self._session is None and self.session_id:
+            self._session = UserSession.objects.filter(
+                id=self.session_id
+            ).first()
+
+            if self._session is not None:
+                SessionActivityTracker.apply(self._session)
+
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        self._session = value
+
     def get_user(self, validated_token):
 
         user = super().get_user(validated_token)
@@ -44,24 +70,41 @@ class SessionJWTAuthentication(JWTAuthentication):
         # Resolve session
         # -----------------------------------------
 
-        try:
+        session = None
+        state = SessionStateCache.get(session_id)
 
-            session = UserSession.objects.get(
-                id=session_id
+        # A cached expiry may predate an extension (saved or still pending
+        # in the activity tracker); confirm it before expiring the session.
+        if (
+            state is None
+            or (
+                state.status == UserSession.Status.ACTIVE
+                and state.expires_at <= time.time()
             )
+        ):
 
-        except UserSession.DoesNotExist:
+            try:
 
-            raise AuthenticationFailed(
-                "Session does not exist or has been revoked.",
-                code="invalid_session",
-            )
+                session = UserSession.objects.get(
+                    id=session_id
+                )
+
+            except UserSession.DoesNotExist:
+
+                raise AuthenticationFailed(
+                    "Session does not exist or has been revoked.",
+                    code="invalid_session",
+                )
+
+            SessionActivityTracker.apply(session)
+            SessionStateCache.store(session)
+            state = SessionState.from_session(session)
 
         # -----------------------------------------
         # Status validation
         # -----------------------------------------
 
-        if session.status != UserSession.Status.ACTIVE:
+        if state.status != UserSession.Status.ACTIVE:
 
             raise AuthenticationFailed(
                 "Session revoked or expired.",
@@ -72,7 +115,7 @@ class SessionJWTAuthentication(JWTAuthentication):
         # Idle expiry
         # -----------------------------------------
 
-        if session.expires_at <= timezone.now():
+        if session is not None and session.expires_at <= timezone.now():
 
             session.status = (
                 UserSession.Status.EXPIRED
@@ -91,12 +134,12 @@ class SessionJWTAuthentication(JWTAuthentication):
 
         if user.is_locked:
 
-            session.status = (
+            UserSession.objects.filter(
+                id=session_id
+            ).set_status(
                 UserSession.Status.REVOKED
             )
 
-            session.save(update_fields=["status"])
-
             raise AuthenticationFailed(
                 "Account locked.",
                 code="account_locked",
@@ -113,6 +156,7 @@ class SessionJWTAuthentication(JWTAuthentication):
         # Expose session downstream
         # -----------------------------------------
 
+        self.session_id = session_id
         self.session = session
 
-        return user
\ No newline at end of file
+        return user
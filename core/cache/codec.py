@@ -0,0 +1,315 @@
+"""Compact, versioned encoding for cached payloads.
+
+Cached list responses and analytics results used to be pickled whole into
+Redis. ``CachePayloadCodec`` encodes them as JSON (via orjson) or msgpack and
+compresses anything above ``CACHE_PAYLOAD_COMPRESS_MIN_BYTES`` with zstd, lz4
+or zlib.
+
+orjson, msgpack, zstandard and lz4 are installed from requirements/base.txt.
+The imports stay guarded so a worker built without one of them (a partial
+rollout, a slim image) falls back to stdlib json / zlib instead of failing
+to start.
+
+Encoded payloads start with a three byte header::
+
+    [format version][serializer id][compression id]
+
+so readers can decode entries written by any configuration, and an
+unreadable entry (unknown version, codec not installed on this worker) is
+reported as a decode error that callers treat as a cache miss.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - see module docstring.
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - see module docstring.
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - see module docstring.
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - see module docstring.
+    lz4_frame = None
+
+
+FORMAT_VERSION = 1
+
+SERIALIZER_JSON = 1
+SERIALIZER_MSGPACK = 2
+SERIALIZER_PICKLE = 3
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+_SERIALIZER_NAMES = {
+    "json": SERIALIZER_JSON,
+    "msgpack": SERIALIZER_MSGPACK,
+}
+
+_COMPRESSION_NAMES = {
+    "none": COMPRESSION_NONE,
+    "zlib": COMPRESSION_ZLIB,
+    "zstd": COMPRESSION_ZSTD,
+    "lz4": COMPRESSION_LZ4,
+}
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+
+
+class CachePayloadDecodeError(ValueError):
+    """Raised when a cached value cannot be decoded by this worker."""
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPayload:
+    data: bytes
+    raw_size: int
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+def _json_default(value: Any) -> str:
+    # DRF coerces decimals (and UUIDs, lazy strings) to strings when
+    # rendering; match its output.
+    return str(value)
+
+
+def _is_plain(value: Any) -> bool:
+    """True when ``value`` survives a JSON/msgpack round trip unchanged."""
+
+    if type(value) in _PLAIN_SCALARS:
+        return True
+
+    if type(value) is list:
+        return all(_is_plain(item) for item in value)
+
+    if type(value) is dict:
+        return all(
+            type(key) is str and _is_plain(item)
+            for key, item in value.items()
+        )
+
+    return False
+
+
+class CachePayloadCodec:
+    """Encode and decode cache values with a self-describing header."""
+
+    # =====================================================
+    # Settings
+    # =====================================================
+
+    @classmethod
+    def get_serializer_id(cls) -> int:
+        name = str(
+            getattr(settings, "CACHE_PAYLOAD_SERIALIZER", "json")
+        ).lower()
+
+        if name not in _SERIALIZER_NAMES:
+            raise ValueError(f"Unknown CACHE_PAYLOAD_SERIALIZER: {name!r}")
+
+        if name == "msgpack" and msgpack is None:
+            return SERIALIZER_JSON
+
+        return _SERIALIZER_NAMES[name]
+
+    @classmethod
+    def get_compression_id(cls) -> int:
+        name = str(
+            getattr(settings, "CACHE_PAYLOAD_COMPRESSION", "auto")
+        ).lower()
+
+        if name == "auto":
+            if zstandard is not None:
+                return COMPRESSION_ZSTD
+            if lz4_frame is not None:
+                return COMPRESSION_LZ4
+            return COMPRESSION_ZLIB
+
+        if name not in _COMPRESSION_NAMES:
+            raise ValueError(f"Unknown CACHE_PAYLOAD_COMPRESSION: {name!r}")
+
+        compression_id = _COMPRESSION_NAMES[name]
+
+        # A configured codec that is not installed degrades to zlib rather
+        # than disabling caching.
+        if compression_id == COMPRESSION_ZSTD and zstandard is None:
+            return COMPRESSION_ZLIB
+        if compression_id == COMPRESSION_LZ4 and lz4_frame is None:
+            return COMPRESSION_ZLIB
+
+        return compression_id
+
+    @classmethod
+    def get_compress_min_bytes(cls) -> int:
+        return max(
+            0,
+            int(getattr(settings, "CACHE_PAYLOAD_COMPRESS_MIN_BYTES", 1024)),
+        )
+
+    # =====================================================
+    # Encode / decode
+    # =====================================================
+
+    @classmethod
+    def encode(cls, value: Any, *, strict: bool = False) -> EncodedPayload:
+        """Encode ``value``.
+
+        ``strict`` callers need the exact Python value back (analytics
+        builders may return tuples, dates or decimals); anything that is not
+        plain JSON data is pickled instead. Non-strict callers cache already
+        rendered API data, where stringifying stray values matches what the
+        JSON renderer would send anyway.
+        """
+
+        if strict and not _is_plain(value):
+            serializer_id = SERIALIZER_PICKLE
+            body = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            serializer_id = cls.get_serializer_id()
+            body = cls._serialize(serializer_id, value)
+
+        raw_size = len(body)
+        compression_id = COMPRESSION_NONE
+
+        if raw_size >= cls.get_compress_min_bytes():
+            compression_id = cls.get_compression_id()
+            body = cls._compress(compression_id, body)
+
+        return EncodedPayload(
+            data=bytes((FORMAT_VERSION, serializer_id, compression_id)) + body,
+            raw_size=raw_size,
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> Any:
+        if not cls.is_encoded(data):
+            raise CachePayloadDecodeError("Value is not an encoded cache payload.")
+
+        serializer_id = data[1]
+        compression_id = data[2]
+
+        try:
+            body = cls._decompress(compression_id, data[3:])
+            return cls._deserialize(serializer_id, body)
+        except CachePayloadDecodeError:
+            raise
+        except Exception as exc:
+            raise CachePayloadDecodeError(
+                "Cached payload is corrupt."
+            ) from exc
+
+    @classmethod
+    def is_encoded(cls, value: Any) -> bool:
+        return (
+            isinstance(value, (bytes, bytearray))
+            and len(value) >= 3
+            and value[0] == FORMAT_VERSION
+        )
+
+    # =====================================================
+    # Serializers
+    # =====================================================
+
+    @classmethod
+    def _serialize(cls, serializer_id: int, value: Any) -> bytes:
+        if serializer_id == SERIALIZER_MSGPACK:
+            return msgpack.packb(
+                value,
+                default=_json_default,
+                use_bin_type=True,
+            )
+
+        if orjson is not None:
+            return orjson.dumps(
+                value,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+
+        return json.dumps(
+            value,
+            default=_json_default,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+    @classmethod
+    def _deserialize(cls, serializer_id: int, body: bytes) -> Any:
+        if serializer_id == SERIALIZER_JSON:
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
+
+        if serializer_id == SERIALIZER_MSGPACK:
+            if msgpack is None:
+                raise CachePayloadDecodeError("msgpack is not installed.")
+            return msgpack.unpackb(body, raw=False)
+
+        if serializer_id == SERIALIZER_PICKLE:
+            return pickle.loads(body)
+
+        raise CachePayloadDecodeError(
+            f"Unknown cache payload serializer: {serializer_id}"
+        )
+
+    # =====================================================
+    # Compression
+    # =====================================================
+
+    @classmethod
+    def _compress(cls, compression_id: int, body: bytes) -> bytes:
+        if compression_id == COMPRESSION_ZSTD:
+            return zstandard.ZstdCompressor(level=3).compress(body)
+
+        if compression_id == COMPRESSION_LZ4:
+            return lz4_frame.compress(body)
+
+        if compression_id == COMPRESSION_ZLIB:
+            return zlib.compress(body, 6)
+
+        return body
+
+    @classmethod
+    def _decompress(cls, compression_id: int, body: bytes) -> bytes:
+        if compression_id == COMPRESSION_NONE:
+            return body
+
+        if compression_id == COMPRESSION_ZLIB:
+            return zlib.decompress(body)
+
+        if compression_id == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise CachePayloadDecodeError("zstandard is not installed.")
+            return zstandard.ZstdDecompressor().decompress(body)
+
+        if compression_id == COMPRESSION_LZ4:
+            if lz4_frame is None:
+                raise CachePayloadDecodeError("lz4 is not installed.")
+            return lz4_frame.decompress(body)
+
+        raise CachePayloadDecodeError(
+            f"Unknown cache payload compression: {compression_id}"
+        )
@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.services.audit_partitions import AuditLogPartitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive audit log months older than the retention window to "
+        "gzip-compressed CSV files and remove them from the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=settings.AUDIT_LOG_RETENTION_MONTHS,
+            help="Keep this many months (including the current one)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=str(settings.AUDIT_LOG_ARCHIVE_DIR),
+            help="Directory the archive files are written to",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the months that would be archived without changing anything",
+        )
+
+    def handle(self, *args, **options):
+        months = options["months"]
+        dry_run = options["dry_run"]
+
+        if months < 0:
+            raise CommandError("--months must be zero or positive.")
+
+        if months == 0:
+            self.stdout.write(self.style.WARNING("Audit log retention is disabled."))
+            return
+
+        cutoff = AuditLogPartitions.add_months(
+            AuditLogPartitions.month_start(timezone.now()),
+            -(months - 1),
+        )
+
+        self.stdout.write(
+            self.style.WARNING(
+                f"Archiving audit logs before {cutoff:%Y-%m}"
+                + (" (dry run)..." if dry_run else "...")
+            )
+        )
+
+        archived = AuditLogPartitions.archive_before(
+            cutoff,
+            archive_dir=options["output_dir"],
+            dry_run=dry_run,
+        )
+
+        for entry in archived:
+            source = "partition" if entry.partition else "rows"
+            self.stdout.write(
+                f"{entry.month:%Y-%m}: {entry.rows} rows ({source}) -> {entry.path}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived months: {len(archived)}")
+        )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from sites.services.room_ancestry import RoomAncestryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the RoomAncestry closure from Room and Location. "
+        "Run after bulk writes that bypass Room.save/Location.save."
+    )
+
+    def handle(self, *args, **options):
+
+        self.stdout.write(self.style.WARNING("Rebuilding room ancestry closure..."))
+
+        result = RoomAncestryService.rebuild()
+
+        self.stdout.write(self.style.SUCCESS("Room ancestry rebuilt"))
+        self.stdout.write(f"Created: {result.created}")
+        self.stdout.write(f"Updated: {result.updated}")
+        self.stdout.write(f"Deleted: {result.deleted}")
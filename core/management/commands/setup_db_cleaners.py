@@ -92,6 +92,12 @@ class Command(BaseCommand):
             cron_expr=settings.USERSESSION_EXPIRE_CRON,
         )
 
+        upsert_task(
+            name="DB Maintenance: flush session activity",
+            task="core.tasks.cleanup.flush_session_activity",
+            cron_expr=settings.USERSESSION_ACTIVITY_FLUSH_CRON,
+        )
+
         upsert_task(
             name="DB Maintenance: cleanup user sessions",
             task="core.tasks.cleanup.cleanup_user_sessions",
@@ -109,6 +115,12 @@ class Command(BaseCommand):
             cron_expr=settings.TASKRUN_CLEANUP_CRON,
         )
 
+        upsert_task(
+            name="DB Maintenance: prepare audit log partitions",
+            task="core.tasks.cleanup.maintain_audit_log_partitions",
+            cron_expr=settings.AUDIT_LOG_PARTITION_CRON,
+        )
+
         # -------------------------------
         # Report lifecycle
         # -------------------------------
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.http import HttpResponseNotFound
 
 from core.request_context import clear_request_id, set_request_id
+from core.services.audit_writer import AuditLogWriter
 
 
 class RequestIDMiddleware:
@@ -26,6 +27,17 @@ class RequestIDMiddleware:
         return response
 
 
+class AuditLogBufferMiddleware:
+    """Write the audit entries recorded by a request in one batch."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with AuditLogWriter.buffered():
+            return self.get_response(request)
+
+
 class OperationalEndpointSecurityMiddleware:
     """Require an explicit bearer token for Prometheus metrics."""
 
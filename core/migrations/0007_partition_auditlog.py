@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+
+from django.db import migrations
+
+
+TABLE = "core_auditlog"
+LEGACY_TABLE = "core_auditlog_unpartitioned"
+MONTHS_AHEAD = 3
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _month_start(value):
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def partition_audit_log(apps, schema_editor):
+    """
+    Rebuild core_auditlog as a table range-partitioned by month of
+    created_at (PostgreSQL only; other databases keep the plain table).
+
+    PostgreSQL requires every unique constraint on a partitioned table to
+    include the partition key, so the primary key becomes (id, created_at)
+    and public_id is unique per created_at. Global public_id uniqueness is
+    still enforced by PublicIDRegistry. Secondary indexes and foreign keys
+    are recreated from the original table's definitions.
+    """
+
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [TABLE],
+        )
+        if cursor.fetchone():
+            return
+
+        cursor.execute(
+            """
+            SELECT index_class.relname, pg_get_indexdef(index_class.oid)
+            FROM pg_index
+            JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = %s::regclass
+              AND NOT pg_index.indisprimary
+              AND NOT pg_index.indisunique
+            """,
+            [TABLE],
+        )
+        indexes = cursor.fetchall()
+
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype = 'f'
+            """,
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(f"SELECT min(created_at), coalesce(max(id), 0) FROM {TABLE}")
+        first_created_at, max_id = cursor.fetchone()
+
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY_TABLE}")
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {LEGACY_TABLE}) "
+            "PARTITION BY RANGE (created_at)"
+        )
+
+        current = _month_start(datetime.now(timezone.utc))
+        month = _month_start(first_created_at) if first_created_at else current
+        last = _add_months(current, MONTHS_AHEAD)
+
+        while month <= last:
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {LEGACY_TABLE}")
+        cursor.execute(f"DROP TABLE {LEGACY_TABLE}")
+
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey "
+            "PRIMARY KEY (id, created_at)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_public_id_created_at_uniq "
+            "UNIQUE (public_id, created_at)"
+        )
+
+        for name, definition in indexes:
+            method_and_columns = definition.split(" USING ", 1)[1]
+            cursor.execute(
+                f'CREATE INDEX "{name}" ON {TABLE} USING {method_and_columns}'
+            )
+
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" {definition}')
+
+        # Identity columns are not available on partitioned tables before
+        # PostgreSQL 17; a sequence default behaves the same for Django.
+        cursor.execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+        cursor.execute(
+            f"SELECT setval('{TABLE}_id_seq', %s, %s)",
+            [max(max_id, 1), max_id > 0],
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{TABLE}_id_seq')"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_auditlog_composite_indexes"),
+    ]
+
+    operations = [
+        # The partitioned table is schema-compatible with the plain one, so
+        # reversing leaves it in place.
+        migrations.RunPython(
+            partition_audit_log,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -16,6 +16,7 @@ from .dashboards import (
     AreaDashboardMixin,
     ConsumableDashboardMixin,
 )
+from .export import StreamingExportMixin
 from .filters import ExcludeFiltersMixin
 from .notifications import NotificationMixin
 from .serializers import ListDetailSerializerMixin
@@ -33,5 +34,6 @@ __all__ = [
     "RoleVisibilityMixin",
     "ScopeFilterMixin",
     "SiteOptionInvalidationMixin",
+    "StreamingExportMixin",
     "UserScopeListCacheMixin",
 ]
\ No newline at end of file
@@ -2,52 +2,18 @@
 
 from __future__ import annotations
 
-from django.conf import settings
-from django.db import transaction
 from django.utils.text import capfirst
 
 from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 
 
 class AuditMixin:
     """Record CRUD and domain audit events after successful transactions."""
 
     @staticmethod
-    def _empty_scope():
-        return {
-            "room": None,
-            "room_name": None,
-            "location": None,
-            "location_name": None,
-            "department": None,
-            "department_name": None,
-        }
-
-    def _resolve_scope(self, target):
-        if not target:
-            return self._empty_scope()
-
-        scope = self._empty_scope()
-
-        room = getattr(target, "room", None)
-        location = getattr(target, "location", None)
-        department = getattr(target, "department", None)
-
-        if room:
-            location = getattr(room, "location", None)
-            department = getattr(location, "department", None) if location else None
-        elif location:
-            department = getattr(location, "department", None)
-
-        scope.update(
-            room=room,
-            room_name=getattr(room, "name", None),
-            location=location,
-            location_name=getattr(location, "name", None),
-            department=department,
-            department_name=getattr(department, "name", None),
-        )
-        return scope
+    def _resolve_scope(target):
+        return AuditLogWriter.resolve_scope(target)
 
     @staticmethod
     def _get_target_label(target):
@@ -82,33 +48,27 @@ class AuditMixin:
 
         scope = self._resolve_scope(target)
 
-        def create_log():
-            AuditLog.objects.create(
-                user=user,
-                user_public_id=getattr(user, "public_id", None),
-                user_email=getattr(user, "email", None),
-                event_type=event_type,
-                description=description,
-                metadata=metadata or {},
-                target_model=self._get_target_model(target),
-                target_id=getattr(target, "public_id", None),
-                target_name=self._get_target_label(target),
-                department=scope["department"],
-                department_name=scope["department_name"],
-                location=scope["location"],
-                location_name=scope["location_name"],
-                room=scope["room"],
-                room_name=scope["room_name"],
-                ip_address=request.META.get("REMOTE_ADDR") if request else None,
-                user_agent=(
-                    request.META.get("HTTP_USER_AGENT", "") if request else ""
-                ),
-            )
-
-        if getattr(settings, "IS_TESTING", False):
-            create_log()
-        else:
-            transaction.on_commit(create_log)
+        AuditLogWriter.record(
+            user=user,
+            user_public_id=getattr(user, "public_id", None),
+            user_email=getattr(user, "email", None),
+            event_type=event_type,
+            description=description,
+            metadata=metadata or {},
+            target_model=self._get_target_model(target),
+            target_id=getattr(target, "public_id", None),
+            target_name=self._get_target_label(target),
+            department=scope["department"],
+            department_name=scope["department_name"],
+            location=scope["location"],
+            location_name=scope["location_name"],
+            room=scope["room"],
+            room_name=scope["room_name"],
+            ip_address=request.META.get("REMOTE_ADDR") if request else None,
+            user_agent=(
+                request.META.get("HTTP_USER_AGENT", "") if request else ""
+            ),
+        )
 
     def audit(
         self,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import secrets
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -13,9 +14,13 @@ from typing import Any
 from django.conf import settings
 from django.core.cache import InvalidCacheBackendError, caches
 from django.db import connection
+from django.http import HttpResponse, HttpResponseBase
 from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from core.cache.codec import CachePayloadCodec, CachePayloadDecodeError
+from core.services.generation_cache import GenerationTokenCache
 from core.services.user_scope_cache import UserScopeCacheService, UserScopeCacheUnavailable
 from sites.services.option_cache import SiteOptionCacheService, SiteOptionCacheUnavailable
 
@@ -24,6 +29,14 @@ from sites.services.option_cache import SiteOptionCacheService, SiteOptionCacheU
 logger = logging.getLogger("arms.scope_cache")
 _CACHE_MISS = object()
 
+COMPARE_AND_DELETE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+
+return 0
+"""
+
 
 @dataclass(slots=True)
 class _DatabaseQueryCounter:
@@ -34,6 +47,108 @@ class _DatabaseQueryCounter:
         return execute(sql, params, many, context)
 
 
+@dataclass(slots=True)
+class _CacheRoundTripCounter:
+    count: int = 0
+
+
+class _CountedCache:
+    """Cache backend proxy counting the calls that reach the cache server."""
+
+    _ROUND_TRIP_METHODS = frozenset({
+        "add",
+        "delete",
+        "delete_many",
+        "get",
+        "get_many",
+        "has_key",
+        "incr",
+        "set",
+        "set_many",
+        "touch",
+    })
+
+    def __init__(self, backend, counter: _CacheRoundTripCounter):
+        self.backend = backend
+        self.counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self.backend, name)
+
+        if name not in self._ROUND_TRIP_METHODS:
+            return attr
+
+        def counted(*args, **kwargs):
+            self.counter.count += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+    def set_entries(self, entries: list[tuple[str, Any, int | None]]) -> None:
+        """Write ``(key, value, timeout)`` entries in one pipelined round trip.
+
+        ``set_many`` applies a single timeout, but the payload, marker and
+        stale copy expire at different times. Django's Redis backend exposes
+        the redis-py client, so the per-key SET EX commands are pipelined
+        directly; other backends fall back to one ``set`` per entry.
+        """
+
+        client = getattr(self.backend, "_cache", None)
+        get_client = getattr(client, "get_client", None)
+        serializer = getattr(client, "_serializer", None)
+
+        if get_client is None or serializer is None:
+            for key, value, timeout in entries:
+                self.counter.count += 1
+                self.backend.set(key, value, timeout=timeout)
+            return
+
+        self.counter.count += 1
+        pipeline = get_client(None, write=True).pipeline(transaction=False)
+
+        for key, value, timeout in entries:
+            key = self.backend.make_and_validate_key(key)
+            timeout = self.backend.get_backend_timeout(timeout)
+
+            if timeout == 0:
+                pipeline.delete(key)
+            else:
+                pipeline.set(key, serializer.dumps(value), ex=timeout)
+
+        pipeline.execute()
+
+    def delete_if_value(self, key: str, value: Any) -> bool:
+        """Delete ``key`` only while it still holds ``value``.
+
+        On Redis the comparison and delete run in one Lua script, so a
+        key that expired and was taken by another worker is never removed.
+        Other backends fall back to a get followed by a delete.
+        """
+
+        client = getattr(self.backend, "_cache", None)
+        get_client = getattr(client, "get_client", None)
+        serializer = getattr(client, "_serializer", None)
+
+        if get_client is None or serializer is None:
+            self.counter.count += 1
+            if self.backend.get(key, _CACHE_MISS) != value:
+                return False
+            self.counter.count += 1
+            self.backend.delete(key)
+            return True
+
+        self.counter.count += 1
+        script = get_client(None, write=True).register_script(
+            COMPARE_AND_DELETE_SCRIPT
+        )
+        return bool(
+            script(
+                keys=[self.backend.make_and_validate_key(key)],
+                args=[serializer.dumps(value)],
+            )
+        )
+
+
 class UserScopeListCacheMixin:
     """Cache a DRF list response per user, active role, and request shape.
 
@@ -44,6 +159,12 @@ class UserScopeListCacheMixin:
     Redis is an optimisation, not a request dependency. Read/generation
     failures therefore bypass the response cache and execute the normal
     database-backed DRF list path.
+
+    Misses are single-flight: one request per key takes a build lock and
+    runs the list, while concurrent requests wait up to
+    ``USER_SCOPE_CACHE_LOCK_WAIT_MS`` for its payload. With
+    ``USER_SCOPE_CACHE_STALE_SECONDS`` set, waiters instead serve the
+    previous payload for the same user/role/request while it is rebuilt.
     """
 
     scope_cache_namespace: str | None = None
@@ -55,6 +176,10 @@ class UserScopeListCacheMixin:
     scope_cache_debug_headers: bool | None = None
     scope_cache_count_database_queries: bool | None = None
     scope_cache_log_request_params: bool | None = None
+    scope_cache_lock_timeout: int | None = None
+    scope_cache_lock_wait_ms: int | None = None
+    scope_cache_stale_seconds: int | None = None
+    scope_cache_rendered_passthrough: bool | None = None
 
     scope_cache_key_prefix = "user-scope-list-cache:v3"
 
@@ -73,11 +198,15 @@ class UserScopeListCacheMixin:
         cache_alias = self.get_scope_cache_alias()
 
         try:
+            backend = _CountedCache(
+                caches[cache_alias],
+                _CacheRoundTripCounter(),
+            )
             context = self.build_scope_cache_context(
                 request,
                 cache_alias=cache_alias,
+                backend=backend,
             )
-            backend = caches[cache_alias]
         except (
             UserScopeCacheUnavailable,
             SiteOptionCacheUnavailable,
@@ -105,7 +234,9 @@ class UserScopeListCacheMixin:
         key_digest = context["request_digest"]
 
         try:
-            cached_payload = backend.get(cache_key, _CACHE_MISS)
+            # Payload and marker share one MGET; the marker only matters on a
+            # miss but costs nothing extra here.
+            cached_values = backend.get_many([cache_key, marker_key])
         except Exception:
             logger.exception(
                 "SCOPE CACHE READ FAILED | user_public_id=%s active_role_id=%s "
@@ -125,43 +256,23 @@ class UserScopeListCacheMixin:
                 context=context,
             )
 
+        cached_payload = self.load_scope_cache_payload(
+            cached_values.get(cache_key, _CACHE_MISS),
+            context,
+        )
+        previously_created = bool(cached_values.get(marker_key, False))
+
         if self.is_valid_cache_payload(cached_payload):
             ttl_remaining = self.get_payload_ttl_remaining(cached_payload)
 
             # Do not serve a payload whose own expiry timestamp has elapsed,
             # even if the Redis key survives for a few milliseconds longer.
             if ttl_remaining is None or ttl_remaining > 0:
-                age_seconds = self.get_payload_age_seconds(cached_payload)
-
-                logger.info(
-                    "SCOPE CACHE HIT | user_public_id=%s active_role_id=%s "
-                    "namespace=%s generation=%s site_generation=%s request_digest=%s "
-                    "ttl_remaining=%s age_seconds=%s cache_alias=%s site_cache_alias=%s%s",
-                    context["user_public_id"],
-                    context["active_role_id"],
-                    context["namespace"],
-                    context["generation"],
-                    context["site_generation"],
-                    key_digest,
-                    ttl_remaining,
-                    age_seconds,
-                    cache_alias,
-                    context["site_cache_alias"],
-                    self.get_request_log_suffix(context),
-                )
-
-                response = Response(
-                    cached_payload["data"],
-                    status=cached_payload.get("status", 200),
-                )
-                self.add_scope_cache_headers(
-                    response,
+                return self.build_cached_scope_response(
+                    cached_payload,
                     status="HIT",
                     context=context,
-                    ttl_remaining=ttl_remaining,
-                    age_seconds=age_seconds,
                 )
-                return response
 
             logger.info(
                 "SCOPE CACHE PAYLOAD EXPIRED BY TIMESTAMP | "
@@ -195,18 +306,77 @@ class UserScopeListCacheMixin:
                     cache_key,
                 )
 
+        lock_key = self.build_scope_cache_lock_key(cache_key)
+        stale_key = self.build_scope_cache_stale_key(context)
+        lock_token = self.acquire_scope_cache_build_lock(
+            backend,
+            lock_key,
+            context,
+        )
+
+        if lock_token is None:
+            # Another worker is already rebuilding this key. Serve the previous
+            # payload inside the stale window, otherwise wait briefly for the
+            # fill before falling back to the database ourselves.
+            stale_payload = self.read_stale_scope_payload(
+                backend,
+                stale_key,
+                context,
+            )
+            if stale_payload is not None:
+                return self.build_cached_scope_response(
+                    stale_payload,
+                    status="STALE",
+                    context=context,
+                )
+
+            filled_payload = self.wait_for_scope_cache_fill(
+                backend,
+                cache_key,
+                context,
+            )
+            if filled_payload is not None:
+                return self.build_cached_scope_response(
+                    filled_payload,
+                    status="HIT_AFTER_WAIT",
+                    context=context,
+                )
+
         try:
-            previously_created = bool(backend.get(marker_key, False))
-        except Exception:
-            previously_created = False
-            logger.exception(
-                "SCOPE CACHE MARKER READ FAILED | user_public_id=%s "
-                "namespace=%s request_digest=%s cache_alias=%s",
-                context["user_public_id"],
-                context["namespace"],
-                key_digest,
-                cache_alias,
+            return self.fill_scope_cache(
+                request,
+                args,
+                kwargs,
+                backend=backend,
+                cache_key=cache_key,
+                marker_key=marker_key,
+                stale_key=stale_key,
+                previously_created=previously_created,
+                context=context,
             )
+        finally:
+            if lock_token is not None:
+                self.release_scope_cache_build_lock(
+                    backend,
+                    lock_key,
+                    lock_token,
+                )
+
+    def fill_scope_cache(
+        self,
+        request,
+        args,
+        kwargs,
+        *,
+        backend,
+        cache_key: str,
+        marker_key: str,
+        stale_key: str,
+        previously_created: bool,
+        context: dict[str, Any],
+    ):
+        cache_alias = context["cache_alias"]
+        key_digest = context["request_digest"]
 
         miss_status = "EXPIRED" if previously_created else "COLD_MISS"
 
@@ -263,14 +433,34 @@ class UserScopeListCacheMixin:
         timeout = self.get_scope_cache_timeout()
         expires_at = created_at + timedelta(seconds=timeout)
         payload = {
-            "data": response.data,
             "status": response.status_code,
             "created_at": created_at.isoformat(),
             "expires_at": expires_at.isoformat(),
+            **self.build_scope_cache_body(request, response),
         }
 
         try:
-            backend.set(cache_key, payload, timeout=timeout)
+            encoded = CachePayloadCodec.encode(payload)
+            context["payload_bytes"] = encoded.size
+            context["payload_raw_bytes"] = encoded.raw_size
+
+            # Payload, expiry marker and stale copy go out in one pipeline.
+            entries = [
+                (cache_key, encoded.data, timeout),
+                (
+                    marker_key,
+                    True,
+                    timeout + self.get_scope_cache_marker_grace(),
+                ),
+            ]
+
+            stale_seconds = self.get_scope_cache_stale_seconds()
+            if stale_seconds:
+                entries.append(
+                    (stale_key, encoded.data, timeout + stale_seconds)
+                )
+
+            backend.set_entries(entries)
         except Exception:
             logger.exception(
                 "SCOPE CACHE STORE FAILED | user_public_id=%s "
@@ -291,24 +481,6 @@ class UserScopeListCacheMixin:
             )
             return response
 
-        try:
-            backend.set(
-                marker_key,
-                True,
-                timeout=timeout + self.get_scope_cache_marker_grace(),
-            )
-        except Exception:
-            # The response was cached successfully. A marker failure only means
-            # a later miss may be labelled COLD_MISS instead of EXPIRED.
-            logger.exception(
-                "SCOPE CACHE MARKER STORE FAILED | user_public_id=%s "
-                "namespace=%s request_digest=%s cache_alias=%s",
-                context["user_public_id"],
-                context["namespace"],
-                key_digest,
-                cache_alias,
-            )
-
         logger.info(
             "SCOPE CACHE CREATED | user_public_id=%s active_role_id=%s "
             "namespace=%s generation=%s site_generation=%s request_digest=%s "
@@ -339,6 +511,187 @@ class UserScopeListCacheMixin:
         )
         return response
 
+    def build_cached_scope_response(
+        self,
+        payload: dict[str, Any],
+        *,
+        status: str,
+        context: dict[str, Any],
+    ) -> HttpResponseBase:
+        ttl_remaining = self.get_payload_ttl_remaining(payload)
+        age_seconds = self.get_payload_age_seconds(payload)
+
+        logger.info(
+            "SCOPE CACHE %s | user_public_id=%s active_role_id=%s "
+            "namespace=%s generation=%s site_generation=%s request_digest=%s "
+            "ttl_remaining=%s age_seconds=%s cache_alias=%s site_cache_alias=%s%s",
+            status,
+            context["user_public_id"],
+            context["active_role_id"],
+            context["namespace"],
+            context["generation"],
+            context["site_generation"],
+            context["request_digest"],
+            ttl_remaining,
+            age_seconds,
+            context["cache_alias"],
+            context["site_cache_alias"],
+            self.get_request_log_suffix(context),
+        )
+
+        if "rendered" not in payload:
+            response = Response(
+                payload["data"],
+                status=payload.get("status", 200),
+            )
+        elif self.get_passthrough_renderer(self.request) is not None:
+            # Already-rendered JSON: skip serializer and renderer work.
+            response = HttpResponse(
+                payload["rendered"].encode("utf-8"),
+                status=payload.get("status", 200),
+                content_type=payload["content_type"],
+            )
+        else:
+            # Same key, different representation (e.g. ``; indent=4``);
+            # hand the parsed data back to normal content negotiation.
+            response = Response(
+                json.loads(payload["rendered"]),
+                status=payload.get("status", 200),
+            )
+
+        self.add_scope_cache_headers(
+            response,
+            status=status,
+            context=context,
+            ttl_remaining=ttl_remaining,
+            age_seconds=age_seconds,
+        )
+        return response
+
+    # =====================================================
+    # Single-flight fill / stale-while-revalidate
+    # =====================================================
+
+    def acquire_scope_cache_build_lock(
+        self,
+        backend,
+        lock_key: str,
+        context: dict[str, Any],
+    ) -> str | None:
+        """Take the build lock; return its owner token, or ``None``."""
+
+        token = secrets.token_hex(16)
+
+        try:
+            if backend.add(
+                lock_key,
+                token,
+                timeout=self.get_scope_cache_lock_timeout(),
+            ):
+                return token
+            return None
+        except Exception:
+            logger.exception(
+                "SCOPE CACHE LOCK FAILED | user_public_id=%s namespace=%s "
+                "request_digest=%s cache_alias=%s",
+                context["user_public_id"],
+                context["namespace"],
+                context["request_digest"],
+                context["cache_alias"],
+            )
+            return None
+
+    def release_scope_cache_build_lock(
+        self,
+        backend,
+        lock_key: str,
+        token: str,
+    ) -> None:
+        """Release the lock only if it is still held under ``token``.
+
+        A fill outliving the lock timeout must not delete a lock another
+        worker has since acquired.
+        """
+
+        try:
+            backend.delete_if_value(lock_key, token)
+        except Exception:
+            logger.exception(
+                "SCOPE CACHE LOCK RELEASE FAILED | key=%s",
+                lock_key,
+            )
+
+    def wait_for_scope_cache_fill(
+        self,
+        backend,
+        cache_key: str,
+        context: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Poll for the lock holder's payload for up to the lock wait."""
+
+        wait_ms = self.get_scope_cache_lock_wait_ms()
+        deadline = time.monotonic() + (wait_ms / 1000)
+
+        while time.monotonic() < deadline:
+            time.sleep(0.025)
+            try:
+                payload = self.load_scope_cache_payload(
+                    backend.get(cache_key, _CACHE_MISS),
+                    context,
+                )
+            except Exception:
+                break
+
+            if self.is_valid_cache_payload(payload):
+                return payload
+
+        logger.info(
+            "SCOPE CACHE LOCK WAIT EXPIRED | user_public_id=%s namespace=%s "
+            "request_digest=%s wait_ms=%s; executing database-backed list",
+            context["user_public_id"],
+            context["namespace"],
+            context["request_digest"],
+            wait_ms,
+        )
+        return None
+
+    def read_stale_scope_payload(
+        self,
+        backend,
+        stale_key: str,
+        context: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        stale_seconds = self.get_scope_cache_stale_seconds()
+        if not stale_seconds:
+            return None
+
+        try:
+            payload = self.load_scope_cache_payload(
+                backend.get(stale_key, _CACHE_MISS),
+                context,
+            )
+        except Exception:
+            logger.exception(
+                "SCOPE CACHE STALE READ FAILED | user_public_id=%s "
+                "namespace=%s request_digest=%s",
+                context["user_public_id"],
+                context["namespace"],
+                context["request_digest"],
+            )
+            return None
+
+        if not self.is_valid_cache_payload(payload):
+            return None
+
+        expires_at = self.parse_payload_datetime(payload, "expires_at")
+        if (
+            expires_at is None
+            or timezone.now() > expires_at + timedelta(seconds=stale_seconds)
+        ):
+            return None
+
+        return payload
+
     def should_use_scope_cache(self, request) -> bool:
         user = request.user
         return bool(
@@ -388,6 +741,30 @@ class UserScopeListCacheMixin:
         )
         return max(0, int(raw_grace))
 
+    def get_scope_cache_lock_timeout(self) -> int:
+        raw_timeout = (
+            self.scope_cache_lock_timeout
+            if self.scope_cache_lock_timeout is not None
+            else getattr(settings, "USER_SCOPE_CACHE_LOCK_TIMEOUT", 30)
+        )
+        return max(1, int(raw_timeout))
+
+    def get_scope_cache_lock_wait_ms(self) -> int:
+        raw_wait = (
+            self.scope_cache_lock_wait_ms
+            if self.scope_cache_lock_wait_ms is not None
+            else getattr(settings, "USER_SCOPE_CACHE_LOCK_WAIT_MS", 500)
+        )
+        return max(0, int(raw_wait))
+
+    def get_scope_cache_stale_seconds(self) -> int:
+        raw_stale = (
+            self.scope_cache_stale_seconds
+            if self.scope_cache_stale_seconds is not None
+            else getattr(settings, "USER_SCOPE_CACHE_STALE_SECONDS", 0)
+        )
+        return max(0, int(raw_stale))
+
     def should_add_debug_headers(self) -> bool:
         if self.scope_cache_debug_headers is not None:
             return bool(self.scope_cache_debug_headers)
@@ -399,6 +776,13 @@ class UserScopeListCacheMixin:
             )
         )
 
+    def should_use_rendered_passthrough(self) -> bool:
+        if self.scope_cache_rendered_passthrough is not None:
+            return bool(self.scope_cache_rendered_passthrough)
+        return bool(
+            getattr(settings, "USER_SCOPE_CACHE_RENDERED_PASSTHROUGH", True)
+        )
+
     def should_count_database_queries(self) -> bool:
         if self.scope_cache_count_database_queries is not None:
             return bool(self.scope_cache_count_database_queries)
@@ -426,17 +810,17 @@ class UserScopeListCacheMixin:
         request,
         *,
         cache_alias: str,
+        backend=None,
     ) -> dict[str, Any]:
         user = request.user
         user_public_id = str(user.public_id)
         active_role_id = user.active_role_id or "none"
-        generation = UserScopeCacheService.get_generation(
+        site_cache_alias = SiteOptionCacheService.get_cache_alias()
+        generation, site_generation = self.get_scope_cache_generations(
             user_public_id,
             cache_alias=cache_alias,
-        )
-        site_cache_alias = SiteOptionCacheService.get_cache_alias()
-        site_generation = SiteOptionCacheService.get_generation(
-            cache_alias=site_cache_alias,
+            site_cache_alias=site_cache_alias,
+            backend=backend,
         )
         namespace = self.get_scope_cache_namespace()
 
@@ -480,8 +864,88 @@ class UserScopeListCacheMixin:
             "request_digest": request_digest,
             "request_shape": request_shape,
             "cache_alias": cache_alias,
+            "cache_round_trips": getattr(backend, "counter", None),
         }
 
+    def get_scope_cache_generations(
+        self,
+        user_public_id: str,
+        *,
+        cache_alias: str,
+        site_cache_alias: str,
+        backend=None,
+    ) -> tuple[str, str]:
+        """Resolve the user and site generations in at most one round trip.
+
+        Tokens held by the local ``GenerationTokenCache`` tier cost nothing.
+        When both must come from the same cache they are fetched with one
+        MGET; anything still absent is created by the owning service.
+        """
+
+        user_key = UserScopeCacheService.generation_key(user_public_id)
+        site_key = SiteOptionCacheService.GENERATION_KEY
+
+        generation = GenerationTokenCache.get(cache_alias, user_key)
+        site_generation = GenerationTokenCache.get(site_cache_alias, site_key)
+
+        if (
+            backend is not None
+            and generation is None
+            and site_generation is None
+            and site_cache_alias == cache_alias
+        ):
+            epoch = GenerationTokenCache.epoch()
+
+            try:
+                values = backend.get_many([user_key, site_key])
+            except Exception as exc:
+                logger.exception(
+                    "SCOPE CACHE GENERATION READ FAILED | user_public_id=%s "
+                    "cache_alias=%s",
+                    user_public_id,
+                    cache_alias,
+                )
+                raise UserScopeCacheUnavailable(
+                    "Unable to read the scope cache generations."
+                ) from exc
+
+            if values.get(user_key):
+                generation = str(values[user_key])
+                GenerationTokenCache.set(
+                    cache_alias,
+                    user_key,
+                    generation,
+                    epoch=epoch,
+                )
+
+            if values.get(site_key):
+                site_generation = str(values[site_key])
+                GenerationTokenCache.set(
+                    site_cache_alias,
+                    site_key,
+                    site_generation,
+                    epoch=epoch,
+                )
+
+        if generation is None:
+            generation = UserScopeCacheService.get_generation(
+                user_public_id,
+                cache_alias=cache_alias,
+                backend=backend,
+            )
+
+        if site_generation is None:
+            site_generation = SiteOptionCacheService.get_generation(
+                cache_alias=site_cache_alias,
+                backend=(
+                    backend
+                    if site_cache_alias == cache_alias
+                    else None
+                ),
+            )
+
+        return generation, site_generation
+
     def build_fallback_context(self, request) -> dict[str, Any]:
         return {
             "user_public_id": str(getattr(request.user, "public_id", "unknown")),
@@ -509,8 +973,108 @@ class UserScopeListCacheMixin:
     def build_scope_cache_marker_key(self, cache_key: str) -> str:
         return f"{cache_key}:previously-created"
 
+    def build_scope_cache_lock_key(self, cache_key: str) -> str:
+        return f"{cache_key}:build-lock"
+
+    def build_scope_cache_stale_key(self, context: dict[str, Any]) -> str:
+        """Generation-free key holding the last payload for stale reads.
+
+        The user and active role stay in the key, so a stale read can only
+        return data the same identity was already served.
+        """
+
+        return (
+            f"{self.scope_cache_key_prefix}:stale:"
+            f"user:{context['user_public_id']}:"
+            f"active-role:{context['active_role_id']}:"
+            f"namespace:{context['namespace']}:"
+            f"request:{context['request_digest']}"
+        )
+
+    def get_passthrough_renderer(self, request) -> JSONRenderer | None:
+        """Return the JSON renderer when cached bytes can be sent verbatim.
+
+        Only plain ``application/json`` qualifies: media type parameters such
+        as ``indent`` change the rendered output but not the cache key.
+        """
+
+        if not self.should_use_rendered_passthrough():
+            return None
+
+        renderer = getattr(request, "accepted_renderer", None)
+        media_type = getattr(request, "accepted_media_type", None)
+
+        if (
+            not isinstance(renderer, JSONRenderer)
+            or renderer.format != "json"
+            or media_type != renderer.media_type
+        ):
+            return None
+
+        return renderer
+
+    def build_scope_cache_body(
+        self,
+        request,
+        response: Response,
+    ) -> dict[str, Any]:
+        renderer = self.get_passthrough_renderer(request)
+
+        if renderer is None:
+            return {"data": response.data}
+
+        rendered = renderer.render(
+            response.data,
+            request.accepted_media_type,
+            self.get_renderer_context(),
+        )
+        content_type = (
+            f"{renderer.media_type}; charset={renderer.charset}"
+            if renderer.charset
+            else renderer.media_type
+        )
+
+        return {
+            "rendered": rendered.decode("utf-8"),
+            "content_type": content_type,
+        }
+
+    def load_scope_cache_payload(
+        self,
+        value: Any,
+        context: dict[str, Any],
+    ) -> Any:
+        """Decode a stored value; undecodable entries come back as ``None``.
+
+        Plain dictionaries written before the codec was introduced are
+        returned unchanged.
+        """
+
+        if not CachePayloadCodec.is_encoded(value):
+            return value
+
+        try:
+            payload = CachePayloadCodec.decode(value)
+        except CachePayloadDecodeError:
+            logger.warning(
+                "SCOPE CACHE PAYLOAD DECODE FAILED | user_public_id=%s "
+                "namespace=%s request_digest=%s payload_bytes=%s",
+                context["user_public_id"],
+                context["namespace"],
+                context["request_digest"],
+                len(value),
+                exc_info=True,
+            )
+            return None
+
+        context["payload_bytes"] = len(value)
+        return payload
+
     def is_valid_cache_payload(self, payload: Any) -> bool:
-        return isinstance(payload, dict) and "data" in payload
+        return isinstance(payload, dict) and (
+            "data" in payload
+            or ("rendered" in payload and "content_type" in payload)
+        )
 
     def parse_payload_datetime(
         self,
@@ -619,7 +1183,7 @@ class UserScopeListCacheMixin:
 
     def add_scope_cache_headers(
         self,
-        response: Response,
+        response: HttpResponseBase,
         *,
         status: str,
         context: dict[str, Any],
@@ -653,3 +1217,16 @@ class UserScopeListCacheMixin:
             response["X-User-Scope-Cache-SQL-Queries"] = str(sql_query_count)
         if elapsed_ms is not None:
             response["X-User-Scope-Cache-Elapsed-MS"] = str(elapsed_ms)
+
+        if context.get("payload_bytes") is not None:
+            response["X-User-Scope-Cache-Payload-Bytes"] = str(
+                context["payload_bytes"]
+            )
+        if context.get("payload_raw_bytes") is not None:
+            response["X-User-Scope-Cache-Payload-Raw-Bytes"] = str(
+                context["payload_raw_bytes"]
+            )
+
+        round_trips = context.get("cache_round_trips")
+        if round_trips is not None:
+            response["X-User-Scope-Cache-Round-Trips"] = str(round_trips.count)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from datetime import timedelta
 
-from django.db.models import F, Q
+from django.db.models import Count, F, Q
 from django.utils import timezone
 
+from assets.selectors.aggregates import aggregate, summarize_equipment
 from assignments.models.asset_assignment import EquipmentAssignment, ReturnRequest
 from assets.models.assets import (
     Accessory,
@@ -49,11 +50,13 @@ class AreaDashboardMixin:
     def build_dashboard(self, obj):
         rooms = self.get_rooms(obj.public_id)
 
-        equipment = Equipment.objects.filter(
-            room__in=rooms,
-            is_deleted=False,
+        equipment = summarize_equipment(
+            Equipment.objects.filter(
+                room__in=rooms,
+                is_deleted=False,
+            )
         )
-        total_equipment = equipment.count()
+        total_equipment = equipment["total"]
 
         assigned_equipment = EquipmentAssignment.objects.filter(
             equipment__room__in=rooms,
@@ -68,28 +71,34 @@ class AreaDashboardMixin:
             1,
         )
 
-        damaged_equipment = equipment.filter(
-            status__in=(
-                EquipmentStatus.DAMAGED,
-                EquipmentStatus.UNDER_REPAIR,
-            )
-        ).count()
-        lost_or_condemned = equipment.filter(
-            status__in=(
-                EquipmentStatus.LOST,
-                EquipmentStatus.CONDEMNED,
-            )
-        ).count()
+        damaged_equipment = (
+            equipment[EquipmentStatus.DAMAGED]
+            + equipment[EquipmentStatus.UNDER_REPAIR]
+        )
+        lost_or_condemned = (
+            equipment[EquipmentStatus.LOST]
+            + equipment[EquipmentStatus.CONDEMNED]
+        )
 
-        consumables = Consumable.objects.filter(
-            room__in=rooms,
-            is_deleted=False,
+        consumables = aggregate(
+            Consumable.objects.filter(
+                room__in=rooms,
+                is_deleted=False,
+            ),
+            {
+                "total": Count("id"),
+                "low_stock": Count(
+                    "id",
+                    filter=Q(
+                        quantity__gt=0,
+                        quantity__lte=F("low_stock_threshold"),
+                    ),
+                ),
+                "out_of_stock": Count("id", filter=Q(quantity=0)),
+            },
         )
-        low_stock = consumables.filter(
-            quantity__gt=0,
-            quantity__lte=F("low_stock_threshold"),
-        ).count()
-        out_of_stock = consumables.filter(quantity=0).count()
+        low_stock = consumables["low_stock"]
+        out_of_stock = consumables["out_of_stock"]
 
         accessories = Accessory.objects.filter(
             room__in=rooms,
@@ -126,7 +135,7 @@ class AreaDashboardMixin:
                     "equipment": total_equipment,
                     "accessories": accessories.count(),
                     "components": components.count(),
-                    "consumables": consumables.count(),
+                    "consumables": consumables["total"],
                 },
                 "equipment_utilization": {
                     "assigned": assigned_equipment,
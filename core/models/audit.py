@@ -51,8 +51,14 @@ class AuditLog(PublicIDModel):
         indexes = [
             models.Index(fields=["event_type"]),
             models.Index(fields=["created_at"]),
-            models.Index(fields=["user"]),
             models.Index(fields=["target_model", "target_id"]),
+            # Audit history reports and scoped audit lists filter by actor
+            # or site within a created_at window.
+            models.Index(fields=["user", "created_at"], name="audit_log_user_created_idx"),
+            models.Index(fields=["user_public_id", "created_at"], name="audit_log_user_pid_created_idx"),
+            models.Index(fields=["room", "created_at"], name="audit_log_room_created_idx"),
+            models.Index(fields=["location", "created_at"], name="audit_log_location_created_idx"),
+            models.Index(fields=["department", "created_at"], name="audit_log_dept_created_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -55,6 +55,10 @@ class SecuritySettings(models.Model):
 
         cache.delete(self.CACHE_KEY)
 
+        from core.security_policy import invalidate_security_policy_cache
+
+        invalidate_security_policy_cache()
+
     def delete(self, *args, **kwargs):
         """
         Prevent deletion of settings.
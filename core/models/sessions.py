@@ -4,6 +4,26 @@ from django.db import models
 from django.utils import timezone
 from django.conf import settings
 
+from core.services.security.session_state import SessionStateCache
+
+
+class UserSessionQuerySet(models.QuerySet):
+
+    def set_status(self, status: str) -> int:
+        """
+        Update the status of every matching session and write it through to
+        the session state cache. Use instead of ``update(status=...)``.
+        """
+
+        session_ids = list(self.values_list("id", flat=True))
+
+        if not session_ids:
+            return 0
+
+        updated = self.filter(id__in=session_ids).update(status=status)
+        SessionStateCache.mark(session_ids, status)
+        return updated
+
 
 class UserSession(models.Model):
     class Status(models.TextChoices):
@@ -27,6 +47,8 @@ class UserSession(models.Model):
     device_name = models.CharField( max_length=128, null=True, blank=True, )
     last_ip_address = models.GenericIPAddressField( null=True, blank=True, )
 
+    objects = UserSessionQuerySet.as_manager()
+
     class Meta:
         indexes = [
             models.Index(fields=["user"]),
@@ -37,6 +59,13 @@ class UserSession(models.Model):
             models.Index(fields=["previous_refresh_token_hash"]),
         ]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"status", "expires_at"} & set(update_fields):
+            SessionStateCache.store(self)
+
     def is_valid(self) -> bool:
         now = timezone.now()
         return (self.status == self.Status.ACTIVE and self.expires_at >= now)
@@ -1,4 +1,14 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination as DRFBasePagination
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 class OptionalPagination(PageNumberPagination):
     """
@@ -36,4 +46,278 @@ class FlexiblePagination(PageNumberPagination):
         ):
             return None
 
-        return super().paginate_queryset(queryset, request, view)
\ No newline at end of file
+        self.keyset = self.get_keyset_paginator(request, view)
+
+        if self.keyset is not None:
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if getattr(self, "keyset", None) is not None:
+            return self.keyset.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
+
+    def get_keyset_paginator(self, request, view):
+        """
+        Switch to keyset pagination for views that declare
+        ``keyset_ordering`` when the client asks with ?pagination=keyset
+        (or follows a cursor link). Page-number mode stays the default.
+        """
+        if not getattr(view, "keyset_ordering", None):
+            return None
+
+        mode = (request.query_params.get("pagination") or "").lower()
+
+        if mode != "keyset" and KeysetPagination.cursor_query_param not in request.query_params:
+            return None
+
+        return KeysetPagination()
+
+
+class KeysetPagination(DRFBasePagination):
+    """
+    Keyset (cursor) pagination on ``(ordering field, id)``.
+
+    Each page is read with ``WHERE (field, id) < (last field, last id)`` on
+    an index instead of ``OFFSET``, so page 10,000 costs the same as page 1
+    and rows inserted while a client scrolls never shift it onto duplicates.
+
+    The view chooses the ordering with ``keyset_ordering`` (``"-created_at"``,
+    ``"-id"``, ...); the field must be non-null. Cursors are opaque,
+    deterministic strings, so a cursor request has a stable scope cache key.
+
+    Totals are not computed unless asked for:
+
+    - ``?count=approx`` returns the planner's row estimate (PostgreSQL), or
+      an exact count when the estimate is small;
+    - ``?count=exact`` runs ``COUNT(*)``.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    default_keyset_ordering = "-id"
+
+    # Below this planner estimate an exact COUNT(*) is cheap enough.
+    exact_count_threshold = 1000
+
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        self.field_name, self.descending = self.get_keyset_ordering(view)
+        self.field = queryset.model._meta.get_field(self.field_name)
+
+        self.cursor = self.decode_cursor(request)
+        self.count, self.count_is_estimate = self.get_count(queryset, request)
+
+        reverse = bool(self.cursor and self.cursor["reverse"])
+        page_qs = queryset.order_by(*self.get_order_by(reverse=reverse))
+
+        if self.cursor is not None:
+            page_qs = page_qs.filter(self.get_keyset_q(self.cursor))
+
+        rows = list(page_qs[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        payload = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+
+        if self.count is not None:
+            payload["count"] = self.count
+            payload["count_is_estimate"] = self.count_is_estimate
+
+        payload["results"] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "count": {"type": "integer"},
+                "count_is_estimate": {"type": "boolean"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    # -------------------------------------------------
+    # Ordering
+    # -------------------------------------------------
+
+    def get_keyset_ordering(self, view):
+        ordering = getattr(view, "keyset_ordering", None) or self.default_keyset_ordering
+
+        descending = ordering.startswith("-")
+        return ordering.lstrip("-"), descending
+
+    def get_order_by(self, *, reverse=False):
+        descending = self.descending != reverse
+        prefix = "-" if descending else ""
+
+        if self.field.primary_key:
+            return [f"{prefix}pk"]
+
+        return [f"{prefix}{self.field_name}", f"{prefix}pk"]
+
+    def get_keyset_q(self, cursor):
+        descending = self.descending != cursor["reverse"]
+        op = "lt" if descending else "gt"
+
+        pk = cursor["pk"]
+
+        if self.field.primary_key:
+            return Q(**{f"pk__{op}": pk})
+
+        value = self.field.to_python(cursor["value"])
+
+        # The leading inclusive bound lets the planner range-scan the
+        # (field, id) index; the OR only breaks ties inside it.
+        return Q(**{f"{self.field_name}__{op}e": value}) & (
+            Q(**{f"{self.field_name}__{op}": value})
+            | Q(**{self.field_name: value, f"pk__{op}": pk})
+        )
+
+    # -------------------------------------------------
+    # Cursors
+    # -------------------------------------------------
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+            if not isinstance(data, dict):
+                raise ValueError("cursor payload must be an object")
+
+            cursor = {
+                "value": data.get("v"),
+                "pk": self.field.model._meta.pk.to_python(data["p"]),
+                "reverse": bool(data.get("r", False)),
+            }
+
+            if not self.field.primary_key:
+                if cursor["value"] is None:
+                    raise ValueError("cursor is missing its ordering value")
+
+                self.field.to_python(cursor["value"])
+        except (
+            AttributeError,
+            TypeError,
+            ValueError,
+            KeyError,
+            UnicodeEncodeError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def encode_cursor(self, obj, *, reverse):
+        data = {"p": obj.pk, "r": int(reverse)}
+
+        if not self.field.primary_key:
+            value = getattr(obj, self.field.attname)
+            data["v"] = value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).decode("ascii").rstrip("=")
+
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    # -------------------------------------------------
+    # Counts
+    # -------------------------------------------------
+
+    def get_count(self, queryset, request):
+        mode = (request.query_params.get(self.count_query_param) or "").lower()
+
+        if mode == "exact":
+            return queryset.order_by().count(), False
+
+        if mode == "approx":
+            estimate = self.estimate_count(queryset)
+
+            if estimate is None or estimate < self.exact_count_threshold:
+                return queryset.order_by().count(), False
+
+            return estimate, True
+
+        return None, False
+
+    def estimate_count(self, queryset):
+        """Planner row estimate for ``queryset``; ``None`` if unavailable."""
+
+        connection = connections[queryset.db]
+
+        if connection.vendor != "postgresql":
+            return None
+
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+        except DatabaseError:
+            return None
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -5,48 +5,181 @@ Provides cached access to runtime-configurable security settings
 with safe fallbacks to Django settings.
 
 Used by authentication, session management, and login flows.
+
+Each process keeps an immutable ``SecurityPolicy`` snapshot of the
+``SecuritySettings`` row, tagged with the policy version it was loaded for.
+The version is a generation token held in the process-local
+``GenerationTokenCache`` tier, so resolving the policy normally costs no
+network call. Saving ``SecuritySettings`` rotates the version and broadcasts
+it over the generation pub/sub channel; every worker reloads on its next
+read.
 """
 
+import logging
+import threading
+from dataclasses import dataclass, fields
 from datetime import timedelta
+from uuid import uuid4
+
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import caches
+from django.db import transaction
 
 from core.models.security import SecuritySettings
+from core.services.generation_cache import GenerationTokenCache
+
+logger = logging.getLogger("arms.security_policy")
 
 
 # ---------------------------------------------------------
 # Cache configuration
 # ---------------------------------------------------------
 
-CACHE_KEY = "security_policy_settings"
-CACHE_TTL = 300  # seconds (5 minutes)
+VERSION_KEY = "security-policy:v1:version"
+
+
+@dataclass(frozen=True, slots=True)
+class SecurityPolicy:
+    """
+    Snapshot of ``SecuritySettings``. Without a settings row ``configured``
+    is False and the fields hold the model defaults.
+    """
+
+    version: str | None
+    configured: bool
+    session_idle_minutes: int
+    session_absolute_hours: int
+    max_concurrent_sessions: int
+    revoke_sessions_on_password_change: bool
+    enable_account_lockout: bool
+    lockout_attempts: int
+    lockout_duration_minutes: int
+    reset_failed_attempts_after_minutes: int
+    permanent_lock_threshold: int
+
+    @classmethod
+    def from_settings(cls, sec, *, version):
+        return cls(
+            version=version,
+            configured=sec.pk is not None,
+            **{
+                field.name: getattr(sec, field.name)
+                for field in fields(cls)
+                if field.name not in ("version", "configured")
+            },
+        )
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
 
 
 # ---------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------
 
+def _get_cache_alias():
+    return settings.SECURITY_POLICY_CACHE_ALIAS
+
+
+def _get_version():
+    """
+    Current policy version, from the local tier when possible. Returns
+    None if the cache is unavailable.
+    """
+    alias = _get_cache_alias()
+
+    version = GenerationTokenCache.get(alias, VERSION_KEY)
+    if version is not None:
+        return version
+
+    epoch = GenerationTokenCache.epoch()
+
+    try:
+        backend = caches[alias]
+        version = backend.get(VERSION_KEY)
+
+        if not version:
+            backend.add(VERSION_KEY, uuid4().hex, timeout=None)
+            version = backend.get(VERSION_KEY)
+    except Exception:
+        logger.warning(
+            "SECURITY POLICY VERSION READ FAILED | cache_alias=%s",
+            alias,
+            exc_info=True,
+        )
+        return None
+
+    if not version:
+        return None
+
+    GenerationTokenCache.set(alias, VERSION_KEY, version, epoch=epoch)
+    return str(version)
+
+
+def get_security_policy():
+    """
+    Return the current ``SecurityPolicy``, reloading it from the database
+    only when the policy version has changed.
+    """
+    global _snapshot
+
+    version = _get_version()
+    policy = _snapshot
+
+    if version is not None and policy is not None and policy.version == version:
+        return policy
+
+    sec = SecuritySettings.objects.first() or SecuritySettings()
+    policy = SecurityPolicy.from_settings(sec, version=version)
+
+    if version is not None:
+        with _snapshot_lock:
+            _snapshot = policy
+
+    return policy
+
+
 def _get_security_settings():
     """
-    Fetch SecuritySettings from cache or database.
+    Configured security policy, or None when no settings row exists.
     """
-    sec = cache.get(CACHE_KEY)
+    sec = get_security_policy()
+
+    return sec if sec.configured else None
 
-    if sec is not None:
-        return sec
 
-    sec = SecuritySettings.objects.first()
-    cache.set(CACHE_KEY, sec, CACHE_TTL)
+def _rotate_version():
+    global _snapshot
 
-    return sec
+    alias = _get_cache_alias()
+
+    with _snapshot_lock:
+        _snapshot = None
+
+    try:
+        caches[alias].set(VERSION_KEY, uuid4().hex, timeout=None)
+    except Exception:
+        # Other workers keep their snapshot until their local version
+        # entry expires (GENERATION_LOCAL_CACHE_TTL).
+        logger.exception(
+            "SECURITY POLICY VERSION ROTATE FAILED | cache_alias=%s",
+            alias,
+        )
+
+    GenerationTokenCache.invalidate(alias, VERSION_KEY)
 
 
 def invalidate_security_policy_cache():
     """
-    Clear cached security policy.
-    Call this when SecuritySettings is updated.
+    Rotate the policy version so every worker reloads the policy.
+    Called by ``SecuritySettings.save()``; rotates again on commit so no
+    worker keeps a snapshot read before the change was visible.
     """
-    cache.delete(CACHE_KEY)
+    _rotate_version()
+
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(_rotate_version)
 
 
 # ---------------------------------------------------------
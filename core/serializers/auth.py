@@ -5,6 +5,7 @@ from core.models.security import PasswordResetEvent, SecuritySettings
 from core.models.sessions import UserSession
 from users.models.users import User
 from core.models.audit import AuditLog, SiteNameChangeHistory
+from core.services.audit_writer import AuditLogWriter
 from django.contrib.auth import password_validation
 from core.utils.tokens import PasswordResetToken
 from core.tasks import admin_reset_user_password
@@ -96,10 +97,10 @@ class AdminSetTemporaryPasswordSerializer(serializers.Serializer):
             UserSession.objects.filter(
                 user=user,
                 status=UserSession.Status.ACTIVE,
-            ).update(status=UserSession.Status.REVOKED)
+            ).set_status(UserSession.Status.REVOKED)
 
         # Audit
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             user=admin,
             user_public_id=admin.public_id,
             user_email=admin.email,
@@ -208,7 +209,7 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
             revoked_count = UserSession.objects.filter(
                 user=user,
                 status=UserSession.Status.ACTIVE
-            ).update(status=UserSession.Status.REVOKED)
+            ).set_status(UserSession.Status.REVOKED)
 
         view = self.context.get("view")
 
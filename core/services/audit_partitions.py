@@ -0,0 +1,382 @@
+"""Monthly audit log partitions and archiving.
+
+On PostgreSQL ``core_auditlog`` is range-partitioned on ``created_at`` (see
+``core/migrations/0007_partition_auditlog.py``): one ``core_auditlog_pYYYY_MM``
+partition per month, plus ``core_auditlog_default`` for rows that fall
+outside the prepared months. Audit queries bound ``created_at``, so the
+planner only visits the months they cover and a 30-day window costs the same
+with ten years of history as with one.
+
+- ``AuditLogPartitions.ensure_partitions`` creates upcoming months before
+  rows arrive; ``core.tasks.cleanup.maintain_audit_log_partitions`` runs it
+  daily.
+- ``AuditLogPartitions.archive_before`` writes every whole month older than
+  a cutoff to ``auditlog_YYYY_MM.csv.gz`` and removes it from the database.
+  Month partitions are detached, exported with ``COPY`` and dropped as a
+  unit; remaining rows (other database vendors, or rows held by the default
+  partition) are exported through the ORM and deleted in batches.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.db import DatabaseError, connection, transaction
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from core.models.audit import AuditLog
+from core.utils.task_helpers import batched_delete
+
+logger = logging.getLogger("arms.audit")
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedMonth:
+    month: date
+    rows: int
+    path: Path
+    partition: bool
+
+
+class AuditLogPartitions:
+    """Create, inspect and archive the monthly audit log partitions."""
+
+    TABLE = AuditLog._meta.db_table
+    PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+    # =====================================================
+    # Months
+    # =====================================================
+
+    @staticmethod
+    def month_start(value: datetime) -> datetime:
+        value = value.astimezone(dt_timezone.utc)
+        return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def add_months(month: datetime, count: int) -> datetime:
+        index = month.year * 12 + month.month - 1 + count
+        return month.replace(year=index // 12, month=index % 12 + 1)
+
+    @classmethod
+    def partition_name(cls, month: datetime) -> str:
+        return f"{cls.TABLE}_p{month:%Y_%m}"
+
+    # =====================================================
+    # Partitions
+    # =====================================================
+
+    @classmethod
+    def is_partitioned(cls) -> bool:
+        if connection.vendor != "postgresql":
+            return False
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(%s)",
+                [cls.TABLE],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def partition_months(cls) -> list[datetime]:
+        """Months that have their own partition, oldest first."""
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(%s)",
+                [cls.TABLE],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        months = []
+        for name in names:
+            match = cls.PARTITION_NAME.match(name)
+            if match:
+                months.append(
+                    datetime(
+                        int(match[1]),
+                        int(match[2]),
+                        1,
+                        tzinfo=dt_timezone.utc,
+                    )
+                )
+
+        return sorted(months)
+
+    @classmethod
+    def ensure_partitions(cls, *, months_ahead: int, now=None) -> list[str]:
+        """
+        Create the partitions for the current month and the next
+        ``months_ahead`` months. Returns the names of the created partitions.
+        """
+
+        if not cls.is_partitioned():
+            return []
+
+        current = cls.month_start(now or timezone.now())
+        existing = set(cls.partition_months())
+        created = []
+
+        for offset in range(max(0, months_ahead) + 1):
+            month = cls.add_months(current, offset)
+            if month in existing:
+                continue
+
+            try:
+                with transaction.atomic():
+                    cls._execute(
+                        f"CREATE TABLE {cls._quote(cls.partition_name(month))} "
+                        f"PARTITION OF {cls._quote(cls.TABLE)} "
+                        f"{cls._bounds_sql(month)}"
+                    )
+            except DatabaseError:
+                # The default partition already holds rows for this month;
+                # they stay there and are archived row by row.
+                logger.warning(
+                    "AUDIT LOG PARTITION SKIPPED | partition=%s",
+                    cls.partition_name(month),
+                    exc_info=True,
+                )
+                continue
+
+            created.append(cls.partition_name(month))
+
+        if created:
+            logger.info(
+                "AUDIT LOG PARTITIONS CREATED | partitions=%s",
+                ",".join(created),
+            )
+
+        return created
+
+    # =====================================================
+    # Archiving
+    # =====================================================
+
+    @classmethod
+    def archive_before(
+        cls,
+        cutoff: datetime,
+        *,
+        archive_dir,
+        dry_run: bool = False,
+    ) -> list[ArchivedMonth]:
+        """
+        Archive and remove every whole month that ends on or before the
+        month containing ``cutoff``.
+        """
+
+        cutoff = cls.month_start(cutoff)
+        archive_dir = Path(archive_dir)
+        archived = []
+
+        if cls.is_partitioned():
+            for month in cls.partition_months():
+                if cls.add_months(month, 1) <= cutoff:
+                    archived.append(
+                        cls._archive_partition(month, archive_dir, dry_run=dry_run)
+                    )
+
+        done = {entry.month for entry in archived}
+
+        for month in cls._row_months_before(cutoff):
+            if month.date() in done:
+                continue
+            archived.append(cls._archive_rows(month, archive_dir, dry_run=dry_run))
+
+        return sorted(archived, key=lambda entry: entry.month)
+
+    @classmethod
+    def _archive_partition(cls, month, archive_dir, *, dry_run) -> ArchivedMonth:
+        name = cls._quote(cls.partition_name(month))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {name}")
+            rows = cursor.fetchone()[0]
+
+        if dry_run:
+            return ArchivedMonth(
+                month.date(),
+                rows,
+                cls._archive_path(archive_dir, month),
+                True,
+            )
+
+        # Detaching only holds the parent lock briefly; the export then reads
+        # a standalone table without blocking audit writes.
+        cls._execute(f"ALTER TABLE {cls._quote(cls.TABLE)} DETACH PARTITION {name}")
+
+        try:
+            path = cls._write_archive(
+                archive_dir,
+                month,
+                lambda output: cls._copy_table(name, output),
+            )
+        except Exception:
+            cls._execute(
+                f"ALTER TABLE {cls._quote(cls.TABLE)} ATTACH PARTITION {name} "
+                f"{cls._bounds_sql(month)}"
+            )
+            raise
+
+        cls._execute(f"DROP TABLE {name}")
+
+        logger.info(
+            "AUDIT LOG PARTITION ARCHIVED | partition=%s rows=%s path=%s",
+            cls.partition_name(month),
+            rows,
+            path,
+        )
+        return ArchivedMonth(month.date(), rows, path, True)
+
+    @classmethod
+    def _archive_rows(cls, month, archive_dir, *, dry_run) -> ArchivedMonth:
+        queryset = AuditLog.objects.filter(
+            created_at__gte=month,
+            created_at__lt=cls.add_months(month, 1),
+        )
+
+        if dry_run:
+            return ArchivedMonth(
+                month.date(),
+                queryset.count(),
+                cls._archive_path(archive_dir, month),
+                False,
+            )
+
+        path = cls._write_archive(
+            archive_dir,
+            month,
+            lambda output: cls._write_rows(queryset, output),
+        )
+        rows = batched_delete(queryset)
+
+        logger.info(
+            "AUDIT LOG ROWS ARCHIVED | month=%s rows=%s path=%s",
+            f"{month:%Y-%m}",
+            rows,
+            path,
+        )
+        return ArchivedMonth(month.date(), rows, path, False)
+
+    @classmethod
+    def _row_months_before(cls, cutoff) -> list[datetime]:
+        return list(
+            AuditLog.objects.filter(created_at__lt=cutoff)
+            .annotate(month=TruncMonth("created_at", tzinfo=dt_timezone.utc))
+            .order_by("month")
+            .values_list("month", flat=True)
+            .distinct()
+        )
+
+    # =====================================================
+    # Files
+    # =====================================================
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        return [field.column for field in AuditLog._meta.concrete_fields]
+
+    @classmethod
+    def _archive_path(cls, archive_dir: Path, month) -> Path:
+        path = archive_dir / f"auditlog_{month:%Y_%m}.csv.gz"
+
+        # A month can be archived more than once (e.g. its partition, then
+        # late rows from the default partition); never overwrite.
+        suffix = 2
+        while path.exists():
+            path = archive_dir / f"auditlog_{month:%Y_%m}_{suffix}.csv.gz"
+            suffix += 1
+
+        return path
+
+    @classmethod
+    def _write_archive(cls, archive_dir: Path, month, write) -> Path:
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+        path = cls._archive_path(archive_dir, month)
+        partial = path.with_name(f"{path.name}.partial")
+
+        try:
+            with gzip.open(partial, "wb") as output:
+                write(output)
+            os.replace(partial, path)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        return path
+
+    @classmethod
+    def _copy_table(cls, table: str, output) -> None:
+        columns = ", ".join(cls._quote(column) for column in cls.columns())
+
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY (SELECT {columns} FROM {table} ORDER BY created_at, id) "
+                "TO STDOUT WITH (FORMAT csv, HEADER)"
+            ) as copy:
+                for chunk in copy:
+                    output.write(chunk)
+
+    @classmethod
+    def _write_rows(cls, queryset, output) -> None:
+        attnames = [field.attname for field in AuditLog._meta.concrete_fields]
+
+        text = io.TextIOWrapper(output, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(cls.columns())
+
+        for row in (
+            queryset.order_by("created_at", "id")
+            .values_list(*attnames)
+            .iterator(chunk_size=2000)
+        ):
+            writer.writerow([cls._csv_value(value) for value in row])
+
+        text.flush()
+        text.detach()
+
+    @staticmethod
+    def _csv_value(value):
+        if value is None:
+            return ""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    # =====================================================
+    # SQL helpers
+    # =====================================================
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return connection.ops.quote_name(name)
+
+    @classmethod
+    def _bounds_sql(cls, month) -> str:
+        # Bounds are generated here, never taken from input.
+        return (
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{cls.add_months(month, 1).isoformat()}')"
+        )
+
+    @staticmethod
+    def _execute(sql: str) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
@@ -0,0 +1,381 @@
+"""Buffered audit log writes.
+
+Audit entries used to be INSERTed one by one inside the request, so a login
+that fails, locks an account and revokes a session paid three round trips
+(plus registry inserts) before responding. ``AuditLogWriter`` collects the
+entries recorded while a request is handled and writes them with a single
+``bulk_create`` before the response is returned.
+
+Delivery rules:
+
+- security events (``SECURITY_EVENTS``: failed logins, account locks and
+  session revocations) are INSERTed immediately in the caller's
+  transaction, so they commit or roll back with the change they record;
+- other entries recorded inside ``transaction.atomic()`` join the buffer only when
+  the outermost transaction commits, so a rolled-back action leaves no audit
+  trail, exactly as the previous in-transaction INSERT did;
+- outside a request buffer (Celery tasks, management commands, shell) each
+  entry is written as soon as it is committed;
+- ``AUDIT_LOG_WRITE_MODE = "celery"`` hands each flushed batch to
+  ``core.tasks.audit.write_audit_log_batch`` instead of inserting it inline,
+  falling back to an inline write when the broker is unreachable.
+
+Entries are built as unsaved ``AuditLog`` instances at the time of the event
+(``created_at`` included) and are never modified afterwards.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.utils.dateparse import parse_datetime
+
+from core.models.audit import AuditLog
+
+logger = logging.getLogger("arms.audit")
+
+
+@dataclass(slots=True)
+class _AuditBuffer:
+    entries: list = field(default_factory=list)
+    rooms: dict = field(default_factory=dict)
+    locations: dict = field(default_factory=dict)
+
+
+_buffer: ContextVar[_AuditBuffer | None] = ContextVar(
+    "audit_log_buffer",
+    default=None,
+)
+
+
+class AuditLogWriter:
+    """Collect audit entries per request and write them in batches."""
+
+    WRITE_MODE_INLINE = "inline"
+    WRITE_MODE_CELERY = "celery"
+
+    # Never deferred: a crash or write failure after commit must not leave
+    # one of these changes without its audit row.
+    SECURITY_EVENTS = frozenset({
+        AuditLog.Events.LOGIN_FAILED,
+        AuditLog.Events.ACCOUNT_LOCKED,
+        AuditLog.Events.ACCOUNT_UNLOCKED,
+        AuditLog.Events.SESSION_REVOKED,
+        AuditLog.Events.SESSION_EXPIRED,
+        AuditLog.Events.PERMISSION_MATRIX_SESSIONS_REVOKED,
+    })
+
+    # =====================================================
+    # Settings
+    # =====================================================
+
+    @classmethod
+    def get_write_mode(cls) -> str:
+        mode = str(
+            getattr(settings, "AUDIT_LOG_WRITE_MODE", cls.WRITE_MODE_INLINE)
+        ).lower()
+
+        if mode not in (cls.WRITE_MODE_INLINE, cls.WRITE_MODE_CELERY):
+            raise ValueError(f"Unknown AUDIT_LOG_WRITE_MODE: {mode!r}")
+
+        return mode
+
+    @classmethod
+    def get_buffer_max_entries(cls) -> int:
+        return max(
+            1,
+            int(getattr(settings, "AUDIT_LOG_BUFFER_MAX_ENTRIES", 500)),
+        )
+
+    # =====================================================
+    # Recording
+    # =====================================================
+
+    @classmethod
+    def record(cls, **fields) -> AuditLog:
+        """Queue one entry; accepts the same fields as ``AuditLog``."""
+
+        entry = AuditLog(**fields)
+        cls._detach_related(entry)
+
+        if entry.event_type in cls.SECURITY_EVENTS:
+            # Written with the change it records: committed together or
+            # not at all.
+            AuditLog.objects.bulk_create([entry])
+            return entry
+
+        transaction.on_commit(lambda: cls._enqueue([entry]))
+
+        return entry
+
+    @classmethod
+    def _enqueue(cls, entries) -> None:
+        buffer = _buffer.get()
+
+        if buffer is None:
+            cls.write(entries)
+            return
+
+        buffer.entries.extend(entries)
+
+        if len(buffer.entries) >= cls.get_buffer_max_entries():
+            cls.flush()
+
+    @classmethod
+    @contextmanager
+    def buffered(cls):
+        """Buffer entries recorded in this context; flush them on exit."""
+
+        if _buffer.get() is not None:
+            yield
+            return
+
+        token = _buffer.set(_AuditBuffer())
+
+        try:
+            yield
+        finally:
+            try:
+                cls.flush()
+            finally:
+                _buffer.reset(token)
+
+    @classmethod
+    def flush(cls) -> int:
+        buffer = _buffer.get()
+
+        if buffer is None or not buffer.entries:
+            return 0
+
+        entries, buffer.entries = buffer.entries, []
+        cls.write(entries)
+        return len(entries)
+
+    @classmethod
+    def pending(cls) -> int:
+        buffer = _buffer.get()
+        return len(buffer.entries) if buffer is not None else 0
+
+    # =====================================================
+    # Writing
+    # =====================================================
+
+    @classmethod
+    def write(cls, entries) -> None:
+        if not entries:
+            return
+
+        if cls.get_write_mode() == cls.WRITE_MODE_CELERY and cls._dispatch(entries):
+            return
+
+        cls.write_inline(entries)
+
+    @classmethod
+    def write_inline(cls, entries) -> None:
+        try:
+            with transaction.atomic():
+                AuditLog.objects.bulk_create(entries)
+            return
+        except DatabaseError:
+            logger.exception(
+                "AUDIT LOG BATCH WRITE FAILED | entries=%s; retrying per entry",
+                len(entries),
+            )
+
+        # One bad row must not drop the rest of the batch.
+        for entry in entries:
+            try:
+                cls._write_one(entry)
+            except IntegrityError:
+                # A linked user or site row was deleted before the write
+                # (e.g. the audited delete itself). Keep the name snapshots
+                # and drop the links, as ON DELETE SET NULL would have.
+                for model_field in cls._related_fields():
+                    setattr(entry, model_field.attname, None)
+
+                try:
+                    cls._write_one(entry)
+                except DatabaseError:
+                    cls._log_write_failure(entry)
+            except DatabaseError:
+                cls._log_write_failure(entry)
+
+    @classmethod
+    def _write_one(cls, entry: AuditLog) -> None:
+        entry.pk = None
+        entry.public_id = None
+
+        with transaction.atomic():
+            AuditLog.objects.bulk_create([entry])
+
+    @classmethod
+    def _log_write_failure(cls, entry: AuditLog) -> None:
+        logger.exception(
+            "AUDIT LOG WRITE FAILED | event_type=%s user_public_id=%s",
+            entry.event_type,
+            entry.user_public_id,
+        )
+
+    @classmethod
+    def _related_fields(cls):
+        return [
+            model_field
+            for model_field in AuditLog._meta.concrete_fields
+            if model_field.is_relation
+        ]
+
+    @classmethod
+    def _detach_related(cls, entry: AuditLog) -> None:
+        """Keep only the ids of related rows.
+
+        The entry may be written after the request deleted one of them;
+        holding the instance would make the save-time unsaved-object check
+        fail instead of writing the snapshot.
+        """
+
+        for model_field in cls._related_fields():
+            if model_field.is_cached(entry):
+                model_field.delete_cached_value(entry)
+
+    @classmethod
+    def _dispatch(cls, entries) -> bool:
+        from core.tasks.audit import write_audit_log_batch
+
+        try:
+            write_audit_log_batch.delay(
+                [cls.serialize_entry(entry) for entry in entries]
+            )
+        except Exception:
+            logger.exception(
+                "AUDIT LOG DISPATCH FAILED | entries=%s; writing inline",
+                len(entries),
+            )
+            return False
+
+        return True
+
+    @classmethod
+    def serialize_entry(cls, entry: AuditLog) -> dict:
+        row = {}
+
+        for model_field in AuditLog._meta.concrete_fields:
+            if model_field.primary_key or model_field.name == "public_id":
+                continue
+
+            row[model_field.attname] = model_field.value_from_object(entry)
+
+        row["created_at"] = entry.created_at.isoformat()
+        return row
+
+    @classmethod
+    def deserialize_entry(cls, row: dict) -> AuditLog:
+        row = dict(row)
+        row["created_at"] = parse_datetime(row["created_at"])
+        return AuditLog(**row)
+
+    # =====================================================
+    # Scope snapshots
+    # =====================================================
+
+    @classmethod
+    def resolve_scope(cls, target) -> dict:
+        """
+        Snapshot the department / location / room of ``target``.
+
+        Related rows already loaded on ``target`` are reused; otherwise the
+        room (or location) is fetched once with its ancestors and remembered
+        for the rest of the request.
+        """
+
+        scope = {
+            "room": None,
+            "room_name": None,
+            "location": None,
+            "location_name": None,
+            "department": None,
+            "department_name": None,
+        }
+
+        if not target:
+            return scope
+
+        room = cls._related(target, "room", cls._load_room)
+        location = department = None
+
+        if room is not None:
+            location = room.location
+            department = location.department if location else None
+        else:
+            location = cls._related(target, "location", cls._load_location)
+
+            if location is not None:
+                department = location.department
+            else:
+                department = getattr(target, "department", None)
+
+        scope.update(
+            room=room,
+            room_name=getattr(room, "name", None),
+            location=location,
+            location_name=getattr(location, "name", None),
+            department=department,
+            department_name=getattr(department, "name", None),
+        )
+        return scope
+
+    @classmethod
+    def _related(cls, target, name, loader):
+        descriptor = getattr(type(target), name, None)
+        field_ = getattr(descriptor, "field", None)
+
+        if field_ is None or not hasattr(descriptor, "is_cached"):
+            return getattr(target, name, None)
+
+        if descriptor.is_cached(target):
+            return getattr(target, name)
+
+        related_id = getattr(target, field_.attname, None)
+        return loader(related_id) if related_id else None
+
+    @classmethod
+    def _load_room(cls, room_id):
+        from sites.models.sites import Room
+
+        return cls._memoized(
+            "rooms",
+            room_id,
+            lambda: Room.objects.select_related("location__department")
+            .filter(pk=room_id)
+            .first(),
+        )
+
+    @classmethod
+    def _load_location(cls, location_id):
+        from sites.models.sites import Location
+
+        return cls._memoized(
+            "locations",
+            location_id,
+            lambda: Location.objects.select_related("department")
+            .filter(pk=location_id)
+            .first(),
+        )
+
+    @classmethod
+    def _memoized(cls, kind, key, loader):
+        buffer = _buffer.get()
+
+        if buffer is None:
+            return loader()
+
+        memo = getattr(buffer, kind)
+
+        if key not in memo:
+            memo[key] = loader()
+
+        return memo[key]
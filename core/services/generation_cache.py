@@ -0,0 +1,332 @@
+"""Process-local tier for cache generation tokens.
+
+Generation tokens (per-user scope generations, the global site-options
+generation) are read on every cached list request but change rarely. This
+module keeps recently read tokens in a small per-process LRU so the hit path
+only needs the payload round trip.
+
+Staleness is bounded two ways:
+
+- every rotation publishes the rotated key on a Redis pub/sub channel, and a
+  daemon listener in each worker drops it from the local tier immediately;
+- entries expire after ``GENERATION_LOCAL_CACHE_TTL`` seconds regardless, so
+  a lost message can only delay invalidation by that long.
+
+While the listener is disconnected the local tier is bypassed. Backends
+without pub/sub (LocMemCache in tests) are process-local already, so local
+discards are sufficient there.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger("arms.scope_cache")
+
+
+class GenerationTokenCache:
+    """Bounded, TTL-limited LRU of ``(cache_alias, key) -> generation``."""
+
+    CHANNEL = "arms:generation-invalidation:v1"
+
+    _entries: OrderedDict = OrderedDict()
+    _lock = threading.Lock()
+    _epoch = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    _listener_pids: dict[str, int] = {}
+    _listener_healthy: dict[str, bool] = {}
+    _pid: int | None = None
+
+    # =====================================================
+    # Settings
+    # =====================================================
+
+    @classmethod
+    def get_ttl_seconds(cls) -> float:
+        return max(
+            0.0,
+            float(getattr(settings, "GENERATION_LOCAL_CACHE_TTL", 5)),
+        )
+
+    @classmethod
+    def get_max_entries(cls) -> int:
+        return max(
+            0,
+            int(getattr(settings, "GENERATION_LOCAL_CACHE_MAX_ENTRIES", 10000)),
+        )
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.get_ttl_seconds() > 0 and cls.get_max_entries() > 0
+
+    # =====================================================
+    # Local tier
+    # =====================================================
+
+    @classmethod
+    def epoch(cls) -> int:
+        """Return the discard counter; pass it back to ``set``."""
+
+        return cls._epoch
+
+    @classmethod
+    def get(cls, cache_alias: str, key: str) -> str | None:
+        if not cls.is_enabled():
+            return None
+
+        cls._reset_after_fork()
+
+        if not cls._ensure_listener(cache_alias):
+            return None
+
+        now = time.monotonic()
+
+        with cls._lock:
+            entry = cls._entries.get((cache_alias, key))
+
+            if entry is None:
+                cls._misses += 1
+                return None
+
+            value, expires_at = entry
+
+            if expires_at <= now:
+                del cls._entries[(cache_alias, key)]
+                cls._misses += 1
+                return None
+
+            cls._entries.move_to_end((cache_alias, key))
+            cls._hits += 1
+            return value
+
+    @classmethod
+    def set(
+        cls,
+        cache_alias: str,
+        key: str,
+        value: str,
+        *,
+        epoch: int,
+    ) -> None:
+        """Store ``value`` unless a discard happened since ``epoch``.
+
+        A reader that fetched the token from Redis just before a rotation must
+        not re-populate the local tier after the rotation's discard arrived.
+        """
+
+        if not cls.is_enabled():
+            return
+
+        max_entries = cls.get_max_entries()
+        expires_at = time.monotonic() + cls.get_ttl_seconds()
+
+        with cls._lock:
+            if cls._epoch != epoch:
+                return
+
+            cls._entries[(cache_alias, key)] = (str(value), expires_at)
+            cls._entries.move_to_end((cache_alias, key))
+
+            while len(cls._entries) > max_entries:
+                cls._entries.popitem(last=False)
+                cls._evictions += 1
+
+    @classmethod
+    def discard(cls, cache_alias: str, key: str) -> None:
+        with cls._lock:
+            cls._epoch += 1
+            cls._entries.pop((cache_alias, key), None)
+
+    @classmethod
+    def clear(cls, cache_alias: str | None = None) -> None:
+        with cls._lock:
+            cls._epoch += 1
+
+            if cache_alias is None:
+                cls._entries.clear()
+                return
+
+            for entry_key in [
+                entry_key
+                for entry_key in cls._entries
+                if entry_key[0] == cache_alias
+            ]:
+                del cls._entries[entry_key]
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        with cls._lock:
+            return {
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "size": len(cls._entries),
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all entries, counters and listener state (tests)."""
+
+        with cls._lock:
+            cls._epoch += 1
+            cls._entries.clear()
+            cls._listener_pids.clear()
+            cls._listener_healthy.clear()
+            cls._hits = 0
+            cls._misses = 0
+            cls._evictions = 0
+
+    # =====================================================
+    # Cross-process invalidation
+    # =====================================================
+
+    @classmethod
+    def invalidate(cls, cache_alias: str, key: str) -> None:
+        """Drop ``key`` locally and tell every other worker to drop it."""
+
+        cls.discard(cache_alias, key)
+
+        client = cls._get_redis_client(cache_alias)
+        if client is None:
+            return
+
+        try:
+            client.publish(cls.CHANNEL, f"{cache_alias}|{key}")
+        except Exception:
+            # Other workers fall back to GENERATION_LOCAL_CACHE_TTL.
+            logger.exception(
+                "GENERATION INVALIDATION PUBLISH FAILED | cache_alias=%s key=%s",
+                cache_alias,
+                key,
+            )
+
+    @classmethod
+    def _get_redis_client(cls, cache_alias: str):
+        """Return a redis-py client for ``cache_alias``, or ``None``."""
+
+        try:
+            backend_client = getattr(caches[cache_alias], "_cache", None)
+            get_client = getattr(backend_client, "get_client", None)
+
+            if get_client is None:
+                return None
+
+            return get_client(None, write=True)
+        except Exception:
+            logger.exception(
+                "GENERATION INVALIDATION CLIENT UNAVAILABLE | cache_alias=%s",
+                cache_alias,
+            )
+            return None
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        pid = os.getpid()
+
+        if cls._pid == pid:
+            return
+
+        with cls._lock:
+            if cls._pid == pid:
+                return
+
+            # Listener threads do not survive fork(); entries inherited from
+            # the parent may have missed invalidations while copied.
+            cls._epoch += 1
+            cls._entries.clear()
+            cls._listener_pids.clear()
+            cls._listener_healthy.clear()
+            cls._pid = pid
+
+    @classmethod
+    def _ensure_listener(cls, cache_alias: str) -> bool:
+        """Start this worker's subscriber; return whether reads may be local."""
+
+        pid = os.getpid()
+
+        if cls._listener_pids.get(cache_alias) == pid:
+            return cls._listener_healthy.get(cache_alias, False)
+
+        with cls._lock:
+            if cls._listener_pids.get(cache_alias) == pid:
+                return cls._listener_healthy.get(cache_alias, False)
+
+            cls._listener_pids[cache_alias] = pid
+            client = cls._get_redis_client(cache_alias)
+
+            if client is None:
+                # No shared backend to publish through: this process is the
+                # only reader, and local discards keep it exact.
+                cls._listener_healthy[cache_alias] = True
+                return True
+
+            cls._listener_healthy[cache_alias] = False
+
+        threading.Thread(
+            target=cls._listen,
+            args=(cache_alias, client),
+            name=f"generation-invalidation:{cache_alias}",
+            daemon=True,
+        ).start()
+
+        return False
+
+    @classmethod
+    def _listen(cls, cache_alias: str, client) -> None:
+        prefix = f"{cache_alias}|"
+
+        while True:
+            pubsub = None
+
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(cls.CHANNEL)
+
+                # Anything cached before the subscription may have missed an
+                # invalidation.
+                cls.clear(cache_alias)
+                cls._listener_healthy[cache_alias] = True
+
+                logger.info(
+                    "GENERATION INVALIDATION LISTENER STARTED | "
+                    "cache_alias=%s pid=%s",
+                    cache_alias,
+                    os.getpid(),
+                )
+
+                for message in pubsub.listen():
+                    data = message.get("data")
+
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8", "replace")
+
+                    if isinstance(data, str) and data.startswith(prefix):
+                        cls.discard(cache_alias, data[len(prefix):])
+
+            except Exception:
+                logger.exception(
+                    "GENERATION INVALIDATION LISTENER FAILED | cache_alias=%s",
+                    cache_alias,
+                )
+
+            finally:
+                cls._listener_healthy[cache_alias] = False
+                cls.clear(cache_alias)
+
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+            time.sleep(1)
@@ -0,0 +1,162 @@
+"""Failed-login counters kept in the cache instead of on the user row.
+
+Failures are counted per user and per client IP. A counter resets only
+after a quiet gap: every failure extends its expiry by the window, so the
+count keeps growing while failures keep arriving (for example an attacker
+waiting out each temporary lock) and permanent lock thresholds are still
+reached.
+
+On Redis the increment and expiry run atomically in one Lua script, so
+concurrent attempts each see a distinct count and exactly one of them
+crosses a lockout threshold. Other cache backends (LocMemCache in tests
+and local development) use ``add`` / ``incr`` / ``touch`` with the same
+semantics.
+
+``hit`` and ``count`` return ``None`` when the cache is unavailable so the
+caller can fall back to counting on the user row.
+"""
+
+from __future__ import annotations
+
+import logging
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger("arms.login_failures")
+
+
+EXPIRING_COUNTER_SCRIPT = """
+local key = KEYS[1]
+local window_ms = tonumber(ARGV[1])
+
+if ARGV[2] == "1" then
+    local count = redis.call("INCR", key)
+    redis.call("PEXPIRE", key, window_ms)
+    return count
+end
+
+return tonumber(redis.call("GET", key) or "0")
+"""
+
+
+class FailedLoginCounter:
+    """Failure counters keyed by scope and identifier."""
+
+    CACHE_PREFIX = "login-failures:v2"
+
+    USER = "user"
+    IP = "ip"
+
+    @classmethod
+    def get_cache(cls):
+        return caches[settings.LOGIN_FAILURE_CACHE_ALIAS]
+
+    @classmethod
+    def key(cls, scope: str, identifier) -> str:
+        return f"{cls.CACHE_PREFIX}:{scope}:{identifier}"
+
+    # ------------------------------------------------
+    # Counters
+    # ------------------------------------------------
+
+    @classmethod
+    def hit(cls, scope: str, identifier, *, window_seconds: int) -> int | None:
+        """Record one failure and return the failures since the last quiet gap."""
+
+        return cls._run(scope, identifier, window_seconds, record=True)
+
+    @classmethod
+    def count(cls, scope: str, identifier, *, window_seconds: int) -> int | None:
+        """Return the current failure count without recording one."""
+
+        return cls._run(scope, identifier, window_seconds, record=False)
+
+    @classmethod
+    def reset(cls, scope: str, identifier) -> None:
+        try:
+            cls.get_cache().delete(cls.key(scope, identifier))
+        except Exception:
+            logger.warning(
+                "LOGIN FAILURE COUNTER RESET FAILED | scope=%s",
+                scope,
+                exc_info=True,
+            )
+
+    @classmethod
+    def _run(cls, scope, identifier, window_seconds, *, record) -> int | None:
+        if not identifier:
+            return 0
+
+        window_seconds = max(1, int(window_seconds))
+        key = cls.key(scope, identifier)
+
+        try:
+            backend = cls.get_cache()
+            client = cls._get_redis_client(backend)
+
+            if client is not None:
+                return cls._run_script(
+                    client,
+                    backend.make_key(key),
+                    window_seconds,
+                    record=record,
+                )
+
+            return cls._run_expiring(
+                backend,
+                key,
+                window_seconds,
+                record=record,
+            )
+
+        except Exception:
+            logger.warning(
+                "LOGIN FAILURE COUNTER UNAVAILABLE | scope=%s",
+                scope,
+                exc_info=True,
+            )
+            return None
+
+    @classmethod
+    def _run_script(cls, client, key, window_seconds, *, record) -> int:
+        # Script objects run via EVALSHA and load the script on first use.
+        script = client.register_script(EXPIRING_COUNTER_SCRIPT)
+
+        return int(
+            script(
+                keys=[key],
+                args=[
+                    window_seconds * 1000,
+                    "1" if record else "0",
+                ],
+            )
+        )
+
+    @classmethod
+    def _run_expiring(cls, backend, key, window_seconds, *, record) -> int:
+        if not record:
+            return int(backend.get(key, 0))
+
+        backend.add(key, 0, timeout=window_seconds)
+
+        try:
+            count = backend.incr(key)
+        except ValueError:
+            # Expired between add() and incr().
+            backend.add(key, 0, timeout=window_seconds)
+            count = backend.incr(key)
+
+        backend.touch(key, window_seconds)
+        return int(count)
+
+    @classmethod
+    def _get_redis_client(cls, backend):
+        """Return a redis-py client behind ``backend``, or ``None``."""
+
+        backend_client = getattr(backend, "_cache", None)
+        get_client = getattr(backend_client, "get_client", None)
+
+        if get_client is None:
+            return None
+
+        return get_client(None, write=True)
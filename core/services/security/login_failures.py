@@ -1,8 +1,12 @@
 from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
 from django.utils import timezone
-from core.models import AuditLog
+from core.services.security.login_counters import FailedLoginCounter
 from rest_framework.exceptions import AuthenticationFailed
 
+from users.models import User
+
 
 def is_temporarily_locked(user):
 
@@ -18,6 +22,16 @@ def is_permanently_locked(user):
 
 def reset_failed_logins(user):
 
+    FailedLoginCounter.reset(FailedLoginCounter.USER, user.pk)
+
+    # Only touch the row when it still holds lock state.
+    if (
+        not user.failed_login_attempts
+        and user.last_failed_login_at is None
+        and user.locked_until is None
+    ):
+        return
+
     user.failed_login_attempts = 0
     user.last_failed_login_at = None
     user.locked_until = None
@@ -29,14 +43,111 @@ def reset_failed_logins(user):
     ])
 
 
+def register_failed_login_ip(ident):
+    """
+    Count a failed login from the client ``ident`` (as returned by
+    ``LoginThrottle.get_ident``); ``LoginThrottle`` reads the same counter.
+    """
+
+    FailedLoginCounter.hit(
+        FailedLoginCounter.IP,
+        ident,
+        window_seconds=settings.LOGIN_FAILURE_IP_WINDOW_SECONDS,
+    )
+
+
 def register_failed_login(
     *,
     user,
     policy,
 ):
+    """
+    Count a failed login for ``user`` and apply the lockout policy.
+
+    Failures are counted in ``FailedLoginCounter``; the user row is written
+    only when a temporary or permanent lock is applied. Returns the
+    outcome for auditing.
+    """
 
     now = timezone.now()
 
+    failed_attempts = FailedLoginCounter.hit(
+        FailedLoginCounter.USER,
+        user.pk,
+        window_seconds=policy.reset_failed_attempts_after_minutes * 60,
+    )
+
+    if failed_attempts is None:
+        return _register_failed_login_on_row(user=user, policy=policy, now=now)
+
+    result = {
+        "failed_attempts": failed_attempts,
+        "temporarily_locked": False,
+        "permanently_locked": False,
+    }
+
+    # -----------------------------------------
+    # Permanent escalation
+    # -----------------------------------------
+
+    if failed_attempts >= policy.permanent_lock_threshold:
+
+        # Conditional updates: concurrent failures past the threshold lock
+        # the row once.
+        result["permanently_locked"] = bool(
+            User.objects
+            .filter(pk=user.pk, is_locked=False)
+            .update(
+                is_locked=True,
+                locked_reason="Exceeded maximum failed login attempts",
+                failed_login_attempts=failed_attempts,
+                last_failed_login_at=now,
+            )
+        )
+
+        if result["permanently_locked"]:
+            user.is_locked = True
+            user.locked_reason = "Exceeded maximum failed login attempts"
+
+    # -----------------------------------------
+    # Temporary lock
+    # -----------------------------------------
+
+    elif (
+        policy.enable_account_lockout
+        and failed_attempts >= policy.lockout_attempts
+    ):
+
+        locked_until = now + timedelta(
+            minutes=policy.lockout_duration_minutes
+        )
+
+        result["temporarily_locked"] = bool(
+            User.objects
+            .filter(pk=user.pk)
+            .filter(Q(locked_until__isnull=True) | Q(locked_until__lte=now))
+            .update(
+                locked_until=locked_until,
+                failed_login_attempts=failed_attempts,
+                last_failed_login_at=now,
+            )
+        )
+
+        if result["temporarily_locked"]:
+            user.locked_until = locked_until
+
+    if result["permanently_locked"] or result["temporarily_locked"]:
+        user.failed_login_attempts = failed_attempts
+        user.last_failed_login_at = now
+
+    return result
+
+
+def _register_failed_login_on_row(*, user, policy, now):
+    """
+    Count on the user row while the counter cache is unavailable.
+    """
+
     # -----------------------------------------
     # Rolling window reset
     # -----------------------------------------
@@ -62,6 +173,12 @@ def register_failed_login(
         "last_failed_login_at",
     ]
 
+    result = {
+        "failed_attempts": user.failed_login_attempts,
+        "temporarily_locked": False,
+        "permanently_locked": False,
+    }
+
     # -----------------------------------------
     # Temporary lock
     # -----------------------------------------
@@ -79,19 +196,7 @@ def register_failed_login(
         )
 
         update_fields.append("locked_until")
-
-        AuditLog.objects.create(
-            event_type=AuditLog.Events.ACCOUNT_LOCKED,
-            user=user,
-            user_public_id=str(user.public_id),
-            user_email=user.email,
-            description="Account temporarily locked",
-            metadata={
-                "lock_type": "temporary",
-                "failed_attempts":
-                user.failed_login_attempts,
-            },
-        )
+        result["temporarily_locked"] = True
 
     # -----------------------------------------
     # Permanent escalation
@@ -111,22 +216,12 @@ def register_failed_login(
             "is_locked",
             "locked_reason",
         ])
-
-        AuditLog.objects.create(
-            event_type=AuditLog.Events.ACCOUNT_LOCKED,
-            user=user,
-            user_public_id=str(user.public_id),
-            user_email=user.email,
-            description="Account permanently locked",
-            metadata={
-                "lock_type": "permanent",
-                "failed_attempts":
-                user.failed_login_attempts,
-            },
-        )
+        result["permanently_locked"] = True
 
     user.save(update_fields=update_fields)
 
+    return result
+
 
 def validate_user_not_locked(user):
 
@@ -141,4 +236,3 @@ def validate_user_not_locked(user):
         raise AuthenticationFailed(
             "Too many failed login attempts. Try again later."
         )
-
@@ -0,0 +1,296 @@
+"""Write-behind tracking of session activity.
+
+Activity pings extend a session's idle expiry (``expires_at``) and record
+``last_used_at``. Instead of updating the ``UserSession`` row on every ping,
+the latest activity is cached per session and flushed to the database in
+batches by ``core.tasks.cleanup.flush_session_activity``.
+
+The pending entry of a session lives until the expiry it grants: after that
+the session is idle-expired anyway, so losing an unflushed entry never
+shortens a session that would still be valid.
+
+Each ping also marks its session dirty. On Redis the dirty set is a sorted
+set scored by ping time and the flush pops it in batches with a Lua script,
+so the flush reads only sessions pinged since the previous run instead of
+every active session. Other cache backends (LocMemCache in tests and local
+development) keep the dirty ids in one cached set, which is not safe across
+processes.
+
+Readers that load a session row and decide on its expiry overlay the pending
+activity first with ``apply`` / ``get_many``: authentication whenever its
+cached ``SessionState`` looks expired, refresh rotation and
+``expire_user_sessions``. ``SessionStateCache`` is deliberately not written
+here, so a ping racing a revocation cannot re-cache the session as active.
+
+When ``SESSION_ACTIVITY_WRITE_BEHIND`` is disabled, or the cache write
+fails, activity is saved to the row directly.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.models.sessions import UserSession
+
+logger = logging.getLogger("arms.session_activity")
+
+
+POP_DIRTY_SCRIPT = """
+local ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", ARGV[1], "LIMIT", 0, ARGV[2])
+
+if #ids > 0 then
+    redis.call("ZREM", KEYS[1], unpack(ids))
+end
+
+return ids
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionActivity:
+    """Latest activity of a session, as POSIX timestamps."""
+
+    expires_at: float
+    last_used_at: float
+
+    def is_newer_than(self, session) -> bool:
+        return self.expires_at > session.expires_at.timestamp()
+
+
+class SessionActivityTracker:
+    """Buffer session activity in the cache and flush it in batches."""
+
+    CACHE_PREFIX = "session-activity:v1"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.SESSION_ACTIVITY_WRITE_BEHIND
+
+    @classmethod
+    def get_cache(cls):
+        return caches[settings.SESSION_ACTIVITY_CACHE_ALIAS]
+
+    @classmethod
+    def key(cls, session_id) -> str:
+        return f"{cls.CACHE_PREFIX}:{session_id}"
+
+    @classmethod
+    def dirty_key(cls) -> str:
+        return f"{cls.CACHE_PREFIX}:dirty"
+
+    # ------------------------------------------------
+    # Recording
+    # ------------------------------------------------
+
+    @classmethod
+    def record(cls, session, *, expires_at: datetime, used_at: datetime) -> None:
+        """
+        Extend ``session`` to ``expires_at``. The instance is updated in
+        memory; the row is updated by the next flush.
+        """
+
+        session.expires_at = expires_at
+        session.last_used_at = used_at
+
+        if cls.is_enabled() and cls._write(session):
+            return
+
+        session.save(update_fields=["expires_at", "last_used_at"])
+
+    @classmethod
+    def _write(cls, session) -> bool:
+        timeout = session.expires_at.timestamp() - time.time()
+
+        if timeout <= 0:
+            return False
+
+        try:
+            backend = cls.get_cache()
+            backend.set(
+                cls.key(session.pk),
+                {
+                    "expires_at": session.expires_at.timestamp(),
+                    "last_used_at": session.last_used_at.timestamp(),
+                },
+                timeout=int(timeout) + 1,
+            )
+            cls._mark_dirty(backend, session.pk)
+        except Exception:
+            logger.warning(
+                "SESSION ACTIVITY WRITE FAILED | session_id=%s",
+                session.pk,
+                exc_info=True,
+            )
+            return False
+
+        return True
+
+    # ------------------------------------------------
+    # Reading
+    # ------------------------------------------------
+
+    @classmethod
+    def get_many(cls, session_ids) -> dict:
+        """Pending ``SessionActivity`` keyed by session id."""
+
+        session_ids = list(session_ids)
+
+        if not cls.is_enabled() or not session_ids:
+            return {}
+
+        keys = {cls.key(session_id): session_id for session_id in session_ids}
+
+        try:
+            values = cls.get_cache().get_many(list(keys))
+        except Exception:
+            logger.warning(
+                "SESSION ACTIVITY READ FAILED | sessions=%s",
+                len(session_ids),
+                exc_info=True,
+            )
+            return {}
+
+        return {
+            keys[key]: SessionActivity(
+                expires_at=value["expires_at"],
+                last_used_at=value["last_used_at"],
+            )
+            for key, value in values.items()
+        }
+
+    @classmethod
+    def apply(cls, session) -> None:
+        """Overlay pending activity on a session loaded from the database."""
+
+        activity = cls.get_many([session.pk]).get(session.pk)
+
+        if activity is not None and activity.is_newer_than(session):
+            session.expires_at = from_timestamp(activity.expires_at)
+            session.last_used_at = from_timestamp(activity.last_used_at)
+
+    # ------------------------------------------------
+    # Dirty sessions
+    # ------------------------------------------------
+
+    @classmethod
+    def _mark_dirty(cls, backend, session_id) -> None:
+        client = cls._get_redis_client(backend)
+
+        if client is not None:
+            client.zadd(
+                backend.make_key(cls.dirty_key()),
+                {str(session_id): time.time()},
+            )
+            return
+
+        dirty = backend.get(cls.dirty_key()) or set()
+        dirty.add(str(session_id))
+        backend.set(cls.dirty_key(), dirty, timeout=None)
+
+    @classmethod
+    def _pop_dirty(cls, backend, limit: int) -> list:
+        """Remove and return up to ``limit`` dirty session ids."""
+
+        client = cls._get_redis_client(backend)
+
+        if client is not None:
+            script = client.register_script(POP_DIRTY_SCRIPT)
+            ids = script(
+                keys=[backend.make_key(cls.dirty_key())],
+                args=[time.time(), limit],
+            )
+            return [
+                session_id.decode() if isinstance(session_id, bytes) else session_id
+                for session_id in ids
+            ]
+
+        dirty = backend.get(cls.dirty_key()) or set()
+        ids = sorted(dirty)[:limit]
+
+        if ids:
+            backend.set(cls.dirty_key(), dirty.difference(ids), timeout=None)
+
+        return ids
+
+    @classmethod
+    def _get_redis_client(cls, backend):
+        """Return a redis-py client behind ``backend``, or ``None``."""
+
+        backend_client = getattr(backend, "_cache", None)
+        get_client = getattr(backend_client, "get_client", None)
+
+        if get_client is None:
+            return None
+
+        return get_client(None, write=True)
+
+    # ------------------------------------------------
+    # Flushing
+    # ------------------------------------------------
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Write the pending activity of sessions pinged since the last flush.
+        Activity entries are left to expire rather than deleted, so a flush
+        racing a ping never drops it; the ping marks the session dirty
+        again.
+        """
+
+        if not cls.is_enabled():
+            return 0
+
+        backend = cls.get_cache()
+        batch_size = settings.SESSION_ACTIVITY_FLUSH_BATCH_SIZE
+        flushed = 0
+
+        while True:
+            session_ids = cls._pop_dirty(backend, batch_size)
+
+            if not session_ids:
+                return flushed
+
+            pending = cls.get_many(
+                uuid.UUID(session_id) for session_id in session_ids
+            )
+            updates = []
+
+            for session in UserSession.objects.filter(
+                id__in=pending,
+                status=UserSession.Status.ACTIVE,
+            ).only("id", "expires_at"):
+                activity = pending[session.pk]
+
+                if not activity.is_newer_than(session):
+                    continue
+
+                session.expires_at = from_timestamp(activity.expires_at)
+                session.last_used_at = from_timestamp(activity.last_used_at)
+                updates.append(session)
+
+            if not updates:
+                continue
+
+            try:
+                UserSession.objects.bulk_update(
+                    updates,
+                    ["expires_at", "last_used_at"],
+                )
+            except Exception:
+                # Put the batch back so the next run retries it.
+                for session_id in session_ids:
+                    cls._mark_dirty(backend, session_id)
+                raise
+
+            flushed += len(updates)
+
+
+def from_timestamp(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=dt_timezone.utc)
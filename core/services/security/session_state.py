@@ -0,0 +1,134 @@
+"""Short-lived cache of session validity for ``SessionJWTAuthentication``.
+
+Every authenticated request confirms that its ``UserSession`` is still active
+and inside its idle window. The status and ``expires_at`` of each session are
+cached under the session id for ``SESSION_STATE_CACHE_TTL`` seconds, so the
+session row is read only on a miss.
+
+Writers keep the cache current explicitly: ``UserSession.save()`` and
+``UserSessionQuerySet.set_status()`` store the new state immediately and again
+once the surrounding transaction commits. Sessions never become active again,
+so a cached revoked or expired state is always safe to trust. A cached expiry
+that has passed is re-read from the database before the session is expired,
+because the session may have been extended since.
+
+Cache failures fall back to the database; a failed write is bounded by the
+TTL.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger("arms.session_state")
+
+
+@dataclass(frozen=True, slots=True)
+class SessionState:
+    """The parts of a ``UserSession`` authentication depends on."""
+
+    status: str
+    expires_at: float
+
+    @classmethod
+    def from_session(cls, session) -> SessionState:
+        return cls(
+            status=session.status,
+            expires_at=session.expires_at.timestamp(),
+        )
+
+
+class SessionStateCache:
+    """Read and write cached ``SessionState`` keyed by session id."""
+
+    CACHE_PREFIX = "session-state:v1"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.SESSION_STATE_CACHE_TTL > 0
+
+    @classmethod
+    def get_cache(cls):
+        return caches[settings.SESSION_STATE_CACHE_ALIAS]
+
+    @classmethod
+    def key(cls, session_id) -> str:
+        return f"{cls.CACHE_PREFIX}:{session_id}"
+
+    @classmethod
+    def get(cls, session_id) -> SessionState | None:
+        if not cls.is_enabled():
+            return None
+
+        try:
+            value = cls.get_cache().get(cls.key(session_id))
+        except Exception:
+            logger.warning(
+                "SESSION STATE CACHE READ FAILED | session_id=%s",
+                session_id,
+                exc_info=True,
+            )
+            return None
+
+        if not value:
+            return None
+
+        return SessionState(
+            status=value["status"],
+            expires_at=value["expires_at"],
+        )
+
+    @classmethod
+    def store(cls, session) -> None:
+        """Cache the current state of one loaded session."""
+
+        cls.store_states(
+            {session.pk: SessionState.from_session(session)}
+        )
+
+    @classmethod
+    def mark(cls, session_ids, status: str) -> None:
+        """Cache a terminal ``status`` for sessions updated in bulk."""
+
+        cls.store_states(
+            {
+                session_id: SessionState(status=status, expires_at=0.0)
+                for session_id in session_ids
+            }
+        )
+
+    @classmethod
+    def store_states(cls, states: dict) -> None:
+        if not cls.is_enabled() or not states:
+            return
+
+        cls._write(states)
+
+        # A concurrent miss may re-cache the state it read before this
+        # transaction committed; write again once the change is visible.
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: cls._write(states))
+
+    @classmethod
+    def _write(cls, states: dict) -> None:
+        try:
+            cls.get_cache().set_many(
+                {
+                    cls.key(session_id): {
+                        "status": state.status,
+                        "expires_at": state.expires_at,
+                    }
+                    for session_id, state in states.items()
+                },
+                timeout=settings.SESSION_STATE_CACHE_TTL,
+            )
+        except Exception:
+            logger.exception(
+                "SESSION STATE CACHE WRITE FAILED | sessions=%s",
+                len(states),
+            )
@@ -15,6 +15,8 @@ from django.conf import settings
 from django.core.cache import caches
 from django.db import transaction
 
+from core.services.generation_cache import GenerationTokenCache
+
 logger = logging.getLogger("arms.scope_cache")
 
 
@@ -75,18 +77,47 @@ class UserScopeCacheService:
         user_public_id: str,
         *,
         cache_alias: str | None = None,
+        backend=None,
     ) -> str:
         """Return the current generation, creating it atomically when absent.
 
         The method is deliberately strict: if Redis cannot provide a stable
         generation, callers must bypass response caching for that request.
+        Recently read generations are served from ``GenerationTokenCache``
+        without a Redis round trip. ``backend`` lets callers pass an already
+        resolved (e.g. instrumented) cache for ``cache_alias``.
         """
 
         user_public_id = cls._normalise_public_id(user_public_id)
         alias = cls.get_cache_alias(cache_alias)
-        backend = cls.get_cache(alias)
         key = cls.generation_key(user_public_id)
 
+        local = GenerationTokenCache.get(alias, key)
+        if local is not None:
+            return local
+
+        epoch = GenerationTokenCache.epoch()
+        generation = cls._load_generation(
+            user_public_id,
+            alias=alias,
+            key=key,
+            backend=backend,
+        )
+        GenerationTokenCache.set(alias, key, generation, epoch=epoch)
+        return generation
+
+    @classmethod
+    def _load_generation(
+        cls,
+        user_public_id: str,
+        *,
+        alias: str,
+        key: str,
+        backend=None,
+    ) -> str:
+        if backend is None:
+            backend = cls.get_cache(alias)
+
         try:
             existing = backend.get(key)
         except Exception as exc:
@@ -239,6 +270,8 @@ class UserScopeCacheService:
                 "Unable to rotate the user's cache generation."
             ) from exc
 
+        GenerationTokenCache.invalidate(alias, key)
+
         logger.info(
             "SCOPE CACHE INVALIDATED | user_public_id=%s "
             "old_generation=%s new_generation=%s reason=%s cache_alias=%s",
@@ -0,0 +1,23 @@
+import logging
+
+from celery import shared_task
+
+from core.services.audit_writer import AuditLogWriter
+
+
+logger = logging.getLogger("arms.audit")
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_kwargs={"max_retries": 5, "countdown": 10},
+    retry_backoff=True,
+)
+def write_audit_log_batch(self, rows):
+    """Insert a batch of audit entries queued by ``AuditLogWriter``."""
+
+    entries = [AuditLogWriter.deserialize_entry(row) for row in rows]
+    AuditLogWriter.write_inline(entries)
+
+    logger.info("AUDIT LOG BATCH WRITTEN | entries=%s", len(entries))
@@ -5,6 +5,7 @@ import logging
 from users.models.users import User
 from core.utils.tokens import PasswordResetToken
 from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 from datetime import timedelta
 from core.models.sessions import UserSession
 
@@ -32,7 +33,7 @@ def send_password_reset_email(self, email: str):
         return
 
     # Audit only for real users
-    AuditLog.objects.create(
+    AuditLogWriter.record(
         # Actor
         user=user,
         user_public_id=user.public_id,
@@ -141,7 +142,7 @@ def admin_reset_user_password(self, *, user_public_id: str, admin_public_id: str
     user.force_password_change = True
     user.save(update_fields=["force_password_change"])
 
-    AuditLog.objects.create(
+    AuditLogWriter.record(
         user=admin,
         user_public_id=admin.public_id,
         user_email=admin.email,
@@ -158,6 +159,6 @@ def admin_reset_user_password(self, *, user_public_id: str, admin_public_id: str
     # kill all of The user's actve session to force relogin wiht new password
     UserSession.objects.filter(
     user=user,
-    status=UserSession.Status.ACTIVE).update(
-        status=UserSession.Status.REVOKED)
+    status=UserSession.Status.ACTIVE).set_status(
+        UserSession.Status.REVOKED)
 
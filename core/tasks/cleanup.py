@@ -10,6 +10,8 @@ from core.utils.task_helpers import acquire_lock, batched_delete, batched_notifi
 from core.models.notifications import Notification
 from core.models.sessions import UserSession
 from core.models.tasks import ScheduledTaskRun
+from core.services.audit_partitions import AuditLogPartitions
+from core.services.security.session_activity import SessionActivityTracker
 
 
 NOTIFICATION_CLEANUP_LOCK = 842001
@@ -425,13 +427,31 @@ def expire_user_sessions(self):
     )
 
     try:
-        expired = (
+        candidates = list(
             UserSession.objects
             .filter(
                 status=UserSession.Status.ACTIVE,
                 expires_at__lt=now,
             )
-            .update(status=UserSession.Status.EXPIRED)
+            .values_list("id", flat=True)
+        )
+
+        # Activity not yet flushed may have extended some of them.
+        pending = SessionActivityTracker.get_many(candidates)
+        idle = [
+            session_id
+            for session_id in candidates
+            if session_id not in pending
+            or pending[session_id].expires_at < now.timestamp()
+        ]
+
+        expired = (
+            UserSession.objects
+            .filter(
+                id__in=idle,
+                status=UserSession.Status.ACTIVE,
+            )
+            .set_status(UserSession.Status.EXPIRED)
         )
 
         run.status = ScheduledTaskRun.Status.SUCCESS
@@ -455,4 +475,80 @@ def expire_user_sessions(self):
         run.duration_ms = int(
             (time.monotonic() - start_ts) * 1000
         )
-        run.save()
\ No newline at end of file
+        run.save()
+
+
+@shared_task(bind=True)
+def flush_session_activity(self):
+    start_ts = time.monotonic()
+
+    run = ScheduledTaskRun.objects.create(
+        task_name="flush_session_activity",
+        status=ScheduledTaskRun.Status.STARTED,
+        message="Flushing pending session activity",
+    )
+
+    try:
+        flushed = SessionActivityTracker.flush()
+
+        run.status = ScheduledTaskRun.Status.SUCCESS
+        run.message = f"flushed={flushed}"
+
+        return {"flushed": flushed}
+
+    except Exception as exc:
+        run.status = ScheduledTaskRun.Status.FAILED
+        run.message = str(exc)
+        logger.exception(
+            "flush_session_activity_failed",
+            extra={
+                "task": "flush_session_activity",
+            },
+        )
+
+        raise
+
+    finally:
+        run.duration_ms = int(
+            (time.monotonic() - start_ts) * 1000
+        )
+        run.save()
+
+
+@shared_task(bind=True)
+def maintain_audit_log_partitions(self):
+    start_ts = time.monotonic()
+
+    run = ScheduledTaskRun.objects.create(
+        task_name="maintain_audit_log_partitions",
+        status=ScheduledTaskRun.Status.STARTED,
+        message="Preparing audit log partitions",
+    )
+
+    try:
+        created = AuditLogPartitions.ensure_partitions(
+            months_ahead=settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD,
+        )
+
+        run.status = ScheduledTaskRun.Status.SUCCESS
+        run.message = f"created={len(created)}"
+
+        return {"created": created}
+
+    except Exception as exc:
+        run.status = ScheduledTaskRun.Status.FAILED
+        run.message = str(exc)
+        logger.exception(
+            "maintain_audit_log_partitions_failed",
+            extra={
+                "task": "maintain_audit_log_partitions",
+            },
+        )
+
+        raise
+
+    finally:
+        run.duration_ms = int(
+            (time.monotonic() - start_ts) * 1000
+        )
+        run.save()
@@ -39,13 +39,14 @@ class _BaseAssetLifecycleTest():
     # SOFT DELETE
     # -----------------------------
     def test_soft_delete_success(self):
-        result = soft_delete_asset(
-            actor=self.admin,
-            asset=self.asset,
-            batch=False,
-            use_atomic=False,
-            lock_asset=False,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            result = soft_delete_asset(
+                actor=self.admin,
+                asset=self.asset,
+                batch=False,
+                use_atomic=False,
+                lock_asset=False,
+            )
 
         self.asset.refresh_from_db()
 
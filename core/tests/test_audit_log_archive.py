@@ -0,0 +1,123 @@
+import csv
+import gzip
+import shutil
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models.audit import AuditLog
+from core.services.audit_partitions import AuditLogPartitions
+from core.tasks.cleanup import maintain_audit_log_partitions
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+class AuditLogArchiveTests(TestCase):
+    """
+    Whole months older than the retention window are written to gzip CSV
+    files and removed; newer months are left untouched.
+    """
+
+    def setUp(self):
+        self.archive_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.archive_dir, ignore_errors=True)
+
+        for created_at in (
+            utc(2026, 1, 3, 8),
+            utc(2026, 1, 30, 17),
+            utc(2026, 2, 14, 9),
+            utc(2026, 4, 1, 0),
+        ):
+            AuditLog.objects.create(
+                event_type=AuditLog.Events.MODEL_UPDATED,
+                description=f"change {created_at:%Y-%m-%d}",
+                metadata={"field": "name"},
+                created_at=created_at,
+            )
+
+    def read_archive(self, name):
+        with gzip.open(self.archive_dir / name, "rt", encoding="utf-8") as archive:
+            return list(csv.DictReader(archive))
+
+    def test_months_before_cutoff_are_archived_and_removed(self):
+        archived = AuditLogPartitions.archive_before(
+            utc(2026, 3, 20),
+            archive_dir=self.archive_dir,
+        )
+
+        self.assertEqual(
+            [(f"{entry.month:%Y-%m}", entry.rows) for entry in archived],
+            [("2026-01", 2), ("2026-02", 1)],
+        )
+        self.assertEqual(
+            list(AuditLog.objects.values_list("description", flat=True)),
+            ["change 2026-04-01"],
+        )
+
+        rows = self.read_archive("auditlog_2026_01.csv.gz")
+        self.assertEqual(
+            [row["description"] for row in rows],
+            ["change 2026-01-03", "change 2026-01-30"],
+        )
+        self.assertEqual(rows[0]["metadata"], '{"field": "name"}')
+        self.assertIn("public_id", rows[0])
+
+    def test_existing_archive_is_not_overwritten(self):
+        (self.archive_dir / "auditlog_2026_01.csv.gz").write_bytes(b"kept")
+
+        AuditLogPartitions.archive_before(
+            utc(2026, 2, 1),
+            archive_dir=self.archive_dir,
+        )
+
+        self.assertEqual(
+            (self.archive_dir / "auditlog_2026_01.csv.gz").read_bytes(),
+            b"kept",
+        )
+        self.assertEqual(len(self.read_archive("auditlog_2026_01_2.csv.gz")), 2)
+
+    def test_command_dry_run_changes_nothing(self):
+        output = StringIO()
+
+        with patch(
+            "core.management.commands.archive_audit_logs.timezone.now",
+            return_value=utc(2026, 4, 10),
+        ):
+            call_command(
+                "archive_audit_logs",
+                months=2,
+                output_dir=str(self.archive_dir),
+                dry_run=True,
+                stdout=output,
+            )
+
+        self.assertIn("Archiving audit logs before 2026-03", output.getvalue())
+        self.assertIn("2026-01: 2 rows", output.getvalue())
+        self.assertEqual(AuditLog.objects.count(), 4)
+        self.assertEqual(list(self.archive_dir.iterdir()), [])
+
+    def test_partition_task_is_a_noop_without_partitioned_table(self):
+        self.assertEqual(maintain_audit_log_partitions.run(), {"created": []})
+
+
+class AuditLogPartitionMonthTests(TestCase):
+    def test_month_arithmetic_crosses_years(self):
+        self.assertEqual(
+            AuditLogPartitions.add_months(utc(2026, 11, 1), 3),
+            utc(2027, 2, 1),
+        )
+        self.assertEqual(
+            AuditLogPartitions.add_months(utc(2026, 1, 1), -1),
+            utc(2025, 12, 1),
+        )
+        self.assertEqual(
+            AuditLogPartitions.partition_name(utc(2026, 7, 1)),
+            "core_auditlog_p2026_07",
+        )
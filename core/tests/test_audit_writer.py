@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+
+from assets.asset_factories import EquipmentFactory
+from assets.models.assets import Equipment
+from core.middleware import AuditLogBufferMiddleware
+from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
+from sites.factories.site_factories import RoomFactory
+
+
+class AuditLogWriterTests(TestCase):
+    """
+    Audit entries are batched per request and only written for work that
+    commits.
+    """
+
+    def test_buffered_entries_are_written_in_one_batch_on_exit(self):
+        with AuditLogWriter.buffered():
+            with self.captureOnCommitCallbacks(execute=True):
+                for n in range(3):
+                    AuditLogWriter.record(event_type=f"event_{n}")
+
+            self.assertEqual(AuditLogWriter.pending(), 3)
+            self.assertFalse(AuditLog.objects.exists())
+
+            with patch.object(
+                AuditLog.objects,
+                "bulk_create",
+                wraps=AuditLog.objects.bulk_create,
+            ) as bulk_create:
+                AuditLogWriter.flush()
+
+        bulk_create.assert_called_once()
+        self.assertEqual(AuditLog.objects.count(), 3)
+
+    def test_unbuffered_entries_are_written_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            AuditLogWriter.record(event_type="task_event")
+
+            self.assertFalse(AuditLog.objects.exists())
+
+        self.assertTrue(AuditLog.objects.filter(event_type="task_event").exists())
+
+    def test_entries_from_rolled_back_transactions_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    AuditLogWriter.record(event_type="rolled_back")
+                    raise RuntimeError
+
+            with transaction.atomic():
+                AuditLogWriter.record(event_type="committed")
+
+        self.assertEqual(
+            list(AuditLog.objects.values_list("event_type", flat=True)),
+            ["committed"],
+        )
+
+    def test_security_events_are_written_with_the_change(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                AuditLogWriter.record(event_type=AuditLog.Events.LOGIN_FAILED)
+                raise RuntimeError
+
+        self.assertFalse(AuditLog.objects.exists())
+
+        with AuditLogWriter.buffered():
+            AuditLogWriter.record(event_type=AuditLog.Events.ACCOUNT_LOCKED)
+
+            self.assertEqual(AuditLogWriter.pending(), 0)
+            self.assertTrue(
+                AuditLog.objects.filter(
+                    event_type=AuditLog.Events.ACCOUNT_LOCKED,
+                ).exists()
+            )
+
+    def test_middleware_flushes_after_the_view(self):
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                AuditLogWriter.record(event_type="login")
+                AuditLogWriter.record(event_type="logout")
+
+            self.assertFalse(AuditLog.objects.exists())
+            return HttpResponse()
+
+        AuditLogBufferMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    @override_settings(AUDIT_LOG_BUFFER_MAX_ENTRIES=2)
+    def test_full_buffer_is_flushed_early(self):
+        with AuditLogWriter.buffered():
+            with self.captureOnCommitCallbacks(execute=True):
+                for n in range(3):
+                    AuditLogWriter.record(event_type=f"event_{n}")
+
+            self.assertEqual(AuditLog.objects.count(), 2)
+            self.assertEqual(AuditLogWriter.pending(), 1)
+
+    @override_settings(AUDIT_LOG_WRITE_MODE="celery")
+    def test_celery_mode_writes_the_same_entry(self):
+        room = RoomFactory()
+
+        with AuditLogWriter.buffered():
+            with self.captureOnCommitCallbacks(execute=True):
+                entry = AuditLogWriter.record(
+                    event_type="queued",
+                    room=room,
+                    room_name=room.name,
+                    metadata={"k": "v"},
+                )
+
+        log = AuditLog.objects.get(event_type="queued")
+        self.assertEqual(log.created_at, entry.created_at)
+        self.assertEqual(log.room_id, room.pk)
+        self.assertEqual(log.metadata, {"k": "v"})
+
+    def test_scope_rows_are_loaded_once_per_request(self):
+        room = RoomFactory()
+        first, second = EquipmentFactory.create_batch(2, room=room)
+        targets = list(Equipment.objects.filter(pk__in=[first.pk, second.pk]))
+
+        with AuditLogWriter.buffered():
+            with self.assertNumQueries(1):
+                scopes = [AuditLogWriter.resolve_scope(target) for target in targets]
+
+        for scope in scopes:
+            self.assertEqual(scope["room_name"], room.name)
+            self.assertEqual(scope["location"], room.location)
+            self.assertEqual(scope["department"], room.location.department)
+
+
+class AuditLogWriterCommitTests(TransactionTestCase):
+    """
+    The batch is written after the audited work committed, so its links
+    may point at rows that no longer exist.
+    """
+
+    def test_entry_survives_deletion_of_its_target(self):
+        equipment = EquipmentFactory()
+
+        with AuditLogWriter.buffered():
+            AuditLogWriter.record(
+                event_type=AuditLog.Events.MODEL_DELETED,
+                room=equipment.room,
+                room_name=equipment.room.name,
+                target_id=equipment.public_id,
+            )
+            equipment.room.delete()
+
+        log = AuditLog.objects.get(target_id=equipment.public_id)
+        self.assertEqual(log.room_name, equipment.room.name)
+        self.assertIsNone(log.room_id)
@@ -0,0 +1,161 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from analytics.utils.utils.cache import (
+    SYSTEM_METRICS,
+    AnalyticsCacheDependency,
+    AnalyticsCacheService,
+)
+from core.cache import codec
+from core.cache.codec import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    FORMAT_VERSION,
+    SERIALIZER_JSON,
+    SERIALIZER_PICKLE,
+    CachePayloadCodec,
+    CachePayloadDecodeError,
+)
+
+
+@override_settings(
+    CACHE_PAYLOAD_SERIALIZER="json",
+    CACHE_PAYLOAD_COMPRESSION="zlib",
+    CACHE_PAYLOAD_COMPRESS_MIN_BYTES=256,
+)
+class CachePayloadCodecTests(SimpleTestCase):
+
+    def list_payload(self, rows=50):
+        return {
+            "data": {
+                "count": rows,
+                "results": [
+                    {"public_id": f"EQ{n:06d}", "name": f"Laptop {n}"}
+                    for n in range(rows)
+                ],
+            },
+            "status": 200,
+        }
+
+    def test_round_trip(self):
+        payload = self.list_payload()
+
+        encoded = CachePayloadCodec.encode(payload)
+
+        self.assertEqual(CachePayloadCodec.decode(encoded.data), payload)
+
+    def test_header_records_version_serializer_and_compression(self):
+        encoded = CachePayloadCodec.encode(self.list_payload())
+
+        self.assertEqual(
+            tuple(encoded.data[:3]),
+            (FORMAT_VERSION, SERIALIZER_JSON, COMPRESSION_ZLIB),
+        )
+        self.assertLess(encoded.size, encoded.raw_size)
+
+    def test_small_payloads_are_not_compressed(self):
+        encoded = CachePayloadCodec.encode({"data": [], "status": 200})
+
+        self.assertEqual(encoded.data[2], COMPRESSION_NONE)
+
+    def test_decimals_are_rendered_as_strings(self):
+        encoded = CachePayloadCodec.encode({"price": Decimal("10.50")})
+
+        self.assertEqual(
+            CachePayloadCodec.decode(encoded.data),
+            {"price": "10.50"},
+        )
+
+    def test_strict_mode_preserves_python_types(self):
+        value = {"day": date(2026, 1, 1), "pair": (1, 2)}
+
+        encoded = CachePayloadCodec.encode(value, strict=True)
+
+        self.assertEqual(encoded.data[1], SERIALIZER_PICKLE)
+        self.assertEqual(CachePayloadCodec.decode(encoded.data), value)
+
+    def test_strict_mode_uses_json_for_plain_data(self):
+        encoded = CachePayloadCodec.encode({"total": 3}, strict=True)
+
+        self.assertEqual(encoded.data[1], SERIALIZER_JSON)
+
+    def test_unknown_version_is_rejected(self):
+        with self.assertRaises(CachePayloadDecodeError):
+            CachePayloadCodec.decode(b"\x09\x01\x00{}")
+
+    def test_missing_compression_library_is_a_decode_error(self):
+        with patch.object(codec, "zstandard", None):
+            with self.assertRaises(CachePayloadDecodeError):
+                CachePayloadCodec.decode(
+                    bytes((FORMAT_VERSION, SERIALIZER_JSON, codec.COMPRESSION_ZSTD))
+                    + b"data"
+                )
+
+    def test_corrupt_body_is_a_decode_error(self):
+        with self.assertRaises(CachePayloadDecodeError):
+            CachePayloadCodec.decode(
+                bytes((FORMAT_VERSION, SERIALIZER_JSON, COMPRESSION_ZLIB))
+                + b"not zlib"
+            )
+
+    @override_settings(CACHE_PAYLOAD_COMPRESSION="zstd")
+    def test_unavailable_compression_degrades_to_zlib(self):
+        with patch.object(codec, "zstandard", None):
+            self.assertEqual(
+                CachePayloadCodec.get_compression_id(),
+                COMPRESSION_ZLIB,
+            )
+
+    def test_installed_codecs_round_trip(self):
+        payload = self.list_payload()
+
+        for serializer in ("json", "msgpack"):
+            for compression in ("zstd", "lz4", "zlib"):
+                with self.subTest(serializer=serializer, compression=compression):
+                    with override_settings(
+                        CACHE_PAYLOAD_SERIALIZER=serializer,
+                        CACHE_PAYLOAD_COMPRESSION=compression,
+                    ):
+                        encoded = CachePayloadCodec.encode(payload)
+
+                    self.assertEqual(
+                        tuple(encoded.data[1:3]),
+                        (
+                            codec._SERIALIZER_NAMES[serializer],
+                            codec._COMPRESSION_NAMES[compression],
+                        ),
+                    )
+                    self.assertEqual(
+                        CachePayloadCodec.decode(encoded.data),
+                        payload,
+                    )
+
+    @override_settings(CACHE_PAYLOAD_COMPRESSION="auto")
+    def test_auto_compression_prefers_zstd(self):
+        self.assertEqual(
+            CachePayloadCodec.get_compression_id(),
+            codec.COMPRESSION_ZSTD,
+        )
+
+    def test_analytics_values_round_trip_exactly(self):
+        value = {"series": [("2026-01-01", Decimal("1.5"))], "total": 3}
+
+        AnalyticsCacheService.get_cache().clear()
+        kwargs = dict(
+            scope="system",
+            identity="global",
+            section="codec-test",
+            dimensions={},
+            dependencies=(AnalyticsCacheDependency(SYSTEM_METRICS),),
+        )
+
+        AnalyticsCacheService.get_or_build(builder=lambda: value, **kwargs)
+        cached = AnalyticsCacheService.get_or_build(
+            builder=lambda: self.fail("builder should not run on a hit"),
+            **kwargs,
+        )
+
+        self.assertEqual(cached, value)
@@ -9,6 +9,7 @@ from core.models.audit import AuditLog
 from assets.asset_factories import EquipmentFactory
 from users.factories.user_factories import AdminUserFactory, UserFactory
 from users.models.roles import RoleAssignment
+from access.models import Permission, RolePermission
 
 
 
@@ -56,7 +57,8 @@ class BatchEquipmentStatusChangeTests(TestCase):
             "status": EquipmentStatus.DAMAGED,
         }
 
-        response = self.client.post(self.url, payload, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format="json")
         self.assertEqual(response.status_code, 200)
 
         self.eq1.refresh_from_db()
@@ -180,6 +182,100 @@ class BatchEquipmentStatusChangeTests(TestCase):
         self.assertEqual(response.data["success"], 2)
         self.assertEqual(response.data["failed"], 1)
 
+    # 9️⃣ Out-of-scope Equipment Counted As Failed
+    def test_batch_status_change_out_of_scope_fails(self):
+        room_admin = UserFactory(is_active=True)
+        room_admin.active_role = RoleAssignment.objects.create(
+            user=room_admin,
+            role="ROOM_ADMIN",
+            room=self.eq1.room,
+            assigned_by=self.admin,
+        )
+        room_admin.save(update_fields=["active_role"])
+
+        permission, _ = Permission.objects.get_or_create(
+            code="assets.update_status",
+            defaults={"domain": "assets", "name": "Update status"},
+        )
+        RolePermission.objects.create(role="ROOM_ADMIN", permission=permission)
+
+        self.client.force_authenticate(user=room_admin)
+
+        payload = {
+            "equipment_public_ids": [
+                self.eq1.public_id,
+                self.eq2.public_id,
+            ],
+            "status": EquipmentStatus.DAMAGED,
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.eq1.refresh_from_db()
+        self.eq2.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["success"], 1)
+        self.assertEqual(response.data["failed"], 1)
+        self.assertEqual(self.eq1.status, EquipmentStatus.DAMAGED)
+        self.assertEqual(self.eq2.status, EquipmentStatus.OK)
+
+    # 🔟 SITE_ADMIN Can Change Equipment Without A Room
+    def test_batch_status_change_site_admin_roomless_equipment(self):
+        roomless = EquipmentFactory(room=None, status=EquipmentStatus.OK)
+        self.authenticate()
+
+        payload = {
+            "equipment_public_ids": [roomless.public_id],
+            "status": EquipmentStatus.DAMAGED,
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        roomless.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["success"], 1)
+        self.assertEqual(roomless.status, EquipmentStatus.DAMAGED)
+
+    # 1️⃣1️⃣ Assignee Can Self-Report Condition
+    def test_batch_status_change_assignee_self_report(self):
+        assignee = UserFactory(is_active=True)
+        assignee.active_role = RoleAssignment.objects.create(
+            user=assignee,
+            role="ROOM_VIEWER",
+            room=self.eq2.room,
+            assigned_by=self.admin,
+        )
+        assignee.save(update_fields=["active_role"])
+
+        EquipmentAssignment.objects.create(
+            equipment=self.eq1,
+            user=assignee,
+            assigned_by=self.admin,
+        )
+
+        permission, _ = Permission.objects.get_or_create(
+            code="assets.update_status",
+            defaults={"domain": "assets", "name": "Update status"},
+        )
+        RolePermission.objects.create(role="ROOM_VIEWER", permission=permission)
+
+        self.client.force_authenticate(user=assignee)
+
+        payload = {
+            "equipment_public_ids": [self.eq1.public_id],
+            "status": EquipmentStatus.DAMAGED,
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.eq1.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["success"], 1)
+        self.assertEqual(self.eq1.status, EquipmentStatus.DAMAGED)
+
 
 class BatchAssignEquipmentTests(TestCase):
 
@@ -218,7 +314,8 @@ class BatchAssignEquipmentTests(TestCase):
             "user_public_id": self.target_user.public_id,
         }
 
-        response = self.client.post(self.url, payload, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format="json")
         self.assertEqual(response.status_code, 200)
 
         self.assertEqual(response.data["success"], 2)
@@ -369,7 +466,8 @@ class BatchUnassignEquipmentTests(TestCase):
             ]
         }
 
-        response = self.client.post(self.url, payload, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format="json")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["success"], 2)
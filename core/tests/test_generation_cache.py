@@ -0,0 +1,150 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from core.services.generation_cache import GenerationTokenCache
+from core.services.user_scope_cache import UserScopeCacheService
+from sites.services.option_cache import SiteOptionCacheService
+
+
+@override_settings(
+    GENERATION_LOCAL_CACHE_TTL=60,
+    GENERATION_LOCAL_CACHE_MAX_ENTRIES=100,
+)
+class GenerationTokenCacheTests(SimpleTestCase):
+    """
+    The local tier must never outlive a rotation made through the
+    services, and must stay within its configured bounds.
+    """
+
+    def setUp(self):
+        caches["default"].clear()
+        GenerationTokenCache.reset()
+
+    def tearDown(self):
+        GenerationTokenCache.reset()
+
+    def test_repeat_reads_skip_the_backend(self):
+        first = UserScopeCacheService.get_generation("UID-1")
+
+        with patch.object(caches["default"], "get") as backend_get:
+            second = UserScopeCacheService.get_generation("UID-1")
+
+        backend_get.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(GenerationTokenCache.stats()["hits"], 1)
+
+    def test_rotation_discards_local_entry(self):
+        old = UserScopeCacheService.get_generation("UID-1")
+
+        result = UserScopeCacheService.invalidate_user("UID-1")
+
+        self.assertEqual(
+            UserScopeCacheService.get_generation("UID-1"),
+            result.new_generation,
+        )
+        self.assertNotEqual(old, result.new_generation)
+
+    def test_site_generation_rotation_discards_local_entry(self):
+        SiteOptionCacheService.get_generation()
+
+        result = SiteOptionCacheService.invalidate(reason="test")
+
+        self.assertEqual(
+            SiteOptionCacheService.get_generation(),
+            result.new_generation,
+        )
+
+    def test_set_after_concurrent_discard_is_ignored(self):
+        epoch = GenerationTokenCache.epoch()
+        GenerationTokenCache.discard("default", "key")
+
+        GenerationTokenCache.set("default", "key", "old", epoch=epoch)
+
+        self.assertIsNone(GenerationTokenCache.get("default", "key"))
+
+    @override_settings(GENERATION_LOCAL_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        for key in ("a", "b"):
+            GenerationTokenCache.set(
+                "default",
+                key,
+                key,
+                epoch=GenerationTokenCache.epoch(),
+            )
+
+        GenerationTokenCache.get("default", "a")
+        GenerationTokenCache.set(
+            "default",
+            "c",
+            "c",
+            epoch=GenerationTokenCache.epoch(),
+        )
+
+        self.assertEqual(GenerationTokenCache.get("default", "a"), "a")
+        self.assertIsNone(GenerationTokenCache.get("default", "b"))
+        self.assertEqual(GenerationTokenCache.stats()["evictions"], 1)
+
+    def test_entries_expire_after_ttl(self):
+        with patch(
+            "core.services.generation_cache.time.monotonic",
+            return_value=1000.0,
+        ):
+            GenerationTokenCache.set(
+                "default",
+                "key",
+                "value",
+                epoch=GenerationTokenCache.epoch(),
+            )
+
+        with patch(
+            "core.services.generation_cache.time.monotonic",
+            return_value=1061.0,
+        ):
+            self.assertIsNone(GenerationTokenCache.get("default", "key"))
+
+    @override_settings(GENERATION_LOCAL_CACHE_TTL=0)
+    def test_zero_ttl_disables_local_tier(self):
+        UserScopeCacheService.get_generation("UID-1")
+
+        with patch.object(
+            caches["default"],
+            "get",
+            return_value="from-backend",
+        ) as backend_get:
+            generation = UserScopeCacheService.get_generation("UID-1")
+
+        backend_get.assert_called_once()
+        self.assertEqual(generation, "from-backend")
+
+    def test_listener_discards_published_keys(self):
+        GenerationTokenCache.set(
+            "default",
+            "key",
+            "value",
+            epoch=GenerationTokenCache.epoch(),
+        )
+
+        pubsub = Mock()
+
+        def listen():
+            # A populated entry is only trusted after subscribing.
+            GenerationTokenCache.set(
+                "default",
+                "key",
+                "value",
+                epoch=GenerationTokenCache.epoch(),
+            )
+            yield {"data": b"default|key"}
+            raise SystemExit
+
+        pubsub.listen.side_effect = listen
+        client = Mock()
+        client.pubsub.return_value = pubsub
+
+        with self.assertRaises(SystemExit):
+            GenerationTokenCache._listen("default", client)
+
+        pubsub.subscribe.assert_called_once_with(GenerationTokenCache.CHANNEL)
+        self.assertNotIn(("default", "key"), GenerationTokenCache._entries)
@@ -0,0 +1,196 @@
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from access.models import Permission, RolePermission
+from core.models.audit import AuditLog
+from assets.api.viewsets.equipment_viewsets import EquipmentModelViewSet
+from assets.models.assets import Equipment, EquipmentStatus
+from sites.models.sites import Department, Location, Room
+from users.models.roles import RoleAssignment
+from users.models.users import User
+
+
+class StreamingListExportTests(APITestCase):
+    """
+    ?export= streams the same scoped, filtered rows the list returns,
+    without paginating or materializing the queryset.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name="Engineering")
+        location = Location.objects.create(name="Main Building", department=department)
+        cls.room = Room.objects.create(name="Room 101", location=location)
+
+        other_department = Department.objects.create(name="Science")
+        other_location = Location.objects.create(
+            name="Other Building",
+            department=other_department,
+        )
+        other_room = Room.objects.create(name="Room 202", location=other_location)
+
+        for n in range(5):
+            Equipment.objects.create(
+                name=f"Laptop {n}",
+                serial_number=f"EQ-IN-{n:03d}",
+                status=EquipmentStatus.OK,
+                room=cls.room,
+            )
+
+        Equipment.objects.create(
+            name="Outside Scope Laptop",
+            serial_number="EQ-OUT-001",
+            status=EquipmentStatus.OK,
+            room=other_room,
+        )
+
+        cls.user = User.objects.create_user(
+            email="roomadmin@example.com",
+            password="password",
+            is_staff=True,
+        )
+        cls.user.active_role = RoleAssignment.objects.create(
+            user=cls.user,
+            role="ROOM_ADMIN",
+            room=cls.room,
+        )
+        cls.user.save()
+
+        permission, _ = Permission.objects.get_or_create(
+            code="assets.view",
+            defaults={"domain": "assets", "name": "assets.view"},
+        )
+        RolePermission.objects.get_or_create(role="ROOM_ADMIN", permission=permission)
+
+        cls.url = reverse("equipments")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def export(self, export_format, **params):
+        response = self.client.get(self.url, {"export": export_format, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode("utf-8")
+
+    def test_ndjson_export_streams_scoped_rows(self):
+        response, body = self.export("ndjson")
+
+        rows = [json.loads(line) for line in body.splitlines()]
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn("attachment;", response["Content-Disposition"])
+        self.assertEqual(
+            sorted(row["serial_number"] for row in rows),
+            [f"EQ-IN-{n:03d}" for n in range(5)],
+        )
+
+    def test_csv_export_has_header_and_one_line_per_row(self):
+        response, body = self.export("csv")
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertEqual(len(rows), 5)
+        self.assertIn("serial_number", rows[0])
+
+    def test_export_applies_list_filters(self):
+        _, body = self.export("ndjson", search="Laptop 3")
+
+        rows = [json.loads(line) for line in body.splitlines()]
+
+        self.assertEqual([row["name"] for row in rows], ["Laptop 3"])
+
+    def test_export_serializes_in_chunks(self):
+        get_serializer = EquipmentModelViewSet.get_serializer
+
+        with patch.object(EquipmentModelViewSet, "export_chunk_size", 2), patch.object(
+            EquipmentModelViewSet,
+            "get_serializer",
+            autospec=True,
+            side_effect=get_serializer,
+        ) as serializer_calls:
+            _, body = self.export("ndjson")
+
+        self.assertEqual(len(body.splitlines()), 5)
+        self.assertEqual(serializer_calls.call_count, 3)
+
+    def test_unknown_export_format_is_rejected(self):
+        response = self.client.get(self.url, {"export": "xml"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_requires_staff(self):
+        self.user.is_staff = False
+        self.user.save(update_fields=["is_staff"])
+
+        response = self.client.get(self.url, {"export": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_csv_export_escapes_formula_cells(self):
+        Equipment.objects.filter(serial_number="EQ-IN-000").update(
+            name="=HYPERLINK(\"http://example.com\")",
+        )
+
+        _, body = self.export("csv")
+
+        rows = {
+            row["serial_number"]: row
+            for row in csv.DictReader(io.StringIO(body))
+        }
+
+        self.assertEqual(
+            rows["EQ-IN-000"]["name"],
+            "'=HYPERLINK(\"http://example.com\")",
+        )
+
+    def test_list_without_export_is_unchanged(self):
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.data["count"], 5)
+
+
+class AuditLogExportTests(APITestCase):
+    """
+    Free-form audit metadata keeps every key in the CSV export, whatever
+    the first row holds.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="auditor@example.com",
+            password="password",
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_csv_export_keeps_metadata_with_differing_keys(self):
+        AuditLog.objects.create(event_type="first", metadata={})
+        AuditLog.objects.create(event_type="second", metadata={"ip": "10.0.0.1"})
+        AuditLog.objects.create(event_type="third", metadata={"reason": "expired"})
+
+        response = self.client.get(reverse("audit-log-list"), {"export": "csv"})
+        body = b"".join(response.streaming_content).decode("utf-8")
+
+        rows = {
+            row["event_type"]: row
+            for row in csv.DictReader(io.StringIO(body))
+        }
+
+        self.assertEqual(json.loads(rows["first"]["metadata"]), {})
+        self.assertEqual(
+            json.loads(rows["second"]["metadata"]),
+            {"ip": "10.0.0.1"},
+        )
+        self.assertEqual(
+            json.loads(rows["third"]["metadata"]),
+            {"reason": "expired"},
+        )
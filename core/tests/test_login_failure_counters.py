@@ -0,0 +1,144 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import Throttled
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core.models import AuditLog
+from core.models.security import SecuritySettings
+from core.security_policy import invalidate_security_policy_cache
+from core.services.security.login_counters import FailedLoginCounter
+from core.services.security.login_failures import (
+    register_failed_login,
+    register_failed_login_ip,
+)
+from core.throttling import LoginThrottle
+from users.factories.user_factories import UserFactory
+
+
+@patch(
+    "core.viewsets.general_viewsets.SessionTokenLoginView.throttle_classes",
+    new=[],
+)
+class FailedLoginCounterTests(TestCase):
+    """
+    Failed logins are counted in the cache; the user row is written only
+    when the lock state changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.policy = SecuritySettings.objects.create(
+            enable_account_lockout=True,
+            lockout_attempts=3,
+            lockout_duration_minutes=15,
+            permanent_lock_threshold=10,
+        )
+        self.addCleanup(invalidate_security_policy_cache)
+        self.user = UserFactory(is_active=True)
+
+    def fail_login(self):
+        return APIClient().post(
+            reverse("login"),
+            {"email": self.user.email, "password": "WrongPassword!"},
+            format="json",
+        )
+
+    def test_lock_is_persisted_and_audited_once(self):
+        for _ in range(2):
+            self.fail_login()
+
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.locked_until)
+
+        self.fail_login()
+
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.locked_until)
+        self.assertEqual(self.user.failed_login_attempts, 3)
+        self.assertEqual(
+            AuditLog.objects.filter(
+                event_type=AuditLog.Events.ACCOUNT_LOCKED,
+                user=self.user,
+            ).count(),
+            1,
+        )
+
+    def test_failures_past_the_threshold_do_not_relock(self):
+        for _ in range(3):
+            register_failed_login(user=self.user, policy=self.policy)
+
+        locked_until = self.user.locked_until
+        result = register_failed_login(user=self.user, policy=self.policy)
+
+        self.assertFalse(result["temporarily_locked"])
+        self.assertEqual(result["failed_attempts"], 4)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.locked_until, locked_until)
+        self.assertEqual(self.user.failed_login_attempts, 3)
+
+    def test_failures_after_each_lock_escalate_to_permanent_lock(self):
+        self.policy.permanent_lock_threshold = 9
+        now = timezone.now()
+
+        # Wait out each temporary lock (shorter than the reset window)
+        # before the next guess.
+        for attempt in range(1, 10):
+            with patch(
+                "core.services.security.login_failures.timezone.now",
+                return_value=now,
+            ):
+                result = register_failed_login(
+                    user=self.user,
+                    policy=self.policy,
+                )
+
+            self.assertEqual(result["failed_attempts"], attempt)
+            now += timedelta(minutes=self.policy.lockout_duration_minutes + 1)
+
+        self.assertTrue(result["permanently_locked"])
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_locked)
+
+    def test_unavailable_counter_falls_back_to_the_row(self):
+        with patch.object(
+            FailedLoginCounter,
+            "get_cache",
+            side_effect=ConnectionError,
+        ):
+            result = register_failed_login(user=self.user, policy=self.policy)
+
+        self.assertEqual(result["failed_attempts"], 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 1)
+
+
+@override_settings(
+    IS_TESTING=False,
+    LOGIN_FAILURE_IP_LIMIT=2,
+    LOGIN_FAILURE_IP_WINDOW_SECONDS=60,
+)
+class LoginThrottleFailureTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def request(self):
+        request = APIRequestFactory().post("/", REMOTE_ADDR="10.1.1.1")
+        request.user = AnonymousUser()
+        return request
+
+    def test_throttle_refuses_clients_over_the_failure_limit(self):
+        throttle = LoginThrottle()
+        ident = throttle.get_ident(self.request())
+
+        register_failed_login_ip(ident)
+        self.assertTrue(throttle.allow_request(self.request(), None))
+
+        register_failed_login_ip(ident)
+        with self.assertRaises(Throttled):
+            LoginThrottle().allow_request(self.request(), None)
@@ -9,8 +9,9 @@ from unittest import mock
 from django.core.cache import cache
 from rest_framework_simplejwt.tokens import AccessToken
 from core.models import UserSession
-from core.security_policy import get_session_absolute_lifetime, get_session_idle_timeout
+from core.security_policy import get_session_absolute_lifetime, get_session_idle_timeout, invalidate_security_policy_cache
 from core.models.security import SecuritySettings
+from core.services.security.login_counters import FailedLoginCounter
 from users.factories.user_factories import UserFactory
 
 
@@ -24,6 +25,7 @@ TEST_UA = "unittest-agent"
 class SessionTokenLoginViewTests(TestCase):
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.url = reverse("login")
 
@@ -105,15 +107,21 @@ class SessionTokenLoginViewTests(TestCase):
                 401,
             )
 
-            user.refresh_from_db()
-
             self.assertEqual(
-                user.failed_login_attempts,
+                FailedLoginCounter.count(
+                    FailedLoginCounter.USER,
+                    user.pk,
+                    window_seconds=1800,
+                ),
                 1,
             )
 
-            self.assertIsNotNone(
-                user.last_failed_login_at,
+            # The row is only written when a lock is applied.
+            user.refresh_from_db()
+
+            self.assertEqual(
+                user.failed_login_attempts,
+                0,
             )
 
     def test_successful_login_resets_failed_login_tracking( self, ):
@@ -396,6 +404,7 @@ class SecurityPolicyTests(TestCase):
     def setUp(self):
         cache.clear()
         SecuritySettings.objects.all().delete()
+        invalidate_security_policy_cache()
 
     def test_policy_overrides_idle_timeout(self):
         SecuritySettings.objects.create(
@@ -428,6 +437,7 @@ class SecurityPolicyLoginIntegrationTests(TestCase):
 
     def setUp(self):
         cache.clear()
+        invalidate_security_policy_cache()
         self.client = APIClient()
         self.login_url = reverse("login")
 
@@ -0,0 +1,166 @@
+import base64
+import json
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.models.audit import AuditLog
+from core.pagination import FlexiblePagination, KeysetPagination
+from users.factories.user_factories import AdminUserFactory
+
+
+class AuditLogListView:
+    keyset_ordering = "-created_at"
+
+
+class KeysetPaginationTests(TestCase):
+    """
+    Keyset pages must cover every row exactly once, in order, without
+    OFFSET, including rows that share an ordering value.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = AdminUserFactory()
+        base = timezone.now()
+
+        # Pairs of rows share a timestamp to exercise the id tiebreaker.
+        AuditLog.objects.bulk_create([
+            AuditLog(
+                event_type=f"event_{n}",
+                created_at=base - timedelta(minutes=n // 2),
+            )
+            for n in range(25)
+        ])
+
+        cls.expected = list(
+            AuditLog.objects.order_by("-created_at", "-pk").values_list("pk", flat=True)
+        )
+
+    def paginate(self, url, paginator=None, view=None):
+        request = Request(APIRequestFactory().get(url))
+        request.user = self.user
+
+        paginator = paginator or KeysetPagination()
+        page = paginator.paginate_queryset(
+            AuditLog.objects.all(),
+            request,
+            view=view or AuditLogListView(),
+        )
+        return paginator, page
+
+    def cursor_of(self, link):
+        return parse_qs(urlparse(link).query)["cursor"][0]
+
+    def test_forward_pages_cover_every_row_once(self):
+        seen = []
+        url = "/audit/?page_size=4"
+
+        while url:
+            paginator, page = self.paginate(url)
+            seen.extend(row.pk for row in page)
+            url = paginator.get_next_link()
+
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_link_returns_the_prior_page(self):
+        first, first_page = self.paginate("/audit/?page_size=4")
+        second, _ = self.paginate(first.get_next_link())
+
+        previous, previous_page = self.paginate(second.get_previous_link())
+
+        self.assertEqual(
+            [row.pk for row in previous_page],
+            [row.pk for row in first_page],
+        )
+        self.assertIsNone(previous.get_previous_link())
+        self.assertIsNone(first.get_previous_link())
+
+    def test_cursor_pages_do_not_use_offset(self):
+        first, _ = self.paginate("/audit/?page_size=4")
+        request = Request(APIRequestFactory().get(first.get_next_link()))
+
+        with self.assertNumQueries(1) as queries:
+            KeysetPagination().paginate_queryset(
+                AuditLog.objects.all(),
+                request,
+                view=AuditLogListView(),
+            )
+
+        self.assertNotIn("OFFSET", queries.captured_queries[0]["sql"].upper())
+
+    def test_cursors_are_deterministic(self):
+        first, _ = self.paginate("/audit/?page_size=4")
+        again, _ = self.paginate("/audit/?page_size=4")
+
+        self.assertEqual(
+            self.cursor_of(first.get_next_link()),
+            self.cursor_of(again.get_next_link()),
+        )
+
+    def test_counts_are_only_computed_on_request(self):
+        paginator, page = self.paginate("/audit/?page_size=4")
+        response = paginator.get_paginated_response([])
+
+        self.assertNotIn("count", response.data)
+
+        paginator, page = self.paginate("/audit/?page_size=4&count=approx")
+        response = paginator.get_paginated_response([])
+
+        self.assertEqual(response.data["count"], 25)
+        self.assertFalse(response.data["count_is_estimate"])
+
+    def test_invalid_cursor_is_not_found(self):
+        with self.assertRaises(NotFound):
+            self.paginate("/audit/?cursor=not-a-cursor")
+
+    def test_malformed_cursor_payloads_are_not_found(self):
+        payloads = (
+            [1],
+            {"p": 1},
+            {"p": 1, "v": None},
+        )
+
+        for payload in payloads:
+            encoded = base64.urlsafe_b64encode(
+                json.dumps(payload).encode("utf-8")
+            ).decode("ascii").rstrip("=")
+
+            with self.subTest(payload=payload), self.assertRaises(NotFound):
+                self.paginate(f"/audit/?cursor={encoded}")
+
+    def test_flexible_pagination_is_page_number_by_default(self):
+        paginator, page = self.paginate(
+            "/audit/?page_size=4",
+            paginator=FlexiblePagination(),
+        )
+        response = paginator.get_paginated_response([])
+
+        self.assertEqual(response.data["count"], 25)
+        self.assertIn("page=2", response.data["next"])
+
+    def test_flexible_pagination_switches_to_keyset_on_request(self):
+        paginator, page = self.paginate(
+            "/audit/?page_size=4&pagination=keyset",
+            paginator=FlexiblePagination(),
+        )
+        response = paginator.get_paginated_response([])
+
+        self.assertNotIn("count", response.data)
+        self.assertIn("cursor=", response.data["next"])
+        self.assertEqual([row.pk for row in page], self.expected[:4])
+
+    def test_views_without_keyset_ordering_ignore_the_switch(self):
+        paginator, page = self.paginate(
+            "/audit/?page_size=4&pagination=keyset",
+            paginator=FlexiblePagination(),
+            view=object(),
+        )
+
+        self.assertIsNone(paginator.keyset)
+        self.assertEqual(len(page), 4)
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models.security import SecuritySettings
+from core.security_policy import (
+    get_lockout_attempts,
+    get_security_policy,
+    get_session_idle_timeout,
+    invalidate_security_policy_cache,
+)
+from core.services.generation_cache import GenerationTokenCache
+from users.factories.user_factories import UserFactory
+
+
+class SecurityPolicySnapshotTests(TestCase):
+    """
+    The policy is served from a process-local snapshot and reloaded only
+    when its version is rotated.
+    """
+
+    def setUp(self):
+        cache.clear()
+        GenerationTokenCache.reset()
+        invalidate_security_policy_cache()
+        self.addCleanup(invalidate_security_policy_cache)
+
+    def test_repeated_reads_use_the_snapshot(self):
+        SecuritySettings.objects.create(session_idle_minutes=10)
+        get_security_policy()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_session_idle_timeout(), timedelta(minutes=10))
+            self.assertEqual(get_lockout_attempts(), 5)
+
+    def test_saving_settings_reloads_the_policy(self):
+        policy = SecuritySettings.objects.create(session_idle_minutes=10)
+        get_security_policy()
+
+        policy.session_idle_minutes = 20
+        policy.save()
+
+        self.assertEqual(get_session_idle_timeout(), timedelta(minutes=20))
+
+    def test_snapshot_changes_only_with_the_version(self):
+        SecuritySettings.objects.create(session_idle_minutes=10)
+        version = get_security_policy().version
+
+        SecuritySettings.objects.update(session_idle_minutes=20)
+        self.assertEqual(get_session_idle_timeout(), timedelta(minutes=10))
+
+        invalidate_security_policy_cache()
+
+        self.assertNotEqual(get_security_policy().version, version)
+        self.assertEqual(get_session_idle_timeout(), timedelta(minutes=20))
+
+    def test_patch_applies_immediately(self):
+        SecuritySettings.objects.create(session_idle_minutes=10)
+        get_security_policy()
+
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+        response = client.patch(
+            reverse("security_settings"),
+            {"session_idle_minutes": 45},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_session_idle_timeout(), timedelta(minutes=45))
+
+    def test_unconfigured_policy_uses_model_defaults_for_login(self):
+        policy = get_security_policy()
+
+        self.assertFalse(policy.configured)
+        self.assertEqual(policy.lockout_attempts, 5)
+        self.assertFalse(SecuritySettings.objects.exists())
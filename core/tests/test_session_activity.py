@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import SessionJWTAuthentication
+from core.factories.session_factories import UserSessionFactory
+from core.models import UserSession
+from core.services.security.session_activity import SessionActivityTracker
+from core.services.security.session_state import SessionStateCache
+from core.tasks.cleanup import expire_user_sessions, flush_session_activity
+from users.factories.user_factories import UserFactory
+
+
+@override_settings(SESSION_ACTIVITY_WRITE_BEHIND=True)
+class SessionActivityWriteBehindTests(TestCase):
+    """
+    Activity pings are buffered in the cache; readers see the buffered
+    expiry and the flush task writes it to the session row.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(is_active=True)
+        self.session = UserSessionFactory(
+            user=self.user,
+            expires_at=timezone.now() + timedelta(minutes=1),
+        )
+
+    def token(self):
+        token = AccessToken.for_user(self.user)
+        token["session_id"] = str(self.session.id)
+        token["abs_exp"] = int(time.time()) + 3600
+        return token
+
+    def ping(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token()}")
+        return client.post(reverse("session-activity"))
+
+    def test_ping_is_buffered_until_flush(self):
+        stored_expiry = self.session.expires_at
+
+        response = self.ping()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(
+            response.data["idle_exp"],
+            stored_expiry.timestamp() + 60,
+        )
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.expires_at, stored_expiry)
+
+        self.assertEqual(flush_session_activity.run(), {"flushed": 1})
+
+        self.session.refresh_from_db()
+        self.assertEqual(
+            int(self.session.expires_at.timestamp()),
+            response.data["idle_exp"],
+        )
+        self.assertEqual(flush_session_activity.run(), {"flushed": 0})
+
+    def test_flush_reads_only_pinged_sessions(self):
+        UserSessionFactory.create_batch(3, user=self.user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(SessionActivityTracker.flush(), 0)
+
+        self.ping()
+
+        # One select for the pinged session and one bulk update.
+        with self.assertNumQueries(2):
+            self.assertEqual(SessionActivityTracker.flush(), 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(SessionActivityTracker.flush(), 0)
+
+    def test_pending_activity_keeps_session_alive(self):
+        self.ping()
+        UserSession.objects.filter(id=self.session.id).update(
+            expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        cache.delete(SessionStateCache.key(self.session.id))
+
+        user = SessionJWTAuthentication().get_user(self.token())
+
+        self.assertEqual(user, self.user)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, UserSession.Status.ACTIVE)
+
+    def test_expiry_skips_sessions_with_pending_activity(self):
+        idle = UserSessionFactory(
+            user=self.user,
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        SessionActivityTracker.record(
+            self.session,
+            expires_at=timezone.now() + timedelta(minutes=30),
+            used_at=timezone.now(),
+        )
+        UserSession.objects.filter(id=self.session.id).update(
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+
+        self.assertEqual(expire_user_sessions.run(), {"expired": 1})
+
+        idle.refresh_from_db()
+        self.session.refresh_from_db()
+        self.assertEqual(idle.status, UserSession.Status.EXPIRED)
+        self.assertEqual(self.session.status, UserSession.Status.ACTIVE)
+
+    @override_settings(SESSION_ACTIVITY_WRITE_BEHIND=False)
+    def test_disabled_write_behind_saves_directly(self):
+        response = self.ping()
+
+        self.session.refresh_from_db()
+        self.assertEqual(
+            int(self.session.expires_at.timestamp()),
+            response.data["idle_exp"],
+        )
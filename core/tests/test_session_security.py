@@ -8,6 +8,7 @@ from rest_framework.test import APIClient
 
 from core.models.security import SecuritySettings
 from core.models.sessions import UserSession
+from core.security_policy import invalidate_security_policy_cache
 from core.services.security.login_failures import (
     register_failed_login,
     reset_failed_logins,
@@ -38,6 +39,7 @@ class SessionSecurityTests(TestCase):
 
     def setUp(self):
         cache.clear()
+        invalidate_security_policy_cache()
         self.client = APIClient()
 
     @staticmethod
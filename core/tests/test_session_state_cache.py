@@ -0,0 +1,120 @@
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import SessionJWTAuthentication
+from core.factories.session_factories import UserSessionFactory
+from core.models import UserSession
+from users.factories.user_factories import UserFactory
+
+
+@override_settings(SESSION_STATE_CACHE_TTL=30)
+class SessionStateCacheTests(TestCase):
+    """
+    Session validity is served from the cache after the first request, and
+    explicit session writes are visible to the next request.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(is_active=True)
+        self.session = UserSessionFactory(user=self.user)
+
+    def token(self, session=None):
+        token = AccessToken.for_user(self.user)
+        token["session_id"] = str((session or self.session).id)
+        token["abs_exp"] = int(time.time()) + 3600
+        return token
+
+    def authenticate(self, session=None):
+        auth = SessionJWTAuthentication()
+        return auth, auth.get_user(self.token(session))
+
+    def session_queries(self, queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if UserSession._meta.db_table in query["sql"]
+        ]
+
+    def test_cached_session_is_not_reloaded(self):
+        self.authenticate()
+
+        with CaptureQueriesContext(connection) as queries:
+            auth, user = self.authenticate()
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(self.session_queries(queries), [])
+        self.assertEqual(auth.session, self.session)
+
+    def test_bulk_revocation_is_written_through(self):
+        self.authenticate()
+
+        UserSession.objects.filter(user=self.user).set_status(
+            UserSession.Status.REVOKED,
+        )
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_saved_revocation_is_written_through(self):
+        self.authenticate()
+
+        self.session.status = UserSession.Status.REVOKED
+        self.session.save(update_fields=["status"])
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate()
+
+        self.assertEqual(self.session_queries(queries), [])
+
+    def test_cached_expiry_is_confirmed_before_expiring(self):
+        self.session.expires_at = timezone.now() - timedelta(seconds=1)
+        self.session.save(update_fields=["expires_at"])
+
+        # Extended without going through save(), e.g. by another worker
+        # whose cache write failed.
+        UserSession.objects.filter(id=self.session.id).update(
+            expires_at=timezone.now() + timedelta(minutes=30),
+        )
+
+        self.authenticate()
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, UserSession.Status.ACTIVE)
+
+    def test_idle_expiry_marks_session_expired(self):
+        self.session.expires_at = timezone.now() - timedelta(seconds=1)
+        self.session.save(update_fields=["expires_at"])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, UserSession.Status.EXPIRED)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate()
+
+        self.assertEqual(self.session_queries(queries), [])
+
+    def test_locked_user_is_rejected_with_cached_session(self):
+        self.authenticate()
+
+        self.user.is_locked = True
+        self.user.save(update_fields=["is_locked"])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, UserSession.Status.REVOKED)
@@ -0,0 +1,250 @@
+import json
+from unittest.mock import Mock, call, patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.mixins.caching.user_scope_list_cache import (
+    _CacheRoundTripCounter,
+    _CountedCache,
+)
+from core.services.generation_cache import GenerationTokenCache
+from core.services.user_scope_cache import UserScopeCacheService
+from sites.api.viewsets.option_viewsets import DepartmentOptionViewSet
+from sites.factories.site_factories import DepartmentFactory
+from users.factories.user_factories import AdminUserFactory
+from users.models.roles import RoleAssignment
+
+
+@override_settings(
+    USER_SCOPE_CACHE_ALIAS="default",
+    USER_SCOPE_CACHE_DEBUG_HEADERS=True,
+    USER_SCOPE_CACHE_LOCK_WAIT_MS=0,
+    USER_SCOPE_CACHE_STALE_SECONDS=0,
+)
+class UserScopeListCacheSingleFlightTests(TestCase):
+    """
+    Concurrent misses for one key must share a single database fill.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUserFactory(is_active=True)
+        cls.admin.active_role = RoleAssignment.objects.create(
+            user=cls.admin,
+            role="SITE_ADMIN",
+            assigned_by=cls.admin,
+        )
+        cls.admin.save(update_fields=["active_role"])
+
+        DepartmentFactory.create_batch(3)
+
+    def setUp(self):
+        caches["default"].clear()
+        GenerationTokenCache.reset()
+        self.factory = APIRequestFactory()
+        self.view = DepartmentOptionViewSet.as_view({"get": "list"})
+
+    def get(self, **extra):
+        request = self.factory.get("/api/options/departments/", **extra)
+        force_authenticate(request, user=self.admin)
+        return self.view(request)
+
+    def body(self, response):
+        if hasattr(response, "render"):
+            response.render()
+        return json.loads(response.content)
+
+    def hold_build_lock(self):
+        """Take the build lock as if another worker were filling the key."""
+
+        original_add = caches["default"].add
+
+        def add(key, *args, **kwargs):
+            if key.endswith(":build-lock"):
+                return False
+            return original_add(key, *args, **kwargs)
+
+        return patch.object(caches["default"], "add", side_effect=add)
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.get()["X-User-Scope-Cache"], "CREATED")
+        self.assertEqual(self.get()["X-User-Scope-Cache"], "HIT")
+
+    def test_payload_sizes_reported(self):
+        created = self.get()
+        hit = self.get()
+
+        self.assertIn("X-User-Scope-Cache-Payload-Raw-Bytes", created)
+        self.assertEqual(
+            created["X-User-Scope-Cache-Payload-Bytes"],
+            hit["X-User-Scope-Cache-Payload-Bytes"],
+        )
+        self.assertEqual(self.body(hit), self.body(created))
+
+    def test_json_hit_returns_rendered_bytes(self):
+        created = self.get()
+        hit = self.get()
+
+        self.assertNotIsInstance(hit, Response)
+        self.assertEqual(hit["Content-Type"], "application/json")
+        self.assertEqual(hit.content, created.render().content)
+
+    def test_media_type_parameters_use_normal_rendering(self):
+        self.get()
+
+        hit = self.get(HTTP_ACCEPT="application/json; indent=4")
+
+        self.assertIsInstance(hit, Response)
+        self.assertEqual(hit["X-User-Scope-Cache"], "HIT")
+        self.assertIn(b"\n    ", hit.render().content)
+
+    @override_settings(USER_SCOPE_CACHE_RENDERED_PASSTHROUGH=False)
+    def test_passthrough_can_be_disabled(self):
+        self.get()
+
+        self.assertIsInstance(self.get(), Response)
+
+    def test_hit_with_local_generations_is_one_round_trip(self):
+        self.get()
+
+        response = self.get()
+
+        self.assertEqual(response["X-User-Scope-Cache"], "HIT")
+        self.assertEqual(response["X-User-Scope-Cache-Round-Trips"], "1")
+
+    def test_hit_reads_both_generations_in_one_round_trip(self):
+        self.get()
+        GenerationTokenCache.reset()
+
+        response = self.get()
+
+        self.assertEqual(response["X-User-Scope-Cache"], "HIT")
+        self.assertEqual(response["X-User-Scope-Cache-Round-Trips"], "2")
+
+    def test_set_entries_pipelines_per_key_timeouts(self):
+        pipeline = Mock()
+        backend = Mock()
+        backend._cache.get_client.return_value.pipeline.return_value = pipeline
+        backend._cache._serializer.dumps.side_effect = lambda value: value
+        backend.make_and_validate_key.side_effect = lambda key: key
+        backend.get_backend_timeout.side_effect = lambda timeout: timeout
+
+        counter = _CacheRoundTripCounter()
+        _CountedCache(backend, counter).set_entries([
+            ("payload", {"data": []}, 120),
+            ("marker", True, 420),
+        ])
+
+        pipeline.set.assert_has_calls([
+            call("payload", {"data": []}, ex=120),
+            call("marker", True, ex=420),
+        ])
+        pipeline.execute.assert_called_once_with()
+        backend.set.assert_not_called()
+        self.assertEqual(counter.count, 1)
+
+    def test_delete_if_value_compares_and_deletes_in_one_script(self):
+        script = Mock(return_value=1)
+        backend = Mock()
+        backend._cache.get_client.return_value.register_script.return_value = (
+            script
+        )
+        backend._cache._serializer.dumps.side_effect = lambda value: value
+        backend.make_and_validate_key.side_effect = lambda key: key
+
+        counter = _CacheRoundTripCounter()
+        released = _CountedCache(backend, counter).delete_if_value(
+            "lock",
+            "token",
+        )
+
+        self.assertTrue(released)
+        script.assert_called_once_with(keys=["lock"], args=["token"])
+        backend.delete.assert_not_called()
+        self.assertEqual(counter.count, 1)
+
+    def test_release_keeps_a_lock_taken_by_another_worker(self):
+        cache = caches["default"]
+        original_add = cache.add
+        lock_keys = []
+
+        def add(key, value, *args, **kwargs):
+            added = original_add(key, value, *args, **kwargs)
+            if key.endswith(":build-lock"):
+                # The lock expires mid-fill and another worker takes it.
+                lock_keys.append(key)
+                cache.set(key, "other-worker")
+            return added
+
+        with patch.object(cache, "add", side_effect=add):
+            self.get()
+
+        self.assertEqual(len(lock_keys), 1)
+        self.assertEqual(cache.get(lock_keys[0]), "other-worker")
+
+    def test_build_lock_released_after_fill(self):
+        self.get()
+
+        lock_keys = [
+            key
+            for key in caches["default"]._cache
+            if str(key).endswith(":build-lock")
+        ]
+        self.assertEqual(lock_keys, [])
+
+    @override_settings(USER_SCOPE_CACHE_LOCK_WAIT_MS=1000)
+    def test_waiter_serves_lock_holder_payload(self):
+        first = self.get()
+
+        # The first read misses; the lock holder's fill lands while this
+        # request is polling.
+        cache = caches["default"]
+        original_get = cache.get
+        reads = []
+
+        def get(key, default=None, *args, **kwargs):
+            if str(key).endswith(first["X-User-Scope-Cache-Request"]):
+                reads.append(key)
+                if len(reads) == 1:
+                    return default
+            return original_get(key, default, *args, **kwargs)
+
+        with self.hold_build_lock(), patch.object(
+            cache,
+            "get",
+            side_effect=get,
+        ), patch(
+            "core.mixins.caching.user_scope_list_cache.time.sleep",
+        ), self.assertNumQueries(0):
+            response = self.get()
+
+        self.assertEqual(response["X-User-Scope-Cache"], "HIT_AFTER_WAIT")
+        self.assertEqual(self.body(response), self.body(first))
+        self.assertEqual(len(reads), 2)
+
+    def test_waiter_falls_back_to_database_after_wait(self):
+        with self.hold_build_lock():
+            response = self.get()
+
+        self.assertEqual(response["X-User-Scope-Cache"], "CREATED")
+
+    @override_settings(USER_SCOPE_CACHE_STALE_SECONDS=30)
+    def test_stale_payload_served_during_rebuild(self):
+        first = self.get()
+        UserScopeCacheService.invalidate_user(self.admin.public_id)
+
+        with self.hold_build_lock(), self.assertNumQueries(0):
+            response = self.get()
+
+        self.assertEqual(response["X-User-Scope-Cache"], "STALE")
+        self.assertEqual(self.body(response), self.body(first))
+
+    @override_settings(USER_SCOPE_CACHE_STALE_SECONDS=30)
+    def test_lock_holder_rebuilds_instead_of_serving_stale(self):
+        self.get()
+        UserScopeCacheService.invalidate_user(self.admin.public_id)
+
+        self.assertEqual(self.get()["X-User-Scope-Cache"], "CREATED")
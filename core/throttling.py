@@ -2,13 +2,31 @@ from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from rest_framework.exceptions import Throttled
 from django.conf import settings
 
+from core.services.security.login_counters import FailedLoginCounter
+
 class LoginThrottle(AnonRateThrottle):
+    """
+    Rate-limits login attempts per client, and refuses clients whose failed
+    logins (counted by ``register_failed_login_ip``) reach
+    ``LOGIN_FAILURE_IP_LIMIT`` within ``LOGIN_FAILURE_IP_WINDOW_SECONDS``.
+    """
+
     scope = "login"
 
     def allow_request(self, request, view):
         # Disable throttling during tests
         if getattr(settings, "IS_TESTING", False):
             return True
+
+        failures = FailedLoginCounter.count(
+            FailedLoginCounter.IP,
+            self.get_ident(request),
+            window_seconds=settings.LOGIN_FAILURE_IP_WINDOW_SECONDS,
+        )
+
+        if failures is not None and failures >= settings.LOGIN_FAILURE_IP_LIMIT:
+            return self.throttle_failure()
+
         return super().allow_request(request, view)
 
     def throttle_failure(self):
@@ -1,4 +1,4 @@
-from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 from django.utils.text import capfirst
 
 
@@ -7,51 +7,7 @@ def _resolve_scope_from_target(target):
     """
     Resolve department / location / room from the target object itself.
     """
-    room = location = department = None
-    room_name = location_name = department_name = None
-
-    if not target:
-        return {
-            "room": None,
-            "room_name": None,
-            "location": None,
-            "location_name": None,
-            "department": None,
-            "department_name": None,
-        }
-
-    if hasattr(target, "room") and target.room:
-        room = target.room
-        room_name = room.name
-
-        if getattr(room, "location", None):
-            location = room.location
-            location_name = location.name
-
-            if getattr(location, "department", None):
-                department = location.department
-                department_name = department.name
-
-    elif hasattr(target, "location") and target.location:
-        location = target.location
-        location_name = location.name
-
-        if getattr(location, "department", None):
-            department = location.department
-            department_name = department.name
-
-    elif hasattr(target, "department") and target.department:
-        department = target.department
-        department_name = department.name
-
-    return {
-        "room": room,
-        "room_name": room_name,
-        "location": location,
-        "location_name": location_name,
-        "department": department,
-        "department_name": department_name,
-    }
+    return AuditLogWriter.resolve_scope(target)
 
 
 def _get_target_label(target):
@@ -94,14 +50,17 @@ def create_audit_log(
     metadata=None,
 ):
     """
-    Create an immutable audit log entry.
+    Record an immutable audit log entry.
     Intended for explicit domain actions (non-CRUD).
+
+    The entry is written with the rest of the request's audit batch once
+    the surrounding transaction commits.
     """
 
     user = getattr(request, "user", None)
     scope = _resolve_scope_from_target(target)
 
-    AuditLog.objects.create(
+    AuditLogWriter.record(
         # Actor
         user=user,
         user_public_id=getattr(user, "public_id", None),
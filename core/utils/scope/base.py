@@ -1,5 +1,7 @@
 from django.db.models import Q
 
+from sites.models.sites import RoomAncestry
+
 class Scope:
     """
     Normalized representation of a user's effective scope.
@@ -48,13 +50,29 @@ class BaseScopePolicy:
 
     # ---- shared helpers ----
 
-    def room_hierarchy_q(self):
-        if self.scope.level == "room":
-            return Q(room=self.scope.obj)
+    def scoped_room_ids(self):
+        """
+        Room ids covered by a location/department scope.
+
+        Reads the ``RoomAncestry`` closure as a single indexed subquery so
+        callers filter on ``room_id`` instead of joining room -> location ->
+        department. Returns ``None`` for room and unscoped roles.
+        """
         if self.scope.level == "location":
-            return Q(room__location=self.scope.obj)
+            return RoomAncestry.objects.filter(
+                location_id=self.scope.obj.pk,
+            ).values("room_id")
         if self.scope.level == "department":
-            return Q(room__location__department=self.scope.obj)
+            return RoomAncestry.objects.filter(
+                department_id=self.scope.obj.pk,
+            ).values("room_id")
+        return None
+
+    def room_hierarchy_q(self, field="room"):
+        if self.scope.level == "room":
+            return Q(**{f"{field}_id": self.scope.obj.pk})
+        if self.scope.level in {"location", "department"}:
+            return Q(**{f"{field}_id__in": self.scoped_room_ids()})
         return Q()
 
     def location_hierarchy_q(self):
@@ -1,7 +1,7 @@
 from django.db.models import Q
 from django.contrib.auth import get_user_model
 from assets.models.assets import Accessory,Component, Consumable, Equipment
-from assignments.models.asset_assignment import ReturnRequest
+from assignments.models.asset_assignment import AccessoryAssignment, ConsumableIssue, ReturnRequest
 from core.models.audit import AuditLog
 from core.utils.scope.base import BaseScopePolicy
 from agreements.models.agreements import AgreementCoverage, AssetAgreement, AssetAgreementItem
@@ -43,7 +43,7 @@ class RoomScopePolicy(BaseScopePolicy):
             return self.queryset.filter(location=self.scope.obj)
 
         if self.scope.level == "department":
-            return self.queryset.filter(location__department=self.scope.obj)
+            return self.queryset.filter(pk__in=self.scoped_room_ids())
 
         return self.queryset.none()
 
@@ -109,7 +109,8 @@ class AuditLogScopePolicy(BaseScopePolicy):
         if not self.scope.level:
             return self.queryset.none()
 
-        return self.queryset.filter(self.room_hierarchy_q()).distinct()
+        # Only forward foreign keys are involved, so no DISTINCT is needed.
+        return self.queryset.filter(self.room_hierarchy_q())
 
 
 @register(Equipment)
@@ -132,7 +133,8 @@ class EquipmentScopePolicy(BaseScopePolicy):
             active_assignment__returned_at__isnull=True,
         )
 
-        return self.queryset.filter(scope_q | assignment_q).distinct()
+        # active_assignment is one-to-one, so the join cannot duplicate rows.
+        return self.queryset.filter(scope_q | assignment_q)
 
 
 @register(Accessory)
@@ -151,12 +153,14 @@ class AccessoryScopePolicy(BaseScopePolicy):
         scope_q = self.room_hierarchy_q()
 
         assignment_q = Q(
-            assignments__user=self.user,
-            assignments__returned_at__isnull=True,
-            assignments__quantity__gt=0,
+            pk__in=AccessoryAssignment.objects.filter(
+                user=self.user,
+                returned_at__isnull=True,
+                quantity__gt=0,
+            ).values("accessory_id")
         )
 
-        return self.queryset.filter(scope_q | assignment_q).distinct()
+        return self.queryset.filter(scope_q | assignment_q)
 
 
 @register(Consumable)
@@ -175,12 +179,14 @@ class ConsumableScopePolicy(BaseScopePolicy):
         scope_q = self.room_hierarchy_q()
 
         assignment_q = Q(
-            issues__user=self.user,
-            issues__returned_at__isnull=True,
-            issues__quantity__gt=0,
+            pk__in=ConsumableIssue.objects.filter(
+                user=self.user,
+                returned_at__isnull=True,
+                quantity__gt=0,
+            ).values("consumable_id")
         )
 
-        return self.queryset.filter(scope_q | assignment_q).distinct()
+        return self.queryset.filter(scope_q | assignment_q)
 
 
 @register(Component)
@@ -196,19 +202,9 @@ class ComponentScopePolicy(BaseScopePolicy):
         if not self.scope.level:
             return self.queryset.none()
 
-        if self.scope.level == "room":
-            q = Q(equipment__room=self.scope.obj)
-
-        elif self.scope.level == "location":
-            q = Q(equipment__room__location=self.scope.obj)
-
-        elif self.scope.level == "department":
-            q = Q(equipment__room__location__department=self.scope.obj)
-
-        else:
-            return self.queryset.none()
-
-        return self.queryset.filter(q).distinct()
+        return self.queryset.filter(
+            self.room_hierarchy_q(field="equipment__room")
+        )
 
 
 
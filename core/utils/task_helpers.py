@@ -40,7 +40,23 @@ def acquire_lock(lock_id: int) -> bool:
             [lock_id],
         )
         return cursor.fetchone()[0]
-    
+
+
+def acquire_xact_lock(lock_id: int) -> None:
+    """
+    Block until the current transaction holds advisory lock ``lock_id``.
+    The lock is released at commit or rollback. No-op off PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s);",
+            [lock_id],
+        )
+
+
 def batched_delete(qs, batch_size=2000):
     total_deleted = 0
 
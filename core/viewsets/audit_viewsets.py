@@ -1,7 +1,7 @@
 from rest_framework import viewsets, status
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter
-from core.mixins import ListDetailSerializerMixin
+from core.mixins import ListDetailSerializerMixin, StreamingExportMixin
 from core.models.audit import AuditLog
 from core.pagination import FlexiblePagination
 from core.serializers.auth import AuditLogLightSerializer, AuditLogSerializer, NotificationSerializer
@@ -18,6 +18,7 @@ from core.filters import AuditLogFilter
 
 class AuditLogViewSet(
     ListDetailSerializerMixin,
+    StreamingExportMixin,
     viewsets.ReadOnlyModelViewSet,
 ):
     """
@@ -34,6 +35,7 @@ class AuditLogViewSet(
     detail_serializer_class = AuditLogSerializer
 
     pagination_class = FlexiblePagination
+    keyset_ordering = "-created_at"
 
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_class = AuditLogFilter
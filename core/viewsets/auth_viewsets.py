@@ -21,7 +21,9 @@ from rest_framework.permissions import IsAuthenticated
 from core.authentication import SessionJWTAuthentication
 from django.utils import timezone
 from datetime import timedelta
-from core.security_policy import get_session_idle_timeout, invalidate_security_policy_cache
+from core.security_policy import get_session_idle_timeout
+from core.services.security.login_counters import FailedLoginCounter
+from core.services.security.session_activity import SessionActivityTracker
 from core.models.notifications import Notification
 from core.models.security import SecuritySettings
 from core.filters import SiteNameChangeHistoryFilter
@@ -60,10 +62,10 @@ class SecuritySettingsAPIView(APIView):
         )
 
         if serializer.is_valid():
+            # SecuritySettings.save() rotates the policy version and
+            # broadcasts it to every worker.
             serializer.save()
 
-            invalidate_security_policy_cache()
-
             return Response(serializer.data)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -128,6 +130,8 @@ class UserLockViewSet(AuditMixin, viewsets.GenericViewSet):
             "last_failed_login_at",
         ])
 
+        FailedLoginCounter.reset(FailedLoginCounter.USER, user.pk)
+
         # -----------------------------------------
         # Revoke active sessions
         # -----------------------------------------
@@ -135,8 +139,8 @@ class UserLockViewSet(AuditMixin, viewsets.GenericViewSet):
         revoked = UserSession.objects.filter(
             user=user,
             status=UserSession.Status.ACTIVE,
-        ).update(
-            status=UserSession.Status.REVOKED
+        ).set_status(
+            UserSession.Status.REVOKED
         )
 
         # -----------------------------------------
@@ -210,6 +214,8 @@ class UserLockViewSet(AuditMixin, viewsets.GenericViewSet):
             "locked_reason",
         ])
 
+        FailedLoginCounter.reset(FailedLoginCounter.USER, user.pk)
+
         # -----------------------------------------
         # Audit event
         # -----------------------------------------
@@ -294,8 +300,8 @@ class ChangePasswordView(APIView):
             serializer.save()
 
             # Revoke all user sessions (security measure)
-            UserSession.objects.filter(user=request.user, status=UserSession.Status.ACTIVE).update(
-                status=UserSession.Status.REVOKED
+            UserSession.objects.filter(user=request.user, status=UserSession.Status.ACTIVE).set_status(
+                UserSession.Status.REVOKED
             )
 
         response = Response(
@@ -736,12 +742,15 @@ class SessionActivityAPIView(APIView):
             new_expiry = session.absolute_expires_at
 
         # ------------------------------------------------
-        # Prevent unnecessary DB writes
+        # Prevent unnecessary writes; the row is updated by
+        # flush_session_activity
         # ------------------------------------------------
         if new_expiry - session.expires_at > timedelta(seconds=30):
-            session.expires_at = new_expiry
-            session.last_used_at = now
-            session.save(update_fields=["expires_at", "last_used_at"])
+            SessionActivityTracker.record(
+                session,
+                expires_at=new_expiry,
+                used_at=now,
+            )
 
         # ------------------------------------------------
         # Response for frontend timers
@@ -16,6 +16,7 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from core.logging import get_logger
 from core.mixins import AuditMixin
 from core.models.audit import AuditLog
+from core.services.audit_writer import AuditLogWriter
 from core.models.sessions import UserSession
 from core.security_policy import *
 from core.serializers.auth import PasswordResetConfirmSerializer
@@ -26,9 +27,11 @@ from core.serializers.general import (
 from core.services.security.login_failures import (
     is_temporarily_locked,
     register_failed_login,
+    register_failed_login_ip,
     reset_failed_logins,
     validate_user_not_locked,
 )
+from core.services.security.session_activity import SessionActivityTracker
 from core.throttling import LoginThrottle, RefreshTokenThrottle
 from core.utils.tokens import PasswordResetToken
 from users.models import User
@@ -78,7 +81,7 @@ class SessionTokenLoginView(TokenObtainPairView):
         # Load security policy
         # -----------------------------------------
 
-        policy = SecuritySettings.load()
+        policy = get_security_policy()
 
         # -----------------------------------------
         # Resolve user (if exists)
@@ -99,7 +102,7 @@ class SessionTokenLoginView(TokenObtainPairView):
 
         except AuthenticationFailed as exc:
 
-            AuditLog.objects.create(
+            AuditLogWriter.record(
                 event_type=AuditLog.Events.ACCOUNT_LOCKED,
                 user=user,
                 user_public_id=str(user.public_id),
@@ -136,6 +139,9 @@ class SessionTokenLoginView(TokenObtainPairView):
             # Register failed login attempt
             # -----------------------------------------
 
+            # Keyed like LoginThrottle, which reads the same counter.
+            register_failed_login_ip(LoginThrottle().get_ident(request))
+
             if user:
 
                 lock_result = register_failed_login(
@@ -147,7 +153,7 @@ class SessionTokenLoginView(TokenObtainPairView):
             # Failed login audit
             # -----------------------------------------
 
-            AuditLog.objects.create(
+            AuditLogWriter.record(
                 event_type=AuditLog.Events.LOGIN_FAILED,
                 user=user,
                 user_public_id=(
@@ -178,7 +184,7 @@ class SessionTokenLoginView(TokenObtainPairView):
                 )
             ):
 
-                AuditLog.objects.create(
+                AuditLogWriter.record(
                     event_type=AuditLog.Events.ACCOUNT_LOCKED,
                     user=user,
                     user_public_id=str(user.public_id),
@@ -276,7 +282,7 @@ class SessionTokenLoginView(TokenObtainPairView):
                             update_fields=["status"]
                         )
 
-                        AuditLog.objects.create(
+                        AuditLogWriter.record(
                             event_type=(
                                 AuditLog.Events
                                 .SESSION_REVOKED
@@ -382,7 +388,7 @@ class SessionTokenLoginView(TokenObtainPairView):
         # Successful login audit
         # -----------------------------------------
 
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             event_type=AuditLog.Events.LOGIN,
             user=user,
             user_public_id=str(user.public_id),
@@ -502,9 +508,9 @@ class RefreshAPIView(APIView):
     def _revoke_family(session: UserSession, *, reason: str) -> None:
         UserSession.objects.filter(
             session_family=session.session_family,
-        ).update(status=UserSession.Status.REVOKED)
+        ).set_status(UserSession.Status.REVOKED)
 
-        AuditLog.objects.create(
+        AuditLogWriter.record(
             event_type=AuditLog.Events.SESSION_REVOKED,
             user=session.user,
             user_public_id=str(session.user.public_id),
@@ -598,6 +604,8 @@ class RefreshAPIView(APIView):
                         cookie_name=cookie_name,
                     )
 
+                SessionActivityTracker.apply(session)
+
                 is_current_token = secrets.compare_digest(
                     session.refresh_token_hash,
                     hashed_refresh,
@@ -651,7 +659,7 @@ class RefreshAPIView(APIView):
                     session.status = UserSession.Status.REVOKED
                     session.save(update_fields=["status"])
 
-                    AuditLog.objects.create(
+                    AuditLogWriter.record(
                         event_type=AuditLog.Events.SESSION_REVOKED,
                         user=session.user,
                         user_public_id=str(session.user.public_id),
@@ -673,7 +681,7 @@ class RefreshAPIView(APIView):
                     session.status = UserSession.Status.EXPIRED
                     session.save(update_fields=["status"])
 
-                    AuditLog.objects.create(
+                    AuditLogWriter.record(
                         event_type=AuditLog.Events.SESSION_EXPIRED,
                         user=session.user,
                         user_public_id=str(session.user.public_id),
@@ -691,9 +699,9 @@ class RefreshAPIView(APIView):
                     UserSession.objects.filter(
                         user=user,
                         status=UserSession.Status.ACTIVE,
-                    ).update(status=UserSession.Status.REVOKED)
+                    ).set_status(UserSession.Status.REVOKED)
 
-                    AuditLog.objects.create(
+                    AuditLogWriter.record(
                         event_type=AuditLog.Events.SESSION_REVOKED,
                         user=user,
                         user_public_id=str(user.public_id),
@@ -940,7 +948,7 @@ class LogoutAPIView(APIView):
 
         if session is not None and revoked_now:
             try:
-                AuditLog.objects.create(
+                AuditLogWriter.record(
                     event_type=AuditLog.Events.LOGOUT,
                     user=session.user,
                     user_public_id=str(session.user.public_id),
@@ -83,7 +83,7 @@ class UserSessionViewSet(viewsets.GenericViewSet):
             status=UserSession.Status.ACTIVE
         ).exclude(id=session_id)
 
-        revoked_count = sessions.update(status=UserSession.Status.REVOKED)
+        revoked_count = sessions.set_status(UserSession.Status.REVOKED)
 
         return Response(
             {"revoked_sessions": revoked_count},
@@ -109,7 +109,7 @@ class UserSessionViewSet(viewsets.GenericViewSet):
             status=UserSession.Status.ACTIVE
         )
 
-        revoked_count = sessions.update(status=UserSession.Status.REVOKED)
+        revoked_count = sessions.set_status(UserSession.Status.REVOKED)
 
         return Response(
             {"revoked_sessions": revoked_count},
@@ -143,7 +143,7 @@ class RevokeUserSessionsViewset(viewsets.GenericViewSet):
             status=UserSession.Status.ACTIVE
         )
 
-        revoked_count = sessions.update(status=UserSession.Status.REVOKED)
+        revoked_count = sessions.set_status(UserSession.Status.REVOKED)
 
         return Response(
             {
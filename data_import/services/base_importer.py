@@ -1,18 +1,50 @@
 import csv
 from dataclasses import dataclass, field
 
+from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db import transaction
+from django.db import DataError, IntegrityError, transaction
 from django.utils import timezone
 from sites.models.sites import Room
 from core.permissions.helpers import has_hierarchy_permission, is_admin_role, is_in_scope, is_viewer_role
 import pandas as pd
 import io
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
 from core.task_reliability import is_transient_task_error
-from data_import.utils import load_and_normalize_csv
+from data_import.utils import iter_csv_chunks
 from reporting.services.job_state import JobLeaseLost
 
+
+class RowSkipped(Exception):
+    """A row that is left out of the import without being an error."""
+
+
+@dataclass
+class PendingRow:
+    row_number: int
+    raw_row: dict
+    row_data: dict
+    room: Room | None = None
+    instance: object = None
+
+
+class TakenValueValidator:
+    """
+    ``UniqueValidator`` stand-in checking values preloaded for a chunk,
+    with the replaced validator's message.
+    """
+
+    def __init__(self, taken: set, message):
+        self.taken = taken
+        self.message = message
+
+    def __call__(self, value):
+        if value in self.taken:
+            raise serializers.ValidationError(self.message, code="unique")
+
+
 @dataclass
 class ImportRowIssue:
     row_number: int
@@ -60,10 +92,21 @@ class BaseAssetImporter:
     allowed_headers = set()
     serializer_class = None
 
+    # Set-based import (see import_bulk). Importers that define ``model``
+    # validate rows with ``serializer_class`` and insert them with
+    # ``bulk_create``.
+    model = None
+    unique_fields = ()
+
     def __init__(self, user, job=None):
         self.user = user
         self.job = job
         self.seen_keys = set()
+        self.rooms = {}
+        self.room_permissions = {}
+
+    def supports_bulk(self) -> bool:
+        return self.model is not None and settings.IMPORT_BULK_ENABLED
 
     def run(self, *, stored_file_name: str) -> dict:
         result = ImportResult()
@@ -74,16 +117,57 @@ class BaseAssetImporter:
         if not default_storage.exists(stored_file_name):
             raise ValueError(f"Import file not found: {stored_file_name}")
 
-        # -----------------------------
-        # Load and normalize CSV
-        # -----------------------------
         with default_storage.open(stored_file_name, "rb") as f:
-            df = load_and_normalize_csv(f)
+            # -----------------------------
+            # Validate headers and count rows
+            # -----------------------------
+            # The file is streamed twice: a counting pass keeps the row
+            # limit all-or-nothing, and the import pass below never holds
+            # more than one chunk in memory.
+            for chunk in iter_csv_chunks(
+                f,
+                chunksize=settings.IMPORT_CSV_CHUNK_ROWS,
+            ):
+                if not result.total_rows:
+                    self.check_headers(set(chunk.columns))
+
+                result.total_rows += len(chunk)
+
+            if result.total_rows > settings.IMPORT_MAX_ROWS:
+                raise ValueError(
+                    f"CSV exceeds the {settings.IMPORT_MAX_ROWS:,} row limit."
+                )
+
+            # -----------------------------
+            # Process rows
+            # -----------------------------
+            row_number = 2
+
+            for chunk in iter_csv_chunks(
+                f,
+                chunksize=settings.IMPORT_CSV_CHUNK_ROWS,
+            ):
+                if self.supports_bulk():
+                    completed = self.import_bulk(
+                        chunk,
+                        result,
+                        first_row_number=row_number,
+                    )
+                else:
+                    completed = self.import_rows(
+                        chunk.to_dict(orient="records"),
+                        result,
+                        first_row_number=row_number,
+                    )
 
-        # print("Detected columns:", df.columns.tolist())
+                if not completed:
+                    break
+
+                row_number += len(chunk)
 
-        headers = set(df.columns)
+        return self.to_payload(result)
 
+    def check_headers(self, headers: set):
         missing = self.required_headers - headers
         extra = headers - self.allowed_headers
 
@@ -97,39 +181,51 @@ class BaseAssetImporter:
                 f"Unexpected columns: {', '.join(sorted(extra))}"
             )
 
-        rows = df.to_dict(orient="records")
+    def refresh_lease(self) -> bool:
+        """
+        Refresh the job's execution lease. Returns ``False`` when the job
+        was cancelled and the import should stop.
+        """
+
+        updated = (
+            self.job.__class__.objects
+            .filter(
+                pk=self.job.pk,
+                status=self.job.Status.RUNNING,
+                task_id=self.job.task_id,
+            )
+            .update(heartbeat_at=timezone.now())
+        )
+        self.job.refresh_from_db()
 
-        result.total_rows = len(rows)
+        if self.job.status == self.job.Status.CANCELLED:
+            return False
 
-        if result.total_rows > 10_000:
-            raise ValueError("CSV exceeds the 10,000 row limit.")
+        if not updated:
+            raise JobLeaseLost(
+                "Import execution lease is no longer owned by this task."
+            )
 
-        # -----------------------------
-        # Process rows
-        # -----------------------------
-        for index, raw_row in enumerate(rows, start=2):
+        return True
 
-            # Refresh the execution lease and observe cancellation in bounded
-            # intervals without adding a query for every imported row.
-            if self.job and index % 10 == 0:
-                updated = (
-                    self.job.__class__.objects
-                    .filter(
-                        pk=self.job.pk,
-                        status=self.job.Status.RUNNING,
-                        task_id=self.job.task_id,
-                    )
-                    .update(heartbeat_at=timezone.now())
-                )
-                self.job.refresh_from_db()
+    # -----------------------------
+    # Row-by-row import
+    # -----------------------------
+    def import_rows(
+        self,
+        rows: list[dict],
+        result: ImportResult,
+        *,
+        first_row_number: int = 2,
+    ) -> bool:
+        """Import rows one by one. Returns ``False`` if the job was cancelled."""
 
-                if self.job.status == self.job.Status.CANCELLED:
-                    break
+        for index, raw_row in enumerate(rows, start=first_row_number):
 
-                if not updated:
-                    raise JobLeaseLost(
-                        "Import execution lease is no longer owned by this task."
-                    )
+            # Refresh the execution lease and observe cancellation in bounded
+            # intervals without adding a query for every imported row.
+            if self.job and index % 10 == 0 and not self.refresh_lease():
+                return False
 
             if self._is_blank_row(raw_row):
                 continue
@@ -198,7 +294,294 @@ class BaseAssetImporter:
                     f"Unexpected error: {exc}",
                     raw_row,
                 )
-        return self.to_payload(result)
+
+        return True
+
+    # -----------------------------
+    # Set-based import
+    # -----------------------------
+    def import_bulk(
+        self,
+        df: pd.DataFrame,
+        result: ImportResult,
+        *,
+        first_row_number: int = 2,
+    ) -> bool:
+        """
+        Import the frame in chunks of ``IMPORT_BULK_BATCH_SIZE`` rows.
+        Returns ``False`` if the job was cancelled.
+
+        Each chunk resolves its rooms, existing assets and unique values with
+        one query each and is inserted with ``bulk_create``, so the number of
+        queries no longer grows with the number of rows. Rows are checked in
+        the same order as ``import_rows`` and report the same issues.
+        """
+
+        batch_size = max(1, settings.IMPORT_BULK_BATCH_SIZE)
+        rows = df.to_dict(orient="records")
+
+        for start in range(0, len(rows), batch_size):
+            if self.job and not self.refresh_lease():
+                return False
+
+            self.import_chunk(
+                rows[start:start + batch_size],
+                result,
+                first_row_number=first_row_number + start,
+            )
+
+        return True
+
+    def import_chunk(
+        self,
+        rows: list[dict],
+        result: ImportResult,
+        *,
+        first_row_number: int,
+    ):
+        first_issue = len(result.issues)
+        pending = []
+
+        for offset, raw_row in enumerate(rows):
+            if self._is_blank_row(raw_row):
+                continue
+
+            pending.append(
+                PendingRow(
+                    row_number=first_row_number + offset,
+                    raw_row=raw_row,
+                    row_data=raw_row,
+                )
+            )
+
+        pending = self.filter_rows(pending, result, self.normalize_entry)
+
+        self.load_rooms(entry.row_data.get("room") for entry in pending)
+        pending = self.filter_rows(pending, result, self.check_room)
+        pending = self.filter_rows(pending, result, self.check_file_duplicate)
+
+        existing = self.existing_keys(pending) if pending else set()
+
+        def check_existing(entry):
+            if self.exists_key(entry.row_data, entry.room) in existing:
+                raise RowSkipped("Duplicate asset already exists.")
+
+        pending = self.filter_rows(pending, result, check_existing)
+
+        taken = self.taken_values(pending)
+        pending = self.filter_rows(
+            pending,
+            result,
+            lambda entry: self.check_instance(entry, taken),
+        )
+
+        if pending:
+            self.save_instances(pending, result)
+
+        # Checks run stage by stage; report the chunk's issues in file order.
+        result.issues[first_issue:] = sorted(
+            result.issues[first_issue:],
+            key=lambda issue: issue.row_number,
+        )
+
+    def filter_rows(self, pending: list, result: ImportResult, check) -> list:
+        """
+        Run ``check`` for every pending row and return the rows that pass,
+        recording issues the same way ``import_rows`` does.
+        """
+
+        kept = []
+
+        for entry in pending:
+            try:
+                check(entry)
+
+            except (PermissionError, RowSkipped) as exc:
+                result.add_skipped(entry.row_number, str(exc), entry.raw_row)
+
+            except ValueError as exc:
+                result.add_failed(entry.row_number, str(exc), entry.raw_row)
+
+            except JobLeaseLost:
+                raise
+
+            except Exception as exc:
+                if is_transient_task_error(exc):
+                    raise
+
+                result.add_failed(
+                    entry.row_number,
+                    f"Unexpected error: {exc}",
+                    entry.raw_row,
+                )
+
+            else:
+                kept.append(entry)
+
+        return kept
+
+    def normalize_entry(self, entry: PendingRow):
+        entry.row_data = self.normalize_row(entry.raw_row)
+
+    def load_rooms(self, room_public_ids):
+        """Fetch every room of a chunk not seen before in one query."""
+
+        wanted = {
+            (room_public_id or "").strip()
+            for room_public_id in room_public_ids
+        } - self.rooms.keys() - {""}
+
+        if not wanted:
+            return
+
+        rooms = (
+            Room.objects
+            .filter(public_id__in=wanted)
+            .select_related("location__department")
+        )
+
+        for room in rooms:
+            self.rooms[room.public_id] = room
+
+        for room_public_id in wanted:
+            self.rooms.setdefault(room_public_id, None)
+
+    def check_room(self, entry: PendingRow):
+        room_public_id = (entry.row_data.get("room") or "").strip()
+
+        if not room_public_id:
+            raise ValueError("Room is required.")
+
+        room = self.rooms.get(room_public_id)
+
+        if not room:
+            raise ValueError(f"Room '{room_public_id}' does not exist.")
+
+        if room.pk not in self.room_permissions:
+            try:
+                self.check_write_permission(room)
+            except PermissionError as exc:
+                self.room_permissions[room.pk] = str(exc)
+            else:
+                self.room_permissions[room.pk] = None
+
+        if self.room_permissions[room.pk]:
+            raise PermissionError(self.room_permissions[room.pk])
+
+        entry.room = room
+
+    def check_file_duplicate(self, entry: PendingRow):
+        dedupe_key = self.get_file_dedupe_key(entry.row_data, entry.room)
+
+        if dedupe_key in self.seen_keys:
+            raise RowSkipped("Duplicate row in file.")
+
+        self.seen_keys.add(dedupe_key)
+
+    def taken_values(self, pending: list) -> dict:
+        """
+        Values of each ``unique_fields`` column of a chunk that already
+        exist in the database, with one query per field.
+        """
+
+        taken = {}
+
+        for field_name in self.unique_fields:
+            values = {
+                entry.row_data.get(field_name)
+                for entry in pending
+            } - {None, ""}
+
+            taken[field_name] = set(
+                self.model.objects
+                .filter(**{f"{field_name}__in": values})
+                .values_list(field_name, flat=True)
+            ) if values else set()
+
+        return taken
+
+    def check_instance(self, entry: PendingRow, taken: dict):
+        """
+        Validate the row with ``serializer_class``, as ``import_rows`` does,
+        without its queries: the room is already resolved, and uniqueness is
+        checked against ``taken``, which also collects the values of earlier
+        rows in the file.
+        """
+
+        serializer = self.serializer_class(
+            data=self.build_payload(entry.row_data, entry.room),
+        )
+        serializer.fields["room"] = serializers.HiddenField(default=entry.room)
+
+        for field_name, values in taken.items():
+            field = serializer.fields[field_name]
+            field.validators = [
+                TakenValueValidator(values, validator.message)
+                if isinstance(validator, UniqueValidator)
+                else validator
+                for validator in field.validators
+            ]
+
+        if not serializer.is_valid():
+            raise ValueError(str(serializer.errors))
+
+        entry.instance = self.model(**serializer.validated_data)
+
+        for field_name, values in taken.items():
+            value = getattr(entry.instance, field_name)
+
+            if value not in (None, ""):
+                values.add(value)
+
+    def save_instances(self, pending: list, result: ImportResult):
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create(
+                    [entry.instance for entry in pending]
+                )
+
+        except (DataError, IntegrityError):
+            # A concurrent writer took a unique value after the chunk was
+            # checked, or a value the serializer allows does not fit its
+            # column. Save the chunk the way import_rows does, so only those
+            # rows fail, with the same messages.
+            for entry in pending:
+                self.save_row(entry, result)
+
+            return
+
+        for _ in pending:
+            result.add_imported()
+
+    def save_row(self, entry: PendingRow, result: ImportResult):
+        serializer = self.serializer_class(
+            data=self.build_payload(entry.row_data, entry.room),
+        )
+
+        try:
+            if not serializer.is_valid():
+                result.add_failed(
+                    entry.row_number,
+                    str(serializer.errors),
+                    entry.raw_row,
+                )
+                return
+
+            with transaction.atomic():
+                serializer.save()
+
+        except Exception as exc:
+            if is_transient_task_error(exc):
+                raise
+
+            result.add_failed(
+                entry.row_number,
+                f"Unexpected error: {exc}",
+                entry.raw_row,
+            )
+
+        else:
+            result.add_imported()
 
     def to_payload(self, result: ImportResult) -> dict:
         return {
@@ -280,3 +663,9 @@ class BaseAssetImporter:
 
     def exists_in_db(self, row: dict, room):
         raise NotImplementedError
+
+    def existing_keys(self, pending: list) -> set:
+        raise NotImplementedError
+
+    def exists_key(self, row: dict, room):
+        raise NotImplementedError
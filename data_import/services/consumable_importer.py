@@ -1,7 +1,7 @@
 
 
 from data_import.services.base_importer import BaseAssetImporter
-from assets.models.assets import Accessory, Consumable
+from assets.models.assets import Consumable
 from assets.api.serializers.consumables import ConsumableWriteSerializer
 
 
@@ -9,6 +9,7 @@ class ConsumableImporter(BaseAssetImporter):
     serializer_class = ConsumableWriteSerializer
     required_headers = {"name", "description", "quantity", "low_stock_threshold", "room"}
     allowed_headers = required_headers
+    model = Consumable
 
     def normalize_row(self, row: dict) -> dict:
         row = super().normalize_row(row)
@@ -42,4 +43,17 @@ class ConsumableImporter(BaseAssetImporter):
         return Consumable.objects.filter(
             name=(row.get("name") or "").strip(),
             room=room,
-        ).exists()
\ No newline at end of file
+        ).exists()
+
+    def existing_keys(self, pending: list) -> set:
+        return set(
+            Consumable.objects
+            .filter(
+                name__in={self.exists_key(e.row_data, e.room)[0] for e in pending},
+                room__in={e.room for e in pending},
+            )
+            .values_list("name", "room_id")
+        )
+
+    def exists_key(self, row: dict, room):
+        return ((row.get("name") or "").strip(), room.pk)
@@ -10,6 +10,8 @@ class EquipmentImporter(BaseAssetImporter):
     serializer_class = EquipmentWriteSerializer
     required_headers = {"name", "brand", "model", "serial_number", "status", "room"}
     allowed_headers = required_headers
+    model = Equipment
+    unique_fields = ("serial_number",)
 
     def normalize_row(self, row: dict) -> dict:
         row = super().normalize_row(row)
@@ -48,4 +50,21 @@ class EquipmentImporter(BaseAssetImporter):
             name=(row.get("name") or "").strip(),
             serial_number=row.get("serial_number"),
             room=room,
-        ).exists()
\ No newline at end of file
+        ).exists()
+
+    def existing_keys(self, pending: list) -> set:
+        return set(
+            Equipment.objects
+            .filter(
+                name__in={self.exists_key(e.row_data, e.room)[0] for e in pending},
+                room__in={e.room for e in pending},
+            )
+            .values_list("name", "serial_number", "room_id")
+        )
+
+    def exists_key(self, row: dict, room):
+        return (
+            (row.get("name") or "").strip(),
+            row.get("serial_number"),
+            room.pk,
+        )
@@ -0,0 +1,232 @@
+import uuid
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from assets.asset_factories import AccessoryFactory, EquipmentFactory
+from assets.models.assets import Equipment
+from core.models.base import PublicIDRegistry
+from data_import.services.accessory_importer import AccessoryImporter
+from data_import.services.consumable_importer import ConsumableImporter
+from data_import.services.equipment_importer import EquipmentImporter
+from sites.factories.site_factories import RoomFactory
+from users.factories.user_factories import UserFactory
+from users.models.roles import RoleAssignment
+
+
+EQUIPMENT_HEADER = "name,brand,model,serial_number,status,room\n"
+
+
+class BulkImporterTests(TestCase):
+    """
+    Set-based imports validate and insert each chunk with a fixed number of
+    queries and report the same row outcomes as the row-by-row path.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.room = RoomFactory()
+        cls.other_room = RoomFactory()
+
+        role = RoleAssignment.objects.create(
+            user=cls.user,
+            role="ROOM_ADMIN",
+            room=cls.room,
+        )
+
+        cls.user.active_role = role
+        cls.user.save()
+
+    def _create_csv(self, content):
+        name = default_storage.save(
+            f"imports/source/{uuid.uuid4().hex}.csv",
+            ContentFile(content),
+        )
+        self.addCleanup(default_storage.delete, name)
+        return name
+
+    def equipment_csv(self, count, *, prefix="SN"):
+        return EQUIPMENT_HEADER + "".join(
+            f"Laptop {i},Dell,XPS,{prefix}-{i},OK,{self.room.public_id}\n"
+            for i in range(count)
+        )
+
+    def import_queries(self, count):
+        file_name = self._create_csv(
+            self.equipment_csv(count, prefix=f"Q{count}")
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            result = EquipmentImporter(user=self.user).run(
+                stored_file_name=file_name,
+            )
+
+        self.assertEqual(result["summary"]["imported_rows"], count)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.assertEqual(self.import_queries(5), self.import_queries(50))
+
+    def test_imported_assets_have_registered_public_ids(self):
+        file_name = self._create_csv(self.equipment_csv(3))
+
+        EquipmentImporter(user=self.user).run(stored_file_name=file_name)
+
+        public_ids = list(Equipment.objects.values_list("public_id", flat=True))
+        self.assertEqual(len(public_ids), 3)
+        self.assertEqual(
+            PublicIDRegistry.objects.filter(public_id__in=public_ids).count(),
+            3,
+        )
+
+    def import_both_ways(self, importer_class, csv_content, *, imported):
+        """Issues of a bulk and a row-by-row run of the same file."""
+
+        outcomes = {}
+
+        for bulk in (False, True):
+            with self.subTest(bulk=bulk), override_settings(
+                IMPORT_BULK_ENABLED=bulk,
+            ):
+                sid = connection.savepoint()
+                result = importer_class(user=self.user).run(
+                    stored_file_name=self._create_csv(csv_content),
+                )
+                connection.savepoint_rollback(sid)
+
+                outcomes[bulk] = [
+                    (issue["row_number"], issue["status"], issue["reason"])
+                    for issue in result["issues"]
+                ]
+                self.assertEqual(result["summary"]["imported_rows"], imported)
+
+        self.assertEqual(outcomes[True], outcomes[False])
+        return outcomes[True]
+
+    def test_row_outcomes_match_row_by_row_import(self):
+        EquipmentFactory(name="Existing", serial_number="SN-DB", room=self.room)
+        EquipmentFactory(name="Elsewhere", serial_number="SN-TAKEN")
+
+        csv_content = (
+            EQUIPMENT_HEADER
+            + f"Laptop,Dell,XPS,SN-1,OK,{self.room.public_id}\n"
+            + f"laptop,Dell,XPS,SN-1,OK,{self.room.public_id}\n"
+            + f"Existing,Dell,XPS,SN-DB,OK,{self.room.public_id}\n"
+            + f"Monitor,Dell,U27,SN-TAKEN,OK,{self.room.public_id}\n"
+            + "Dock,Dell,WD19,SN-2,OK,MISSING\n"
+            + f"Dock,Dell,WD19,SN-3,OK,{self.other_room.public_id}\n"
+            + f",Dell,WD19,SN-4,OK,{self.room.public_id}\n"
+            + f"Tablet,Apple,iPad,,OK,{self.room.public_id}\n"
+        )
+
+        outcomes = self.import_both_ways(
+            EquipmentImporter,
+            csv_content,
+            imported=2,
+        )
+
+        self.assertEqual(
+            [(row_number, status) for row_number, status, _ in outcomes],
+            [
+                (3, "skipped"),
+                (4, "skipped"),
+                (5, "failed"),
+                (6, "failed"),
+                (7, "skipped"),
+                (8, "failed"),
+            ],
+        )
+
+    def test_consumable_messages_come_from_the_write_serializer(self):
+        csv_content = (
+            "name,description,quantity,low_stock_threshold,room\n"
+            f"Paper,A4,10,2,{self.room.public_id}\n"
+            f"Toner,{'x' * 256},10,2,{self.room.public_id}\n"
+            f"Pens,Blue,100001,2,{self.room.public_id}\n"
+            f"Clips,Small,10,100001,{self.room.public_id}\n"
+            f",Unnamed,10,2,{self.room.public_id}\n"
+        )
+
+        outcomes = self.import_both_ways(
+            ConsumableImporter,
+            csv_content,
+            imported=1,
+        )
+
+        self.assertEqual([row[0] for row in outcomes], [3, 4, 5, 6])
+        self.assertIn("no more than 255 characters", outcomes[0][2])
+        self.assertIn("Quantity value is unreasonably large.", outcomes[1][2])
+        self.assertIn("Low stock threshold is unreasonably large.", outcomes[2][2])
+        self.assertIn("'name'", outcomes[3][2])
+
+    def test_accessory_serial_conflicts_match_row_by_row_import(self):
+        AccessoryFactory(serial_number="ACC-DB")
+
+        csv_content = (
+            "name,serial_number,quantity,room\n"
+            f"Mouse,ACC-1,5,{self.room.public_id}\n"
+            f"Keyboard,ACC-1,5,{self.room.public_id}\n"
+            f"Headset,ACC-DB,100001,{self.room.public_id}\n"
+        )
+
+        outcomes = self.import_both_ways(
+            AccessoryImporter,
+            csv_content,
+            imported=1,
+        )
+
+        self.assertEqual([row[:2] for row in outcomes], [(3, "failed"), (4, "failed")])
+        self.assertIn("serial number already exists", outcomes[0][2])
+        self.assertIn("serial number already exists", outcomes[1][2])
+        self.assertIn("Quantity value is unreasonably large.", outcomes[1][2])
+
+    def test_insert_conflict_falls_back_to_row_by_row_messages(self):
+        csv_content = (
+            "name,serial_number,quantity,room\n"
+            f"Mouse,RACE-1,5,{self.room.public_id}\n"
+            f"Keyboard,RACE-2,5,{self.room.public_id}\n"
+        )
+        # A concurrent import takes RACE-1 after the chunk was checked.
+        AccessoryFactory(serial_number="RACE-1")
+
+        with patch.object(
+            AccessoryImporter,
+            "taken_values",
+            return_value={"serial_number": set()},
+        ):
+            result = AccessoryImporter(user=self.user).run(
+                stored_file_name=self._create_csv(csv_content),
+            )
+
+        self.assertEqual(result["summary"]["imported_rows"], 1)
+        self.assertEqual(
+            [issue["reason"] for issue in result["issues"]],
+            [
+                "{'serial_number': [ErrorDetail(string='Accessory with this "
+                "serial number already exists.', code='unique')]}"
+            ],
+        )
+
+    @override_settings(IMPORT_BULK_BATCH_SIZE=2)
+    def test_unique_serials_are_enforced_across_chunks(self):
+        csv_content = (
+            "name,serial_number,quantity,room\n"
+            f"Mouse,SN1,5,{self.room.public_id}\n"
+            f"Keyboard,SN2,5,{self.room.public_id}\n"
+            f"Headset,SN1,5,{self.room.public_id}\n"
+        )
+
+        result = AccessoryImporter(user=self.user).run(
+            stored_file_name=self._create_csv(csv_content),
+        )
+
+        self.assertEqual(result["summary"]["imported_rows"], 2)
+        self.assertEqual(
+            [(issue["row_number"], issue["status"]) for issue in result["issues"]],
+            [(4, "failed")],
+        )
@@ -0,0 +1,93 @@
+import io
+import uuid
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from data_import.services.consumable_importer import ConsumableImporter
+from data_import.utils import iter_csv_chunks
+from sites.factories.site_factories import RoomFactory
+from users.factories.user_factories import UserFactory
+from users.models.roles import RoleAssignment
+
+
+class CsvChunkTests(SimpleTestCase):
+    def test_chunks_are_normalized(self):
+        upload = io.BytesIO(
+            "\ufeffName ; Serial Number;Unnamed: 2\n"
+            " Laptop ; SN-1 ;\n"
+            " ; ;\n"
+            "Dock;SN-2;\n"
+            "Mouse;SN-3;\n".encode("utf-8")
+        )
+
+        chunks = list(iter_csv_chunks(upload, chunksize=2))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(list(chunks[0].columns), ["name", "serial_number"])
+        self.assertEqual(
+            [row for chunk in chunks for row in chunk.to_dict(orient="records")],
+            [
+                {"name": "Laptop", "serial_number": "SN-1"},
+                {"name": "Dock", "serial_number": "SN-2"},
+                {"name": "Mouse", "serial_number": "SN-3"},
+            ],
+        )
+
+    def test_short_rows_are_padded(self):
+        upload = io.BytesIO(b"name,serial_number\nLaptop\n")
+
+        (chunk,) = iter_csv_chunks(upload, chunksize=10)
+
+        self.assertEqual(chunk.iloc[0]["serial_number"], "")
+
+    def test_header_only_file_is_rejected(self):
+        with self.assertRaises(ValueError):
+            list(iter_csv_chunks(io.BytesIO(b"name,room\n"), chunksize=10))
+
+
+@override_settings(IMPORT_CSV_CHUNK_ROWS=2)
+class ChunkedImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.room = RoomFactory()
+
+        role = RoleAssignment.objects.create(
+            user=cls.user,
+            role="ROOM_ADMIN",
+            room=cls.room,
+        )
+
+        cls.user.active_role = role
+        cls.user.save()
+
+    def test_rows_are_imported_across_parse_chunks(self):
+        csv_content = "name,description,quantity,low_stock_threshold,room\n" + "".join(
+            f"{name},,10,2,{self.room.public_id}\n"
+            for name in ("Paper", "Toner", "Staples", "Paper", "Pens")
+        )
+        stored_name = default_storage.save(
+            f"imports/source/{uuid.uuid4().hex}.csv",
+            ContentFile(csv_content),
+        )
+        self.addCleanup(default_storage.delete, stored_name)
+
+        result = ConsumableImporter(user=self.user).run(
+            stored_file_name=stored_name,
+        )
+
+        self.assertEqual(
+            result["summary"],
+            {
+                "total_rows": 5,
+                "imported_rows": 4,
+                "skipped_rows": 1,
+                "failed_rows": 0,
+            },
+        )
+        self.assertEqual(
+            [(issue["row_number"], issue["reason"]) for issue in result["issues"]],
+            [(5, "Duplicate row in file.")],
+        )
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from data_import.services.equipment_importer import EquipmentImporter
@@ -148,6 +148,7 @@ class BaseImporterTests(TestCase):
         self.assertEqual(result["summary"]["failed_rows"], 1)
 
     
+    @override_settings(IMPORT_MAX_ROWS=10_000)
     def test_csv_row_limit_exceeded(self):
 
         rows = "\n".join(
@@ -23,13 +23,20 @@ def delete_import_upload(stored_file_name: str) -> bool:
     return True
 
 
-def load_and_normalize_csv(file_obj):
+def iter_csv_chunks(file_obj, *, chunksize: int):
+    """
+    Parse a CSV upload into normalized DataFrames of at most ``chunksize``
+    rows, so memory is bounded by the chunk size rather than the file size.
+
+    The delimiter is sniffed from the first 8 KiB and the file is read with
+    pandas' C parser. Raises ``ValueError`` when the file has no data rows.
+    """
+
     file_obj.seek(0)
 
     # Django storage backends normally return a binary stream for ``rb``.
-    # Pandas' Python CSV engine delegates delimiter detection to csv.Sniffer,
-    # which expects text and raises TypeError when it receives bytes. Wrap the
-    # storage stream without taking ownership of it so the caller can close it.
+    # csv.Sniffer expects text, so wrap the storage stream without taking
+    # ownership of it so the caller can close it.
     text_stream = file_obj
     detach_text_wrapper = False
 
@@ -57,21 +64,29 @@ def load_and_normalize_csv(file_obj):
         except csv.Error:
             delimiter = ","
 
-        df = pd.read_csv(
+        parsed_rows = 0
+
+        with pd.read_csv(
             text_stream,
             dtype=str,
             sep=delimiter,
-            engine="python",
+            engine="c",
+            chunksize=chunksize,
             skip_blank_lines=True,
             keep_default_na=False,
-        )
+        ) as reader:
+            for chunk in reader:
+                parsed_rows += len(chunk)
+                yield normalize_csv_chunk(chunk)
+
+        if not parsed_rows:
+            raise ValueError("CSV file must include a header row.")
     finally:
         if detach_text_wrapper:
             text_stream.detach()
 
-    if df.empty:
-        raise ValueError("CSV file must include a header row.")
 
+def normalize_csv_chunk(df):
     # Normalize headers
     df.columns = (
         df.columns
@@ -85,10 +100,10 @@ def load_and_normalize_csv(file_obj):
     # Remove Excel junk columns
     df = df.loc[:, ~df.columns.str.contains("^unnamed", case=False)]
 
-    # Trim whitespace in cells
-    df = df.apply(lambda col: col.str.strip() if col.dtype == "object" else col)
+    # Trim whitespace in cells; short rows are padded with empty strings
+    df = df.fillna("")
+    for column in df.columns:
+        df[column] = df[column].str.strip()
 
     # Remove fully blank rows
-    df = df[df.apply(lambda row: any(str(v).strip() for v in row), axis=1)]
-
-    return df
\ No newline at end of file
+    return df[df.ne("").any(axis=1)]
@@ -113,6 +113,7 @@ MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
 
     "core.middleware.RequestIDMiddleware",
+    "core.middleware.AuditLogBufferMiddleware",
     "core.middleware.OperationalEndpointSecurityMiddleware",
 
     "corsheaders.middleware.CorsMiddleware",
@@ -206,4 +206,84 @@ USER_SCOPE_CACHE_COUNT_DB_QUERIES = env.bool(
 USER_SCOPE_CACHE_LOG_REQUEST_PARAMS = env.bool(
     "USER_SCOPE_CACHE_LOG_REQUEST_PARAMS",
     default=True,
-)
\ No newline at end of file
+)
+
+# Single-flight misses: one request per key rebuilds while concurrent requests
+# poll for its payload for up to LOCK_WAIT_MS before querying themselves.
+USER_SCOPE_CACHE_LOCK_TIMEOUT = env.int(
+    "USER_SCOPE_CACHE_LOCK_TIMEOUT",
+    default=30,
+)
+
+USER_SCOPE_CACHE_LOCK_WAIT_MS = env.int(
+    "USER_SCOPE_CACHE_LOCK_WAIT_MS",
+    default=500,
+)
+
+# Stale-while-revalidate window. While a rebuild is in flight, waiters may
+# serve the previous payload for the same user, active role and request for
+# this many seconds past its expiry (or generation rotation). 0 disables it.
+USER_SCOPE_CACHE_STALE_SECONDS = env.int(
+    "USER_SCOPE_CACHE_STALE_SECONDS",
+    default=0,
+)
+
+# Cache plain application/json list responses as rendered bytes and return
+# them verbatim on a hit. Other renderers keep caching ``response.data``.
+USER_SCOPE_CACHE_RENDERED_PASSTHROUGH = env.bool(
+    "USER_SCOPE_CACHE_RENDERED_PASSTHROUGH",
+    default=True,
+)
+
+# Process-local tier for generation tokens (user scope + site options).
+# Rotations are pushed to every worker over Redis pub/sub; the TTL bounds
+# staleness if a message is lost. Set the TTL to 0 to always read Redis.
+GENERATION_LOCAL_CACHE_TTL = env.int(
+    "GENERATION_LOCAL_CACHE_TTL",
+    default=5,
+)
+
+GENERATION_LOCAL_CACHE_MAX_ENTRIES = env.int(
+    "GENERATION_LOCAL_CACHE_MAX_ENTRIES",
+    default=10000,
+)
+
+# -------------------------------------------------
+# Cached payload encoding
+# -------------------------------------------------
+
+# Scope list and analytics payloads are stored as versioned bytes:
+# "json" (encoded with orjson) or "msgpack", compressed above the threshold
+# with "auto" (zstd, falling back to lz4 then zlib if a library is missing),
+# "zstd", "lz4", "zlib" or "none".
+CACHE_PAYLOAD_SERIALIZER = env(
+    "CACHE_PAYLOAD_SERIALIZER",
+    default="json",
+)
+
+CACHE_PAYLOAD_COMPRESSION = env(
+    "CACHE_PAYLOAD_COMPRESSION",
+    default="auto",
+)
+
+CACHE_PAYLOAD_COMPRESS_MIN_BYTES = env.int(
+    "CACHE_PAYLOAD_COMPRESS_MIN_BYTES",
+    default=1024,
+)
+
+# -------------------------------------------------
+# Room scope index
+# -------------------------------------------------
+
+# Workers compare their process-local room ancestry snapshot with the shared
+# generation at most this often.
+ROOM_SCOPE_INDEX_REFRESH_SECONDS = env.int(
+    "ROOM_SCOPE_INDEX_REFRESH_SECONDS",
+    default=2,
+)
+
+# Upper bound on snapshot age, covering writes that bypass the model hooks.
+ROOM_SCOPE_INDEX_MAX_AGE = env.int(
+    "ROOM_SCOPE_INDEX_MAX_AGE",
+    default=300,
+)
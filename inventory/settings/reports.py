@@ -19,4 +19,115 @@ REPORT_FILENAME_TEMPLATE = (
 REPORT_CACHE_TTL_SECONDS = env.int(
     "REPORT_CACHE_TTL_SECONDS",
     default=900,
-)
\ No newline at end of file
+)
+
+# Rendered reports stay in memory up to this size, then spill to a temporary
+# file (in REPORT_SPOOL_DIR, or the system temp dir) before upload.
+REPORT_SPOOL_MAX_MEMORY_BYTES = env.int(
+    "REPORT_SPOOL_MAX_MEMORY_BYTES",
+    default=8 * 1024 * 1024,
+)
+
+REPORT_SPOOL_DIR = env(
+    "REPORT_SPOOL_DIR",
+    default="",
+)
+
+# Row-heavy reports above REPORT_PARTITION_ROWS rows are split into date
+# windows (at most REPORT_PARTITION_MAX) rendered by parallel Celery tasks.
+REPORT_PARTITION_ROWS = env.int(
+    "REPORT_PARTITION_ROWS",
+    default=250_000,
+)
+
+REPORT_PARTITION_MAX = env.int(
+    "REPORT_PARTITION_MAX",
+    default=8,
+)
+
+# Partition tasks refresh the job heartbeat after this many rows.
+REPORT_PARTITION_HEARTBEAT_ROWS = env.int(
+    "REPORT_PARTITION_HEARTBEAT_ROWS",
+    default=50_000,
+)
+
+# Pre-flight estimates (reporting.services.admission). A job estimated at or
+# above any heavy threshold runs on REPORT_HEAVY_QUEUE instead of "reports".
+REPORT_HEAVY_QUEUE = env(
+    "REPORT_HEAVY_QUEUE",
+    default="reports_heavy",
+)
+
+REPORT_HEAVY_ROWS = env.int(
+    "REPORT_HEAVY_ROWS",
+    default=100_000,
+)
+
+REPORT_HEAVY_SECONDS = env.int(
+    "REPORT_HEAVY_SECONDS",
+    default=120,
+)
+
+REPORT_HEAVY_SIZE_MB = env.int(
+    "REPORT_HEAVY_SIZE_MB",
+    default=50,
+)
+
+# Recent finished jobs of the same type/format used to calibrate estimates,
+# and the throughput assumed before any history exists.
+REPORT_ESTIMATE_HISTORY_JOBS = env.int(
+    "REPORT_ESTIMATE_HISTORY_JOBS",
+    default=20,
+)
+
+REPORT_ESTIMATE_DEFAULT_ROWS_PER_SECOND = env.int(
+    "REPORT_ESTIMATE_DEFAULT_ROWS_PER_SECOND",
+    default=2_000,
+)
+
+# Admission budgets: queued + running jobs per user, heavy jobs per user and
+# heavy jobs across all users. Requests over budget are refused with 429.
+REPORT_MAX_ACTIVE_JOBS_PER_USER = env.int(
+    "REPORT_MAX_ACTIVE_JOBS_PER_USER",
+    default=5,
+)
+
+REPORT_MAX_ACTIVE_HEAVY_JOBS_PER_USER = env.int(
+    "REPORT_MAX_ACTIVE_HEAVY_JOBS_PER_USER",
+    default=1,
+)
+
+# The heavy worker's --concurrency in docker-compose reads the same variable,
+# so every admitted heavy job has a slot and keeps its heartbeat.
+REPORT_MAX_ACTIVE_HEAVY_JOBS = env.int(
+    "REPORT_MAX_ACTIVE_HEAVY_JOBS",
+    default=2,
+)
+
+REPORT_ADMISSION_RETRY_AFTER_SECONDS = env.int(
+    "REPORT_ADMISSION_RETRY_AFTER_SECONDS",
+    default=60,
+)
+
+# Asset imports. Uploads are parsed IMPORT_CSV_CHUNK_ROWS rows at a time;
+# importers that support set-based mode validate and insert
+# IMPORT_BULK_BATCH_SIZE rows at a time with a fixed number of queries.
+IMPORT_MAX_ROWS = env.int(
+    "IMPORT_MAX_ROWS",
+    default=100_000,
+)
+
+IMPORT_CSV_CHUNK_ROWS = env.int(
+    "IMPORT_CSV_CHUNK_ROWS",
+    default=10_000,
+)
+
+IMPORT_BULK_ENABLED = env.bool(
+    "IMPORT_BULK_ENABLED",
+    default=True,
+)
+
+IMPORT_BULK_BATCH_SIZE = env.int(
+    "IMPORT_BULK_BATCH_SIZE",
+    default=1000,
+)
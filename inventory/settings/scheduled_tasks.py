@@ -53,6 +53,11 @@ USERSESSION_EXPIRE_CRON = env(
     default="15 * * * *",
 )
 
+USERSESSION_ACTIVITY_FLUSH_CRON = env(
+    "USERSESSION_ACTIVITY_FLUSH_CRON",
+    default="* * * * *",
+)
+
 # -------------------------------------------------
 # ScheduledTaskRun retention
 # -------------------------------------------------
@@ -89,4 +94,13 @@ LOG_DELETE_AFTER_DAYS = env.int(
 LOG_ARCHIVE_CRON = env(
     "LOG_ARCHIVE_CRON",
     default="15 2 * * *",
-)
\ No newline at end of file
+)
+
+# -------------------------------------------------
+# Audit log partitions
+# -------------------------------------------------
+
+AUDIT_LOG_PARTITION_CRON = env(
+    "AUDIT_LOG_PARTITION_CRON",
+    default="45 2 * * *",
+)
@@ -1,6 +1,8 @@
 # inventory/settings/security.py
 
-from .base import APP_ENV, DEBUG, IS_TESTING, env
+from pathlib import Path
+
+from .base import APP_ENV, BASE_DIR, DEBUG, IS_TESTING, env
 
 # -------------------------------------------------
 # Cookie / Security Settings
@@ -91,6 +93,47 @@ SECURE_PROXY_SSL_HEADER = (
 
 USE_X_FORWARDED_HOST = True
 
+# -------------------------------------------------
+# Runtime security policy
+# -------------------------------------------------
+
+# Cache holding the SecuritySettings policy version. Workers keep a local
+# snapshot of the policy and reload it when the version is rotated.
+SECURITY_POLICY_CACHE_ALIAS = env(
+    "SECURITY_POLICY_CACHE_ALIAS",
+    default="default",
+)
+
+# Cache holding the permission registry generation. Workers compile the
+# permission matrix into per-role sets and recompile when it is rotated.
+PERMISSION_REGISTRY_CACHE_ALIAS = env(
+    "PERMISSION_REGISTRY_CACHE_ALIAS",
+    default="default",
+)
+
+# -------------------------------------------------
+# Failed login counters
+# -------------------------------------------------
+
+# Failed logins are counted in this cache per user and per client. A
+# counter resets once no failure has arrived for its window (per user:
+# SecuritySettings.reset_failed_attempts_after_minutes). LoginThrottle
+# refuses a client once its count reaches LOGIN_FAILURE_IP_LIMIT.
+LOGIN_FAILURE_CACHE_ALIAS = env(
+    "LOGIN_FAILURE_CACHE_ALIAS",
+    default="default",
+)
+
+LOGIN_FAILURE_IP_LIMIT = env.int(
+    "LOGIN_FAILURE_IP_LIMIT",
+    default=20,
+)
+
+LOGIN_FAILURE_IP_WINDOW_SECONDS = env.int(
+    "LOGIN_FAILURE_IP_WINDOW_SECONDS",
+    default=900,
+)
+
 # -------------------------------------------------
 # CSRF
 # -------------------------------------------------
@@ -102,3 +145,44 @@ CSRF_TRUSTED_ORIGINS = env.list(
         "http://localhost:8000",
     ],
 )
+
+# -------------------------------------------------
+# Audit log writer
+# -------------------------------------------------
+
+# "inline" writes each request's audit entries with one bulk INSERT before
+# the response is returned; "celery" hands the batch to a worker instead.
+AUDIT_LOG_WRITE_MODE = env(
+    "AUDIT_LOG_WRITE_MODE",
+    default="inline",
+)
+
+AUDIT_LOG_BUFFER_MAX_ENTRIES = env.int(
+    "AUDIT_LOG_BUFFER_MAX_ENTRIES",
+    default=500,
+)
+
+# -------------------------------------------------
+# Audit log storage
+# -------------------------------------------------
+
+# On PostgreSQL core_auditlog is partitioned by month of created_at. The
+# maintenance task keeps this many future months created ahead of time.
+AUDIT_LOG_PARTITION_MONTHS_AHEAD = env.int(
+    "AUDIT_LOG_PARTITION_MONTHS_AHEAD",
+    default=3,
+)
+
+# archive_audit_logs moves whole months older than this into gzip-compressed
+# CSV files under AUDIT_LOG_ARCHIVE_DIR. 0 keeps every month.
+AUDIT_LOG_RETENTION_MONTHS = env.int(
+    "AUDIT_LOG_RETENTION_MONTHS",
+    default=24,
+)
+
+AUDIT_LOG_ARCHIVE_DIR = Path(
+    env(
+        "AUDIT_LOG_ARCHIVE_DIR",
+        default=str(BASE_DIR / "audit_archive"),
+    )
+)
@@ -38,4 +38,42 @@ SESSION_EXPIRED_RETENTION_DAYS = env.int(
 SESSION_REVOKED_RETENTION_DAYS = env.int(
     "SESSION_REVOKED_RETENTION_DAYS",
     default=20,
-)
\ No newline at end of file
+)
+# -------------------------------------------------
+# Session state cache
+# -------------------------------------------------
+
+# SessionJWTAuthentication caches each session's status and idle expiry for
+# this many seconds. Revocations write through explicitly, so the TTL only
+# bounds staleness after a failed cache write. 0 disables the cache.
+SESSION_STATE_CACHE_TTL = env.int(
+    "SESSION_STATE_CACHE_TTL",
+    default=30,
+)
+
+SESSION_STATE_CACHE_ALIAS = env(
+    "SESSION_STATE_CACHE_ALIAS",
+    default="default",
+)
+
+# -------------------------------------------------
+# Session activity write-behind
+# -------------------------------------------------
+
+# Activity pings are buffered in the cache and written to UserSession by
+# flush_session_activity (USERSESSION_ACTIVITY_FLUSH_CRON). Disable to save
+# every extension to the row directly.
+SESSION_ACTIVITY_WRITE_BEHIND = env.bool(
+    "SESSION_ACTIVITY_WRITE_BEHIND",
+    default=True,
+)
+
+SESSION_ACTIVITY_CACHE_ALIAS = env(
+    "SESSION_ACTIVITY_CACHE_ALIAS",
+    default="default",
+)
+
+SESSION_ACTIVITY_FLUSH_BATCH_SIZE = env.int(
+    "SESSION_ACTIVITY_FLUSH_BATCH_SIZE",
+    default=1000,
+)
@@ -1,7 +1,8 @@
 
 from rest_framework import serializers
+from reporting.api.serializers.reports import ReportOutputFormatMixin
 
-class AssetHistoryReportRequestSerializer(serializers.Serializer):
+class AssetHistoryReportRequestSerializer(ReportOutputFormatMixin):
 
     ASSET_TYPE_CHOICES = [
         "equipment",
@@ -1,6 +1,7 @@
 from sites.models.sites import Department, Location, Room
 from rest_framework.exceptions import PermissionDenied
 from rest_framework import serializers
+from reporting.api.serializers.reports import ReportOutputFormatMixin
 
 
 def enforce_inventory_summary_scope(user, validated_data):
@@ -140,7 +141,7 @@ def enforce_inventory_summary_scope(user, validated_data):
     )
 
 
-class InventorySummaryReportRequestSerializer(serializers.Serializer):
+class InventorySummaryReportRequestSerializer(ReportOutputFormatMixin):
     """
     Request payload:
 
@@ -1,20 +1,37 @@
 from rest_framework import serializers
 
 from reporting.models.reports import ReportJob
+from reporting.services.admission import job_estimate
 from reporting.services.job_errors import public_job_error
 
 
+class ReportOutputFormatMixin(serializers.Serializer):
+    """
+    Adds the optional ``output_format`` field to report request serializers.
+
+    Views pop it from ``validated_data`` into ``ReportJob.output_format``
+    so it is not passed to the report builder.
+    """
+
+    output_format = serializers.ChoiceField(
+        choices=ReportJob.OutputFormat.choices,
+        default=ReportJob.OutputFormat.XLSX,
+    )
+
+
 class ReportJobSerializer(serializers.ModelSerializer):
     error = serializers.SerializerMethodField()
     can_download = serializers.SerializerMethodField()
     is_running = serializers.SerializerMethodField()
     is_failed = serializers.SerializerMethodField()
+    estimate = serializers.SerializerMethodField()
 
     class Meta:
         model = ReportJob
         fields = [
             "public_id",
             "report_type",
+            "output_format",
             "status",
             "created_at",
             "finished_at",
@@ -22,12 +39,16 @@ class ReportJobSerializer(serializers.ModelSerializer):
             "can_download",
             "is_running",
             "is_failed",
+            "estimate",
         ]
         read_only_fields = fields
 
     def get_error(self, obj):
         return public_job_error(obj)
 
+    def get_estimate(self, obj):
+        return job_estimate(obj)
+
     def get_can_download(self, obj):
         request = self.context.get("request")
 
@@ -2,13 +2,14 @@
 from rest_framework import serializers
 from sites.models.sites import Department, Location, Room
 import re #regex for sanitization
+from reporting.api.serializers.reports import ReportOutputFormatMixin
 
 
 class SiteSerializer(serializers.Serializer):
     siteType = serializers.ChoiceField(choices=['department', 'location', 'room'])
     siteId = serializers.CharField()
 
-class SiteAssetRequestSerializer(serializers.Serializer):
+class SiteAssetRequestSerializer(ReportOutputFormatMixin):
     site = SiteSerializer()  # nested site object
     ASSET_TYPES = ['equipment', 'component', 'consumable', 'accessory']
     EXPORT_FORMATS = ['excel', 'pdf']
@@ -43,7 +44,7 @@ class SiteAssetRequestSerializer(serializers.Serializer):
             )
         return data
 
-class SiteAuditLogRequestSerializer(serializers.Serializer):
+class SiteAuditLogRequestSerializer(ReportOutputFormatMixin):
     site = serializers.DictField()
     audit_period_days = serializers.IntegerField( default=30, required=False, )
 
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.utils import timezone
+from reporting.api.serializers.reports import ReportOutputFormatMixin
 
 class UserDemographicsSerializer(serializers.Serializer):
     full_name = serializers.CharField()
@@ -54,7 +55,7 @@ class UserSummaryReportSerializer(serializers.Serializer):
     passwordevents = UserPasswordEventSummarySerializer(required=False)
 
 
-class UserSummaryReportRequestSerializer(serializers.Serializer):
+class UserSummaryReportRequestSerializer(ReportOutputFormatMixin):
     user = serializers.CharField(
         help_text="User public_id or email address"
     )
@@ -94,7 +95,7 @@ class UserSummaryReportRequestSerializer(serializers.Serializer):
 
         return value
 
-class UserAuditHistoryReportRequestSerializer(serializers.Serializer):
+class UserAuditHistoryReportRequestSerializer(ReportOutputFormatMixin):
 
     user = serializers.CharField()
 
@@ -130,7 +131,7 @@ class UserAuditHistoryReportRequestSerializer(serializers.Serializer):
 
         return attrs
 
-class UserLoginHistoryReportRequestSerializer(serializers.Serializer):
+class UserLoginHistoryReportRequestSerializer(ReportOutputFormatMixin):
 
     user = serializers.CharField( help_text="User public_id or email address" )
     start_date = serializers.DateField( required=False, help_text="Start date for the report period" )
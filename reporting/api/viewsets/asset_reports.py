@@ -9,6 +9,7 @@ from rest_framework import status
 from access.permissions.base import RequiresPermission
 from reporting.api.serializers.asset_reports import AssetHistoryReportRequestSerializer
 from reporting.models.reports import ReportJob
+from reporting.services.admission import admit_report_job, job_estimate
 from reporting.services.job_dispatch import enqueue_report_job
 
 
@@ -50,10 +51,14 @@ class AssetHistoryReport(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type=ReportJob.ReportType.ASSET_HISTORY,
-            params=serializer.data,
+            output_format=output_format,
+            params=params,
         )
 
         enqueue_report_job(job.id)
@@ -62,6 +67,7 @@ class AssetHistoryReport(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
\ No newline at end of file
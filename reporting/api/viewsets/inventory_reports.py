@@ -5,6 +5,7 @@ from reporting.api.serializers.inventory_report import InventorySummaryReportReq
 from reporting.models.reports import ReportJob
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from reporting.services.admission import admit_report_job, job_estimate
 from reporting.services.job_dispatch import enqueue_report_job
 from rest_framework.response import Response
 from rest_framework import status
@@ -25,10 +26,14 @@ class InventorySummaryReport(APIView):
         )
         serializer.is_valid(raise_exception=True)
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.validated_data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type=ReportJob.ReportType.INVENTORY_SUMMARY,
-            params=serializer.validated_data,
+            output_format=output_format,
+            params=params,
         )
 
         enqueue_report_job(job.id)
@@ -37,6 +42,7 @@ class InventorySummaryReport(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
\ No newline at end of file
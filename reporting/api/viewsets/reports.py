@@ -11,6 +11,7 @@ from reporting.api.serializers.reports import ReportJobSerializer
 from reporting.filters import ReportJobFilter
 from reporting.models.reports import ReportJob
 from reporting.services.job_errors import public_job_error
+from reporting.services.result_cache import report_file_is_shared
 from reporting.services.storage import (
     delete_report,
     open_report,
@@ -84,7 +85,8 @@ class MyReportJobViewSet(
         )
 
     def perform_destroy(self, instance):
-        delete_report(instance.report_file)
+        if not report_file_is_shared(instance):
+            delete_report(instance.report_file)
         instance.delete()
 
 
@@ -108,5 +110,6 @@ class ReportJobAdminViewSet(
     )
 
     def perform_destroy(self, instance):
-        delete_report(instance.report_file)
+        if not report_file_is_shared(instance):
+            delete_report(instance.report_file)
         instance.delete()
@@ -5,7 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from access.permissions.base import RequiresPermission
 from reporting.api.serializers.site_reports import SiteAssetRequestSerializer, SiteAuditLogRequestSerializer
-from reporting.models.reports import ReportJob
+from reporting.services.admission import admit_report_job, job_estimate
 from reporting.services.job_dispatch import enqueue_report_job
 
 
@@ -21,10 +21,14 @@ class SiteAssetExcelReportAPIView(APIView):
         serializer = SiteAssetRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.validated_data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type="site_assets",
-            params=serializer.validated_data,
+            output_format=output_format,
+            params=params,
         )
 
         enqueue_report_job(job.id)
@@ -33,6 +37,7 @@ class SiteAssetExcelReportAPIView(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
@@ -48,10 +53,14 @@ class SiteAuditLogReportAPIView(APIView):
         serializer = SiteAuditLogRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.validated_data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type="site_audit_logs",
-            params=serializer.validated_data,
+            output_format=output_format,
+            params=params,
         )
 
         enqueue_report_job(job.id)
@@ -60,6 +69,7 @@ class SiteAuditLogReportAPIView(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
\ No newline at end of file
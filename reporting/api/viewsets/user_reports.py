@@ -9,6 +9,7 @@ from core.models.audit import AuditLog
 from access.permissions.base import RequiresPermission
 from reporting.api.serializers.user_report import UserAuditHistoryReportRequestSerializer, UserLoginHistoryReportRequestSerializer, UserSummaryReportRequestSerializer
 from reporting.models.reports import ReportJob
+from reporting.services.admission import admit_report_job, job_estimate
 from reporting.services.job_dispatch import enqueue_report_job
 from reporting.utils.resolve_audit_date_range import resolve_audit_date_range
 from reporting.utils.excel_renderer import estimate_excel_size_mb
@@ -43,10 +44,14 @@ class UserSummaryReport(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.validated_data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type=ReportJob.ReportType.USER_SUMMARY,
-            params=serializer.validated_data,
+            output_format=output_format,
+            params=params,
         )
 
         enqueue_report_job(job.id)
@@ -55,6 +60,7 @@ class UserSummaryReport(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
@@ -93,10 +99,14 @@ class UserAuditHistoryReport(APIView):
         # Create Report Job
         # -------------------------------------------------
 
-        job = ReportJob.objects.create(
+        params = dict(serializer.validated_data)
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type=ReportJob.ReportType.USER_AUDIT_HISTORY,
-            params=serializer.validated_data,
+            output_format=output_format,
+            params=params,
         )
 
         # -------------------------------------------------
@@ -109,6 +119,7 @@ class UserAuditHistoryReport(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
@@ -276,9 +287,12 @@ class UserLoginHistoryReport(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        job = ReportJob.objects.create(
+        output_format = params.pop("output_format")
+
+        job = admit_report_job(
             user=request.user,
             report_type=ReportJob.ReportType.USER_LOGIN_HISTORY,
+            output_format=output_format,
             params=params,
         )
 
@@ -288,6 +302,7 @@ class UserLoginHistoryReport(APIView):
             {
                 "report_id": job.public_id,
                 "status": "queued",
+                "estimate": job_estimate(job),
             },
             status=status.HTTP_202_ACCEPTED,
         )
\ No newline at end of file
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-17 01:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0005_reportjob_execution_lease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportjob',
+            name='output_format',
+            field=models.CharField(choices=[('xlsx', 'Excel Workbook'), ('csv', 'CSV (gzip, zipped per sheet)'), ('parquet', 'Parquet (zipped per sheet)')], default='xlsx', max_length=10),
+        ),
+    ]
@@ -29,6 +29,11 @@ class ReportJob(PublicIDModel):
         ASSET_HISTORY = "asset_history", "Asset History"
         INVENTORY_SUMMARY = "inventory_summary", "Inventory Summary"
 
+    class OutputFormat(models.TextChoices):
+        XLSX = "xlsx", "Excel Workbook"
+        CSV = "csv", "CSV (gzip, zipped per sheet)"
+        PARQUET = "parquet", "Parquet (zipped per sheet)"
+
     user = models.ForeignKey( settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="report_jobs", )
 
     report_type = models.CharField( max_length=40, choices=ReportType.choices, db_index=True, )
@@ -37,6 +42,12 @@ class ReportJob(PublicIDModel):
 
     params = models.JSONField()
 
+    output_format = models.CharField(
+        max_length=10,
+        choices=OutputFormat.choices,
+        default=OutputFormat.XLSX,
+    )
+
     error = models.TextField(blank=True)
 
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
@@ -46,6 +57,18 @@ class ReportJob(PublicIDModel):
 
     result_payload = models.JSONField(null=True, blank=True)
 
+    # Content key of the rendered result (see reporting.services.result_cache).
+    # Only jobs that produced report_file themselves carry a key.
+    cache_key = models.CharField(max_length=64, blank=True)
+
+    # Pre-flight cost estimate (see reporting.services.admission) and the
+    # size of the artifact the job actually rendered.
+    estimated_rows = models.PositiveIntegerField(null=True, blank=True)
+    estimated_duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    estimated_size_bytes = models.PositiveBigIntegerField(null=True, blank=True)
+    is_heavy = models.BooleanField(default=False)
+    report_size_bytes = models.PositiveBigIntegerField(null=True, blank=True)
+
     notification_sent = models.BooleanField(default=False)
 
     # Celery execution lease. The task id identifies the worker delivery that
@@ -64,6 +87,14 @@ class ReportJob(PublicIDModel):
                 fields=["status", "heartbeat_at"],
                 name="report_job_status_hb_idx",
             ),
+            models.Index(
+                fields=["cache_key", "finished_at"],
+                name="report_job_cache_key_idx",
+            ),
+            models.Index(
+                fields=["report_type", "status", "finished_at"],
+                name="report_job_type_finished_idx",
+            ),
         ]
 
     def __str__(self):
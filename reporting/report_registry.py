@@ -5,12 +5,14 @@ from data_import.services.import_builder import build_asset_import
 from reporting.services.inventory_reports import build_inventory_summary_report
 from reporting.utils.report_adapters.inventory_reports import inventory_summary_to_workbook_spec
 from reporting.services.asset_reports import build_asset_history_report
-from reporting.services.site_reports import build_site_asset_report, build_site_audit_log_report
+from reporting.services.site_reports import build_site_asset_report, build_site_audit_log_report, count_site_audit_log_rows
 from reporting.services.user_summary import build_user_audit_history_report, build_user_login_history_report, build_user_summary_report
+from reporting.services.user_summary import count_user_audit_history_rows, plan_user_audit_history_partitions, user_audit_history_partition_rows
 from reporting.utils.report_adapters.asset_reports import asset_history_to_workbook_spec
 from reporting.utils.report_adapters.site_reports import site_asset_to_workbook_spec, site_audit_log_to_workbook_spec
 from reporting.utils.report_adapters.user_summary import user_audit_history_to_workbook_spec, user_login_history_to_workbook_spec, user_summary_to_workbook_spec
 from reporting.utils.resolve_audit_date_range import resolve_report_date_range
+from reporting.services.result_cache import inventory_data_generation
 
 """
 Report Registry
@@ -30,6 +32,20 @@ param_map
     Function that translates stored ReportJob.params into
     arguments expected by the builder function.
 
+partition (optional)
+    Plan / rows functions that let a row-heavy report be rendered by
+    parallel Celery tasks (see reporting.services.partitions).
+
+cache_generation (optional)
+    Function returning the data generation the report depends on.
+    Reports that define it are served from the result cache when an
+    identical job finished recently (see reporting.services.result_cache).
+
+estimate_rows (optional)
+    Function taking the builder arguments and returning the number of
+    rows the report will contain, used by the pre-flight cost estimate
+    (see reporting.services.admission).
+
 Workflow
 --------
 API request
@@ -46,7 +62,8 @@ builder collects data
     ↓
 renderer builds workbook spec
     ↓
-Excel file written to disk
+spec written as XLSX, zipped CSV or zipped Parquet
+(ReportJob.output_format) and stored
 """
 
 # ---------------------------------------------------------
@@ -152,12 +169,14 @@ REPORT_DEFINITIONS = {
         "builder": build_site_asset_report,
         "renderer": site_asset_to_workbook_spec,
         "param_map": site_asset_params,
+        "cache_generation": inventory_data_generation,
     },
 
     "site_audit_logs": {
         "builder": build_site_audit_log_report,
         "renderer": site_audit_log_to_workbook_spec,
         "param_map": site_audit_params,
+        "estimate_rows": count_site_audit_log_rows,
     },
 
     "asset_import": {
@@ -170,14 +189,18 @@ REPORT_DEFINITIONS = {
         "builder": build_user_audit_history_report,
         "renderer": user_audit_history_to_workbook_spec,
         "param_map": user_audit_history_params,
-         "streaming": True,
+        "estimate_rows": count_user_audit_history_rows,
+        "partition": {
+            "plan": plan_user_audit_history_partitions,
+            "rows": user_audit_history_partition_rows,
+            "rows_key": "history_rows",
+        },
     },   
 
     "user_login_history": {
     "builder": build_user_login_history_report,
     "renderer": user_login_history_to_workbook_spec,
     "param_map": user_login_history_params,
-    "streaming": True,
 },
 "asset_history": {
     "builder": build_asset_history_report,
@@ -188,6 +211,7 @@ REPORT_DEFINITIONS = {
         "builder": build_inventory_summary_report,
         "renderer": inventory_summary_to_workbook_spec,
         "param_map": inventory_summary_params,
+        "cache_generation": inventory_data_generation,
     },
 
 }
\ No newline at end of file
@@ -0,0 +1,260 @@
+"""
+Report cost estimation and admission control.
+
+Before a ``ReportJob`` is queued its cost is estimated from:
+
+- the number of source rows, for report types that register an
+  ``estimate_rows`` function in the report registry;
+- the report type's recent history: the duration (``started_at`` to
+  ``finished_at``) and artifact size of the last
+  ``REPORT_ESTIMATE_HISTORY_JOBS`` jobs of the same type and format that
+  rendered a file. With a row count, history gives a per-row rate; without
+  one, the median job is used.
+
+Jobs estimated at or above any ``REPORT_HEAVY_*`` threshold are marked
+``is_heavy`` and run on ``REPORT_HEAVY_QUEUE``, so a dedicated worker pool
+absorbs long exports while the regular ``reports`` workers keep serving
+small ones. The partitions of a partitioned heavy job run on ``reports``.
+
+Admission enforces concurrency budgets over queued and running jobs:
+``REPORT_MAX_ACTIVE_JOBS_PER_USER``, ``REPORT_MAX_ACTIVE_HEAVY_JOBS_PER_USER``
+and ``REPORT_MAX_ACTIVE_HEAVY_JOBS`` (all users). A request over budget is
+refused with ``ReportAdmissionDenied`` (HTTP 429) and no job is created.
+``REPORT_MAX_ACTIVE_HEAVY_JOBS`` should not exceed the heavy worker's
+concurrency, or an admitted job waits in the queue without a heartbeat.
+"""
+
+import math
+from dataclasses import dataclass
+from statistics import median
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from rest_framework.exceptions import Throttled
+
+from core.utils.task_helpers import acquire_xact_lock
+from reporting.models.reports import ReportJob
+from reporting.report_registry import REPORT_DEFINITIONS
+from reporting.utils.excel_renderer import estimate_excel_size_mb
+
+
+HEAVY_ADMISSION_LOCK = 842004
+
+ACTIVE_STATUSES = (
+    ReportJob.Status.PENDING,
+    ReportJob.Status.RUNNING,
+)
+
+
+class ReportAdmissionDenied(Throttled):
+    default_detail = "Too many reports are being generated. Try again later."
+    default_code = "report_admission_denied"
+
+
+@dataclass(frozen=True)
+class ReportEstimate:
+    rows: int | None
+    duration_ms: int
+    size_bytes: int
+    heavy: bool
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "duration_seconds": math.ceil(self.duration_ms / 1000),
+            "size_mb": round(self.size_bytes / (1024 * 1024), 2),
+            "heavy": self.heavy,
+        }
+
+
+def job_estimate(job: ReportJob) -> dict | None:
+    """The estimate stored on ``job`` in API form, if it has one."""
+
+    if job.estimated_duration_ms is None:
+        return None
+
+    return ReportEstimate(
+        rows=job.estimated_rows,
+        duration_ms=job.estimated_duration_ms,
+        size_bytes=job.estimated_size_bytes or 0,
+        heavy=job.is_heavy,
+    ).as_dict()
+
+
+# ==========================================================
+# Estimation
+# ==========================================================
+
+def estimate_report(job: ReportJob) -> ReportEstimate:
+    """Estimate the cost of ``job`` (which need not be saved yet)."""
+
+    rows = estimate_report_rows(job)
+    history = report_history(job.report_type, job.output_format)
+
+    if rows is not None:
+        rated = [sample for sample in history if sample[0]]
+        history_rows = sum(sample[0] for sample in rated)
+
+        if history_rows:
+            duration_ms = rows * sum(sample[1] for sample in rated) / history_rows
+            size_bytes = rows * sum(sample[2] for sample in rated) / history_rows
+        else:
+            duration_ms = rows * 1000 / max(
+                1,
+                settings.REPORT_ESTIMATE_DEFAULT_ROWS_PER_SECOND,
+            )
+            size_bytes = estimate_excel_size_mb(rows) * 1024 * 1024
+
+    elif history:
+        duration_ms = median(sample[1] for sample in history)
+        size_bytes = median(sample[2] for sample in history)
+
+    else:
+        duration_ms = 0
+        size_bytes = 0
+
+    duration_ms = int(duration_ms)
+    size_bytes = int(size_bytes)
+
+    heavy = (
+        (rows or 0) >= settings.REPORT_HEAVY_ROWS
+        or duration_ms >= settings.REPORT_HEAVY_SECONDS * 1000
+        or size_bytes >= settings.REPORT_HEAVY_SIZE_MB * 1024 * 1024
+    )
+
+    return ReportEstimate(
+        rows=rows,
+        duration_ms=duration_ms,
+        size_bytes=size_bytes,
+        heavy=heavy,
+    )
+
+
+def estimate_report_rows(job: ReportJob) -> int | None:
+    definition = REPORT_DEFINITIONS.get(job.report_type) or {}
+    counter = definition.get("estimate_rows")
+
+    if counter is None:
+        return None
+
+    try:
+        return counter(**definition["param_map"](job.params, job.user))
+    except ValueError:
+        # Invalid parameters fail the job itself with the builder's error;
+        # the estimate falls back to the report type's history.
+        return None
+
+
+def report_history(report_type: str, output_format: str) -> list:
+    """``(rows, duration_ms, size_bytes)`` of recent rendered jobs."""
+
+    jobs = (
+        ReportJob.objects
+        .filter(
+            report_type=report_type,
+            output_format=output_format,
+            status=ReportJob.Status.DONE,
+            started_at__isnull=False,
+            finished_at__isnull=False,
+            report_size_bytes__isnull=False,
+        )
+        .order_by("-finished_at")
+        .values_list(
+            "estimated_rows",
+            "started_at",
+            "finished_at",
+            "report_size_bytes",
+        )[: settings.REPORT_ESTIMATE_HISTORY_JOBS]
+    )
+
+    return [
+        (
+            rows,
+            max(0, (finished_at - started_at).total_seconds() * 1000),
+            size_bytes,
+        )
+        for rows, started_at, finished_at, size_bytes in jobs
+    ]
+
+
+# ==========================================================
+# Admission
+# ==========================================================
+
+def admit_report_job(
+    *,
+    user,
+    report_type: str,
+    output_format: str,
+    params: dict,
+) -> ReportJob:
+    """
+    Estimate a report request, check the concurrency budgets and create
+    its ``ReportJob``. Raises ``ReportAdmissionDenied`` when over budget.
+    """
+
+    job = ReportJob(
+        user=user,
+        report_type=report_type,
+        output_format=output_format,
+        params=params,
+    )
+    estimate = estimate_report(job)
+
+    job.estimated_rows = estimate.rows
+    job.estimated_duration_ms = estimate.duration_ms
+    job.estimated_size_bytes = estimate.size_bytes
+    job.is_heavy = estimate.heavy
+
+    with transaction.atomic():
+        # Serialize admissions per user so concurrent requests cannot both
+        # take the last slot of the user's budget.
+        get_user_model().objects.select_for_update().filter(pk=user.pk).first()
+
+        if estimate.heavy:
+            # The global heavy budget spans users; serialize its check too.
+            acquire_xact_lock(HEAVY_ADMISSION_LOCK)
+
+        check_admission_budget(user, heavy=estimate.heavy)
+        job.save()
+
+    return job
+
+
+def check_admission_budget(user, *, heavy: bool) -> None:
+    active = ReportJob.objects.filter(status__in=ACTIVE_STATUSES)
+    user_active = active.filter(user=user)
+
+    if user_active.count() >= settings.REPORT_MAX_ACTIVE_JOBS_PER_USER:
+        raise ReportAdmissionDenied(
+            detail=(
+                "You already have the maximum number of reports in progress."
+            ),
+            wait=settings.REPORT_ADMISSION_RETRY_AFTER_SECONDS,
+        )
+
+    if not heavy:
+        return
+
+    if (
+        user_active.filter(is_heavy=True).count()
+        >= settings.REPORT_MAX_ACTIVE_HEAVY_JOBS_PER_USER
+    ):
+        raise ReportAdmissionDenied(
+            detail=(
+                "You already have a large report in progress. Wait for it "
+                "to finish or narrow the report."
+            ),
+            wait=settings.REPORT_ADMISSION_RETRY_AFTER_SECONDS,
+        )
+
+    if (
+        active.filter(is_heavy=True).count()
+        >= settings.REPORT_MAX_ACTIVE_HEAVY_JOBS
+    ):
+        raise ReportAdmissionDenied(
+            detail="The server is busy with other large reports.",
+            wait=settings.REPORT_ADMISSION_RETRY_AFTER_SECONDS,
+        )
+
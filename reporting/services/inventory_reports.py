@@ -1,13 +1,24 @@
 from datetime import timedelta
 
-from django.db.models import Count, F, Q, Sum
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 
 from analytics.services.snapshots import User
-from assets.models.assets import Accessory, Consumable, Equipment
+from assets.models.assets import EquipmentStatus
 from assignments.models.asset_assignment import AccessoryAssignment, AccessoryEvent, ConsumableIssue
+from assets.selectors.aggregates import (
+    aggregate,
+    empty_accessory_summary,
+    empty_consumable_summary,
+    empty_equipment_summary,
+    empty_placement_summary,
+    inventory_value,
+    summarize_accessories,
+    summarize_consumables,
+    summarize_equipment,
+    summarize_placements,
+)
 from assets.selectors.base import accessory_queryset, consumable_queryset, equipment_queryset
-from reporting.utils.asset_value_helpers import calculate_inventory_values
 from sites.models.sites import Department, Location, Room, UserPlacement
 from users.models.roles import RoleAssignment
 
@@ -176,52 +187,49 @@ def build_inventory_summary_report(
 
     users_qs = User.objects.filter(
         id__in=placements.values("user_id")
-    ).distinct()
+    )
 
     # =====================================================
-    # Overview KPIs
+    # Scope Totals (one conditional aggregate per type)
     # =====================================================
-    usable_equipment = equipment_qs.exclude(
-        status__in=["retired", "condemned"]
-    )
+    equipment_totals = summarize_equipment(equipment_qs)
+    accessory_totals = summarize_accessories(accessory_qs)
+    consumable_totals = summarize_consumables(consumable_qs)
 
-    assigned_equipment = usable_equipment.filter(
-        active_assignment__returned_at__isnull=True
-    ).distinct()
+    user_totals = aggregate(users_qs, {
+        "total": Count("id"),
+        "active": Count("id", filter=Q(is_active=True)),
+        "inactive": Count("id", filter=Q(is_active=False)),
+        "locked": Count("id", filter=Q(is_locked=True)),
+    })
 
-    usable_count = usable_equipment.count()
-    assigned_count = assigned_equipment.count()
+    usable_count = equipment_totals["usable"]
+    assigned_count = equipment_totals["assigned_usable"]
 
     equipment_utilization = (
         round((assigned_count / usable_count) * 100, 2)
         if usable_count else 0
     )
 
-    total_equipment = equipment_qs.count()
-
-    total_accessories = (
-        accessory_qs.aggregate(
-            total=Sum("quantity")
-        )["total"] or 0
-    )
-
-    total_consumables = (
-        consumable_qs.aggregate(
-            total=Sum("quantity")
-            )["total"] or 0
-        )
-
-    values = calculate_inventory_values(
-        equipment_qs,
-        accessory_qs,
-        consumable_qs,
-    )
-
-    low_stock_count = consumable_qs.filter(
-        low_stock_threshold__gt=0,
-        quantity__lte=F("low_stock_threshold"),
-    ).count()
+    total_equipment = equipment_totals["total"]
+    total_accessories = accessory_totals["units"]
+    total_consumables = consumable_totals["units"]
+    low_stock_count = consumable_totals["low_stock"]
+
+    values = {
+        "equipment_value": equipment_totals["value"],
+        "accessory_value": accessory_totals["value"],
+        "consumable_value": consumable_totals["value"],
+        "total_inventory_value": inventory_value(
+            equipment_totals,
+            accessory_totals,
+            consumable_totals,
+        ),
+    }
 
+    # =====================================================
+    # Overview KPIs
+    # =====================================================
     overview = {
         "total_equipment": total_equipment,
         "total_accessories_units": total_accessories,
@@ -230,7 +238,7 @@ def build_inventory_summary_report(
         "accessory_value": values["accessory_value"],
         "consumable_value": values["consumable_value"],
         "total_inventory_value": values["total_inventory_value"],
-        "total_users": users_qs.count(),
+        "total_users": user_totals["total"],
         "equipment_utilization_percent":
             equipment_utilization,
         "floating_equipment":
@@ -238,13 +246,9 @@ def build_inventory_summary_report(
         "low_stock_consumables":
             low_stock_count,
         "damaged_assets":
-            equipment_qs.filter(
-                status="damaged"
-            ).count(),
+            equipment_totals[EquipmentStatus.DAMAGED],
         "lost_assets":
-            equipment_qs.filter(
-                status="lost"
-            ).count(),
+            equipment_totals[EquipmentStatus.LOST],
     }
 
     # =====================================================
@@ -256,7 +260,7 @@ def build_inventory_summary_report(
         "departments": departments.count(),
         "locations": locations.count(),
         "rooms": rooms.count(),
-        "users": users_qs.count(),
+        "users": user_totals["total"],
     }
 
     # =====================================================
@@ -267,30 +271,12 @@ def build_inventory_summary_report(
         "usable": usable_count,
         "assigned": assigned_count,
         "unassigned": usable_count - assigned_count,
-        "ok":
-            equipment_qs.filter(
-                status="ok"
-            ).count(),
-        "damaged":
-            equipment_qs.filter(
-                status="damaged"
-            ).count(),
-        "under_repair":
-            equipment_qs.filter(
-                status="under_repair"
-            ).count(),
-        "lost":
-            equipment_qs.filter(
-                status="lost"
-            ).count(),
-        "retired":
-            equipment_qs.filter(
-                status="retired"
-            ).count(),
-        "condemned":
-            equipment_qs.filter(
-                status="condemned"
-            ).count(),
+        "ok": equipment_totals[EquipmentStatus.OK],
+        "damaged": equipment_totals[EquipmentStatus.DAMAGED],
+        "under_repair": equipment_totals[EquipmentStatus.UNDER_REPAIR],
+        "lost": equipment_totals[EquipmentStatus.LOST],
+        "retired": equipment_totals[EquipmentStatus.RETIRED],
+        "condemned": equipment_totals[EquipmentStatus.CONDEMNED],
         "utilization_percent":
             equipment_utilization,
     }
@@ -307,6 +293,26 @@ def build_inventory_summary_report(
         )["total"] or 0
     )
 
+    accessory_events = aggregate(
+        AccessoryEvent.objects.filter(
+            accessory__in=accessory_qs,
+            event_type__in=["damaged", "lost"],
+        ),
+        {
+            "damaged_last_30_days": Count(
+                "id",
+                filter=Q(
+                    event_type="damaged",
+                    occurred_at__gte=thirty_days_ago,
+                ),
+            ),
+            "lost_units": Sum(
+                "quantity",
+                filter=Q(event_type="lost"),
+            ),
+        },
+    )
+
     accessories = {
         "total_units": total_accessories,
         "assigned_units": assigned_accessories,
@@ -324,19 +330,9 @@ def build_inventory_summary_report(
             if total_accessories else 0
         ),
         "damage_events_last_30_days":
-            AccessoryEvent.objects.filter(
-                accessory__in=accessory_qs,
-                event_type="damaged",
-                occurred_at__gte=thirty_days_ago,
-            ).count(),
-        "lost_units": (
-            AccessoryEvent.objects.filter(
-                accessory__in=accessory_qs,
-                event_type="lost",
-            ).aggregate(
-                total=Sum("quantity")
-            )["total"] or 0
-        ),
+            accessory_events["damaged_last_30_days"],
+        "lost_units":
+            accessory_events["lost_units"],
     }
 
     # =====================================================
@@ -361,9 +357,7 @@ def build_inventory_summary_report(
         "low_stock_items":
             low_stock_count,
         "out_of_stock_items":
-            consumable_qs.filter(
-                quantity=0
-            ).count(),
+            consumable_totals["out_of_stock"],
     }
 
     asset_value = {
@@ -384,19 +378,10 @@ def build_inventory_summary_report(
     # User Summary
     # =====================================================
     users = {
-        "total": users_qs.count(),
-        "active":
-            users_qs.filter(
-                is_active=True
-            ).count(),
-        "inactive":
-            users_qs.filter(
-                is_active=False
-            ).count(),
-        "locked":
-            users_qs.filter(
-                is_locked=True
-            ).count(),
+        "total": user_totals["total"],
+        "active": user_totals["active"],
+        "inactive": user_totals["inactive"],
+        "locked": user_totals["locked"],
     }
 
     # =====================================================
@@ -455,230 +440,43 @@ def build_inventory_summary_report(
     # =====================================================
     breakdown = []
 
-    if scope == "global":
-        for dept in departments:
-            ids = Room.objects.filter(
-                location__department=dept
-            ).values_list(
-                "id",
-                flat=True,
-            )
-
-            eq = equipment_queryset().filter(
-                room_id__in=ids,
-            
-            )
-
-            us = UserPlacement.objects.filter(
-                room_id__in=ids,
-                is_current=True,
-            )
-
-            values = calculate_inventory_values(
-                eq,
-               accessory_queryset().filter(
-                    room_id__in=ids,
-                ),
-                consumable_queryset().filter(
-                    room_id__in=ids,
-                ),
-            )
-
-            breakdown.append({
-                "scope_type": "department",
-                "scope_name": dept.name,
-                "equipment": eq.count(),
-                "assigned_equipment":
-                    eq.filter(
-                        active_assignment__returned_at__isnull=True
-                    ).count(),
-                "damaged_equipment":
-                    eq.filter(
-                        status="damaged"
-                    ).count(),
-                "under_repair":
-                    eq.filter(
-                        status="under_repair"
-                    ).count(),
-                "accessory_units":
-                    accessory_queryset().filter(
-                        room_id__in=ids,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "consumable_units":
-                    consumable_queryset().filter(
-                        room_id__in=ids,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "low_stock_consumables":
-                    consumable_queryset().filter(
-                        room_id__in=ids,
-                        low_stock_threshold__gt=0,
-                        quantity__lte=F(
-                            "low_stock_threshold"
-                        ),
-                    ).count(),
-                "users":
-                    us.count(),
-                "active_users":
-                    User.objects.filter(
-                        id__in=us.values("user_id"),
-                        is_active=True,
-                    ).count(),
-                "equipment_value": values["equipment_value"],
-                "accessory_value": values["accessory_value"],
-                "consumable_value": values["consumable_value"],
-                "total_inventory_value": values["total_inventory_value"], })
-
-    elif scope == "department":
-        for loc in locations:
-            ids = Room.objects.filter(
-                location=loc
-            ).values_list(
-                "id",
-                flat=True,
-            )
-
-            eq = equipment_queryset().filter(
-                room_id__in=ids,
-             
-            )
-
-            us = UserPlacement.objects.filter(
-                room_id__in=ids,
-                is_current=True,
-            )
-
-            values = calculate_inventory_values(
-                eq,
-                accessory_queryset().filter(
-                    room_id__in=ids,
-                ),
-                consumable_queryset().filter(
-                    room_id__in=ids,
-                ),
-            )
-
-            breakdown.append({
-                "scope_type": "location",
-                "scope_name": loc.name,
-                "equipment": eq.count(),
-                "assigned_equipment":
-                    eq.filter(
-                        active_assignment__returned_at__isnull=True
-                    ).count(),
-                "damaged_equipment":
-                    eq.filter(
-                        status="damaged"
-                    ).count(),
-                "under_repair":
-                    eq.filter(
-                        status="under_repair"
-                    ).count(),
-                "accessory_units":
-                   accessory_queryset().filter(
-                        room_id__in=ids,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "consumable_units":
-                    consumable_queryset().filter(
-                        room_id__in=ids,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "low_stock_consumables":
-                    consumable_queryset().filter(
-                        room_id__in=ids,
-                        low_stock_threshold__gt=0,
-                        quantity__lte=F(
-                            "low_stock_threshold"
-                        ),
-                    ).count(),
-                "users":
-                    us.count(),
-                "active_users":
-                    User.objects.filter(
-                        id__in=us.values("user_id"),
-                        is_active=True,
-                    ).count(),
-            "equipment_value": values["equipment_value"],
-            "accessory_value": values["accessory_value"],
-            "consumable_value": values["consumable_value"],
-            "total_inventory_value": values["total_inventory_value"], 
-            
-            })
-    elif scope == "location":
-        for rm in rooms:
+    breakdown_levels = {
+        "global": ("department", departments, "room__location__department_id"),
+        "department": ("location", locations, "room__location_id"),
+        "location": ("room", rooms, "room_id"),
+    }
 
-            eq = equipment_queryset().filter(
-                room=rm,
-            )
+    if scope in breakdown_levels:
+        scope_type, children, group_by = breakdown_levels[scope]
 
-            us = UserPlacement.objects.filter(
-                room=rm,
-                is_current=True,
-            )
+        # One GROUP BY query per asset type covers every child.
+        equipment_groups = summarize_equipment(equipment_qs, group_by=group_by)
+        accessory_groups = summarize_accessories(accessory_qs, group_by=group_by)
+        consumable_groups = summarize_consumables(consumable_qs, group_by=group_by)
+        placement_groups = summarize_placements(placements, group_by=group_by)
 
-            values = calculate_inventory_values(
-                eq,
-                accessory_queryset().filter(
-                    room=rm,
-                ),
-                consumable_queryset().filter(
-                    room=rm,
-                ),
-            )
+        for child in children:
+            eq = equipment_groups.get(child.id) or empty_equipment_summary()
+            acc = accessory_groups.get(child.id) or empty_accessory_summary()
+            con = consumable_groups.get(child.id) or empty_consumable_summary()
+            us = placement_groups.get(child.id) or empty_placement_summary()
 
             breakdown.append({
-                "scope_type": "room",
-                "scope_name": rm.name,
-                "equipment": eq.count(),
-                "assigned_equipment":
-                    eq.filter(
-                        active_assignment__returned_at__isnull=True
-                    ).count(),
-                "damaged_equipment":
-                    eq.filter(
-                        status="damaged"
-                    ).count(),
-                "under_repair":
-                    eq.filter(
-                        status="under_repair"
-                    ).count(),
-                "accessory_units":
-                    accessory_queryset().filter(
-                        room=rm,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "consumable_units":
-                    consumable_queryset().filter(
-                        room=rm,
-                    ).aggregate(
-                        total=Sum("quantity")
-                    )["total"] or 0,
-                "low_stock_consumables":
-                    consumable_queryset().filter(
-                        room=rm,
-                        low_stock_threshold__gt=0,
-                        quantity__lte=F(
-                            "low_stock_threshold"
-                        ),
-                    ).count(),
-                "users":
-                    us.count(),
-                "active_users":
-                    User.objects.filter(
-                        id__in=us.values("user_id"),
-                        is_active=True,
-                    ).count(),
-                "equipment_value": values["equipment_value"],
-                "accessory_value": values["accessory_value"],
-                "consumable_value": values["consumable_value"],
-                "total_inventory_value": values["total_inventory_value"],
+                "scope_type": scope_type,
+                "scope_name": child.name,
+                "equipment": eq["total"],
+                "assigned_equipment": eq["assigned"],
+                "damaged_equipment": eq[EquipmentStatus.DAMAGED],
+                "under_repair": eq[EquipmentStatus.UNDER_REPAIR],
+                "accessory_units": acc["units"],
+                "consumable_units": con["units"],
+                "low_stock_consumables": con["low_stock"],
+                "users": us["placements"],
+                "active_users": us["active_users"],
+                "equipment_value": eq["value"],
+                "accessory_value": acc["value"],
+                "consumable_value": con["value"],
+                "total_inventory_value": inventory_value(eq, acc, con),
             })
 
     # =====================================================
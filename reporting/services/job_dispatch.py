@@ -1,6 +1,7 @@
 import logging
 import uuid
 
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
@@ -23,6 +24,14 @@ def task_for_job(job: ReportJob):
     return generate_report_task
 
 
+def report_queue_options(job: ReportJob) -> dict:
+    """``apply_async`` options routing a heavy report to its own queue."""
+
+    if job.is_heavy:
+        return {"queue": settings.REPORT_HEAVY_QUEUE}
+    return {}
+
+
 def enqueue_report_job(job_id: int) -> bool:
     """Reserve a task id and enqueue a job without allowing duplicate sends."""
 
@@ -51,9 +60,10 @@ def enqueue_report_job(job_id: int) -> bool:
         job.heartbeat_at = now
         job.save(update_fields=["task_id", "heartbeat_at"])
         task = task_for_job(job)
+        queue_options = report_queue_options(job)
 
     try:
-        task.apply_async(args=[job_id], task_id=task_id)
+        task.apply_async(args=[job_id], task_id=task_id, **queue_options)
     except Exception:
         ReportJob.objects.filter(
             pk=job_id,
@@ -0,0 +1,177 @@
+"""
+Partitioned report generation.
+
+Row-heavy report types can register a ``partition`` entry in the report
+registry::
+
+    "partition": {
+        "plan": fn(**builder_params) -> [partition, ...],
+        "rows": fn(partition, **builder_params) -> iterable of rows,
+        "rows_key": "history_rows",   # payload["data"] key the rows fill
+    }
+
+``plan`` returns JSON-serializable partitions (an empty list keeps the job
+in a single task). Each partition is rendered by its own Celery task into a
+part file next to the final report; the finalizing task then feeds the parts,
+in order, to the renderer in place of ``payload["data"][rows_key]``.
+
+Part files are gzip-compressed. For CSV output they already hold the final
+CSV lines and are copied into the archive as-is; for other formats they hold
+one JSON array per row with dates, times and decimals tagged so the merged
+report keeps its cell types.
+"""
+
+import gzip
+import io
+import json
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import Count, Max, Min
+from django.utils.dateparse import parse_datetime
+
+from reporting.models.reports import ReportJob
+from reporting.services.storage import delete_report, open_report
+from reporting.utils.tabular_renderer import GzipCsvParts, write_csv_rows
+
+
+# ==========================================================
+# Planning
+# ==========================================================
+
+def check_row_limit(total_rows: int, max_rows: int) -> None:
+    if total_rows > max_rows:
+        raise RuntimeError(
+            f"Report exceeds maximum allowed rows ({max_rows}). "
+            "Please narrow the date range."
+        )
+
+
+def plan_date_partitions(
+    queryset,
+    *,
+    field: str = "created_at",
+    max_rows: int | None = None,
+) -> list:
+    """
+    Split ``queryset`` into equal ``field`` windows.
+
+    Returns ``[]`` when the rows fit in one partition. Windows are
+    half-open (``gte``/``lt``); the last one is open-ended, so rows added
+    after planning still land in a partition. With ``max_rows``, an
+    over-limit queryset is rejected here, before any partition renders.
+    """
+
+    bounds = queryset.order_by().aggregate(
+        rows=Count("pk"),
+        first=Min(field),
+        last=Max(field),
+    )
+
+    if max_rows is not None:
+        check_row_limit(bounds["rows"], max_rows)
+
+    count = min(
+        settings.REPORT_PARTITION_MAX,
+        math.ceil(bounds["rows"] / max(1, settings.REPORT_PARTITION_ROWS)),
+    )
+
+    if count < 2 or bounds["first"] == bounds["last"]:
+        return []
+
+    first, last = bounds["first"], bounds["last"]
+    step = (last - first) / count
+
+    partitions = []
+    for index in range(count):
+        start = first + step * index
+
+        if index == count - 1:
+            partitions.append({"gte": start.isoformat()})
+        else:
+            end = first + step * (index + 1)
+            partitions.append({"gte": start.isoformat(), "lt": end.isoformat()})
+
+    return partitions
+
+
+def filter_date_partition(queryset, partition: dict, *, field: str = "created_at"):
+    return queryset.filter(
+        **{
+            f"{field}__{lookup}": parse_datetime(value)
+            for lookup, value in partition.items()
+        }
+    )
+
+
+# ==========================================================
+# Part files
+# ==========================================================
+
+def part_name(job: ReportJob, task_id: str, index: int) -> str:
+    return f"{job.public_id}/{task_id}/parts/{index:04d}.gz"
+
+
+def delete_parts(names) -> None:
+    for name in names:
+        delete_report(name)
+
+
+def write_part(rows, output, *, output_format: str) -> None:
+    with gzip.GzipFile(fileobj=output, mode="wb", mtime=0) as compressed:
+        text = io.TextIOWrapper(compressed, encoding="utf-8", newline="")
+
+        if output_format == ReportJob.OutputFormat.CSV:
+            write_csv_rows(text, rows)
+        else:
+            for row in rows:
+                text.write(json.dumps([_encode(value) for value in row]))
+                text.write("\n")
+
+        text.flush()
+        text.detach()
+
+
+def merged_rows(names: list, *, output_format: str):
+    """Rows of every part, in order, in the form the renderer expects."""
+
+    if output_format == ReportJob.OutputFormat.CSV:
+        return GzipCsvParts(names, opener=open_report)
+
+    return _iter_part_rows(names)
+
+
+def _iter_part_rows(names):
+    for name in names:
+        with open_report(name) as raw:
+            with gzip.GzipFile(fileobj=raw, mode="rb") as compressed:
+                for line in io.TextIOWrapper(compressed, encoding="utf-8"):
+                    yield [_decode(value) for value in json.loads(line)]
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode(value):
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    if "t" in value:
+        return time.fromisoformat(value["t"])
+    return Decimal(value["dec"])
@@ -0,0 +1,129 @@
+"""
+Report result cache.
+
+Report types registered with a ``cache_generation`` callable are
+content-addressed: a job's cache key is the hash of its report type, output
+format, normalized params and the current data generation. A new job whose
+key matches a job that finished within ``REPORT_CACHE_TTL_SECONDS`` is
+completed by pointing at that job's stored object instead of rebuilding it.
+
+Only jobs that actually rendered a file carry a cache key, so reuse never
+extends an artifact's freshness past the TTL. Several jobs may then share one
+stored object; ``report_file_is_shared`` must be checked before deleting it.
+
+Cached artifacts are shared between requesters, so cacheable reports are
+rendered without ``meta.generated_by``; ``meta.generated_at`` is the time
+the shared data snapshot was read, not the time of the later request.
+
+The data generation is the newest audit log entry that records a data change;
+logins and other session events do not invalidate results. This is an
+approximation of a data version, with known limits bounded by
+``REPORT_CACHE_TTL_SECONDS``:
+
+- writes that are not audited (queryset ``.update()``, bulk imports and
+  other unaudited bulk paths, admin shell changes) do not move the
+  generation, so a result built before them can be served until it expires;
+- most audit entries are written after their change commits
+  (``AuditLogWriter``; later still with ``AUDIT_LOG_WRITE_MODE = "celery"``),
+  so a job that computes its key in that window sees the previous generation
+  and may reuse a result built before the change.
+
+Keep the TTL short enough that serving such a result is acceptable.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.models.audit import AuditLog
+from reporting.models.reports import ReportJob
+from reporting.services.storage import report_exists
+
+
+CACHE_NEUTRAL_EVENTS = (
+    *AuditLog.Events.NOISE_EVENTS,
+    AuditLog.Events.SESSION_REVOKED,
+    AuditLog.Events.SESSION_EXPIRED,
+    AuditLog.Events.PASSWORD_RESET_REQUESTED,
+    AuditLog.Events.EXPORT_GENERATED,
+)
+
+
+def inventory_data_generation(params) -> int:
+    return (
+        AuditLog.objects
+        .exclude(event_type__in=CACHE_NEUTRAL_EVENTS)
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    ) or 0
+
+
+def report_cache_key(job: ReportJob, definition: dict) -> str:
+    """Return the job's content key, or "" when it is not cacheable."""
+
+    generation = definition.get("cache_generation")
+
+    if generation is None or settings.REPORT_CACHE_TTL_SECONDS <= 0:
+        return ""
+
+    material = json.dumps(
+        {
+            "report_type": job.report_type,
+            "output_format": job.output_format,
+            "params": job.params,
+            "generation": generation(job.params),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def find_cached_report(cache_key: str, *, exclude_job_id=None) -> str:
+    """Return the stored name of a fresh artifact for ``cache_key``."""
+
+    if not cache_key:
+        return ""
+
+    cutoff = timezone.now() - timedelta(
+        seconds=settings.REPORT_CACHE_TTL_SECONDS
+    )
+
+    candidates = (
+        ReportJob.objects
+        .filter(
+            cache_key=cache_key,
+            status=ReportJob.Status.DONE,
+            finished_at__gte=cutoff,
+        )
+        .exclude(report_file="")
+        .exclude(pk=exclude_job_id)
+        .order_by("-finished_at")
+        .values_list("report_file", flat=True)[:3]
+    )
+
+    for name in candidates:
+        if report_exists(name):
+            return name
+
+    return ""
+
+
+def report_file_is_shared(job: ReportJob) -> bool:
+    """True when another job still references ``job.report_file``."""
+
+    if not job.report_file:
+        return False
+
+    return (
+        ReportJob.objects
+        .filter(report_file=job.report_file)
+        .exclude(pk=job.pk)
+        .exists()
+    )
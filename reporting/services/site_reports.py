@@ -145,6 +145,47 @@ def build_site_asset_report(
     return payload
 
 
+SITE_AUDIT_FILTER_FIELDS = {
+    "department": "department__public_id",
+    "location": "location__public_id",
+    "room": "room__public_id",
+}
+
+SITE_AUDIT_PERIODS = {30, 60, 90, 120}
+
+
+def site_audit_log_queryset(*, site: dict, audit_period_days: int):
+    """Audit logs of ``site`` within the last ``audit_period_days`` days."""
+
+    site_type = site["siteType"]
+    site_id = site["siteId"]
+
+    if site_type not in SITE_AUDIT_FILTER_FIELDS:
+        raise ValueError("Invalid siteType")
+
+    if audit_period_days not in SITE_AUDIT_PERIODS:
+        raise ValueError("Invalid audit_period_days")
+
+    start_date = timezone.now() - timedelta(days=audit_period_days)
+
+    return AuditLog.objects.filter(
+        **{SITE_AUDIT_FILTER_FIELDS[site_type]: site_id},
+        created_at__gte=start_date,
+    )
+
+
+def count_site_audit_log_rows(
+    *,
+    site: dict,
+    audit_period_days: int,
+    generated_by=None,
+) -> int:
+    return site_audit_log_queryset(
+        site=site,
+        audit_period_days=audit_period_days,
+    ).count()
+
+
 def build_site_audit_log_report(
     *,
     site: dict,
@@ -159,14 +200,6 @@ def build_site_audit_log_report(
     }
     """
 
-    site_filter_field_map = {
-        "department": "department__public_id",
-        "location": "location__public_id",
-        "room": "room__public_id",
-    }
-
-    ALLOWED_PERIODS = {30, 60, 90, 120}
-
     EVENT_LABELS = {
         "login": "Login",
         "logout": "Logout",
@@ -184,18 +217,8 @@ def build_site_audit_log_report(
     site_type = site["siteType"]
     site_id = site["siteId"]
 
-    if site_type not in site_filter_field_map:
-        raise ValueError("Invalid siteType")
-
-    if audit_period_days not in ALLOWED_PERIODS:
-        raise ValueError("Invalid audit_period_days")
-
-    start_date = timezone.now() - timedelta(days=audit_period_days)
-    site_filter_field = site_filter_field_map[site_type]
-
     logs = (
-        AuditLog.objects
-        .filter(**{site_filter_field: site_id}, created_at__gte=start_date)
+        site_audit_log_queryset(site=site, audit_period_days=audit_period_days)
         .select_related("user", "department", "location", "room")
         .order_by("-created_at")
     )
@@ -1,7 +1,10 @@
+import tempfile
+from contextlib import contextmanager
 from pathlib import PurePosixPath
 
+from django.conf import settings
 from django.core.exceptions import SuspiciousFileOperation
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.storage import storages
 
 
@@ -31,20 +34,54 @@ def report_exists(name: str) -> bool:
     return get_report_storage().exists(normalize_report_name(name))
 
 
+def report_size(name: str) -> int:
+    return get_report_storage().size(normalize_report_name(name))
+
+
 def open_report(name: str, mode: str = "rb"):
     return get_report_storage().open(normalize_report_name(name), mode)
 
 
-def save_report(name: str, content: bytes) -> str:
+@contextmanager
+def spooled_report_file():
+    """
+    Temporary file for rendering a report before it is stored.
+
+    Output stays in memory up to ``REPORT_SPOOL_MAX_MEMORY_BYTES`` and then
+    rolls over to disk, so worker memory does not grow with report size.
+    """
+
+    with tempfile.SpooledTemporaryFile(
+        max_size=settings.REPORT_SPOOL_MAX_MEMORY_BYTES,
+        dir=settings.REPORT_SPOOL_DIR or None,
+    ) as spool:
+        yield spool
+
+
+def save_report(name: str, content) -> str:
+    """
+    Store ``content`` (bytes or a readable binary file) under ``name``.
+
+    File objects are rewound and handed to the storage backend as-is:
+    the filesystem backend copies them in chunks and S3 uploads them as a
+    multipart upload, so the report is never read into memory whole.
+    """
+
     storage = get_report_storage()
     normalized_name = normalize_report_name(name)
 
+    if isinstance(content, (bytes, bytearray)):
+        content = ContentFile(content)
+    else:
+        content.seek(0)
+        content = File(content, name=report_download_name(normalized_name))
+
     # A report key is deterministic for a ReportJob. Removing an existing
     # object makes retries idempotent for both local and S3-compatible storage.
     if storage.exists(normalized_name):
         storage.delete(normalized_name)
 
-    return storage.save(normalized_name, ContentFile(content))
+    return storage.save(normalized_name, content)
 
 
 def delete_report(name: str) -> bool:
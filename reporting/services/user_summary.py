@@ -10,6 +10,11 @@ from core.models.sessions import UserSession
 from django.utils import timezone
 from datetime import datetime, time
 
+from reporting.services.partitions import (
+    check_row_limit,
+    filter_date_partition,
+    plan_date_partitions,
+)
 from reporting.utils.resolve_audit_date_range import resolve_audit_date_range
 
 MAX_YEARS = 5
@@ -183,21 +188,19 @@ def generate_user_audit_history_rows(logs):
             log.ip_address,
             log.user_agent,
         ]
-def build_user_audit_history_report(
+
+
+def user_audit_history_logs(
     *,
     user_identifier: str,
     start_date=None,
     end_date=None,
     relative_range: str | None = None,
-    generated_by=None,
-) -> dict:
+):
     """
-    Build User Audit History Report using canonical payload:
+    Resolve the user and date range of an audit history report.
 
-    {
-        "meta": {...},
-        "data": {...}
-    }
+    Returns ``(user, logs, start_date, end_date)``.
     """
 
     # -------------------------------------------------
@@ -237,17 +240,39 @@ def build_user_audit_history_report(
     if end_date:
         logs = logs.filter(created_at__lte=end_date)
 
+    return user, logs, start_date, end_date
+
+
+def build_user_audit_history_report(
+    *,
+    user_identifier: str,
+    start_date=None,
+    end_date=None,
+    relative_range: str | None = None,
+    generated_by=None,
+) -> dict:
+    """
+    Build User Audit History Report using canonical payload:
+
+    {
+        "meta": {...},
+        "data": {...}
+    }
+    """
+
+    user, logs, start_date, end_date = user_audit_history_logs(
+        user_identifier=user_identifier,
+        start_date=start_date,
+        end_date=end_date,
+        relative_range=relative_range,
+    )
+
     # -------------------------------------------------
     # Row Count Guard
     # -------------------------------------------------
 
     total_rows = logs.count()
-
-    if total_rows > MAX_ROWS:
-        raise RuntimeError(
-            f"Report exceeds maximum allowed rows ({MAX_ROWS}). "
-            "Please narrow the date range."
-        )
+    check_row_limit(total_rows, MAX_ROWS)
 
     # -------------------------------------------------
     # Aggregate Stats
@@ -298,6 +323,72 @@ def build_user_audit_history_report(
         },
     }
 
+def count_user_audit_history_rows(
+    *,
+    user_identifier: str,
+    start_date=None,
+    end_date=None,
+    relative_range: str | None = None,
+    generated_by=None,
+) -> int:
+    """Number of history rows the report will contain."""
+
+    _, logs, _, _ = user_audit_history_logs(
+        user_identifier=user_identifier,
+        start_date=start_date,
+        end_date=end_date,
+        relative_range=relative_range,
+    )
+
+    return logs.count()
+
+
+def plan_user_audit_history_partitions(
+    *,
+    user_identifier: str,
+    start_date=None,
+    end_date=None,
+    relative_range: str | None = None,
+    generated_by=None,
+) -> list:
+    """
+    Date windows for rendering a large audit history in parallel.
+
+    Over-limit histories fail here, before any partition is rendered.
+    """
+
+    _, logs, _, _ = user_audit_history_logs(
+        user_identifier=user_identifier,
+        start_date=start_date,
+        end_date=end_date,
+        relative_range=relative_range,
+    )
+
+    return plan_date_partitions(logs, max_rows=MAX_ROWS)
+
+
+def user_audit_history_partition_rows(
+    partition: dict,
+    *,
+    user_identifier: str,
+    start_date=None,
+    end_date=None,
+    relative_range: str | None = None,
+    generated_by=None,
+):
+    """History rows of one window from ``plan_user_audit_history_partitions``."""
+
+    _, logs, _, _ = user_audit_history_logs(
+        user_identifier=user_identifier,
+        start_date=start_date,
+        end_date=end_date,
+        relative_range=relative_range,
+    )
+
+    return generate_user_audit_history_rows(
+        filter_date_partition(logs, partition)
+    )
+
 LOGIN_EVENT_TYPES = [
     AuditLog.Events.LOGIN,
     AuditLog.Events.LOGIN_FAILED,
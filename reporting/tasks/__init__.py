@@ -1 +1,2 @@
 from .reports import *
+from .partitions import *
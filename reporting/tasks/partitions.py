@@ -0,0 +1,233 @@
+"""
+Parallel rendering of partitioned reports.
+
+``generate_report_task`` keeps its execution lease and fans the job out as a
+chord: one ``render_report_partition`` per partition, then
+``finalize_partitioned_report`` to merge the parts into the final artifact.
+Every sub-task checks and refreshes the job heartbeat under the parent's
+task id, so a cancelled job or a recovery takeover stops them the same way
+it stops a single-task report.
+"""
+
+import logging
+
+from celery import chord, group, shared_task
+from django.conf import settings
+
+from core.mixins import NotificationMixin
+from core.task_reliability import is_transient_task_error, retry_countdown
+from reporting.models.reports import ReportJob
+from reporting.report_registry import REPORT_DEFINITIONS
+from reporting.services.job_errors import REPORT_FAILURE_MESSAGE
+from reporting.services.job_state import JobLeaseLost, mark_job_failed
+from reporting.services.partitions import (
+    delete_parts,
+    merged_rows,
+    part_name,
+    write_part,
+)
+from reporting.services.result_cache import report_cache_key
+from reporting.services.storage import (
+    delete_report,
+    report_size,
+    save_report,
+    spooled_report_file,
+)
+from reporting.tasks.reports import (
+    build_report_file,
+    complete_report_job,
+    require_job_lease,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def plan_report_partitions(job: ReportJob, definition: dict) -> list:
+    partition = definition.get("partition")
+
+    if not partition:
+        return []
+
+    builder_params = definition["param_map"](job.params, job.user)
+    return partition["plan"](**builder_params)
+
+
+def dispatch_report_partitions(job: ReportJob, task_id: str, partitions) -> None:
+    # Only the parent task of a heavy job runs on the heavy queue. Its
+    # partitions and finalizer take the "reports" route so the chord fans
+    # out across the regular workers instead of one heavy slot.
+    header = group(
+        render_report_partition.s(job.id, task_id, index, partition)
+        for index, partition in enumerate(partitions)
+    )
+    callback = (
+        finalize_partitioned_report.s(job.id, task_id)
+        .on_error(
+            abort_partitioned_report.s(
+                report_job_id=job.id,
+                lease_task_id=task_id,
+                part_count=len(partitions),
+            )
+        )
+    )
+
+    chord(header)(callback)
+
+
+def heartbeat_rows(rows, job_id: int, task_id: str):
+    every = max(1, settings.REPORT_PARTITION_HEARTBEAT_ROWS)
+
+    for count, row in enumerate(rows, start=1):
+        if count % every == 0:
+            require_job_lease(job_id, task_id)
+        yield row
+
+
+@shared_task(
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    max_retries=settings.REPORT_TASK_MAX_RETRIES,
+    soft_time_limit=settings.REPORT_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.REPORT_TASK_TIME_LIMIT,
+)
+def render_report_partition(
+    self,
+    report_job_id: int,
+    lease_task_id: str,
+    index: int,
+    partition: dict,
+) -> str:
+    """Render one partition's rows into a part file; return its name."""
+
+    try:
+        require_job_lease(report_job_id, lease_task_id)
+
+        job = ReportJob.objects.select_related("user").get(pk=report_job_id)
+        definition = REPORT_DEFINITIONS[job.report_type]
+        builder_params = definition["param_map"](job.params, job.user)
+        rows = definition["partition"]["rows"](partition, **builder_params)
+
+        with spooled_report_file() as output:
+            write_part(
+                heartbeat_rows(rows, report_job_id, lease_task_id),
+                output,
+                output_format=job.output_format,
+            )
+            require_job_lease(report_job_id, lease_task_id)
+
+            return save_report(
+                part_name(job, lease_task_id, index),
+                output,
+            )
+
+    except JobLeaseLost:
+        logger.warning(
+            "report_partition_lease_lost",
+            extra={"job_id": report_job_id, "partition": index},
+        )
+        raise
+
+    except Exception as exc:
+        retries = int(getattr(self.request, "retries", 0) or 0)
+        if (
+            is_transient_task_error(exc)
+            and retries < settings.REPORT_TASK_MAX_RETRIES
+        ):
+            raise self.retry(exc=exc, countdown=retry_countdown(self))
+
+        logger.exception(
+            "report_partition_failed",
+            extra={"job_id": report_job_id, "partition": index},
+        )
+        raise
+
+
+@shared_task(
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    soft_time_limit=settings.REPORT_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.REPORT_TASK_TIME_LIMIT,
+)
+def finalize_partitioned_report(
+    self,
+    part_names: list,
+    report_job_id: int,
+    lease_task_id: str,
+):
+    """Merge the rendered parts into the report and complete the job."""
+
+    stored_report_name = ""
+
+    try:
+        require_job_lease(report_job_id, lease_task_id)
+
+        job = ReportJob.objects.select_related("user").get(pk=report_job_id)
+        definition = REPORT_DEFINITIONS[job.report_type]
+
+        stored_report_name = build_report_file(
+            job,
+            definition,
+            lease_task_id,
+            rows=merged_rows(part_names, output_format=job.output_format),
+        )
+
+        complete_report_job(
+            job,
+            lease_task_id,
+            stored_report_name,
+            cache_key=report_cache_key(job, definition),
+            report_size_bytes=report_size(stored_report_name),
+            notifier=NotificationMixin(),
+        )
+        return {"status": "done", "report_file": stored_report_name}
+
+    except JobLeaseLost:
+        if stored_report_name:
+            delete_report(stored_report_name)
+        logger.warning(
+            "finalize_partitioned_report_lease_lost",
+            extra={"job_id": report_job_id, "task_id": lease_task_id},
+        )
+        return {"status": "lease_lost"}
+
+    except Exception:
+        logger.exception(
+            "finalize_partitioned_report_failed",
+            extra={"job_id": report_job_id, "task_id": lease_task_id},
+        )
+        if stored_report_name:
+            delete_report(stored_report_name)
+        mark_job_failed(
+            report_job_id,
+            lease_task_id,
+            message=REPORT_FAILURE_MESSAGE,
+        )
+        raise
+
+    finally:
+        delete_parts(part_names)
+
+
+@shared_task
+def abort_partitioned_report(
+    *args,
+    report_job_id: int,
+    lease_task_id: str,
+    part_count: int,
+):
+    """Chord error callback: fail the job and drop any rendered parts."""
+
+    mark_job_failed(
+        report_job_id,
+        lease_task_id,
+        message=REPORT_FAILURE_MESSAGE,
+    )
+
+    job = ReportJob.objects.filter(pk=report_job_id).first()
+    if job is not None:
+        delete_parts(
+            part_name(job, lease_task_id, index)
+            for index in range(part_count)
+        )
@@ -1,4 +1,3 @@
-import io
 import logging
 import time
 from datetime import datetime
@@ -27,15 +26,31 @@ from reporting.services.job_state import (
     prepare_job_retry,
     touch_job,
 )
-from reporting.services.storage import delete_report, save_report
+from reporting.services.result_cache import (
+    find_cached_report,
+    report_cache_key,
+)
+from reporting.services.storage import (
+    delete_report,
+    report_size,
+    save_report,
+    spooled_report_file,
+)
 from reporting.utils.report_payload import wrap_report_payload
-from reporting.utils.excel_renderer import (
-    render_workbook,
-    render_workbook_streaming,
+from reporting.utils.excel_renderer import render_workbook
+from reporting.utils.tabular_renderer import (
+    render_csv_archive,
+    render_parquet_archive,
 )
 
 logger = logging.getLogger(__name__)
 
+REPORT_FILE_EXTENSIONS = {
+    ReportJob.OutputFormat.XLSX: "xlsx",
+    ReportJob.OutputFormat.CSV: "csv.zip",
+    ReportJob.OutputFormat.PARQUET: "parquet.zip",
+}
+
 
 def normalize_datetimes(obj):
     """Recursively convert timezone-aware datetimes for openpyxl."""
@@ -48,6 +63,28 @@ def normalize_datetimes(obj):
     return obj
 
 
+def write_report_output(
+    workbook_spec: dict,
+    output,
+    *,
+    output_format: str,
+) -> None:
+    """Render ``workbook_spec`` into ``output`` in the requested format."""
+
+    if output_format == ReportJob.OutputFormat.CSV:
+        render_csv_archive(workbook_spec, output)
+        return
+
+    if output_format == ReportJob.OutputFormat.PARQUET:
+        render_parquet_archive(workbook_spec, output)
+        return
+
+    if output_format != ReportJob.OutputFormat.XLSX:
+        raise RuntimeError(f"Unknown report output format: {output_format}")
+
+    render_workbook(workbook_spec).save(output)
+
+
 def require_job_lease(job_id: int, task_id: str) -> None:
     if not touch_job(job_id, task_id):
         raise JobLeaseLost(
@@ -55,6 +92,179 @@ def require_job_lease(job_id: int, task_id: str) -> None:
         )
 
 
+def build_report_file(
+    job: ReportJob,
+    definition: dict,
+    task_id: str,
+    *,
+    rows=None,
+) -> str:
+    """
+    Build, render and store the report for ``job``; return its name.
+
+    ``rows`` replaces the payload's partitioned rows with the merged output
+    of the partition tasks.
+    """
+
+    builder = definition["builder"]
+    renderer = definition["renderer"]
+    builder_params = definition["param_map"](job.params, job.user)
+
+    if job.report_type == ReportJob.ReportType.ASSET_IMPORT:
+        payload = job.result_payload
+        if not (
+            isinstance(payload, dict)
+            and "meta" in payload
+            and "data" in payload
+        ):
+            payload = wrap_report_payload(
+                report_type=job.report_type,
+                data=payload or {},
+                extra_meta={
+                    "generated_by": job.user.get_username(),
+                    "asset_type": job.params.get("asset_type"),
+                    "original_file_name": job.params.get(
+                        "original_file_name",
+                        "",
+                    ),
+                },
+            )
+    else:
+        payload = builder(**builder_params)
+
+    require_job_lease(job.id, task_id)
+    payload = normalize_datetimes(payload)
+
+    if payload is None:
+        raise RuntimeError("Report payload is empty")
+    if not isinstance(payload, dict):
+        raise RuntimeError("Report payload must be a dict")
+    if not isinstance(payload.get("meta"), dict):
+        raise RuntimeError("Report payload missing a valid 'meta' object")
+    if not isinstance(payload.get("data"), dict):
+        raise RuntimeError("Report payload missing a valid 'data' object")
+
+    if definition.get("cache_generation") is not None:
+        # The stored file may be served to other requesters from the
+        # result cache, so it must not name this one. "generated_at" is
+        # kept: it is when the shared data snapshot was read.
+        payload["meta"]["generated_by"] = None
+
+    payload["meta"].setdefault("report_type", job.report_type)
+    payload["meta"].setdefault("generated_by", job.user.get_username())
+    payload["meta"].setdefault("schema_version", 1)
+
+    if rows is not None:
+        payload["data"][definition["partition"]["rows_key"]] = rows
+
+    workbook_spec = renderer(payload)
+    require_job_lease(job.id, task_id)
+
+    output_format = job.output_format or ReportJob.OutputFormat.XLSX
+    filename = settings.REPORT_FILENAME_TEMPLATE.format(
+        report_type=job.report_type,
+        public_id=job.public_id,
+    )
+    extension = REPORT_FILE_EXTENSIONS.get(output_format, output_format)
+
+    # The report is written to a spooled file and streamed to storage
+    # from there, so large exports spill to disk instead of being held
+    # in memory as one more copy of the report.
+    with spooled_report_file() as output:
+        write_report_output(
+            workbook_spec,
+            output,
+            output_format=output_format,
+        )
+        require_job_lease(job.id, task_id)
+
+        # Store each execution under its own key. A stale worker can then
+        # clean up only the object it created without deleting the
+        # successful output produced by a replacement task. The basename
+        # remains the user-facing download filename.
+        return save_report(
+            f"{job.public_id}/{task_id}/{filename}.{extension}",
+            output,
+        )
+
+
+def complete_report_job(
+    job: ReportJob,
+    task_id: str,
+    report_name: str,
+    *,
+    cache_key: str = "",
+    report_size_bytes: int | None = None,
+    notifier=None,
+) -> None:
+    """
+    Mark ``job`` done with ``report_name`` if ``task_id`` still owns it.
+
+    ``report_size_bytes`` is only given when the job rendered the file
+    itself; it feeds the cost estimates of later jobs.
+    """
+
+    notifier = notifier or NotificationMixin()
+
+    with transaction.atomic():
+        locked_job = (
+            ReportJob.objects
+            .select_for_update()
+            .select_related("user")
+            .get(pk=job.pk)
+        )
+
+        if locked_job.status == ReportJob.Status.CANCELLED:
+            raise JobLeaseLost("Report was cancelled before completion.")
+
+        if (
+            locked_job.status != ReportJob.Status.RUNNING
+            or locked_job.task_id != task_id
+        ):
+            raise JobLeaseLost(
+                "Report execution lease changed before completion."
+            )
+
+        locked_job.status = ReportJob.Status.DONE
+        locked_job.finished_at = timezone.now()
+        locked_job.report_file = report_name
+        locked_job.cache_key = cache_key
+        locked_job.report_size_bytes = report_size_bytes
+        locked_job.error = ""
+        locked_job.heartbeat_at = None
+        locked_job.task_id = ""
+        locked_job.save(
+            update_fields=[
+                "status",
+                "finished_at",
+                "report_file",
+                "cache_key",
+                "report_size_bytes",
+                "error",
+                "heartbeat_at",
+                "task_id",
+            ]
+        )
+
+        if not locked_job.notification_sent:
+            notifier.notify(
+                recipient=locked_job.user,
+                notif_type="report_ready",
+                level="info",
+                title="Your report is ready",
+                message=(
+                    "Go to your reports page to download the report."
+                ),
+                entity=locked_job,
+                meta={
+                    "report_type": locked_job.report_type,
+                    "report_public_id": locked_job.public_id,
+                },
+            )
+            locked_job.notification_sent = True
+            locked_job.save(update_fields=["notification_sent"])
+
+
 @shared_task(
     bind=True,
     acks_late=True,
@@ -97,131 +307,55 @@ def generate_report_task(self, report_job_id: int):
         if not definition:
             raise RuntimeError(f"Unknown report type: {job.report_type}")
 
-        builder = definition["builder"]
-        renderer = definition["renderer"]
-        builder_params = definition["param_map"](job.params, job.user)
-
-        if job.report_type == ReportJob.ReportType.ASSET_IMPORT:
-            payload = job.result_payload
-            if not (
-                isinstance(payload, dict)
-                and "meta" in payload
-                and "data" in payload
-            ):
-                payload = wrap_report_payload(
-                    report_type=job.report_type,
-                    data=payload or {},
-                    extra_meta={
-                        "generated_by": job.user.get_username(),
-                        "asset_type": job.params.get("asset_type"),
-                        "original_file_name": job.params.get(
-                            "original_file_name",
-                            "",
-                        ),
-                    },
-                )
-        else:
-            payload = builder(**builder_params)
-
-        require_job_lease(job.id, task_id)
-        payload = normalize_datetimes(payload)
-
-        if payload is None:
-            raise RuntimeError("Report payload is empty")
-        if not isinstance(payload, dict):
-            raise RuntimeError("Report payload must be a dict")
-        if not isinstance(payload.get("meta"), dict):
-            raise RuntimeError("Report payload missing a valid 'meta' object")
-        if not isinstance(payload.get("data"), dict):
-            raise RuntimeError("Report payload missing a valid 'data' object")
-
-        payload["meta"].setdefault("report_type", job.report_type)
-        payload["meta"].setdefault("generated_by", job.user.get_username())
-        payload["meta"].setdefault("schema_version", 1)
-
-        workbook_spec = renderer(payload)
-        require_job_lease(job.id, task_id)
+        cache_key = report_cache_key(job, definition)
+        report_name = find_cached_report(cache_key, exclude_job_id=job.id)
 
-        if definition.get("streaming", False):
-            workbook = render_workbook_streaming(workbook_spec)
+        if report_name:
+            logger.info(
+                "report_result_cache_hit",
+                extra={"job_id": job.id, "report_file": report_name},
+            )
         else:
-            workbook = render_workbook(workbook_spec)
-
-        buffer = io.BytesIO()
-        workbook.save(buffer)
-        buffer.seek(0)
-        require_job_lease(job.id, task_id)
-
-        filename = settings.REPORT_FILENAME_TEMPLATE.format(
-            report_type=job.report_type,
-            public_id=job.public_id,
-        )
-        # Store each execution under its own key. A stale worker can then
-        # clean up only the object it created without deleting the successful
-        # output produced by a replacement task. The basename remains the
-        # user-facing download filename.
-        stored_report_name = save_report(
-            f"{job.public_id}/{task_id}/{filename}.xlsx",
-            buffer.getvalue(),
-        )
-
-        with transaction.atomic():
-            locked_job = (
-                ReportJob.objects
-                .select_for_update()
-                .select_related("user")
-                .get(pk=job.pk)
+            from reporting.tasks.partitions import (
+                dispatch_report_partitions,
+                plan_report_partitions,
             )
 
-            if locked_job.status == ReportJob.Status.CANCELLED:
-                raise JobLeaseLost("Report was cancelled before completion.")
+            partitions = plan_report_partitions(job, definition)
 
-            if (
-                locked_job.status != ReportJob.Status.RUNNING
-                or locked_job.task_id != task_id
-            ):
-                raise JobLeaseLost(
-                    "Report execution lease changed before completion."
+            if partitions:
+                # The partition tasks inherit this task's lease; the chord
+                # callback completes the job.
+                dispatch_report_partitions(job, task_id, partitions)
+                run.status = ScheduledTaskRun.Status.SUCCESS
+                run.message = (
+                    f"ReportJob {job.public_id} split into "
+                    f"{len(partitions)} partitions"
                 )
-
-            locked_job.status = ReportJob.Status.DONE
-            locked_job.finished_at = timezone.now()
-            locked_job.report_file = stored_report_name
-            locked_job.error = ""
-            locked_job.heartbeat_at = None
-            locked_job.task_id = ""
-            locked_job.save(
-                update_fields=[
-                    "status",
-                    "finished_at",
-                    "report_file",
-                    "error",
-                    "heartbeat_at",
-                    "task_id",
-                ]
-            )
-
-            if not locked_job.notification_sent:
-                notifier.notify(
-                    recipient=locked_job.user,
-                    notif_type="report_ready",
-                    level="info",
-                    title="Your report is ready",
-                    message=(
-                        "Go to your reports page to download the report."
-                    ),
-                    entity=locked_job,
-                    meta={
-                        "report_type": locked_job.report_type,
-                        "report_public_id": locked_job.public_id,
-                    },
-                )
-                locked_job.notification_sent = True
-                locked_job.save(update_fields=["notification_sent"])
+                return {"status": "partitioned", "partitions": len(partitions)}
+
+            stored_report_name = build_report_file(job, definition, task_id)
+            report_name = stored_report_name
+
+        complete_report_job(
+            job,
+            task_id,
+            report_name,
+            # Only the job that rendered the object advertises it for reuse.
+            cache_key=cache_key if stored_report_name else "",
+            report_size_bytes=(
+                report_size(stored_report_name) if stored_report_name else None
+            ),
+            notifier=notifier,
+        )
 
         run.status = ScheduledTaskRun.Status.SUCCESS
         run.message = f"ReportJob {job.public_id} completed"
-        return {"status": "done", "report_file": stored_report_name}
+        return {
+            "status": "done",
+            "report_file": report_name,
+            "cached": not stored_report_name,
+        }
 
     except JobLeaseLost:
         if stored_report_name:
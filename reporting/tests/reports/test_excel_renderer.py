@@ -0,0 +1,52 @@
+import io
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from openpyxl import load_workbook
+
+from reporting.utils.excel_renderer import CURRENCY_FORMAT, render_workbook
+
+
+def rendered(spec):
+    output = io.BytesIO()
+    render_workbook(spec).save(output)
+    output.seek(0)
+    return load_workbook(output)
+
+
+class RenderWorkbookTests(SimpleTestCase):
+    def test_currency_columns_are_formatted_as_rows_are_written(self):
+        wb = rendered(
+            {
+                "Assets": {
+                    "headers": ["Name", "Value"],
+                    "rows": [["Laptop", Decimal("10.50")], ["Dock", None]],
+                    "formats": {"Value": "currency"},
+                }
+            }
+        )
+
+        ws = wb["Assets"]
+        self.assertEqual(ws["B2"].number_format, CURRENCY_FORMAT)
+        self.assertEqual(ws["A2"].number_format, "General")
+        self.assertIsNone(ws["B3"].value)
+
+    def test_widths_come_from_the_sampled_rows(self):
+        def rows():
+            yield ["short"]
+            yield ["x" * 40]
+
+        with patch("reporting.utils.excel_renderer.AUTOSIZE_SAMPLE_ROWS", 1):
+            wb = rendered({"Sheet": {"headers": ["Name"], "rows": rows()}})
+
+        ws = wb["Sheet"]
+        self.assertEqual(ws.column_dimensions["A"].width, len("short") + 2)
+        self.assertEqual(ws.max_row, 3)
+        self.assertEqual(ws["A3"].value, "x" * 40)
+
+    def test_empty_spec_renders_placeholder_sheet(self):
+        wb = rendered({})
+
+        self.assertEqual(wb.sheetnames, ["Report"])
+        self.assertEqual(wb["Report"]["A1"].value, "No data available")
@@ -0,0 +1,135 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from assets.asset_factories import (
+    AccessoryFactory,
+    ConsumableFactory,
+    EquipmentFactory,
+)
+from assets.models.assets import EquipmentStatus
+from assets.selectors.aggregates import (
+    summarize_consumables,
+    summarize_equipment,
+)
+from assets.selectors.base import consumable_queryset, equipment_queryset
+from reporting.services.inventory_reports import build_inventory_summary_report
+from sites.factories.site_factories import (
+    DepartmentFactory,
+    LocationFactory,
+    RoomFactory,
+)
+from users.factories.user_factories import UserFactory, UserPlacementFactory
+
+
+class InventoryAggregateTests(TestCase):
+    """
+    Conditional aggregates must match the per-figure queries they replace,
+    and the summary report must not scale its query count with the number
+    of child sites.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = DepartmentFactory()
+        cls.location = LocationFactory(department=cls.department)
+        cls.rooms = RoomFactory.create_batch(3, location=cls.location)
+
+        statuses = [
+            EquipmentStatus.OK,
+            EquipmentStatus.OK,
+            EquipmentStatus.DAMAGED,
+            EquipmentStatus.RETIRED,
+            EquipmentStatus.LOST,
+        ]
+
+        for n, status in enumerate(statuses):
+            EquipmentFactory(
+                room=cls.rooms[n % 2],
+                status=status,
+                purchase_price=Decimal("100.00"),
+            )
+
+        ConsumableFactory(room=cls.rooms[0], quantity=0, unit_cost=Decimal("2.00"))
+        ConsumableFactory(
+            room=cls.rooms[0],
+            quantity=3,
+            low_stock_threshold=5,
+            unit_cost=Decimal("2.00"),
+        )
+        ConsumableFactory(room=cls.rooms[1], quantity=10, unit_cost=Decimal("1.50"))
+        AccessoryFactory(room=cls.rooms[1], quantity=4, unit_cost=Decimal("5.00"))
+
+        for room in cls.rooms[:2]:
+            UserPlacementFactory(room=room, user=UserFactory(is_active=True))
+
+    def test_equipment_summary_matches_individual_counts(self):
+        queryset = equipment_queryset()
+        summary = summarize_equipment(queryset)
+
+        self.assertEqual(summary["total"], queryset.count())
+
+        for status in EquipmentStatus:
+            self.assertEqual(
+                summary[status],
+                queryset.filter(status=status).count(),
+            )
+
+        self.assertEqual(
+            summary["usable"],
+            queryset.exclude(status__in=["retired", "condemned"]).count(),
+        )
+        self.assertEqual(summary["value"], Decimal("500.00"))
+
+    def test_consumable_summary_matches_individual_counts(self):
+        summary = summarize_consumables(consumable_queryset())
+
+        self.assertEqual(summary["items"], 3)
+        self.assertEqual(summary["units"], 13)
+        self.assertEqual(summary["low_stock"], 1)
+        self.assertEqual(summary["out_of_stock"], 1)
+        self.assertEqual(summary["value"], Decimal("21.00"))
+
+    def test_grouped_summary_covers_each_group(self):
+        groups = summarize_equipment(equipment_queryset(), group_by="room_id")
+
+        self.assertEqual(groups[self.rooms[0].id]["total"], 3)
+        self.assertEqual(groups[self.rooms[1].id]["total"], 2)
+        self.assertNotIn(self.rooms[2].id, groups)
+
+    def test_breakdown_rows_match_grouped_figures(self):
+        payload = build_inventory_summary_report(
+            scope="location",
+            scope_id=self.location.public_id,
+        )
+
+        breakdown = {
+            row["scope_name"]: row
+            for row in payload["data"]["breakdown"]
+        }
+
+        first = breakdown[self.rooms[0].name]
+        self.assertEqual(first["equipment"], 3)
+        self.assertEqual(first["low_stock_consumables"], 1)
+        self.assertEqual(first["users"], 1)
+
+        empty = breakdown[self.rooms[2].name]
+        self.assertEqual(empty["equipment"], 0)
+        self.assertEqual(empty["total_inventory_value"], 0)
+
+    def test_report_query_count_does_not_grow_with_children(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                build_inventory_summary_report(
+                    scope="location",
+                    scope_id=self.location.public_id,
+                )
+            return len(queries)
+
+        before = count_queries()
+        RoomFactory.create_batch(5, location=self.location)
+
+        self.assertEqual(count_queries(), before)
+        self.assertLessEqual(before, 20)
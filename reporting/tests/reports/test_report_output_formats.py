@@ -0,0 +1,172 @@
+import csv
+import gzip
+import io
+import zipfile
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pyarrow.parquet as pq
+from django.test import SimpleTestCase, TestCase
+
+from reporting.models.reports import ReportJob
+from reporting.services.storage import delete_report, open_report
+from reporting.tasks.reports import generate_report_task
+from reporting.utils.tabular_renderer import (
+    render_csv_archive,
+    render_parquet_archive,
+)
+from users.factories.user_factories import UserFactory
+
+
+def history_rows(count):
+    for n in range(count):
+        yield [datetime(2026, 1, 1, 12, n % 60), f"event_{n}", None]
+
+
+def sample_spec(count=3):
+    return {
+        "Summary": {
+            "headers": ["Field", "Value"],
+            "rows": [["Total", count], ["Value", Decimal("12.50")]],
+            "formats": {"Value": "currency"},
+        },
+        "Audit History": {
+            "headers": ["Timestamp", "Event", "Target"],
+            "rows": history_rows(count),
+        },
+    }
+
+
+class TabularRendererTests(SimpleTestCase):
+    def read_csv_members(self, output):
+        with zipfile.ZipFile(output) as archive:
+            return {
+                name: list(
+                    csv.reader(
+                        io.StringIO(gzip.decompress(archive.read(name)).decode())
+                    )
+                )
+                for name in archive.namelist()
+            }
+
+    def test_csv_archive_has_one_gzip_member_per_sheet(self):
+        output = io.BytesIO()
+        render_csv_archive(sample_spec(), output)
+
+        members = self.read_csv_members(output)
+
+        self.assertEqual(
+            sorted(members),
+            ["Audit History.csv.gz", "Summary.csv.gz"],
+        )
+        self.assertEqual(members["Summary.csv.gz"][2], ["Value", "12.50"])
+
+        history = members["Audit History.csv.gz"]
+        self.assertEqual(history[0], ["Timestamp", "Event", "Target"])
+        self.assertEqual(history[1], ["2026-01-01 12:00:00", "event_0", ""])
+        self.assertEqual(len(history), 4)
+
+    def test_csv_archive_consumes_row_generators(self):
+        rows = history_rows(5)
+        spec = {"Audit History": {"headers": ["A", "B", "C"], "rows": rows}}
+
+        render_csv_archive(spec, io.BytesIO())
+
+        self.assertIsNone(next(rows, None))
+
+    def read_parquet_member(self, output, name):
+        with zipfile.ZipFile(output) as archive:
+            return pq.read_table(io.BytesIO(archive.read(name)))
+
+    def test_parquet_archive_round_trips_rows(self):
+        output = io.BytesIO()
+
+        with patch("reporting.utils.tabular_renderer.PARQUET_BATCH_ROWS", 2):
+            render_parquet_archive(sample_spec(count=5), output)
+
+        with zipfile.ZipFile(output) as archive:
+            history = pq.read_table(
+                io.BytesIO(archive.read("Audit History.parquet"))
+            )
+            summary = pq.read_table(io.BytesIO(archive.read("Summary.parquet")))
+
+        self.assertEqual(history.num_rows, 5)
+        self.assertEqual(history.column_names, ["Timestamp", "Event", "Target"])
+        self.assertEqual(summary.column("Value").to_pylist(), [5.0, 12.5])
+
+    def test_parquet_columns_widen_across_batches(self):
+        rows = [
+            [1, "a"],
+            [2, "b"],
+            [2.5, 7],
+            [None, "c", "extra"],
+        ]
+        spec = {"Mixed": {"headers": ["Number", "Label"], "rows": iter(rows)}}
+        output = io.BytesIO()
+
+        with patch("reporting.utils.tabular_renderer.PARQUET_BATCH_ROWS", 2):
+            render_parquet_archive(spec, output)
+
+        table = self.read_parquet_member(output, "Mixed.parquet")
+
+        self.assertEqual(table.column_names, ["Number", "Label", "column_3"])
+        self.assertEqual(table.column("Number").to_pylist(), [1.0, 2.0, 2.5, None])
+        self.assertEqual(table.column("Label").to_pylist(), ["a", "b", "7", "c"])
+        self.assertEqual(
+            table.column("column_3").to_pylist(),
+            [None, None, None, "extra"],
+        )
+
+    def test_header_only_parquet_sheet_is_readable(self):
+        output = io.BytesIO()
+        render_parquet_archive({"Empty": {"headers": ["A", "B"], "rows": []}}, output)
+
+        table = self.read_parquet_member(output, "Empty.parquet")
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, ["A", "B"])
+
+
+class ReportTaskOutputFormatTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+
+    def tearDown(self):
+        for name in ReportJob.objects.exclude(report_file="").values_list(
+            "report_file",
+            flat=True,
+        ):
+            delete_report(name)
+
+    @patch("reporting.tasks.reports.NotificationMixin.notify")
+    @patch.dict(
+        "reporting.tasks.reports.REPORT_DEFINITIONS",
+        {
+            ReportJob.ReportType.USER_AUDIT_HISTORY: {
+                "builder": lambda **kwargs: {"meta": {}, "data": {}},
+                "renderer": lambda payload: sample_spec(),
+                "param_map": lambda params, user: {},
+            }
+        },
+        clear=True,
+    )
+    def test_csv_jobs_store_a_csv_archive(self, mock_notify):
+        job = ReportJob.objects.create(
+            user=self.user,
+            report_type=ReportJob.ReportType.USER_AUDIT_HISTORY,
+            output_format=ReportJob.OutputFormat.CSV,
+            params={},
+        )
+
+        with patch("reporting.tasks.reports.render_workbook") as xlsx:
+            generate_report_task.apply(args=[job.id], throw=True).get()
+
+        job.refresh_from_db()
+        xlsx.assert_not_called()
+        self.assertTrue(job.report_file.endswith(".csv.zip"))
+
+        with open_report(job.report_file) as report_file:
+            with zipfile.ZipFile(report_file) as archive:
+                self.assertIn("Audit History.csv.gz", archive.namelist())
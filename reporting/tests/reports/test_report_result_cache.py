@@ -0,0 +1,129 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from analytics.tasks.cleanup import delete_old_reports
+from core.models.audit import AuditLog
+from reporting.models.reports import ReportJob
+from reporting.services.result_cache import (
+    inventory_data_generation,
+    report_file_is_shared,
+)
+from reporting.services.storage import delete_report, report_exists
+from reporting.tasks.reports import generate_report_task
+from users.factories.user_factories import UserFactory
+
+
+builder = MagicMock(return_value={"meta": {}, "data": {}})
+renderer = MagicMock(return_value={"Summary": {"headers": ["A"], "rows": [[1]]}})
+
+
+@patch("reporting.tasks.reports.NotificationMixin.notify")
+@patch.dict(
+    "reporting.tasks.reports.REPORT_DEFINITIONS",
+    {
+        ReportJob.ReportType.INVENTORY_SUMMARY: {
+            "builder": builder,
+            "renderer": renderer,
+            "param_map": lambda params, user: {},
+            "cache_generation": inventory_data_generation,
+        }
+    },
+    clear=True,
+)
+class ReportResultCacheTests(TestCase):
+    """
+    Identical jobs on unchanged data reuse the stored artifact; the shared
+    object is only deleted with the last job that references it.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+
+    def setUp(self):
+        builder.reset_mock()
+        renderer.reset_mock()
+
+    def tearDown(self):
+        for name in set(
+            ReportJob.objects.exclude(report_file="").values_list(
+                "report_file",
+                flat=True,
+            )
+        ):
+            delete_report(name)
+
+    def run_job(self, user=None, params=None):
+        job = ReportJob.objects.create(
+            user=user or self.user,
+            report_type=ReportJob.ReportType.INVENTORY_SUMMARY,
+            params=params or {"scope": "department", "scope_id": "DPT1"},
+        )
+        generate_report_task.apply(args=[job.id], throw=True).get()
+        job.refresh_from_db()
+        return job
+
+    def test_identical_job_reuses_stored_report(self, mock_notify):
+        first = self.run_job()
+        second = self.run_job(user=self.other_user)
+
+        self.assertEqual(builder.call_count, 1)
+        self.assertEqual(second.status, ReportJob.Status.DONE)
+        self.assertEqual(second.report_file, first.report_file)
+        self.assertTrue(first.cache_key)
+        self.assertEqual(second.cache_key, "")
+        self.assertEqual(mock_notify.call_count, 2)
+
+    def test_cached_report_does_not_name_the_requester(self, mock_notify):
+        self.run_job()
+
+        meta = renderer.call_args.args[0]["meta"]
+        self.assertIsNone(meta["generated_by"])
+
+    def test_different_params_are_built_separately(self, mock_notify):
+        first = self.run_job()
+        second = self.run_job(params={"scope": "global", "scope_id": None})
+
+        self.assertEqual(builder.call_count, 2)
+        self.assertNotEqual(second.report_file, first.report_file)
+
+    def test_data_changes_invalidate_but_logins_do_not(self, mock_notify):
+        self.run_job()
+
+        AuditLog.objects.create(event_type=AuditLog.Events.LOGIN)
+        self.run_job()
+        self.assertEqual(builder.call_count, 1)
+
+        AuditLog.objects.create(event_type=AuditLog.Events.MODEL_UPDATED)
+        self.run_job()
+        self.assertEqual(builder.call_count, 2)
+
+    def test_results_older_than_ttl_are_rebuilt(self, mock_notify):
+        first = self.run_job()
+        ReportJob.objects.filter(pk=first.pk).update(
+            finished_at=timezone.now() - timedelta(hours=1),
+        )
+
+        with self.settings(REPORT_CACHE_TTL_SECONDS=60):
+            self.run_job()
+
+        self.assertEqual(builder.call_count, 2)
+
+    def test_shared_object_outlives_all_but_the_last_job(self, mock_notify):
+        first = self.run_job()
+        second = self.run_job()
+
+        self.assertTrue(report_file_is_shared(first))
+
+        ReportJob.objects.filter(pk=first.pk).update(
+            finished_at=timezone.now() - timedelta(days=365),
+        )
+        delete_old_reports.run()
+
+        self.assertFalse(ReportJob.objects.filter(pk=first.pk).exists())
+        self.assertTrue(report_exists(second.report_file))
+        self.assertFalse(report_file_is_shared(second))
@@ -1,5 +1,5 @@
 from django.core.exceptions import SuspiciousFileOperation
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
 from reporting.services.storage import (
     delete_report,
@@ -9,6 +9,7 @@ from reporting.services.storage import (
     report_download_name,
     report_exists,
     save_report,
+    spooled_report_file,
 )
 
 
@@ -53,3 +54,26 @@ class ReportStorageTests(SimpleTestCase):
     def test_parent_path_segments_are_rejected(self):
         with self.assertRaises(SuspiciousFileOperation):
             normalize_report_name("../secret.txt")
+
+    def test_save_streams_file_objects(self):
+        with spooled_report_file() as output:
+            output.write(b"streamed payload")
+
+            stored_name = save_report("report-storage-test.xlsx", output)
+
+        with open_report(stored_name) as report_file:
+            self.assertEqual(report_file.read(), b"streamed payload")
+
+    @override_settings(REPORT_SPOOL_MAX_MEMORY_BYTES=16)
+    def test_spooled_output_rolls_over_to_disk(self):
+        with spooled_report_file() as output:
+            output.write(b"x" * 8)
+            self.assertFalse(output._rolled)
+
+            output.write(b"x" * 32)
+            self.assertTrue(output._rolled)
+
+            save_report("report-storage-test.xlsx", output)
+
+        with open_report("report-storage-test.xlsx") as report_file:
+            self.assertEqual(report_file.read(), b"x" * 40)
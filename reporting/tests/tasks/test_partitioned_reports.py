@@ -0,0 +1,178 @@
+import csv
+import gzip
+import io
+import zipfile
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from core.models.audit import AuditLog
+from reporting.models.reports import ReportJob
+from reporting.services.job_state import JobLeaseLost
+from reporting.services.partitions import (
+    filter_date_partition,
+    part_name,
+    plan_date_partitions,
+)
+from reporting.services.storage import delete_report, open_report, report_exists
+from reporting.tasks.partitions import (
+    dispatch_report_partitions,
+    render_report_partition,
+)
+from reporting.tasks.reports import generate_report_task
+from users.factories.user_factories import UserFactory
+
+
+@override_settings(REPORT_PARTITION_ROWS=2, REPORT_PARTITION_MAX=3)
+class PartitionedReportTests(TestCase):
+    """
+    Row-heavy reports are split into date windows, rendered by a chord and
+    merged back into one artifact in the original row order.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requester = UserFactory()
+        cls.subject = UserFactory()
+
+        now = timezone.now()
+        for n in range(6):
+            AuditLog.objects.create(
+                user=cls.subject,
+                user_public_id=cls.subject.public_id,
+                event_type=AuditLog.Events.MODEL_UPDATED,
+                description=f"change {n}",
+                created_at=now - timedelta(days=6 - n),
+            )
+
+    def tearDown(self):
+        for name in ReportJob.objects.exclude(report_file="").values_list(
+            "report_file",
+            flat=True,
+        ):
+            delete_report(name)
+
+    def subject_logs(self):
+        return AuditLog.objects.filter(user=self.subject)
+
+    def run_job(self, output_format=ReportJob.OutputFormat.XLSX):
+        job = ReportJob.objects.create(
+            user=self.requester,
+            report_type=ReportJob.ReportType.USER_AUDIT_HISTORY,
+            output_format=output_format,
+            params={
+                "user": self.subject.public_id,
+                "relative_range": "last_30_days",
+            },
+        )
+
+        with patch("reporting.tasks.reports.NotificationMixin.notify"):
+            result = generate_report_task.apply(
+                args=[job.id],
+                task_id=f"partitioned-{output_format}",
+                throw=True,
+            ).get()
+
+        job.refresh_from_db()
+        return job, result
+
+    def test_windows_cover_every_row_once(self):
+        partitions = plan_date_partitions(self.subject_logs())
+
+        self.assertEqual(len(partitions), 3)
+
+        ids = [
+            log_id
+            for partition in partitions
+            for log_id in filter_date_partition(
+                self.subject_logs(),
+                partition,
+            ).values_list("id", flat=True)
+        ]
+        self.assertCountEqual(ids, self.subject_logs().values_list("id", flat=True))
+
+    @override_settings(REPORT_PARTITION_ROWS=100)
+    def test_small_reports_are_not_partitioned(self):
+        self.assertEqual(plan_date_partitions(self.subject_logs()), [])
+
+    def test_partitioned_workbook_keeps_rows_in_order(self):
+        job, result = self.run_job()
+
+        self.assertEqual(result, {"status": "partitioned", "partitions": 3})
+        self.assertEqual(job.status, ReportJob.Status.DONE)
+        self.assertEqual(job.task_id, "")
+
+        with open_report(job.report_file) as report_file:
+            sheet = load_workbook(report_file)["History"]
+
+        descriptions = [row[2] for row in sheet.iter_rows(min_row=2, values_only=True)]
+        self.assertEqual(descriptions, [f"change {n}" for n in range(6)])
+
+        for index in range(3):
+            self.assertFalse(
+                report_exists(part_name(job, "partitioned-xlsx", index))
+            )
+
+    def test_partitioned_csv_concatenates_rendered_parts(self):
+        job, _ = self.run_job(ReportJob.OutputFormat.CSV)
+
+        with open_report(job.report_file) as report_file:
+            with zipfile.ZipFile(report_file) as archive:
+                body = gzip.decompress(archive.read("History.csv.gz"))
+
+        rows = list(csv.reader(io.StringIO(body.decode("utf-8"))))
+
+        self.assertEqual(rows[0][0], "Timestamp")
+        self.assertEqual(
+            [row[2] for row in rows[1:]],
+            [f"change {n}" for n in range(6)],
+        )
+
+    @patch("reporting.services.user_summary.MAX_ROWS", 5)
+    def test_over_limit_history_fails_before_partitions_dispatch(self):
+        with patch(
+            "reporting.tasks.partitions.dispatch_report_partitions",
+        ) as dispatch, self.assertRaisesMessage(
+            RuntimeError,
+            "Please narrow the date range.",
+        ):
+            self.run_job()
+
+        dispatch.assert_not_called()
+        job = ReportJob.objects.get(user=self.requester)
+        self.assertEqual(job.status, ReportJob.Status.FAILED)
+
+    @patch("reporting.tasks.partitions.chord")
+    def test_heavy_job_partitions_leave_the_heavy_queue(self, mock_chord):
+        job = ReportJob.objects.create(
+            user=self.requester,
+            report_type=ReportJob.ReportType.USER_AUDIT_HISTORY,
+            params={"user": self.subject.public_id},
+            is_heavy=True,
+        )
+
+        dispatch_report_partitions(job, "heavy-owner", [{}, {}])
+
+        header = mock_chord.call_args.args[0]
+        callback = mock_chord.return_value.call_args.args[0]
+
+        for signature in [*header.tasks, callback]:
+            self.assertNotIn("queue", signature.options)
+
+    def test_partition_without_the_lease_stops(self):
+        job = ReportJob.objects.create(
+            user=self.requester,
+            report_type=ReportJob.ReportType.USER_AUDIT_HISTORY,
+            status=ReportJob.Status.RUNNING,
+            task_id="current-owner",
+            params={"user": self.subject.public_id},
+        )
+
+        with self.assertRaises(JobLeaseLost):
+            render_report_partition.apply(
+                args=[job.id, "stale-owner", 0, {}],
+                throw=True,
+            )
@@ -0,0 +1,229 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models.audit import AuditLog
+from reporting.models.reports import ReportJob
+from reporting.services.admission import (
+    HEAVY_ADMISSION_LOCK,
+    admit_report_job,
+    estimate_report,
+)
+from reporting.services.job_dispatch import enqueue_report_job
+from reporting.services.storage import delete_report
+from reporting.tasks.reports import generate_report_task
+from sites.factories.site_factories import DepartmentFactory
+from users.factories.user_factories import UserFactory
+
+
+@override_settings(
+    REPORT_HEAVY_ROWS=3,
+    REPORT_ESTIMATE_DEFAULT_ROWS_PER_SECOND=1,
+)
+class ReportEstimateTests(TestCase):
+    """
+    Estimates combine the source row count with the report type's history;
+    heavy estimates are routed to the dedicated queue.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.department = DepartmentFactory()
+
+    def site_audit_job(self, **fields):
+        return ReportJob(
+            user=self.user,
+            report_type=ReportJob.ReportType.SITE_AUDIT_LOGS,
+            params={
+                "site": {
+                    "siteType": "department",
+                    "siteId": self.department.public_id,
+                },
+                "audit_period_days": 30,
+            },
+            **fields,
+        )
+
+    def add_logs(self, count):
+        for _ in range(count):
+            AuditLog.objects.create(
+                department=self.department,
+                event_type=AuditLog.Events.MODEL_UPDATED,
+            )
+
+    def add_history(self, *, rows, seconds, size_bytes, report_type=None):
+        finished_at = timezone.now()
+        ReportJob.objects.create(
+            user=self.user,
+            report_type=report_type or ReportJob.ReportType.SITE_AUDIT_LOGS,
+            params={},
+            status=ReportJob.Status.DONE,
+            estimated_rows=rows,
+            started_at=finished_at - timedelta(seconds=seconds),
+            finished_at=finished_at,
+            report_size_bytes=size_bytes,
+        )
+
+    def test_row_count_without_history_uses_default_rate(self):
+        self.add_logs(2)
+
+        estimate = estimate_report(self.site_audit_job())
+
+        self.assertEqual(estimate.rows, 2)
+        self.assertEqual(estimate.duration_ms, 2000)
+        self.assertFalse(estimate.heavy)
+
+    def test_history_calibrates_per_row_cost(self):
+        self.add_logs(2)
+        self.add_history(rows=10, seconds=50, size_bytes=1000)
+
+        estimate = estimate_report(self.site_audit_job())
+
+        self.assertEqual(estimate.duration_ms, 10_000)
+        self.assertEqual(estimate.size_bytes, 200)
+
+    def test_types_without_row_count_use_median_history(self):
+        for seconds in (10, 30, 400):
+            self.add_history(
+                rows=None,
+                seconds=seconds,
+                size_bytes=seconds,
+                report_type=ReportJob.ReportType.USER_SUMMARY,
+            )
+
+        estimate = estimate_report(
+            ReportJob(
+                user=self.user,
+                report_type=ReportJob.ReportType.USER_SUMMARY,
+                params={},
+            )
+        )
+
+        self.assertIsNone(estimate.rows)
+        self.assertEqual(estimate.duration_ms, 30_000)
+
+    @patch("reporting.services.job_dispatch.task_for_job")
+    def test_heavy_job_is_sent_to_heavy_queue(self, mock_task_for_job):
+        task = Mock()
+        mock_task_for_job.return_value = task
+        self.add_logs(3)
+
+        job = admit_report_job(
+            user=self.user,
+            report_type=ReportJob.ReportType.SITE_AUDIT_LOGS,
+            output_format=ReportJob.OutputFormat.XLSX,
+            params=self.site_audit_job().params,
+        )
+        enqueue_report_job(job.id)
+
+        self.assertTrue(job.is_heavy)
+        task.apply_async.assert_called_once_with(
+            args=[job.id],
+            task_id=ReportJob.objects.get(pk=job.pk).task_id,
+            queue="reports_heavy",
+        )
+
+    @patch("reporting.tasks.reports.NotificationMixin.notify")
+    def test_rendered_jobs_record_their_artifact_size(self, mock_notify):
+        job = self.site_audit_job()
+        job.save()
+
+        generate_report_task.apply(args=[job.id], throw=True)
+
+        job.refresh_from_db()
+        self.addCleanup(delete_report, job.report_file)
+        self.assertGreater(job.report_size_bytes, 0)
+
+
+@override_settings(
+    REPORT_MAX_ACTIVE_JOBS_PER_USER=2,
+    REPORT_MAX_ACTIVE_HEAVY_JOBS_PER_USER=1,
+    REPORT_MAX_ACTIVE_HEAVY_JOBS=1,
+    REPORT_HEAVY_ROWS=1,
+)
+@patch("reporting.api.viewsets.site_reports.enqueue_report_job")
+@patch(
+    "access.permissions.base.AccessService.has_permission",
+    return_value=True,
+)
+class ReportAdmissionApiTests(TestCase):
+    """Requests over a concurrency budget are refused before a job exists."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.department = DepartmentFactory()
+        cls.empty_department = DepartmentFactory()
+
+        AuditLog.objects.create(
+            department=cls.department,
+            event_type=AuditLog.Events.MODEL_UPDATED,
+        )
+
+    def post(self, user, department):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client.post(
+            reverse("site-audit-log-report"),
+            {
+                "site": {
+                    "siteType": "department",
+                    "siteId": department.public_id,
+                },
+                "audit_period_days": 30,
+            },
+            format="json",
+        )
+
+    def test_response_includes_estimate(self, mock_permission, mock_enqueue):
+        response = self.post(self.user, self.empty_department)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["estimate"]["rows"], 0)
+        self.assertFalse(response.data["estimate"]["heavy"])
+
+    def test_per_user_budget(self, mock_permission, mock_enqueue):
+        self.post(self.user, self.empty_department)
+        self.post(self.user, self.empty_department)
+
+        response = self.post(self.user, self.empty_department)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        self.assertEqual(ReportJob.objects.filter(user=self.user).count(), 2)
+
+    def test_global_heavy_budget_leaves_small_reports_alone(
+        self,
+        mock_permission,
+        mock_enqueue,
+    ):
+        self.assertEqual(self.post(self.user, self.department).status_code, 202)
+
+        self.assertEqual(
+            self.post(self.other_user, self.department).status_code,
+            429,
+        )
+        self.assertEqual(
+            self.post(self.other_user, self.empty_department).status_code,
+            202,
+        )
+
+    def test_heavy_admissions_serialize_the_global_check(
+        self,
+        mock_permission,
+        mock_enqueue,
+    ):
+        with patch(
+            "reporting.services.admission.acquire_xact_lock",
+        ) as mock_lock:
+            self.post(self.user, self.empty_department)
+            mock_lock.assert_not_called()
+
+            self.post(self.user, self.department)
+            mock_lock.assert_called_once_with(HEAVY_ADMISSION_LOCK)
@@ -3,22 +3,14 @@ from openpyxl.utils import get_column_letter
 from datetime import datetime
 from django.utils.timezone import is_aware
 from decimal import Decimal
+from itertools import islice
 from openpyxl.cell import WriteOnlyCell
 
 CURRENCY_FORMAT = "$#,##0.00"
 
-def autosize_columns(ws):
-    for col in ws.columns:
-        max_length = 0
-        col_letter = get_column_letter(col[0].column)
-
-        for cell in col:
-            if cell.value is not None:
-                max_length = max(
-                    max_length,
-                    len(str(cell.value))
-                )
-        ws.column_dimensions[col_letter].width = max_length + 2
+# Column widths are measured on the header and the first rows of each sheet
+# only; later rows are written without being inspected.
+AUTOSIZE_SAMPLE_ROWS = 500
 
 
 def excel_safe(value):
@@ -26,90 +18,25 @@ def excel_safe(value):
         return value.replace(tzinfo=None)
     return value
 
-def apply_sheet_formats(ws, headers, formats):
-    """
-    Apply workbook-spec formats to worksheet columns.
-    """
-
-    if not headers or not formats:
-        return
-
-    header_map = {
-        header: idx + 1
-        for idx, header in enumerate(headers)
-    }
-
-    for column_name, format_type in formats.items():
-
-        column_index = header_map.get(column_name)
-
-        if not column_index:
-            continue
-
-        for row_num in range(2, ws.max_row + 1):
-
-            cell = ws.cell(
-                row=row_num,
-                column=column_index,
-            )
-
-            if cell.value is None:
-                continue
-
-            if format_type == "currency":
-
-                if isinstance(
-                    cell.value,
-                    (int, float, Decimal),
-                ):
-                    cell.number_format = (
-                        CURRENCY_FORMAT
-                    )
-
 
 def render_workbook(spec: dict) -> Workbook:
-    wb = Workbook()
+    """
+    Render a workbook spec in a single pass.
 
-    default_ws = wb.active
-    created_any = False
+    Every sheet is written with openpyxl's write-only mode: column widths
+    come from a bounded sample (the header plus the first
+    ``AUTOSIZE_SAMPLE_ROWS`` rows) and number formats are set on each cell
+    as it is written, so nothing walks the finished sheet again. Rows may
+    be any iterable, including generators.
+    """
 
-    for sheet_name, sheet in spec.items():
+    wb = Workbook(write_only=True)
 
+    for sheet_name, sheet in spec.items():
         ws = wb.create_sheet(
             title=str(sheet_name)[:31]
         )
-
-        created_any = True
-
-        headers = sheet.get("headers", [])
-        rows = sheet.get("rows", [])
-        formats = sheet.get("formats", {})
-
-        if headers:
-            ws.append([
-                excel_safe(v)
-                for v in headers
-            ])
-
-        for row in rows:
-            ws.append([
-                excel_safe(v)
-                for v in row
-            ])
-
-        apply_sheet_formats(
-            ws,
-            headers,
-            formats,
-        )
-
-        autosize_columns(ws)
-
-    if (
-        created_any
-        and default_ws.title == "Sheet"
-    ):
-        wb.remove(default_ws)
+        write_sheet(ws, sheet)
 
     if not wb.sheetnames:
         ws = wb.create_sheet(
@@ -121,81 +48,77 @@ def render_workbook(spec: dict) -> Workbook:
 
     return wb
 
-def render_workbook_streaming(spec: dict) -> Workbook:
 
-    wb = Workbook(write_only=True)
+def write_sheet(ws, sheet: dict) -> None:
+    headers = [excel_safe(v) for v in sheet.get("headers", [])]
+    rows = iter(sheet.get("rows", []))
+    formats = sheet.get("formats", {})
 
-    for sheet_name, sheet in spec.items():
+    currency_columns = {
+        index
+        for index, header in enumerate(headers)
+        if formats.get(header) == "currency"
+    }
 
-        ws = wb.create_sheet(
-            title=str(sheet_name)[:31]
-        )
+    # Widths must be set before the first row is written; buffer the
+    # sample, size the columns from it, then stream everything out.
+    sample = [
+        [excel_safe(v) for v in row]
+        for row in islice(rows, AUTOSIZE_SAMPLE_ROWS)
+    ]
 
-        headers = sheet.get("headers", [])
-        rows = sheet.get("rows", [])
-        formats = sheet.get("formats", {})
-
-        # -------------------------------------
-        # Header mapping
-        # -------------------------------------
-
-        header_map = {
-            header: idx
-            for idx, header in enumerate(headers)
-        }
-
-        currency_columns = {
-            header_map[column_name]
-            for column_name, format_type in formats.items()
-            if (
-                format_type == "currency"
-                and column_name in header_map
-            )
-        }
+    for index, width in enumerate(column_widths(headers, sample)):
+        ws.column_dimensions[get_column_letter(index + 1)].width = width
+
+    if headers:
+        ws.append(headers)
 
-        # -------------------------------------
-        # Headers
-        # -------------------------------------
+    for row in sample:
+        ws.append(format_row(ws, row, currency_columns))
 
-        if headers:
-            ws.append(
-                [excel_safe(v) for v in headers]
+    for row in rows:
+        ws.append(
+            format_row(
+                ws,
+                [excel_safe(v) for v in row],
+                currency_columns,
             )
+        )
+
 
-        # -------------------------------------
-        # Rows
-        # -------------------------------------
+def column_widths(headers: list, sample: list) -> list:
+    widths = []
 
-        for row in rows:
+    for row in (headers, *sample):
+        for index, value in enumerate(row):
+            if index == len(widths):
+                widths.append(0)
 
-            output_row = []
+            if value is not None:
+                widths[index] = max(widths[index], len(str(value)))
 
-            for col_index, value in enumerate(row):
+    return [width + 2 for width in widths]
 
-                value = excel_safe(value)
 
-                if (
-                    col_index in currency_columns
-                    and isinstance(
-                        value,
-                        (int, float, Decimal),
-                    )
-                ):
-                    cell = WriteOnlyCell(
-                        ws,
-                        value=value,
-                    )
+def format_row(ws, row: list, currency_columns: set) -> list:
+    if not currency_columns:
+        return row
 
-                    cell.number_format = (
-                        CURRENCY_FORMAT
-                    )
+    output_row = []
 
-                    output_row.append(cell)
+    for index, value in enumerate(row):
+        if (
+            index in currency_columns
+            and isinstance(value, (int, float, Decimal))
+        ):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.number_format = CURRENCY_FORMAT
+            output_row.append(cell)
+        else:
+            output_row.append(value)
 
-                else:
-                    output_row.append(value)
+    return output_row
 
-            ws.append(output_row)
 
 def estimate_excel_size_mb(row_count: int, avg_row_bytes: int = 220) -> float:
     """
@@ -0,0 +1,304 @@
+"""
+CSV and Parquet renderers for workbook specs.
+
+Both take the same spec the Excel renderers consume::
+
+    {
+        "Sheet Name": {
+            "headers": [...],
+            "rows": iterable of lists,   # may be a generator
+            "formats": {...},            # ignored: no cell styling
+        },
+    }
+
+and write a zip archive to ``output`` with one member per sheet:
+
+- ``render_csv_archive``: ``<sheet>.csv.gz`` members (gzip-compressed CSV,
+  readable with ``pandas.read_csv`` directly);
+- ``render_parquet_archive``: ``<sheet>.parquet`` members written in row
+  groups of ``PARQUET_BATCH_ROWS``.
+
+Rows are consumed one at a time, so generator-backed sheets such as the
+audit history rows are never materialized. A CSV sheet's rows may also be a
+``GzipCsvParts`` of pre-rendered chunks (see reporting.services.partitions),
+which are copied into the archive without being parsed.
+"""
+
+import csv
+import gzip
+import io
+import re
+import shutil
+import tempfile
+import zipfile
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import chain, islice
+
+import pyarrow
+import pyarrow.ipc as pyarrow_ipc
+import pyarrow.parquet as pyarrow_parquet
+
+
+PARQUET_BATCH_ROWS = 10_000
+
+_UNSAFE_MEMBER_CHARS = re.compile(r"[^\w\- .()]+")
+
+
+def sheet_member_name(sheet_name, suffix: str) -> str:
+    name = _UNSAFE_MEMBER_CHARS.sub("_", str(sheet_name)).strip(" .")
+    return f"{name or 'sheet'}{suffix}"
+
+
+# ==========================================================
+# CSV
+# ==========================================================
+
+class GzipCsvParts:
+    """
+    Sheet rows already rendered as gzip-compressed CSV chunks.
+
+    Concatenated gzip members form a valid gzip stream, so the chunks are
+    appended to the sheet member byte for byte.
+    """
+
+    def __init__(self, names, *, opener):
+        self.names = list(names)
+        self.opener = opener
+
+    def copy_to(self, raw) -> None:
+        for name in self.names:
+            with self.opener(name) as part:
+                shutil.copyfileobj(part, raw)
+
+
+def render_csv_archive(spec: dict, output) -> None:
+    # Members are already gzip-compressed; storing them avoids paying for
+    # a second deflate pass.
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for sheet_name, sheet in spec.items():
+            member = sheet_member_name(sheet_name, ".csv.gz")
+            headers = sheet.get("headers", [])
+            rows = sheet.get("rows", [])
+
+            with archive.open(member, "w", force_zip64=True) as raw:
+                if isinstance(rows, GzipCsvParts):
+                    _write_gzip_csv(raw, [headers] if headers else [])
+                    rows.copy_to(raw)
+                else:
+                    _write_gzip_csv(
+                        raw,
+                        chain([headers], rows) if headers else rows,
+                    )
+
+
+def _write_gzip_csv(raw, rows) -> None:
+    with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+        text = io.TextIOWrapper(
+            compressed,
+            encoding="utf-8",
+            newline="",
+        )
+        write_csv_rows(text, rows)
+        text.flush()
+        text.detach()
+
+
+def write_csv_rows(stream, rows) -> None:
+    writer = csv.writer(stream)
+
+    for row in rows:
+        writer.writerow(
+            ["" if value is None else value for value in row]
+        )
+
+
+# ==========================================================
+# Parquet
+# ==========================================================
+
+def render_parquet_archive(spec: dict, output) -> None:
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for sheet_name, sheet in spec.items():
+            member = sheet_member_name(sheet_name, ".parquet")
+
+            with archive.open(member, "w", force_zip64=True) as raw:
+                _write_parquet_sheet(raw, sheet)
+
+
+def _write_parquet_sheet(stream, sheet: dict) -> None:
+    """
+    Write one sheet in two passes over a temporary spool.
+
+    A Parquet file has one schema, but a column's type is only known once
+    every row has been seen. Each batch is first spooled to disk as an
+    Arrow stream with its own inferred types; the column types are then
+    merged (``_merge_types``) and the batches are read back one at a time,
+    converted to the final schema and written as row groups.
+    """
+
+    rows = iter(sheet.get("rows", []))
+    headers = list(sheet.get("headers", []))
+
+    width = len(headers)
+    column_types = []
+    segments = []
+
+    with tempfile.TemporaryFile() as spool:
+        while True:
+            batch = list(islice(rows, PARQUET_BATCH_ROWS))
+
+            if not batch:
+                break
+
+            table = _spool_table(batch)
+
+            width = max(width, table.num_columns)
+            for index, column in enumerate(table.columns):
+                if index == len(column_types):
+                    column_types.append(set())
+                column_types[index].add(column.type)
+
+            start = spool.tell()
+            with pyarrow_ipc.new_stream(spool, table.schema) as spool_writer:
+                spool_writer.write_table(table)
+            segments.append((start, spool.tell() - start, table.num_rows))
+
+        schema = pyarrow.schema(
+            [
+                pyarrow.field(
+                    name,
+                    _merge_types(
+                        column_types[index]
+                        if index < len(column_types)
+                        else ()
+                    ),
+                )
+                for index, name in enumerate(_column_names(headers, width))
+            ]
+        )
+
+        with pyarrow_parquet.ParquetWriter(
+            stream,
+            schema,
+            compression="snappy",
+        ) as writer:
+            # Header-only sheets still produce a readable (empty) file.
+            for start, length, num_rows in segments:
+                spool.seek(start)
+                table = pyarrow_ipc.open_stream(spool.read(length)).read_all()
+
+                writer.write_table(
+                    pyarrow.Table.from_arrays(
+                        [
+                            _conform_column(
+                                table.column(index)
+                                if index < table.num_columns
+                                else None,
+                                field_.type,
+                                num_rows,
+                            )
+                            for index, field_ in enumerate(schema)
+                        ],
+                        schema=schema,
+                    )
+                )
+
+
+def _column_names(headers, width=None) -> list:
+    names = [str(header) for header in headers]
+
+    for index in range(len(names), width or len(names)):
+        names.append(f"column_{index + 1}")
+
+    # Parquet requires unique column names.
+    seen = {}
+    unique = []
+    for name in names:
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        unique.append(name if not count else f"{name}_{count + 1}")
+
+    return unique
+
+
+def _parquet_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _spool_table(batch):
+    width = max(len(row) for row in batch)
+
+    return pyarrow.Table.from_arrays(
+        [
+            _column_array(
+                [
+                    _parquet_value(row[index]) if index < len(row) else None
+                    for row in batch
+                ]
+            )
+            for index in range(width)
+        ],
+        names=[f"c{index}" for index in range(width)],
+    )
+
+
+def _column_array(values):
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # Mixed types within the batch.
+        return pyarrow.array(
+            [_as_text(value) for value in values],
+            type=pyarrow.string(),
+        )
+
+
+def _merge_types(types):
+    """
+    One type for a column across batches: the common type, float64 for a
+    mix of integers and floats, otherwise string.
+    """
+
+    types = {
+        type_
+        for type_ in types
+        if not pyarrow.types.is_null(type_)
+    }
+
+    if len(types) == 1:
+        return types.pop()
+
+    if types and all(
+        pyarrow.types.is_integer(type_) or pyarrow.types.is_floating(type_)
+        for type_ in types
+    ):
+        return pyarrow.float64()
+
+    return pyarrow.string()
+
+
+def _conform_column(column, type_, num_rows):
+    if column is None or pyarrow.types.is_null(column.type):
+        return pyarrow.nulls(num_rows, type=type_)
+
+    if column.type == type_:
+        return column
+
+    if pyarrow.types.is_string(type_):
+        return pyarrow.array(
+            [_as_text(value) for value in column.to_pylist()],
+            type=type_,
+        )
+
+    return column.cast(type_)
+
+
+def _as_text(value):
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
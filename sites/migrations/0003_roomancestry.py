@@ -0,0 +1,54 @@
+# Generated by Django 5.2.16 on 2026-10-17 01:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_room_ancestry(apps, schema_editor):
+    Room = apps.get_model("sites", "Room")
+    RoomAncestry = apps.get_model("sites", "RoomAncestry")
+
+    rows = (
+        Room.objects
+        .filter(location__isnull=False)
+        .values_list("id", "location_id", "location__department_id")
+    )
+
+    RoomAncestry.objects.bulk_create(
+        [
+            RoomAncestry(
+                room_id=room_id,
+                location_id=location_id,
+                department_id=department_id,
+            )
+            for room_id, location_id, department_id in rows.iterator(chunk_size=2000)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomAncestry',
+            fields=[
+                ('room', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ancestry', serialize=False, to='sites.room')),
+                ('department', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='room_ancestry', to='sites.department')),
+                ('location', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='room_ancestry', to='sites.location')),
+            ],
+            options={
+                'verbose_name': 'Room Ancestry',
+                'verbose_name_plural': 'Room Ancestry',
+                'indexes': [models.Index(fields=['location', 'room'], name='sites_ancestry_loc_room_idx'), models.Index(fields=['department', 'room'], name='sites_ancestry_dept_room_idx')],
+            },
+        ),
+        migrations.RunPython(
+            backfill_room_ancestry,
+            migrations.RunPython.noop,
+        ),
+    ]
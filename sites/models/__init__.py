@@ -1 +1 @@
-from .sites import Department, Location, Room, UserPlacement
\ No newline at end of file
+from .sites import Department, Location, Room, RoomAncestry, UserPlacement
\ No newline at end of file
@@ -21,6 +21,14 @@ class Department(PublicIDModel):
             models.Index(fields=["name"]),
         ]
         
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from sites.services.room_ancestry import RoomAncestryService
+
+        RoomAncestryService.mark_changed(reason="department_deleted")
+        return result
+
     def __str__(self):
         return self.name
 
@@ -50,6 +58,23 @@ class Location(PublicIDModel):
 
     
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "department" in update_fields:
+            from sites.services.room_ancestry import RoomAncestryService
+
+            RoomAncestryService.sync_location(self)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from sites.services.room_ancestry import RoomAncestryService
+
+        RoomAncestryService.mark_changed(reason="location_deleted")
+        return result
+
     def __str__(self):
         if self.department:
             return f"{self.name} @ {self.department.name}"
@@ -78,6 +103,23 @@ class Room(PublicIDModel):
         )
     ]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "location" in update_fields:
+            from sites.services.room_ancestry import RoomAncestryService
+
+            RoomAncestryService.sync_room(self)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        from sites.services.room_ancestry import RoomAncestryService
+
+        RoomAncestryService.mark_changed(reason="room_deleted")
+        return result
+
     def __str__(self):
         if self.location:
             return f"{self.name} @ {self.location.name}"
@@ -91,6 +133,34 @@ class Room(PublicIDModel):
             parts.append(f"Department: {self.location.department.name}")
         return f"{self.name} ({', '.join(parts[1:])})" if len(parts) > 1 else self.name
 
+class RoomAncestry(models.Model):
+    """
+    Denormalised room -> location -> department closure used for scope checks.
+
+    A row exists for every room that currently belongs to a location. Rooms
+    without a location have no row, which scope filters treat as "outside
+    every department and location". Rows are maintained by ``Room.save`` and
+    ``Location.save``; deleting a location cascades its rows and deleting a
+    department clears ``department``. Writes that bypass ``save()`` (queryset
+    ``update()``/``bulk_create()``) must run ``rebuild_room_ancestry``.
+    """
+
+    room = models.OneToOneField(Room, on_delete=models.CASCADE, primary_key=True, related_name="ancestry")
+    location = models.ForeignKey(Location, on_delete=models.CASCADE, db_index=False, related_name="room_ancestry")
+    department = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, db_index=False, related_name="room_ancestry")
+
+    class Meta:
+        verbose_name = "Room Ancestry"
+        verbose_name_plural = "Room Ancestry"
+        indexes = [
+            models.Index(fields=["location", "room"], name="sites_ancestry_loc_room_idx"),
+            models.Index(fields=["department", "room"], name="sites_ancestry_dept_room_idx"),
+        ]
+
+    def __str__(self):
+        return f"room={self.room_id} location={self.location_id} department={self.department_id}"
+
+
 class UserPlacement(PublicIDModel):
     """
     Tracks the physical room assignment history of a user.
@@ -15,6 +15,8 @@ from django.conf import settings
 from django.core.cache import caches
 from django.db import transaction
 
+from core.services.generation_cache import GenerationTokenCache
+
 logger = logging.getLogger("arms.scope_cache")
 
 
@@ -63,11 +65,30 @@ class SiteOptionCacheService:
         cls,
         *,
         cache_alias: str | None = None,
+        backend=None,
     ) -> str:
         """Return the global site generation, creating it atomically if absent."""
 
         alias = cls.get_cache_alias(cache_alias)
-        backend = cls.get_cache(alias)
+
+        local = GenerationTokenCache.get(alias, cls.GENERATION_KEY)
+        if local is not None:
+            return local
+
+        epoch = GenerationTokenCache.epoch()
+        generation = cls._load_generation(alias=alias, backend=backend)
+        GenerationTokenCache.set(
+            alias,
+            cls.GENERATION_KEY,
+            generation,
+            epoch=epoch,
+        )
+        return generation
+
+    @classmethod
+    def _load_generation(cls, *, alias: str, backend=None) -> str:
+        if backend is None:
+            backend = cls.get_cache(alias)
 
         try:
             existing = backend.get(cls.GENERATION_KEY)
@@ -204,6 +225,8 @@ class SiteOptionCacheService:
                 "Unable to rotate the site-options cache generation."
             ) from exc
 
+        GenerationTokenCache.invalidate(alias, cls.GENERATION_KEY)
+
         logger.info(
             "SITE OPTION CACHE INVALIDATED | old_generation=%s "
             "new_generation=%s reason=%s cache_alias=%s",
@@ -0,0 +1,380 @@
+"""Room ancestry closure maintenance and the in-process room scope index.
+
+``RoomAncestry`` stores one ``(room, location, department)`` row per located
+room so queryset scope filters can use a single indexed subquery instead of
+joining room -> location -> department. ``RoomScopeIndex`` is a read-only,
+process-local snapshot of the same closure used by Python-side scope checks.
+
+Every closure write rotates a shared generation token. Workers compare their
+snapshot against that token at most once per
+``ROOM_SCOPE_INDEX_REFRESH_SECONDS`` and rebuild with one query when it has
+moved. ``ROOM_SCOPE_INDEX_MAX_AGE`` bounds staleness caused by writes that
+bypass the model hooks.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from sites.models.sites import Location, Room, RoomAncestry
+
+logger = logging.getLogger("arms.scope_index")
+
+
+@dataclass(frozen=True, slots=True)
+class RoomScopeIndex:
+    """Immutable lookup tables built from one read of ``RoomAncestry``."""
+
+    generation: str | None
+    room_locations: Mapping[int, int]
+    location_departments: Mapping[int, int | None]
+    location_rooms: Mapping[int, frozenset[int]]
+    department_rooms: Mapping[int, frozenset[int]]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_rows(cls, rows, *, generation: str | None) -> "RoomScopeIndex":
+        room_locations: dict[int, int] = {}
+        location_departments: dict[int, int | None] = {}
+        location_rooms: dict[int, set[int]] = defaultdict(set)
+        department_rooms: dict[int, set[int]] = defaultdict(set)
+
+        for room_id, location_id, department_id in rows:
+            room_locations[room_id] = location_id
+            location_departments[location_id] = department_id
+            location_rooms[location_id].add(room_id)
+            if department_id is not None:
+                department_rooms[department_id].add(room_id)
+
+        return cls(
+            generation=generation,
+            room_locations=room_locations,
+            location_departments=location_departments,
+            location_rooms={
+                key: frozenset(value)
+                for key, value in location_rooms.items()
+            },
+            department_rooms={
+                key: frozenset(value)
+                for key, value in department_rooms.items()
+            },
+        )
+
+    def knows_location(self, location_id: int | None) -> bool:
+        return location_id in self.location_departments
+
+    def department_for_location(self, location_id: int | None) -> int | None:
+        return self.location_departments.get(location_id)
+
+    def department_for_room(self, room_id: int | None) -> int | None:
+        return self.location_departments.get(
+            self.room_locations.get(room_id)
+        )
+
+    def room_ids_for_location(self, location_id: int | None) -> frozenset[int]:
+        return self.location_rooms.get(location_id, frozenset())
+
+    def room_ids_for_department(self, department_id: int | None) -> frozenset[int]:
+        return self.department_rooms.get(department_id, frozenset())
+
+
+@dataclass(frozen=True, slots=True)
+class RoomAncestryRebuildResult:
+    created: int
+    updated: int
+    deleted: int
+
+
+class RoomAncestryService:
+    """Keep ``RoomAncestry`` in sync and serve the process-local index."""
+
+    CACHE_PREFIX = "room-ancestry:v1"
+    GENERATION_KEY = f"{CACHE_PREFIX}:generation"
+
+    _index: RoomScopeIndex | None = None
+    _checked_at: float = 0.0
+    _lock = threading.Lock()
+
+    # =====================================================
+    # Settings
+    # =====================================================
+
+    @classmethod
+    def get_cache(cls):
+        alias = getattr(
+            settings,
+            "ROOM_SCOPE_INDEX_CACHE_ALIAS",
+            getattr(settings, "USER_SCOPE_CACHE_ALIAS", "default"),
+        )
+        return caches[alias]
+
+    @classmethod
+    def get_refresh_seconds(cls) -> float:
+        return max(
+            0.0,
+            float(getattr(settings, "ROOM_SCOPE_INDEX_REFRESH_SECONDS", 2)),
+        )
+
+    @classmethod
+    def get_max_age_seconds(cls) -> float:
+        return max(
+            0.0,
+            float(getattr(settings, "ROOM_SCOPE_INDEX_MAX_AGE", 300)),
+        )
+
+    # =====================================================
+    # Closure maintenance
+    # =====================================================
+
+    @classmethod
+    def sync_room(cls, room: Room) -> None:
+        """Upsert (or remove) the closure row for one room."""
+
+        if room.location_id is None:
+            deleted, _ = RoomAncestry.objects.filter(room_id=room.pk).delete()
+            if deleted:
+                cls.mark_changed(reason=f"room_detached:{room.pk}")
+            return
+
+        if Room.location.is_cached(room) and room.location is not None:
+            department_id = room.location.department_id
+        else:
+            department_id = (
+                Location.objects
+                .filter(pk=room.location_id)
+                .values_list("department_id", flat=True)
+                .first()
+            )
+
+        current = (
+            RoomAncestry.objects
+            .filter(room_id=room.pk)
+            .values_list("location_id", "department_id")
+            .first()
+        )
+
+        if current == (room.location_id, department_id):
+            return
+
+        if current is None:
+            RoomAncestry.objects.create(
+                room_id=room.pk,
+                location_id=room.location_id,
+                department_id=department_id,
+            )
+        else:
+            RoomAncestry.objects.filter(room_id=room.pk).update(
+                location_id=room.location_id,
+                department_id=department_id,
+            )
+
+        cls.mark_changed(reason=f"room_synced:{room.pk}")
+
+    @classmethod
+    def sync_location(cls, location: Location) -> None:
+        """Propagate a location's department to all of its rooms' rows."""
+
+        rows = RoomAncestry.objects.filter(location_id=location.pk)
+
+        if location.department_id is None:
+            rows = rows.filter(department_id__isnull=False)
+        else:
+            rows = rows.exclude(department_id=location.department_id)
+
+        if rows.update(department_id=location.department_id):
+            cls.mark_changed(reason=f"location_synced:{location.pk}")
+
+    @classmethod
+    def rebuild(cls) -> RoomAncestryRebuildResult:
+        """Recompute the full closure from ``Room`` and ``Location``."""
+
+        expected = {
+            room_id: (location_id, department_id)
+            for room_id, location_id, department_id in (
+                Room.objects
+                .filter(location__isnull=False)
+                .values_list("id", "location_id", "location__department_id")
+            )
+        }
+
+        with transaction.atomic():
+            existing = {
+                row.room_id: row
+                for row in RoomAncestry.objects.select_for_update()
+            }
+
+            stale_ids = [
+                room_id for room_id in existing if room_id not in expected
+            ]
+            to_create = []
+            to_update = []
+
+            for room_id, (location_id, department_id) in expected.items():
+                row = existing.get(room_id)
+
+                if row is None:
+                    to_create.append(
+                        RoomAncestry(
+                            room_id=room_id,
+                            location_id=location_id,
+                            department_id=department_id,
+                        )
+                    )
+                elif (
+                    row.location_id != location_id
+                    or row.department_id != department_id
+                ):
+                    row.location_id = location_id
+                    row.department_id = department_id
+                    to_update.append(row)
+
+            if stale_ids:
+                RoomAncestry.objects.filter(room_id__in=stale_ids).delete()
+            if to_create:
+                RoomAncestry.objects.bulk_create(to_create, batch_size=1000)
+            if to_update:
+                RoomAncestry.objects.bulk_update(
+                    to_update,
+                    ["location", "department"],
+                    batch_size=1000,
+                )
+
+        result = RoomAncestryRebuildResult(
+            created=len(to_create),
+            updated=len(to_update),
+            deleted=len(stale_ids),
+        )
+
+        logger.info(
+            "ROOM ANCESTRY REBUILT | created=%s updated=%s deleted=%s",
+            result.created,
+            result.updated,
+            result.deleted,
+        )
+
+        cls.mark_changed(reason="rebuild")
+        return result
+
+    # =====================================================
+    # Generation / invalidation
+    # =====================================================
+
+    @classmethod
+    def mark_changed(cls, *, reason: str) -> None:
+        """Drop this process's index and rotate the shared generation.
+
+        The generation is rotated immediately so the writing process and any
+        reader inside the same transaction see the change, and again after
+        commit so a worker that rebuilt from pre-commit data is forced to
+        rebuild once more.
+        """
+
+        cls._index = None
+        cls._rotate_generation(reason=reason)
+
+        def callback() -> None:
+            cls._index = None
+            cls._rotate_generation(reason=f"{reason}:committed")
+
+        transaction.on_commit(callback)
+
+    @classmethod
+    def _rotate_generation(cls, *, reason: str) -> None:
+        try:
+            cls.get_cache().set(cls.GENERATION_KEY, uuid4().hex, timeout=None)
+        except Exception:
+            # Other workers fall back to ROOM_SCOPE_INDEX_MAX_AGE.
+            logger.exception(
+                "ROOM SCOPE INDEX GENERATION ROTATE FAILED | reason=%s",
+                reason,
+            )
+
+    @classmethod
+    def _read_generation(cls) -> str | None:
+        try:
+            value = cls.get_cache().get(cls.GENERATION_KEY)
+        except Exception:
+            logger.exception("ROOM SCOPE INDEX GENERATION READ FAILED")
+            return None
+        return str(value) if value else None
+
+    # =====================================================
+    # Index access
+    # =====================================================
+
+    @classmethod
+    def get_index(cls) -> RoomScopeIndex:
+        """Return a fresh-enough snapshot, rebuilding it with one query."""
+
+        index = cls._index
+        now = time.monotonic()
+
+        if (
+            index is not None
+            and now - cls._checked_at < cls.get_refresh_seconds()
+        ):
+            return index
+
+        with cls._lock:
+            index = cls._index
+            now = time.monotonic()
+
+            if (
+                index is not None
+                and now - cls._checked_at < cls.get_refresh_seconds()
+            ):
+                return index
+
+            generation = cls._read_generation()
+
+            if (
+                index is not None
+                and generation is not None
+                and generation == index.generation
+                and now - index.loaded_at < cls.get_max_age_seconds()
+            ):
+                cls._checked_at = now
+                return index
+
+            index = cls.load_index(generation=generation)
+            cls._index = index
+            cls._checked_at = time.monotonic()
+            return index
+
+    @classmethod
+    def load_index(cls, *, generation: str | None) -> RoomScopeIndex:
+        started = time.perf_counter()
+
+        index = RoomScopeIndex.from_rows(
+            RoomAncestry.objects.values_list(
+                "room_id",
+                "location_id",
+                "department_id",
+            ),
+            generation=generation,
+        )
+
+        logger.debug(
+            "ROOM SCOPE INDEX LOADED | rooms=%s generation=%s elapsed_ms=%s",
+            len(index.room_locations),
+            generation,
+            round((time.perf_counter() - started) * 1000, 2),
+        )
+        return index
+
+    @classmethod
+    def reset_local_index(cls) -> None:
+        """Forget this process's snapshot (tests and management commands)."""
+
+        cls._index = None
+        cls._checked_at = 0.0
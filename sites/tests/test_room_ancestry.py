@@ -0,0 +1,176 @@
+from types import SimpleNamespace
+
+from django.test import TestCase
+
+from access.services.scope import ScopeService
+from sites.factories.site_factories import (
+    DepartmentFactory,
+    LocationFactory,
+    RoomFactory,
+)
+from sites.models.sites import Room, RoomAncestry
+from sites.services.room_ancestry import RoomAncestryService
+
+
+class RoomAncestryClosureTests(TestCase):
+    """
+    The RoomAncestry closure must mirror Room.location and
+    Location.department after every model-level write.
+    """
+
+    def setUp(self):
+        RoomAncestryService.reset_local_index()
+
+        self.department = DepartmentFactory()
+        self.location = LocationFactory(department=self.department)
+        self.room = RoomFactory(location=self.location)
+
+    def ancestry(self, room):
+        return (
+            RoomAncestry.objects
+            .filter(room=room)
+            .values_list("location_id", "department_id")
+            .first()
+        )
+
+    def test_room_create_writes_closure_row(self):
+        self.assertEqual(
+            self.ancestry(self.room),
+            (self.location.pk, self.department.pk),
+        )
+
+    def test_room_relocation_updates_closure_row(self):
+        other_location = LocationFactory()
+
+        self.room.location = other_location
+        self.room.save(update_fields=["location"])
+
+        self.assertEqual(
+            self.ancestry(self.room),
+            (other_location.pk, other_location.department_id),
+        )
+
+    def test_rename_does_not_touch_closure(self):
+        self.room.name = "Renamed"
+
+        with self.assertNumQueries(1):
+            self.room.save(update_fields=["name"])
+
+    def test_location_relocation_propagates_department(self):
+        other_department = DepartmentFactory()
+
+        self.location.department = other_department
+        self.location.save(update_fields=["department"])
+
+        self.assertEqual(
+            self.ancestry(self.room),
+            (self.location.pk, other_department.pk),
+        )
+
+    def test_room_without_location_has_no_row(self):
+        self.room.location = None
+        self.room.save()
+
+        self.assertIsNone(self.ancestry(self.room))
+
+    def test_location_delete_cascades_closure_rows(self):
+        self.location.delete()
+
+        self.assertFalse(RoomAncestry.objects.filter(room=self.room).exists())
+
+    def test_department_delete_clears_department(self):
+        self.department.delete()
+
+        self.assertEqual(
+            self.ancestry(self.room),
+            (self.location.pk, None),
+        )
+
+    def test_rebuild_repairs_drift(self):
+        stray_room = RoomFactory()
+        RoomAncestry.objects.filter(room=stray_room).delete()
+        RoomAncestry.objects.filter(room=self.room).update(department=None)
+
+        result = RoomAncestryService.rebuild()
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(
+            self.ancestry(stray_room),
+            (stray_room.location_id, stray_room.location.department_id),
+        )
+        self.assertEqual(
+            self.ancestry(self.room),
+            (self.location.pk, self.department.pk),
+        )
+
+
+class RoomScopeIndexTests(TestCase):
+    """
+    The in-process index answers scope questions without loading
+    Room/Location/Department rows.
+    """
+
+    def setUp(self):
+        RoomAncestryService.reset_local_index()
+
+        self.department = DepartmentFactory()
+        self.location = LocationFactory(department=self.department)
+        self.sibling_location = LocationFactory(department=self.department)
+        self.room = RoomFactory(location=self.location)
+        self.sibling_room = RoomFactory(location=self.sibling_location)
+        self.foreign_room = RoomFactory()
+
+    def role(self, role, **scope):
+        return SimpleNamespace(
+            role=role,
+            department_id=scope.get("department_id"),
+            location_id=scope.get("location_id"),
+            room_id=scope.get("room_id"),
+        )
+
+    def test_department_scope_room_ids(self):
+        room_ids = ScopeService.get_room_ids_in_scope(
+            self.role("DEPARTMENT_ADMIN", department_id=self.department.pk)
+        )
+
+        self.assertEqual(
+            room_ids,
+            frozenset({self.room.pk, self.sibling_room.pk}),
+        )
+
+    def test_location_scope_room_ids(self):
+        room_ids = ScopeService.get_room_ids_in_scope(
+            self.role("LOCATION_VIEWER", location_id=self.location.pk)
+        )
+
+        self.assertEqual(room_ids, frozenset({self.room.pk}))
+
+    def test_site_admin_is_unrestricted(self):
+        self.assertIsNone(
+            ScopeService.get_room_ids_in_scope(self.role("SITE_ADMIN"))
+        )
+
+    def test_can_access_room_id(self):
+        role = self.role("DEPARTMENT_VIEWER", department_id=self.department.pk)
+
+        self.assertTrue(ScopeService.can_access_room_id(role, self.sibling_room.pk))
+        self.assertFalse(ScopeService.can_access_room_id(role, self.foreign_room.pk))
+
+    def test_department_check_uses_index_for_unloaded_location(self):
+        role = self.role("DEPARTMENT_ADMIN", department_id=self.department.pk)
+        RoomAncestryService.get_index()
+
+        room = Room.objects.get(pk=self.room.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(ScopeService.can_access_room(role, room))
+
+    def test_index_reloads_after_relocation(self):
+        role = self.role("DEPARTMENT_ADMIN", department_id=self.department.pk)
+        self.assertFalse(ScopeService.can_access_room_id(role, self.foreign_room.pk))
+
+        self.foreign_room.location = self.location
+        self.foreign_room.save(update_fields=["location"])
+
+        self.assertTrue(ScopeService.can_access_room_id(role, self.foreign_room.pk))
@@ -25,7 +25,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
-from core.mixins import AuditMixin
+from core.mixins import AuditMixin, StreamingExportMixin
 from core.permissions.helpers import ensure_permission, filter_user_assets_by_scope
 from django.db.models import Count
 from rest_framework.viewsets import GenericViewSet
@@ -41,7 +41,7 @@ from assignments.models.asset_assignment import AccessoryAssignment, ConsumableI
 from assets.services.assets import user_has_active_assets
 
 
-class UserModelViewSet(AuditMixin, ScopeFilterMixin, viewsets.ModelViewSet):
+class UserModelViewSet(AuditMixin, ScopeFilterMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     User directory + self-service profile updates.
 
@@ -59,6 +59,7 @@ class UserModelViewSet(AuditMixin, ScopeFilterMixin, viewsets.ModelViewSet):
     search_fields = ["^email", "email"]
     filterset_class = UserFilter
     pagination_class = FlexiblePagination
+    keyset_ordering = "-id"
 
     permission_classes = [UserPermission]
     http_method_names = ["get", "put", "patch", "head", "options"]